@@ -21,13 +21,12 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
-from collections import (
-    deque,
-    namedtuple,
-)
+from collections import namedtuple
 from enum import IntEnum
 from functools import partial
 import json
+import os
+import time
 
 from PyQt6 import QtCore
 
@@ -35,15 +34,28 @@ from picard import (
     log,
     tagger_instance,
 )
+from picard.acoustid.fingerprintcache import FingerprintCache
+from picard.acoustid.lookup import LookupBatcher
 from picard.acoustid.recordings import RecordingResolver
+from picard.acoustid.scheduler import (
+    FPCALC_DECODE_LENGTH,
+    FpcalcScheduler,
+    children_cpu_time,
+    expected_cost,
+)
 from picard.config import get_config
 from picard.const import FPCALC_NAMES
+from picard.const.appdirs import cache_folder
 from picard.const.defaults import DEFAULT_FPCALC_THREADS
 from picard.const.sys import IS_WIN
-from picard.file import File
+from picard.file import (
+    File,
+    FileIdentity,
+)
 from picard.i18n import N_
 from picard.util import (
     find_executable,
+    thread,
     win_prefix_longpath,
 )
 from picard.webservice.api_helpers import AcoustIdAPIHelper
@@ -76,22 +88,48 @@ def find_fpcalc():
     return find_executable(*FPCALC_NAMES)
 
 
-AcoustIDTask = namedtuple('AcoustIDTask', ('file', 'next_func'))
+LOOKUP_META = 'recordings releasegroups releases tracks compress sources'
+
+
+AcoustIDTask = namedtuple('AcoustIDTask', ('file', 'next_func', 'cache_key'), defaults=(None,))
 
 
 class AcoustIDClient(QtCore.QObject):
     def __init__(self, acoustid_api: AcoustIdAPIHelper):
         super().__init__()
         self.tagger = tagger_instance()
-        self._queue: deque = deque()
-        self._running = 0
+        self._queue = FpcalcScheduler(self.get_max_processes)
+        self._children_cpu_time = children_cpu_time()
         self._acoustid_api = acoustid_api
+        self._fingerprint_cache = None
+        self._lookup_batcher = LookupBatcher(acoustid_api, meta=LOOKUP_META)
 
     def init(self):
-        pass
+        config = get_config()
+        self._fingerprint_cache = FingerprintCache(
+            os.path.join(cache_folder(), 'fingerprints.sqlite'),
+            config.setting['fingerprint_cache_size'],
+        )
 
     def done(self):
-        pass
+        if self._fingerprint_cache is not None:
+            stats = self._fingerprint_cache.stats
+            if stats.hits or stats.stored:
+                log.debug(
+                    "AcoustID: Fingerprint cache hits: %d, misses: %d, stored: %d, evicted: %d, saved %.1f s of decoding",
+                    stats.hits,
+                    stats.misses,
+                    stats.stored,
+                    stats.evicted,
+                    stats.saved_time,
+                )
+            if stats.stored:
+                self._fingerprint_cache.evict()
+            self._fingerprint_cache.close()
+
+    @property
+    def _running(self):
+        return self._queue.running
 
     def get_max_processes(self):
         config = get_config()
@@ -181,15 +219,13 @@ class AcoustIDClient(QtCore.QObject):
             mparms,
             echo=None,
         )
-        params = {'meta': 'recordings releasegroups releases tracks compress sources'}
+        handler = partial(self._on_lookup_finished, task)
         if result[0] == 'fingerprint':
             fp_type, fingerprint, length = result
-            params['fingerprint'] = fingerprint
-            params['duration'] = str(length)
+            self._lookup_batcher.add(fingerprint, length, handler)
         else:
             fp_type, recordingid = result
-            params['recordingid'] = recordingid
-        self._acoustid_api.query_acoustid(partial(self._on_lookup_finished, task), **params)
+            self._acoustid_api.query_acoustid(handler, meta=LOOKUP_META, recordingid=recordingid)
 
     def _on_fpcalc_finished(self, task, exit_code, exit_status):
         process = self.sender()
@@ -200,7 +236,7 @@ class AcoustIDClient(QtCore.QObject):
         process.setProperty('picard_finished', True)
         result = None
         try:
-            self._running -= 1
+            self._process_finished(process)
             self._run_next_task()
             # fpcalc returns the exit code 3 in case of decoding errors that
             # still allowed it to calculate a result.
@@ -239,6 +275,11 @@ class AcoustIDClient(QtCore.QObject):
                 # might get submitted.
                 if exit_code == FpcalcExit.NOERROR:
                     task.file.set_acoustid_fingerprint(fingerprint, length)
+                    if self._fingerprint_cache is not None and task.cache_key:
+                        decode_time = time.monotonic() - process.property('picard_started')
+                        thread.run_task(
+                            partial(self._fingerprint_cache.put, task.cache_key, fingerprint, length, decode_time)
+                        )
             task.next_func(result)
 
     def _on_fpcalc_error(self, task, error):
@@ -249,7 +290,7 @@ class AcoustIDClient(QtCore.QObject):
             return
         process.setProperty('picard_finished', True)
         try:
-            self._running -= 1
+            self._queue.release(process.property('picard_device'))
             self._run_next_task()
             log.error(
                 "Fingerprint calculator failed error= %s (%r) program=%r arguments=%r",
@@ -261,17 +302,38 @@ class AcoustIDClient(QtCore.QObject):
         finally:
             task.next_func(None)
 
+    def _process_finished(self, process):
+        cpu_time = children_cpu_time()
+        # The CPU time of terminated child processes grows by the time used
+        # by the process that just finished.
+        process_cpu_time = cpu_time - self._children_cpu_time
+        self._children_cpu_time = cpu_time
+        device = process.property('picard_device')
+        self._queue.finished(
+            device,
+            process.property('picard_cost'),
+            time.monotonic() - process.property('picard_started'),
+            process_cpu_time,
+        )
+        if not self._queue.running and not len(self._queue):
+            for line in self._queue.report():
+                log.debug("Fingerprint calculator throughput for %s", line)
+
     def _run_next_task(self):
-        try:
-            task = self._queue.popleft()
-        except IndexError:
-            return
-        if task.file.state == File.State.REMOVED:
-            log.debug("File %r was removed", task.file)
-            return
-        self._running += 1
+        while next_task := self._queue.pop():
+            task, device, cost = next_task
+            if task.file.state == File.State.REMOVED:
+                log.debug("File %r was removed", task.file)
+                self._queue.release(device)
+                continue
+            self._start_fpcalc(task, device, cost)
+
+    def _start_fpcalc(self, task, device, cost):
         process = QtCore.QProcess(self)
         process.setProperty('picard_finished', False)
+        process.setProperty('picard_started', time.monotonic())
+        process.setProperty('picard_device', device)
+        process.setProperty('picard_cost', cost)
         process.finished.connect(partial(self._on_fpcalc_finished, task))
         process.errorOccurred.connect(partial(self._on_fpcalc_error, task))
         file_path = task.file.filename
@@ -279,8 +341,8 @@ class AcoustIDClient(QtCore.QObject):
         # long path support is enabled. Ensure the path is properly prefixed.
         if IS_WIN:
             file_path = win_prefix_longpath(file_path)
-        process.start(self._fpcalc, ['-json', '-length', '120', file_path])
-        log.debug("Starting fingerprint calculator %r %r", self._fpcalc, task.file.filename)
+        process.start(self._fpcalc, ['-json', '-length', str(FPCALC_DECODE_LENGTH), file_path])
+        log.debug("Starting fingerprint calculator %r %r (device %r)", self._fpcalc, task.file.filename, device)
 
     def analyze(self, file, next_func):
         fpcalc_next = partial(self._lookup_fingerprint, AcoustIDTask(file, next_func))
@@ -308,17 +370,50 @@ class AcoustIDClient(QtCore.QObject):
         if task.file.state == File.State.REMOVED:
             log.debug("File %r was removed", task.file)
             return
-        self._queue.append(task)
+        if self._fingerprint_cache is not None and self._fingerprint_cache.max_size > 0:
+            # Skip fpcalc if a fingerprint for the unchanged file is cached.
+            # Identifying the file reads it, so the lookup runs in a thread.
+            thread.run_task(
+                partial(self._cached_fingerprint, task.file.filename),
+                partial(self._cached_fingerprint_finished, task),
+            )
+            return
+        self._queue_fpcalc(task)
+
+    def _cached_fingerprint(self, filename):
+        key = FileIdentity(filename).cache_key
+        return key, self._fingerprint_cache.get(key)
+
+    def _cached_fingerprint_finished(self, task, result=None, error=None):
+        if task.file.state == File.State.REMOVED:
+            log.debug("File %r was removed", task.file)
+            return
+        if error is not None:
+            log.error("AcoustID: Fingerprint cache lookup for %r failed: %s", task.file.filename, error)
+            self._queue_fpcalc(task)
+            return
+        key, cached = result
+        if cached:
+            fingerprint, length = cached
+            log.debug("AcoustID: Using cached fingerprint for '%s'", task.file.filename)
+            task.file.set_acoustid_fingerprint(fingerprint, length)
+            task.next_func(('fingerprint', fingerprint, length))
+            return
+        self._queue_fpcalc(task._replace(cache_key=key))
+
+    def _queue_fpcalc(self, task):
+        metadata = task.file.orig_metadata
+        try:
+            filesize = int(metadata['~filesize'] or 0)
+        except ValueError:
+            filesize = 0
+        device = self._queue.device_for(task.file.filename)
+        self._queue.push(task, device, expected_cost(filesize, metadata.length))
         self._fpcalc = get_fpcalc()
-        if self._running < self.get_max_processes():
-            self._run_next_task()
+        self._run_next_task()
 
     def fingerprint(self, file, next_func):
         self._fingerprint(AcoustIDTask(file, next_func))
 
     def stop_analyze(self, file):
-        new_queue = deque()
-        for task in self._queue:
-            if task.file != file and task.file.state != File.State.REMOVED:
-                new_queue.appendleft(task)
-        self._queue = new_queue
+        self._queue.remove(lambda task: task.file == file or task.file.state == File.State.REMOVED)
@@ -0,0 +1,196 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Persistent cache for fingerprints calculated by fpcalc.
+
+Entries are keyed by `FileIdentity.cache_key`, so a fingerprint is only
+reused as long as the file's inode, size, modification time and the hash
+over its first bytes are unchanged.
+
+The cache is used from worker threads, all database access holds a lock.
+"""
+
+from dataclasses import dataclass
+import os
+import sqlite3
+import threading
+import time
+
+from picard import log
+
+
+@dataclass
+class FingerprintCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+    # Sum of the fpcalc run times that were avoided by cache hits, in seconds
+    saved_time: float = 0.0
+
+
+class FingerprintCache:
+    """Stores fingerprint and duration of audio files in a SQLite database.
+
+    The database is opened on first use. Once it holds more than `max_size`
+    entries the least recently used entries get evicted.
+    """
+
+    # Evict only after this many new entries to avoid counting rows on each insert
+    EVICTION_INTERVAL = 100
+    # Number of cache hits whose last use time is written in one transaction
+    TOUCH_INTERVAL = 100
+
+    def __init__(self, path: str, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        self.stats = FingerprintCacheStats()
+        self._db = None
+        self._lock = threading.Lock()
+        self._inserts_since_eviction = 0
+        # Last use times of cache hits which are not yet written
+        self._touched = {}
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._db is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._db = sqlite3.connect(self.path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS fingerprints ("
+                    " key TEXT PRIMARY KEY,"
+                    " fingerprint TEXT NOT NULL,"
+                    " duration INTEGER NOT NULL,"
+                    " decode_time REAL NOT NULL,"
+                    " last_used REAL NOT NULL)"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS fingerprints_last_used ON fingerprints (last_used)")
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                log.error("AcoustID: Failed opening fingerprint cache %r: %s", self.path, e)
+                self._close()
+        return self._db
+
+    def _write_touched(self, db: sqlite3.Connection) -> None:
+        """Writes the pending last use times, the caller commits"""
+        if self._touched:
+            db.executemany(
+                "UPDATE fingerprints SET last_used = ? WHERE key = ?",
+                [(last_used, key) for key, last_used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def get(self, key: str | None) -> tuple[str, int] | None:
+        """Returns a tuple (fingerprint, duration) for key, or None if not cached"""
+        if not key or self.max_size <= 0:
+            return None
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT fingerprint, duration, decode_time FROM fingerprints WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self.stats.misses += 1
+                    return None
+                self._touched[key] = time.time()
+                if len(self._touched) >= self.TOUCH_INTERVAL:
+                    self._write_touched(db)
+                    db.commit()
+            except sqlite3.Error as e:
+                log.error("AcoustID: Fingerprint cache lookup failed: %s", e)
+                return None
+            fingerprint, duration, decode_time = row
+            self.stats.hits += 1
+            self.stats.saved_time += decode_time
+        return fingerprint, duration
+
+    def put(self, key: str | None, fingerprint: str, duration: int, decode_time: float) -> None:
+        """Store fingerprint and duration for key.
+
+        decode_time is the time in seconds it took to calculate the fingerprint.
+        """
+        if not key or self.max_size <= 0:
+            return
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                self._write_touched(db)
+                db.execute(
+                    "INSERT OR REPLACE INTO fingerprints (key, fingerprint, duration, decode_time, last_used)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, fingerprint, duration, decode_time, time.time()),
+                )
+                db.commit()
+                self.stats.stored += 1
+                self._inserts_since_eviction += 1
+                if self._inserts_since_eviction >= self.EVICTION_INTERVAL:
+                    self._evict(db)
+            except sqlite3.Error as e:
+                log.error("AcoustID: Storing fingerprint in cache failed: %s", e)
+
+    def evict(self) -> None:
+        """Remove least recently used entries exceeding the maximum cache size"""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                self._write_touched(db)
+                self._evict(db)
+            except sqlite3.Error as e:
+                log.error("AcoustID: Fingerprint cache eviction failed: %s", e)
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        self._inserts_since_eviction = 0
+        cursor = db.execute(
+            "DELETE FROM fingerprints WHERE key IN ("
+            " SELECT key FROM fingerprints ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (max(self.max_size, 0),),
+        )
+        db.commit()
+        if cursor.rowcount > 0:
+            self.stats.evicted += cursor.rowcount
+            log.debug("AcoustID: Evicted %d entries from fingerprint cache", cursor.rowcount)
+
+    def __len__(self) -> int:
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return 0
+            return db.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self) -> None:
+        """Writes the pending last use times and closes the database"""
+        with self._lock:
+            if self._db is not None and self._touched:
+                try:
+                    self._write_touched(self._db)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    log.error("AcoustID: Updating fingerprint cache failed: %s", e)
+            self._close()
+
+    def _close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,118 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from collections import namedtuple
+from functools import partial
+
+from PyQt6 import QtCore
+
+from picard import log
+from picard.webservice import ReplyHandler
+from picard.webservice.api_helpers import AcoustIdAPIHelper
+
+
+# Time to wait for further fingerprints before sending a lookup request
+LOOKUP_BATCH_WINDOW_MS = 250
+# Maximum number of fingerprints sent in a single lookup request
+LOOKUP_BATCH_SIZE = 10
+
+
+LookupRequest = namedtuple('LookupRequest', ('fingerprint', 'duration', 'handler'))
+
+
+class LookupBatcher:
+    """Combines fingerprint lookups into multi-fingerprint AcoustID requests.
+
+    Fingerprints added within `window_ms` get looked up together, up to
+    `max_size` fingerprints per request. The result for each fingerprint is
+    passed to its handler as a single lookup response document, so handlers
+    do not need to know whether the lookup was batched.
+    """
+
+    def __init__(
+        self,
+        acoustid_api: AcoustIdAPIHelper,
+        window_ms: int = LOOKUP_BATCH_WINDOW_MS,
+        max_size: int = LOOKUP_BATCH_SIZE,
+        **params,
+    ):
+        self._acoustid_api = acoustid_api
+        self._params = params
+        self.max_size = max_size
+        self._pending: list[LookupRequest] = []
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(window_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def add(self, fingerprint: str, duration: int, handler: ReplyHandler) -> None:
+        self._pending.append(LookupRequest(fingerprint, duration, handler))
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Send lookup requests for all pending fingerprints"""
+        self._timer.stop()
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.max_size):
+            self._lookup(pending[i : i + self.max_size])
+
+    def _lookup(self, batch: list[LookupRequest]) -> None:
+        if len(batch) == 1:
+            request = batch[0]
+            self._acoustid_api.query_acoustid(
+                request.handler,
+                fingerprint=request.fingerprint,
+                duration=str(request.duration),
+                **self._params,
+            )
+            return
+        log.debug("AcoustID: looking up batch of %d fingerprints", len(batch))
+        self._acoustid_api.query_acoustid_batch(
+            partial(self._on_batch_finished, batch),
+            [(request.fingerprint, request.duration) for request in batch],
+            **self._params,
+        )
+
+    def _on_batch_finished(self, batch: list[LookupRequest], document, http, error) -> None:
+        if error:
+            for request in batch:
+                request.handler(document, http, error)
+            return
+        try:
+            if document['status'] != 'ok':
+                # A single invalid fingerprint fails the whole batch, look up
+                # the fingerprints one by one to get results for the others.
+                log.warning(
+                    "AcoustID: batch lookup failed (%r), retrying %d fingerprints individually",
+                    document.get('error'),
+                    len(batch),
+                )
+                for request in batch:
+                    self._lookup([request])
+                return
+            results = {int(fp['index']): fp.get('results', []) for fp in document.get('fingerprints', [])}
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            log.error("AcoustID: Error reading batch lookup response", exc_info=True)
+            for request in batch:
+                request.handler({}, http, e)
+            return
+        for i, request in enumerate(batch):
+            request.handler({'status': 'ok', 'results': results.get(i, [])}, http, error)
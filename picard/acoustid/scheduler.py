@@ -0,0 +1,195 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Scheduling of fpcalc processes.
+
+Tasks are queued per device (the mount point of the file) and ordered by
+their expected cost, so that files on slow network shares do not block
+files on fast local storage. The number of processes is adjusted to the
+observed CPU utilization of fpcalc: if fpcalc mostly waits for I/O more
+processes can run in parallel, but only one of them per I/O bound device.
+"""
+
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from dataclasses import dataclass
+import heapq
+import itertools
+import os
+
+from picard.util.bytes2human import binary as bytes2human_binary
+from picard.util.filenaming import _get_mount_point
+
+
+# Maximum length of audio in seconds decoded by fpcalc
+FPCALC_DECODE_LENGTH = 120
+
+# Processes using less CPU time than this fraction of their run time are considered I/O bound
+IO_BOUND_CPU_RATIO = 0.5
+
+# Weight of the latest measurement in the moving average of the CPU ratio
+CPU_RATIO_SMOOTHING = 0.3
+
+
+def expected_cost(filesize: int, length_ms: int, decode_length: int = FPCALC_DECODE_LENGTH) -> int:
+    """Estimate the number of bytes fpcalc needs to read for a file.
+
+    fpcalc stops decoding after decode_length seconds, for longer files only
+    the corresponding part of the file gets read.
+    """
+    if filesize <= 0:
+        return 0
+    if length_ms > 0:
+        return int(filesize * min(1.0, decode_length * 1000 / length_ms))
+    return filesize
+
+
+def children_cpu_time() -> float:
+    """Returns the CPU time used by terminated child processes.
+
+    Not available on all platforms, in which case 0 is returned.
+    """
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+@dataclass
+class DeviceStats:
+    running: int = 0
+    completed: int = 0
+    bytes: int = 0
+    wall_time: float = 0.0
+    # Moving average of CPU time divided by run time, None if unknown
+    cpu_ratio: float | None = None
+
+    @property
+    def throughput(self) -> float:
+        """Returns the processed bytes per second of run time"""
+        return self.bytes / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def io_bound(self) -> bool:
+        return self.cpu_ratio is not None and self.cpu_ratio < IO_BOUND_CPU_RATIO
+
+
+class FpcalcScheduler:
+    """Orders and throttles fpcalc tasks by device and expected cost.
+
+    `max_processes` returns the configured number of processes. The actual
+    limit gets raised up to twice this number while running processes are
+    I/O bound.
+    """
+
+    def __init__(self, max_processes: Callable[[], int]):
+        self._max_processes = max_processes
+        self._queues: dict[str, list] = {}
+        self._counter = itertools.count()
+        self.devices: dict[str, DeviceStats] = {}
+        self.running = 0
+        self._cpu_ratio: float | None = None
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def __iter__(self) -> Iterator:
+        for queue in self._queues.values():
+            for entry in queue:
+                yield entry[2]
+
+    @staticmethod
+    def device_for(filename: str) -> str:
+        return _get_mount_point(os.path.dirname(filename))
+
+    def push(self, task, device: str, cost: int = 0) -> None:
+        queue = self._queues.setdefault(device, [])
+        heapq.heappush(queue, (cost, next(self._counter), task))
+        self.devices.setdefault(device, DeviceStats())
+
+    def remove(self, predicate: Callable) -> None:
+        """Remove all queued tasks for which predicate returns True"""
+        for device, queue in self._queues.items():
+            self._queues[device] = [entry for entry in queue if not predicate(entry[2])]
+            heapq.heapify(self._queues[device])
+
+    @property
+    def max_running(self) -> int:
+        base = max(1, self._max_processes())
+        if self._cpu_ratio is None or self._cpu_ratio >= 1.0:
+            return base
+        return min(2 * base, max(base, round(base / max(self._cpu_ratio, 0.1))))
+
+    def device_limit(self, device: str) -> int:
+        if self.devices[device].io_bound:
+            return 1
+        return self.max_running
+
+    def pop(self):
+        """Returns a tuple (task, device, cost) for the next task to run.
+
+        Returns None if no task can be started right now.
+        """
+        if self.running >= self.max_running:
+            return None
+        candidates = [
+            device
+            for device, queue in self._queues.items()
+            if queue and self.devices[device].running < self.device_limit(device)
+        ]
+        if not candidates:
+            return None
+        # Prefer devices with the fewest running processes, then the cheapest task
+        device = min(candidates, key=lambda d: (self.devices[d].running, self._queues[d][0][:2]))
+        cost, _count, task = heapq.heappop(self._queues[device])
+        self.devices[device].running += 1
+        self.running += 1
+        return task, device, cost
+
+    def release(self, device: str) -> None:
+        """Free the slot of a task for device without recording statistics"""
+        self.devices[device].running -= 1
+        self.running -= 1
+
+    def finished(self, device: str, cost: int, wall_time: float, cpu_time: float | None = None) -> None:
+        """Record the completion of a process started for device"""
+        self.release(device)
+        stats = self.devices[device]
+        stats.completed += 1
+        stats.bytes += cost
+        stats.wall_time += wall_time
+        if cpu_time is not None and cpu_time > 0 and wall_time > 0:
+            ratio = min(1.0, cpu_time / wall_time)
+            stats.cpu_ratio = self._smooth(stats.cpu_ratio, ratio)
+            self._cpu_ratio = self._smooth(self._cpu_ratio, ratio)
+
+    @staticmethod
+    def _smooth(average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return average + CPU_RATIO_SMOOTHING * (value - average)
+
+    def report(self) -> Iterator[str]:
+        """Yields a line with throughput statistics for each device"""
+        for device, stats in self.devices.items():
+            if not stats.completed:
+                continue
+            cpu = f'{stats.cpu_ratio:.0%}' if stats.cpu_ratio is not None else 'n/a'
+            yield (
+                f'{device}: {stats.completed} files, {bytes2human_binary(stats.bytes)}'
+                f' in {stats.wall_time:.1f} s ({bytes2human_binary(stats.throughput)}/s), CPU {cpu}'
+            )
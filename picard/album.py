@@ -51,9 +51,12 @@ from collections.abc import (
     Iterable,
 )
 from enum import IntEnum
+from functools import partial
+import json
 import time
 import traceback
 from typing import Any
+import zlib
 
 from PyQt6 import QtNetwork
 
@@ -95,10 +98,12 @@ from picard.script import (
     ScriptParser,
     iter_active_tagging_scripts,
 )
+from picard.session.session_journal import session_journal
 from picard.track import Track
 from picard.util import (
     format_time,
     mbid_validate,
+    thread,
 )
 from picard.util.isrc import normalized_isrcs
 from picard.util.textencoding import asciipunct
@@ -203,6 +208,8 @@ class Album(MetadataItem):
         self._discids = set()
         self._disc_isrcs: dict[int, str] = disc_isrcs or {}
         self._recordings_map = {}
+        # Release JSON kept on disk after loading, see release_node()
+        self._release_data = None
         if discid:
             self._discids.add(discid)
         self._after_load_callbacks: list[tuple[Callable[[], Any], bool]] = []
@@ -754,12 +761,60 @@ class Album(MetadataItem):
             if multiartists:
                 track.metadata['~multiartist'] = '1'
 
-        # Preserve release JSON for session export after load finished
-        self._release_node_cache = self._release_node
-        del self._release_node
+        # Preserve release JSON for session export after load finished. The
+        # live node is kept until it has been stored in a thread.
+        self._release_data = None
+        thread.run_task(
+            partial(self._store_release_node, self._release_node),
+            partial(self._release_node_stored, self._release_node),
+        )
         del self._release_artist_nodes
         self._tracks_loaded = True
 
+    @staticmethod
+    def _store_release_node(release_node):
+        """Moves the release JSON to a compressed temporary file.
+
+        Identical releases share the same file, it gets removed once no album
+        references it anymore.
+        """
+        # Local import, picard.coverart depends on this module
+        from picard.coverart.image import DataHash
+
+        try:
+            data = zlib.compress(json.dumps(release_node, separators=(',', ':')).encode('utf-8'))
+            return DataHash(data, prefix='picard-release-', suffix='.json.z')
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("Failed storing release JSON: %s", e)
+            return None
+
+    def _release_node_stored(self, release_node, result=None, error=None):
+        # The album may have been reloaded meanwhile
+        if getattr(self, '_release_node', None) is not release_node:
+            return
+        if error is not None:
+            log.warning("Failed storing release JSON: %s", error)
+        self._release_data = result
+        del self._release_node
+
+    def release_node(self):
+        """Returns the MusicBrainz release JSON of this album.
+
+        While loading and until it has been stored this is the live release
+        node. Afterwards it is read back from disk on each call, returns None
+        if not available.
+        """
+        release_node = getattr(self, '_release_node', None)
+        if release_node is not None:
+            return release_node
+        if self._release_data is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(self._release_data.data()))
+        except (OSError, ValueError, zlib.error) as e:
+            log.error("Failed reading release JSON of %r: %s", self.id, e)
+            return None
+
     def _finalize_loading_album(self):
         with self.suspend_metadata_images_update:
             for track in self._new_tracks:
@@ -966,6 +1021,7 @@ class Album(MetadataItem):
         self._finalize_loading(error=True)
 
     def update(self, update_tracks=True, update_selection=True):
+        session_journal.album_changed(self)
         if self.ui_item:
             self.ui_item.update(update_tracks, update_selection=update_selection)
 
@@ -52,6 +52,7 @@ from picard.const import (
 )
 from picard.oauth import OAuthInvalidStateError
 from picard.util import mbid_validate
+from picard.util.metrics import metrics
 from picard.util.thread import to_main
 
 
@@ -218,6 +219,8 @@ class RequestHandler(BaseHTTPRequestHandler):
             self._add_release(args)
         elif action == '/auth':
             self._auth(args)
+        elif action == '/metrics':
+            self._metrics(args)
         else:
             self._response(404, 'Unknown action.')
 
@@ -265,6 +268,13 @@ class RequestHandler(BaseHTTPRequestHandler):
         else:
             self._response(400, 'Missing parameter "code".')
 
+    def _metrics(self, args):
+        if args.get('format', [''])[0] == 'json':
+            self._response(200, metrics.to_json(), 'application/json')
+        else:
+            # Prometheus text exposition format
+            self._response(200, metrics.to_prometheus(), 'text/plain; version=0.0.4; charset=utf-8')
+
     def _response(self, code, content='', content_type='text/plain'):
         self.server_version = SERVER_VERSION
         self.send_response(code)
@@ -54,6 +54,10 @@ def cache_folder() -> str:
     )
 
 
+def log_folder() -> str:
+    return os.path.join(cache_folder(), 'logs')
+
+
 def plugin_folder() -> str:
     appdata_folder = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
     return os.path.normpath(os.environ.get('PICARD_PLUGIN_DIR', os.path.join(appdata_folder, 'plugins3')))
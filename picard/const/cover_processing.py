@@ -226,5 +226,8 @@ def get_image_format_from_format(format_string: str) -> ImageFormat | None:
 
 COVER_PROCESSING_SLEEP = 0.001
 
+# Maximum number of images waiting for a cover art worker process
+COVER_PROCESSING_PROCESS_QUEUE_SIZE = 64
+
 
 ALLOWED_QT_FORMATS: set[str] = {x.data().decode('utf-8') for x in QtGui.QImageWriter.supportedImageFormats()}
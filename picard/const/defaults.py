@@ -102,8 +102,15 @@ DEFAULT_CA_PROVIDERS = [
 DEFAULT_COVER_IMAGE_FILENAME = 'cover'
 
 DEFAULT_FPCALC_THREADS = 2
+# Maximum number of fingerprints kept in the fingerprint cache, 0 disables the cache
+DEFAULT_FINGERPRINT_CACHE_SIZE = 50000
 DEFAULT_PROGRAM_UPDATE_LEVEL = 0
 
+# Padding of tags, see picard.formats.padding
+DEFAULT_TAG_PADDING_POLICY = 'default'
+DEFAULT_TAG_PADDING_SIZE_KB = 64
+DEFAULT_TAG_PADDING_PERCENT = 1
+
 # On macOS it is not common that the global menu shows icons
 DEFAULT_SHOW_MENU_ICONS = not IS_MACOS
 
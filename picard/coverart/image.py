@@ -459,16 +459,25 @@ class CoverArtImage:
         filename = make_save_path(filename, win_compat=win_compat, mac_compat=IS_MACOS)
         return filename
 
-    def save(self, dirname: str, metadata: Metadata, counters: dict[str, int]) -> None:
+    def save(
+        self,
+        dirname: str,
+        metadata: Metadata,
+        counters: dict[str, int],
+        saved_images: set[tuple[str, str]] | None = None,
+    ) -> None:
         """Saves this image.
 
         :dirname: The name of the directory that contains the audio file
         :metadata: A metadata object
         :counters: A dictionary mapping filenames to the amount of how many
                     images with that filename were already saved in `dirname`.
+        :saved_images: Optional set of (filename, data hash) of the images
+                    already saved by other files of the same batch, images
+                    found in it are not saved again.
         """
         if self.external_file_coverart is not None:
-            self.external_file_coverart.save(dirname, metadata, counters)
+            self.external_file_coverart.save(dirname, metadata, counters, saved_images)
             return
         if not self.can_be_saved_to_disk:
             return
@@ -486,6 +495,10 @@ class CoverArtImage:
         overwrite = config.setting['save_images_overwrite']
         ext = self.extension
         image_filename = self._next_filename(filename, counters)
+        saved_key = (image_filename + ext, self.datahash.hash)
+        if saved_images is not None and saved_key in saved_images:
+            log.debug("Cover image %r already saved for another file", image_filename + ext)
+            return
         while os.path.exists(image_filename + ext) and not overwrite:
             if not self._is_write_needed(image_filename + ext):
                 break
@@ -494,16 +507,17 @@ class CoverArtImage:
             new_filename = image_filename + ext
             # Even if overwrite is enabled we don't need to write the same
             # image multiple times
-            if not self._is_write_needed(new_filename):
-                return
-            log.debug("Saving cover image to %r", new_filename)
-            try:
-                new_dirname = os.path.dirname(new_filename)
-                os.makedirs(new_dirname, exist_ok=True)
-                assert self.tempfile_filename is not None
-                shutil.copyfile(self.tempfile_filename, new_filename)
-            except OSError as e:
-                raise CoverArtImageIOError(e) from e
+            if self._is_write_needed(new_filename):
+                log.debug("Saving cover image to %r", new_filename)
+                try:
+                    new_dirname = os.path.dirname(new_filename)
+                    os.makedirs(new_dirname, exist_ok=True)
+                    assert self.tempfile_filename is not None
+                    shutil.copyfile(self.tempfile_filename, new_filename)
+                except OSError as e:
+                    raise CoverArtImageIOError(e) from e
+        if saved_images is not None:
+            saved_images.add(saved_key)
 
     @staticmethod
     def _next_filename(filename, counters):
@@ -37,6 +37,12 @@ from picard.coverart.processing import (  # noqa: F401 # pylint: disable=unused-
     filters,
     processors,
 )
+from picard.coverart.processing.executor import (
+    ProcessingResult,
+    get_process_executor,
+    processors_are_process_safe,
+    settings_snapshot,
+)
 from picard.debug_opts import DebugOpt
 from picard.extension_points.cover_art_filters import (
     ext_point_cover_art_filters,
@@ -53,6 +59,12 @@ from picard.util.imageinfo import (
     IdentificationError,
     ImageInfo,
 )
+from picard.util.metrics import metrics
+
+
+COVERART_PROCESSING_SECONDS = metrics.histogram(
+    'coverart_processing_seconds', "Time to process a cover art image, including waiting for a worker"
+)
 
 
 def run_image_filters(data: bytes, image_info: ImageInfo, album: Album, coverartimage: CoverArtImage) -> bool:
@@ -186,6 +198,60 @@ class CoverArtImageProcessing:
                 coverartimage.set_external_file_data(initial_data)
             raise
 
+    def _apply_process_result(
+        self,
+        coverartimage: CoverArtImage,
+        initial_data: bytes,
+        save_images_to_files: bool,
+        result: ProcessingResult | None,
+        error: BaseException | None,
+    ) -> None:
+        try:
+            if error is not None:
+                coverartimage.set_data(initial_data)
+                if save_images_to_files:
+                    coverartimage.set_external_file_data(initial_data)
+                # Report the failure to the album, as processing in a thread does
+                if isinstance(error, (CoverArtImageError, CoverArtProcessingError)):
+                    self.errors.put(error)
+                else:
+                    self.errors.put(CoverArtProcessingError(error))
+                return
+            if result.tags_data is not None:
+                coverartimage.set_data(result.tags_data)
+            if result.file_data is not None:
+                coverartimage.set_external_file_data(result.file_data)
+            for e in result.errors:
+                self.errors.put(e)
+        except CoverArtImageError as e:
+            self.errors.put(e)
+
+    def _run_image_processors_in_process(
+        self,
+        coverartimage: CoverArtImage,
+        initial_data: bytes,
+        image_info: ImageInfo,
+        callback: Callable[[CoverArtImage, Exception | None], None],
+    ) -> bool:
+        executor = get_process_executor()
+        if executor is None or not processors_are_process_safe(self.queues):
+            return False
+
+        settings = settings_snapshot()
+
+        def on_finished(result: ProcessingResult | None, error: BaseException | None):
+            try:
+                self._apply_process_result(coverartimage, initial_data, settings['save_images_to_files'], result, error)
+            finally:
+                thread.to_main(callback, coverartimage, error)
+                self.task_counter.decrement()
+
+        self.task_counter.increment()
+        if executor.submit(initial_data, image_info, settings, on_finished):
+            return True
+        self.task_counter.decrement()
+        return False
+
     def run_image_processors(
         self,
         coverartimage: CoverArtImage,
@@ -194,10 +260,18 @@ class CoverArtImageProcessing:
         callback: Callable[[CoverArtImage, Exception | None], None],
     ) -> None:
         if coverartimage.can_be_processed:
+            start_time = time.perf_counter()
+
+            def timed_callback(coverartimage, error):
+                COVERART_PROCESSING_SECONDS.observe(time.perf_counter() - start_time)
+                callback(coverartimage, error)
+
+            if self._run_image_processors_in_process(coverartimage, initial_data, image_info, timed_callback):
+                return
             run_processors = partial(self._run_image_processors, coverartimage, initial_data, image_info)
 
             def next_func(result=None, error=None):
-                callback(coverartimage, error)
+                timed_callback(coverartimage, error)
 
             thread.run_task(run_processors, next_func=next_func, task_counter=self.task_counter)
         else:
@@ -0,0 +1,336 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Process pool backend for cover art image processing.
+
+Image decoding, scaling and encoding hold the GIL for a considerable amount
+of time. Running them in separate processes keeps the shared thread pool
+available for file loading. Only raw image bytes and a snapshot of the
+relevant settings are passed to the worker processes, the results are
+returned as raw bytes again.
+"""
+
+from collections import deque
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+import concurrent.futures
+from dataclasses import (
+    dataclass,
+    field,
+)
+import multiprocessing
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from picard import log
+from picard.config import get_config
+from picard.const.cover_processing import COVER_PROCESSING_PROCESS_QUEUE_SIZE
+from picard.debug_opts import DebugOpt
+from picard.extension_points.cover_art_processors import (
+    CoverArtProcessingError,
+    ImageProcessor,
+    ProcessingImage,
+)
+from picard.util.bytes2human import binary as bytes2human_binary
+from picard.util.imageinfo import ImageInfo
+
+
+# Settings read by the built-in image processors. A snapshot of those is
+# passed to the worker processes, which do not have access to the config.
+PROCESSING_SETTINGS = (
+    'save_images_to_tags',
+    'save_images_to_files',
+    'cover_tags_enlarge',
+    'cover_tags_resize',
+    'cover_tags_resize_target_width',
+    'cover_tags_resize_target_height',
+    'cover_tags_resize_mode',
+    'cover_tags_convert_images',
+    'cover_tags_convert_to_format',
+    'cover_file_enlarge',
+    'cover_file_resize',
+    'cover_file_resize_target_width',
+    'cover_file_resize_target_height',
+    'cover_file_resize_mode',
+    'cover_file_convert_images',
+    'cover_file_convert_to_format',
+    'cover_image_quality',
+)
+
+
+@dataclass
+class ProcessingResult:
+    tags_data: bytes | None = None
+    file_data: bytes | None = None
+    errors: list[Exception] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+@dataclass
+class ProcessPoolStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    processing_time: float = 0.0
+    queue_time: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of processed images per second"""
+        elapsed = time.monotonic() - self.started
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+def processors_are_process_safe(queues: dict[ImageProcessor.Target, list[ImageProcessor]]) -> bool:
+    """Returns True if all processors in queues can run in a worker process"""
+    return all(processor.process_safe for queue in queues.values() for processor in queue)
+
+
+def settings_snapshot(names: Iterable[str] = PROCESSING_SETTINGS) -> dict[str, Any]:
+    setting = get_config().setting
+    return {name: setting[name] for name in names}
+
+
+def _install_settings(settings: dict[str, Any]) -> None:
+    # Worker processes have no config set up, provide a read-only stand-in
+    # exposing the settings snapshot to the processors.
+    from picard import config
+
+    config.config = SimpleNamespace(setting=settings)
+    config.setting = settings
+
+
+def _run_queue(queue: list[ImageProcessor], image: ProcessingImage, target: ImageProcessor.Target, errors: list):
+    try:
+        for processor in queue:
+            processor.run(image, target)
+    except CoverArtProcessingError as e:
+        errors.append(e)
+    return image.get_result()
+
+
+def process_image_data(
+    initial_data: bytes,
+    image_info: ImageInfo,
+    settings: dict[str, Any],
+) -> ProcessingResult:
+    """Run the cover art processors on initial_data inside a worker process.
+
+    Processors for tags and files are run sequentially, parallelism is
+    achieved by running several worker processes.
+    """
+    # Importing the processors module registers the built-in processors
+    from picard.coverart.processing import processors  # noqa: F401 # pylint: disable=unused-import
+    from picard.extension_points.cover_art_processors import get_cover_art_processors
+
+    _install_settings(settings)
+    start_time = time.perf_counter()
+    save_images_to_tags = settings['save_images_to_tags']
+    save_images_to_files = settings['save_images_to_files']
+    result = ProcessingResult()
+    queues = get_cover_art_processors()
+    image = ProcessingImage(initial_data, image_info)
+
+    if not save_images_to_tags and not save_images_to_files:
+        result.tags_data = initial_data
+    else:
+        same_errors = []
+        data = _run_queue(queues[ImageProcessor.Target.SAME], image, ImageProcessor.Target.SAME, same_errors)
+        if same_errors:
+            result.errors.extend(same_errors)
+            result.tags_data = initial_data
+            if save_images_to_files:
+                result.file_data = initial_data
+            result.elapsed = time.perf_counter() - start_time
+            return result
+        result.tags_data = data if save_images_to_tags else initial_data
+        if save_images_to_files:
+            result.file_data = _run_queue(
+                queues[ImageProcessor.Target.FILE], image.copy(), ImageProcessor.Target.FILE, result.errors
+            )
+        if save_images_to_tags:
+            result.tags_data = _run_queue(
+                queues[ImageProcessor.Target.TAGS], image.copy(), ImageProcessor.Target.TAGS, result.errors
+            )
+
+    result.elapsed = time.perf_counter() - start_time
+    return result
+
+
+@dataclass
+class _Job:
+    initial_data: bytes
+    image_info: ImageInfo
+    settings: dict[str, Any]
+    callback: Callable[[ProcessingResult | None, BaseException | None], None]
+    queued: float = field(default_factory=time.monotonic)
+
+
+class CoverArtProcessExecutor:
+    """Runs cover art processing in a pool of worker processes.
+
+    The number of jobs handed to the process pool at once is limited to the
+    number of worker processes, further jobs wait in a bounded queue.
+    `submit` returns False if this queue is full, callers are expected to
+    process the image themselves in this case.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int = COVER_PROCESSING_PROCESS_QUEUE_SIZE):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.stats = ProcessPoolStats()
+        self._executor = None
+        self._queue = deque()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            # Always spawn new processes, forking a running Qt application is unsafe
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._queue) + self._in_flight
+
+    def submit(
+        self,
+        initial_data: bytes,
+        image_info: ImageInfo,
+        settings: dict[str, Any],
+        callback: Callable[[ProcessingResult | None, BaseException | None], None],
+    ) -> bool:
+        """Queue image processing of initial_data.
+
+        callback gets called with the `ProcessingResult` or an exception once
+        processing has finished. It is not called on the main thread.
+        Returns False if the queue is full and the job was not accepted.
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queued:
+                self.stats.rejected += 1
+                return False
+            self._queue.append(_Job(initial_data, image_info, settings, callback))
+            self.stats.submitted += 1
+        self._dispatch()
+        return True
+
+    def _dispatch(self):
+        while True:
+            with self._lock:
+                if not self._queue or self._in_flight >= self.max_workers:
+                    return
+                job = self._queue.popleft()
+                self._in_flight += 1
+            try:
+                future = self._get_executor().submit(process_image_data, job.initial_data, job.image_info, job.settings)
+            except Exception as e:
+                self._finished(job, None, e)
+            else:
+                future.add_done_callback(lambda f, job=job: self._on_done(job, f))
+
+    def _on_done(self, job: _Job, future: concurrent.futures.Future):
+        try:
+            result = future.result()
+        except Exception as e:
+            self._finished(job, None, e)
+        else:
+            self._finished(job, result, None)
+
+    def _finished(self, job: _Job, result: ProcessingResult | None, error: BaseException | None):
+        with self._lock:
+            self._in_flight -= 1
+            stats = self.stats
+            stats.queue_time += time.monotonic() - job.queued
+            stats.bytes_in += len(job.initial_data)
+            if error is None:
+                stats.completed += 1
+                stats.processing_time += result.elapsed
+                stats.bytes_out += len(result.tags_data or b'') + len(result.file_data or b'')
+            else:
+                stats.failed += 1
+        if error is not None:
+            log.error("Cover art processing in worker process failed: %s", error)
+        elif DebugOpt.COVERART.enabled:
+            log.debug(
+                "Cover art processed in worker process in %.1f ms;"
+                " %d done, %d failed, %d rejected, %d pending,"
+                " %.2f images/s, avg. %.1f ms processing, avg. %.1f ms total, %s in, %s out",
+                1000 * result.elapsed,
+                stats.completed,
+                stats.failed,
+                stats.rejected,
+                self.pending,
+                stats.throughput,
+                1000 * stats.processing_time / max(stats.completed, 1),
+                1000 * stats.queue_time / max(stats.completed + stats.failed, 1),
+                bytes2human_binary(stats.bytes_in),
+                bytes2human_binary(stats.bytes_out),
+            )
+        try:
+            job.callback(result, error)
+        finally:
+            self._dispatch()
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            queued = list(self._queue)
+            self._queue.clear()
+        for job in queued:
+            job.callback(None, CoverArtProcessingError("Cover art process pool was shut down"))
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_process_executor: CoverArtProcessExecutor | None = None
+
+
+def get_process_executor() -> CoverArtProcessExecutor | None:
+    """Returns the shared process executor.
+
+    Returns None if processing in separate processes is disabled. The
+    executor gets recreated if the configured number of processes changed.
+    """
+    global _process_executor
+    processes = get_config().setting['cover_processing_processes']
+    if _process_executor is not None and _process_executor.max_workers != processes:
+        _process_executor.shutdown(wait=False)
+        _process_executor = None
+    if processes > 0 and _process_executor is None:
+        _process_executor = CoverArtProcessExecutor(processes)
+    return _process_executor
+
+
+def shutdown_process_executor():
+    global _process_executor
+    if _process_executor is not None:
+        _process_executor.shutdown()
+        _process_executor = None
@@ -35,6 +35,8 @@ from picard.extension_points.cover_art_processors import (
 
 
 class ResizeImage(ImageProcessor):
+    process_safe = True
+
     def target(self):
         setting = get_config().setting
         cover_tags_resize = setting['cover_tags_resize']
@@ -122,6 +124,8 @@ class ResizeImage(ImageProcessor):
 
 
 class ConvertImage(ImageProcessor):
+    process_safe = True
+
     def target(self):
         config = get_config()
         tags_convert_images = config.setting['cover_tags_convert_images']
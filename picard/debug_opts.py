@@ -171,3 +171,9 @@ class DebugOpt(DebugOptEnum):
     TIMINGS = 10, N_('Timings'), N_('Log timing information for operations affecting UI responsiveness')
     ISRC = 11, N_('ISRC'), N_('Log ISRC processing, submission, and lookup details')
     RATECONTROL = 12, N_('Rate Control'), N_('Log request throttling, congestion window, and backoff details')
+    GUI_STALLS = 13, N_('GUI Stalls'), N_('Detect and log stalls of the user interface and where they happen')
+    PROFILING = (
+        14,
+        N_('Profiling'),
+        N_('Profile CPU time and memory allocations, results are written to the log folder'),
+    )
@@ -52,8 +52,6 @@ from picard.util.isrc import (
 )
 from picard.util.mbserver import build_submission_url
 
-from picard.ui.cdlookup import CDLookupDialog
-
 
 class Disc:
     def __init__(self, id: str | None = None):
@@ -198,9 +196,15 @@ class Disc:
             except (AttributeError, IndexError):
                 log.error(traceback.format_exc())
 
-        dialog = CDLookupDialog(releases, self, parent=self.tagger.window)
+        dialog = self._lookup_dialog(releases)
         dialog.exec()
 
+    def _lookup_dialog(self, releases):
+        # Local import: the dialog is only needed once a disc was looked up
+        from picard.ui.cdlookup import CDLookupDialog
+
+        return CDLookupDialog(releases, self, parent=self.tagger.window)
+
     def _toc_lookup_finished(self, document, http, error):
         """Handle the result of a TOC lookup."""
         self.tagger.restore_cursor()
@@ -225,7 +229,7 @@ class Disc:
             return
 
         # Otherwise show the dialog for user to select
-        dialog = CDLookupDialog(releases, self, parent=self.tagger.window)
+        dialog = self._lookup_dialog(releases)
         # If files were provided, match them after user selection
         if self._files_to_match:
             dialog.accepted.connect(partial(self._on_dialog_accepted, dialog))
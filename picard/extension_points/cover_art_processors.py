@@ -152,6 +152,10 @@ class ImageProcessor:
         # processing is identical for tags and files
         SAME = auto()
 
+    # Set to True if the processor only depends on the image data and the cover
+    # art processing settings, allowing it to run in a separate worker process.
+    process_safe = False
+
     def target(self) -> Target:
         """Return the processing target for this image processor.
 
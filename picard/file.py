@@ -64,12 +64,14 @@ import time
 from typing import (
     IO,
     TYPE_CHECKING,
+    NamedTuple,
 )
 import weakref
 
 from mutagen import (
     FileType,
     MutagenError,
+    PaddingInfo,
 )
 
 from picard import (
@@ -96,6 +98,7 @@ from picard.matching import (
 from picard.metadata import Metadata
 from picard.plugin import PluginFunctions
 from picard.script import get_file_naming_script
+from picard.session.session_journal import session_journal
 from picard.tags import (
     ALL_TAGS,
     calculated_tag_names,
@@ -122,9 +125,9 @@ from picard.util.filenaming import (
     move_ensure_casing,
 )
 from picard.util.imagelist import ImageList
+from picard.util.metrics import metrics
 from picard.util.scripttofilename import script_to_filename_with_metadata
-
-from picard.ui.filter import Filter
+from picard.util.settingscache import settings_cache
 
 
 if TYPE_CHECKING:
@@ -134,6 +137,10 @@ if TYPE_CHECKING:
     from picard.track import Track
 
 
+FILE_LOAD_SECONDS = metrics.histogram('file_load_seconds', "Time to read the tags of a file")
+FILE_SAVE_SECONDS = metrics.histogram('file_save_seconds', "Time to write the tags of a file")
+FILE_TAG_WRITES = metrics.counter('file_tag_writes_total', "Number of saved files by whether the tags were written")
+
 FILE_COMPARISON_WEIGHTS = {
     'identifiers': {
         'barcode': 28,
@@ -213,6 +220,13 @@ class FileIdentity:
     def __bool__(self):
         return self._exists
 
+    @property
+    def cache_key(self) -> str | None:
+        """A string identifying the file content, or None if the file could not be read"""
+        if not self._exists or self._hash is None:
+            return None
+        return f'{self._inode}:{self._size}:{self._mtime!r}:{self._hash}'
+
     def _fast_hash(self):
         try:
             with open(self._filepath, "rb") as fh:
@@ -224,6 +238,69 @@ class FileIdentity:
             raise FileIdentityError(f"Failed to hash file {self._filepath}") from e
 
 
+class FileLoadResult(NamedTuple):
+    """Result of loading a file in a worker thread"""
+
+    metadata: Metadata
+    identity: FileIdentity
+
+
+class FileSaveResult(NamedTuple):
+    """Result of saving a file in a worker thread"""
+
+    filename: str
+    identity: FileIdentity
+    tags_written: bool = True
+
+
+class TagFormat(NamedTuple):
+    """Layout of the tags in a file which settings change without changing any tag value.
+
+    Recorded by the formats when loading and saving, see File._tag_format_changed().
+    """
+
+    id3_version: int | None = None
+    id3_encodings: frozenset[int] = frozenset()
+    id3v23_join_with: str | None = None
+    has_id3v1: bool = False
+    has_apev2: bool = False
+    has_id3: bool = False
+    padding: PaddingInfo | None = None
+
+
+class SaveBatch:
+    """State shared by the files saved together.
+
+    Counts the files whose tags were written or skipped, `callback` is called
+    with the batch once all files have finished saving.
+
+    `saved_images` holds the external cover art files already handled in this
+    batch, so tracks of the same album do not each check and write the same
+    image file. It is only accessed from the single save thread.
+    """
+
+    def __init__(self, total: int, callback: 'Callable[[SaveBatch], None]'):
+        self.total = total
+        self.callback = callback
+        self.written = 0
+        self.skipped = 0
+        self.failed = 0
+        self.saved_images = set()
+
+    def add(self, result: FileSaveResult | None = None, error=None):
+        """Records the outcome of saving one file, a None result means it was not saved"""
+        if error is not None:
+            self.failed += 1
+        elif result is None:
+            self.total -= 1
+        elif result.tags_written:
+            self.written += 1
+        else:
+            self.skipped += 1
+        if self.written + self.skipped + self.failed >= self.total:
+            self.callback(self)
+
+
 class File(MetadataItem):
     NAME: str | None = None
     # Logical tag format key and description for the family of this handler.
@@ -263,6 +340,9 @@ class File(MetadataItem):
     # files is cached, set @state.setter
     num_pending_files = 0
 
+    # Set by the formats which record the layout of their tags
+    _tag_format: TagFormat | None = None
+
     def __init__(self, filename: str):
         super().__init__()
         self.filename: str = filename
@@ -362,7 +442,12 @@ class File(MetadataItem):
         if self.tagger.stopping:
             log.debug("File not loaded because %s is stopping: %r", PICARD_APP_NAME, self.filename)
             return None
-        return self._load(filename)
+        # Captured before the tags get read, so changes while loading are
+        # detected on save. Reading the file start also warms the OS cache.
+        identity = FileIdentity(filename)
+        with FILE_LOAD_SECONDS.time(format=type(self).__name__):
+            metadata = self._load(filename)
+        return FileLoadResult(metadata, identity)
 
     def _load(self, filename: str) -> Metadata:
         """Load metadata from the file."""
@@ -400,11 +485,11 @@ class File(MetadataItem):
         else:
             self.clear_errors()
             self.state = self.State.NORMAL
-            self._loaded_identity = FileIdentity(self.filename)
+            self._loaded_identity = result.identity
             postprocessors = []
             if config.setting['guess_tracknumber_and_title']:
                 postprocessors.append(self._guess_tracknumber_and_title)
-            self._copy_loaded_metadata(result, postprocessors)
+            self._copy_loaded_metadata(result.metadata, postprocessors)
         # use cached fingerprint from file metadata
         if not config.setting['ignore_existing_acoustid_fingerprints']:
             fingerprints = self.metadata.getall('acoustid_fingerprint')
@@ -412,7 +497,6 @@ class File(MetadataItem):
                 self.set_acoustid_fingerprint(fingerprints[0])
         run_file_post_load_processors(self)
         callback(self)
-        Filter.apply_filters()
 
     def _copy_loaded_metadata(self, metadata, postprocessors=None):
         metadata['~length'] = format_time(metadata.length)
@@ -468,7 +552,7 @@ class File(MetadataItem):
     def has_error(self):
         return self.state == File.State.ERROR
 
-    def save(self):
+    def save(self, batch: SaveBatch | None = None):
         self.set_pending()
         run_file_pre_save_processors(self)
         # On Windows, ask the internal player to release this file before
@@ -477,12 +561,58 @@ class File(MetadataItem):
             self._release_file_from_player(self.filename)
         metadata = Metadata()
         metadata.copy(self.metadata)
+        config = get_config()
+        write_tags = not config.setting['skip_unchanged_tag_writes'] or self._tags_changed(metadata, config.setting)
         thread.run_task(
-            partial(self._save_and_rename, self.filename, metadata),
-            self._saving_finished,
+            partial(self._save_check, self.filename, metadata, write_tags, batch),
+            partial(self._saving_finished, batch=batch),
             thread_pool=self.tagger.save_thread_pool,
         )
 
+    def _tags_changed(self, metadata: Metadata, settings) -> bool:
+        """Returns whether saving metadata would change the tags in the file.
+
+        Compares the values as they would be written, see _format_specific_copy(),
+        the embedded images and the deleted tags with orig_metadata. With
+        clear_existing_tags the file may contain tags Picard did not load, so
+        the tags are always considered changed. Settings which change the
+        written file without changing the values, like the ID3 version, are
+        checked by _tag_format_changed().
+        """
+        if settings['clear_existing_tags']:
+            return True
+        if self._tag_format_changed(metadata, settings):
+            return True
+        if any(self._is_written_tag(name) for name in metadata.deleted_tags):
+            return True
+        for name in metadata:
+            if not self._is_written_tag(name):
+                continue
+            new_values = self.format_specific_metadata(metadata, name, settings)
+            if new_values and new_values != self.orig_metadata.getall(name):
+                return True
+        return self.orig_metadata.images != self._expected_embedded_images()
+
+    def _tag_format_changed(self, metadata: Metadata, settings) -> bool:
+        """Returns whether saving with settings changes the layout of the tags.
+
+        The base implementation checks the padding, formats recording more
+        details in _tag_format extend it.
+        """
+        tag_format = self._tag_format
+        if tag_format is None or tag_format.padding is None:
+            return False
+        # Local import: picard.formats imports this module
+        from picard.formats.padding import padding_changes
+
+        return padding_changes(tag_format.padding, metadata, settings)
+
+    def _is_written_tag(self, name: str) -> bool:
+        if name.startswith('~'):
+            # Hidden variables are not saved, except for the rating and raw ID3 frames
+            return name == '~rating' or (name.startswith('~id3') and self.supports_tag(name))
+        return self.supports_tag(name)
+
     def _preserve_times(self, filename, func):
         """Save filename times before calling func, and set them again"""
         try:
@@ -537,8 +667,25 @@ class File(MetadataItem):
         if player:
             player.release_file(filename)
 
-    def _save_and_rename(self, old_filename, metadata):
-        """Save the metadata."""
+    def _save_check(self, old_filename, metadata, write_tags=True, batch=None):
+        if not write_tags and FileIdentity(old_filename) != self._loaded_identity:
+            # The tags in the file may differ from orig_metadata
+            log.debug("File %r changed since it was loaded, writing tags", old_filename)
+            write_tags = True
+        saved_images = batch.saved_images if batch is not None else None
+        new_filename = self._save_and_rename(old_filename, metadata, write_tags, saved_images)
+        if new_filename is None:
+            return None
+        tags_written = write_tags and get_config().setting['enable_tag_saving']
+        return FileSaveResult(new_filename, FileIdentity(new_filename), tags_written)
+
+    def _save_and_rename(self, old_filename, metadata, write_tags=True, saved_images=None):
+        """Save the metadata.
+
+        If write_tags is False the tags in the file are already up to date and
+        only renaming and moving is done. saved_images is passed on to
+        CoverArtImage.save().
+        """
         config = get_config()
         # Check that file has not been removed since thread was queued
         # Also don't save if we are stopping.
@@ -556,14 +703,11 @@ class File(MetadataItem):
                 log.warning("File externally modified.")
             elif not current:
                 log.warning("File missing!")
-            save = partial(self._save, old_filename, metadata)
-            if config.setting['preserve_timestamps']:
-                try:
-                    self._retry_on_permission_error(partial(self._preserve_times, old_filename, save))
-                except self.PreserveTimesUtimeError as why:
-                    log.warning(why)
+            if write_tags:
+                self._write_tags(old_filename, metadata, config)
             else:
-                self._retry_on_permission_error(save)
+                log.debug("Tags of %r are unchanged, not writing them", old_filename)
+                FILE_TAG_WRITES.inc(result='skipped')
         # Rename files
         if config.setting['rename_files'] or config.setting['move_files']:
             new_filename = self._rename(old_filename, metadata, config.setting)
@@ -586,9 +730,21 @@ class File(MetadataItem):
                 log.debug("Not removing empty directory: %s", why)
         # Save cover art images
         if config.setting['save_images_to_files']:
-            self._save_images(os.path.dirname(new_filename), metadata)
+            self._save_images(os.path.dirname(new_filename), metadata, saved_images)
         return new_filename
 
+    def _write_tags(self, filename, metadata, config):
+        save = partial(self._save, filename, metadata)
+        with FILE_SAVE_SECONDS.time(format=type(self).__name__):
+            if config.setting['preserve_timestamps']:
+                try:
+                    self._retry_on_permission_error(partial(self._preserve_times, filename, save))
+                except self.PreserveTimesUtimeError as why:
+                    log.warning(why)
+            else:
+                self._retry_on_permission_error(save)
+        FILE_TAG_WRITES.inc(result='written')
+
     def _expected_embedded_images(self) -> 'ImageList':
         """Images that should end up embedded in tags for the current metadata.
 
@@ -605,7 +761,9 @@ class File(MetadataItem):
         else:
             return self.orig_metadata.images.copy()
 
-    def _saving_finished(self, result=None, error=None):
+    def _saving_finished(self, result=None, error=None, batch=None):
+        if batch is not None:
+            batch.add(result, error)
         # Handle file removed before save
         # Result is None if save was skipped
         if (self.state == File.State.REMOVED or self.tagger.stopping) and result is None:
@@ -614,7 +772,7 @@ class File(MetadataItem):
         if error is not None:
             self._set_error(error)
         else:
-            self.filename = new_filename = resolve_fs_path(result)
+            self.filename = new_filename = resolve_fs_path(result.filename)
             self.base_filename = os.path.basename(new_filename)
             length = self.orig_metadata.length
             temp_info = {}
@@ -644,7 +802,7 @@ class File(MetadataItem):
             self._update_filesystem_metadata(self.orig_metadata)
             if images_changed:
                 self.metadata_images_changed.emit()
-            self._loaded_identity = FileIdentity(self.filename)
+            self._loaded_identity = result.identity
             # run post save hook
             run_file_post_save_processors(self)
 
@@ -791,11 +949,11 @@ class File(MetadataItem):
                 )
                 time.sleep(self._PERMISSION_ERROR_RETRY_DELAY)
 
-    def _save_images(self, dirname, metadata):
+    def _save_images(self, dirname, metadata, saved_images=None):
         """Save the cover images to disk."""
         counters = Counter()
         for image in metadata.images.to_be_saved_to_files(previous_images=self.orig_metadata.images):
-            image.save(dirname, metadata, counters)
+            image.save(dirname, metadata, counters, saved_images)
 
     def _move_additional_files(self, old_filename, new_filename, config):
         """Move extra files, like images, playlists…"""
@@ -803,8 +961,9 @@ class File(MetadataItem):
             new_path = os.path.dirname(new_filename)
             old_path = os.path.dirname(old_filename)
             if new_path != old_path:
-                patterns_string = config.setting['move_additional_files_pattern']
-                patterns = self._compile_move_additional_files_pattern(patterns_string)
+                patterns = settings_cache.get(
+                    'move_additional_files_pattern', self._compile_move_additional_files_pattern
+                )
                 try:
                     moves = self._get_additional_files_moves(old_path, new_path, patterns)
                     self._apply_additional_files_moves(moves, config.setting['move_overwrite_existing_files'])
@@ -853,6 +1012,7 @@ class File(MetadataItem):
         self.tagger.acoustidmanager.remove(self)
         self.tagger.isrc_submit_manager.remove(self)
         self.state = File.State.REMOVED
+        session_journal.file_removed(self)
 
     def move(self, to_parent_item):
         # To be able to move a file the target must implement add_file(file)
@@ -1287,6 +1447,7 @@ class File(MetadataItem):
                 self.update_item(update_selection=False)
 
     def update_item(self, update_selection=True):
+        session_journal.file_changed(self)
         if self.ui_item:
             self.ui_item.update(update_selection=update_selection)
 
@@ -40,12 +40,14 @@
 
 from collections import Counter
 from enum import IntEnum
+import os
 import re
 from types import MappingProxyType
 from urllib.parse import urlparse
 
 from mutagen import (
     FileType,
+    PaddingInfo,
     id3,
 )
 import mutagen.aiff
@@ -63,11 +65,16 @@ from picard.coverart.image import (
     TagCoverArtImage,
 )
 from picard.coverart.utils import types_from_id3
-from picard.file import File
+from picard.file import (
+    File,
+    TagFormat,
+)
 from picard.formats.mutagenext import (
     compatid3,
     delall_ci,
 )
+from picard.formats.padding import TagPadding
+from picard.formats.util import has_id3v1
 from picard.i18n import N_
 from picard.metadata import Metadata
 from picard.tags import (
@@ -139,6 +146,8 @@ class ID3File(File):
     """Generic ID3-based file."""
 
     _IsMP3 = False
+    # Whether _save_tags() writes or removes an ID3v1 tag as configured
+    _writes_id3v1 = True
     FORMAT_KEY = 'id3'
     FORMAT_DESCRIPTION = N_("ID3 (MP3, AIFF)")
     _File: type[FileType] | None = None
@@ -353,6 +362,7 @@ class ID3File(File):
         """Initialize loading process and return necessary parameters."""
         self.__casemap = {}
         file = self._get_file(filename)
+        self._tag_format = self._read_tag_format(file, filename)
         tags = file.tags or {}
         config = get_config()
 
@@ -365,6 +375,72 @@ class ID3File(File):
             'rating_steps': config.setting['rating_steps'],
         }
 
+    def _read_tag_format(self, file, filename):
+        """Returns the layout of the ID3 tags of the loaded mutagen file"""
+        tags = file.tags
+        if tags is None:
+            return TagFormat(has_id3v1=has_id3v1(filename), has_apev2=self._has_apev2(filename))
+        padding = getattr(tags, '_padding', None)
+        if padding is not None:
+            padding = PaddingInfo(padding, os.path.getsize(filename) - tags.size)
+        return TagFormat(
+            id3_version=tags.version[1],
+            id3_encodings=self._text_frame_encodings(tags),
+            has_id3v1=has_id3v1(filename),
+            has_apev2=self._has_apev2(filename),
+            padding=padding,
+        )
+
+    def _text_frame_encodings(self, tags):
+        """Encodings of the loaded text frames, which get written with the configured encoding"""
+        return frozenset(
+            frame.encoding
+            for frame in tags.values()
+            if isinstance(frame, id3.TextFrame)
+            and not isinstance(frame, id3.NumericPartTextFrame)
+            and (frame.FrameID in self.__translate or frame.FrameID == 'TXXX')
+        )
+
+    @staticmethod
+    def _written_encoding(settings):
+        """Encoding of the text frames in the file after saving with settings"""
+        encoding = Id3Encoding.from_config(settings['id3v2_encoding'])
+        if settings['write_id3v23'] and encoding not in {Id3Encoding.LATIN1, Id3Encoding.UTF16}:
+            # ID3v2.3 only supports Latin-1 and UTF-16, mutagen converts to UTF-16
+            encoding = Id3Encoding.UTF16
+        return encoding
+
+    def _has_apev2(self, filename):
+        if not self._IsMP3:
+            return False
+        try:
+            mutagen.apev2.APEv2(filename)
+        except mutagen.apev2.error:
+            return False
+        return True
+
+    def _tag_format_changed(self, metadata, settings):
+        tag_format = self._tag_format
+        if tag_format is None:
+            return False
+        id3_version = 3 if settings['write_id3v23'] else 4
+        if tag_format.id3_version is not None and tag_format.id3_version != id3_version:
+            return True
+        if tag_format.id3_encodings - {self._written_encoding(settings)}:
+            return True
+        # The separator used in existing ID3v2.3 tags is only known after saving them
+        if (
+            id3_version == 3
+            and tag_format.id3v23_join_with is not None
+            and tag_format.id3v23_join_with != settings['id3v23_join_with']
+        ):
+            return True
+        if self._writes_id3v1 and tag_format.has_id3v1 != settings['write_id3v1']:
+            return True
+        if tag_format.has_apev2 and settings['remove_ape_from_mp3']:
+            return True
+        return super()._tag_format_changed(metadata, settings)
+
     def _upgrade_23_frames(self, tags):
         """Upgrade ID3v2.3 frames to ID3v2.4 format."""
         for old, new in self.__upgrade.items():
@@ -606,14 +682,28 @@ class ID3File(File):
         self._save_people_frames(tags, people_frames)
         self._remove_deleted_tags(tags, metadata, config_params)
 
-        self._save_tags(tags, filename)
+        padding = TagPadding.from_config(metadata)
+        self._save_tags(tags, filename, padding=padding)
+        padding.record(type(self).__name__, filename)
 
-        if self._IsMP3 and config.setting['remove_ape_from_mp3']:
+        remove_apev2 = self._IsMP3 and config.setting['remove_ape_from_mp3']
+        if remove_apev2:
             try:
                 mutagen.apev2.delete(filename)
             except BaseException:
                 pass
 
+        old_format = self._tag_format or TagFormat()
+        write_id3v23 = config.setting['write_id3v23']
+        self._tag_format = TagFormat(
+            id3_version=3 if write_id3v23 else 4,
+            id3_encodings=frozenset({self._written_encoding(config.setting)}),
+            id3v23_join_with=config.setting['id3v23_join_with'] if write_id3v23 else None,
+            has_id3v1=config.setting['write_id3v1'] if self._writes_id3v1 else old_format.has_id3v1,
+            has_apev2=old_format.has_apev2 and not remove_apev2,
+            padding=padding.saved_info(),
+        )
+
     def _initialize_tags_for_saving(self, tags, config):
         """Initialize tags for saving, handling existing tag clearing and image preservation."""
         if config.setting['clear_existing_tags']:
@@ -655,7 +745,7 @@ class ID3File(File):
         except mutagen.id3.ID3NoHeaderError:
             return compatid3.CompatID3()
 
-    def _save_tags(self, tags, filename):
+    def _save_tags(self, tags, filename, padding=None):
         config = get_config()
         if config.setting['write_id3v1']:
             v1 = 2
@@ -665,10 +755,10 @@ class ID3File(File):
         if config.setting['write_id3v23']:
             tags.update_to_v23()
             separator = config.setting['id3v23_join_with']
-            tags.save(filename, v2_version=3, v1=v1, v23_sep=separator)
+            tags.save(filename, v2_version=3, v1=v1, v23_sep=separator, padding=padding)
         else:
             tags.update_to_v24()
-            tags.save(filename, v2_version=4, v1=v1)
+            tags.save(filename, v2_version=4, v1=v1, padding=padding)
 
     def format_specific_metadata(self, metadata, tag, settings=None):
         if not settings:
@@ -1126,6 +1216,8 @@ class TrueAudioFile(ID3File):
 class NonCompatID3File(ID3File):
     """Base class for ID3 files which do not support setting `compatid3.CompatID3`."""
 
+    _writes_id3v1 = False
+
     def _get_file(self, filename):
         assert self._File, f"_File not defined for {self.__class__.__name__}"
         return self._File(filename, known_frames=compatid3.known_frames)
@@ -1136,15 +1228,15 @@ class NonCompatID3File(ID3File):
             file.add_tags()
         return file.tags
 
-    def _save_tags(self, tags, filename):
+    def _save_tags(self, tags, filename, padding=None):
         config = get_config()
         if config.setting['write_id3v23']:
             compatid3.update_to_v23(tags)
             separator = config.setting['id3v23_join_with']
-            tags.save(filename, v2_version=3, v23_sep=separator)
+            tags.save(filename, v2_version=3, v23_sep=separator, padding=padding)
         else:
             tags.update_to_v24()
-            tags.save(filename, v2_version=4)
+            tags.save(filename, v2_version=4, padding=padding)
 
 
 class DSFFile(NonCompatID3File):
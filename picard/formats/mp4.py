@@ -48,6 +48,7 @@ from picard.coverart.image import (
 )
 from picard.file import File
 from picard.formats.mutagenext import delall_ci
+from picard.formats.padding import TagPadding
 from picard.metadata import Metadata
 
 
@@ -360,7 +361,9 @@ class MP4File(File):
 
         self._remove_deleted_tags(metadata, tags)
 
-        file.save()
+        padding = TagPadding.from_config(metadata)
+        file.save(padding=padding)
+        padding.record(type(self).__name__, filename)
 
     def _remove_deleted_tags(self, metadata, tags):
         """Remove the tags from the file that were deleted in the UI"""
@@ -0,0 +1,158 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Padding of the tags written with mutagen.
+
+If the new tags do not fit into the space of the old tags and their padding,
+mutagen has to move the audio data, which rewrites the whole file. With the
+"default" policy mutagen picks the padding itself. The other policies keep
+any existing padding the tags fit into and otherwise reserve a fixed size or
+a percentage of the audio size, so following saves can be done in place.
+
+With `tag_padding_reserve_images` the padding reserved on a rewrite also
+includes the size of the images which are not embedded with the current
+settings. Enabling image embedding later then does not rewrite each file
+again.
+"""
+
+from enum import Enum
+
+from mutagen import PaddingInfo
+
+from picard import log
+from picard.config import get_config
+from picard.util.metrics import metrics
+
+
+TAG_SAVES_TOTAL = metrics.counter('tag_saves_total', "Number of tag writes by format and write mode")
+TAG_SAVE_REWRITTEN_BYTES = metrics.counter(
+    'tag_save_rewritten_bytes_total', "Bytes of audio data moved because the tags did not fit"
+)
+
+
+class PaddingPolicy(str, Enum):
+    DEFAULT = 'default'
+    FIXED = 'fixed'
+    PERCENT = 'percent'
+
+
+class WriteMode(str, Enum):
+    IN_PLACE = 'in_place'
+    REWRITE = 'rewrite'
+
+
+class TagPadding:
+    """Padding callback for the `padding` argument of mutagen's save methods.
+
+    After saving, `mode` tells whether the tags were written in place or the
+    file got rewritten, it stays None if mutagen did not ask for the padding.
+    """
+
+    def __init__(self, policy=PaddingPolicy.DEFAULT, size=0, percent=0, reserve=0):
+        self.policy = PaddingPolicy(policy)
+        self.size = size
+        self.percent = percent
+        self.reserve = reserve
+        self.mode = None
+        self.padding = None
+        self.data_size = 0
+        self.moved_bytes = 0
+
+    @classmethod
+    def from_config(cls, metadata=None, settings=None):
+        """Returns the padding for saving metadata with the configured policy"""
+        if settings is None:
+            settings = get_config().setting
+        try:
+            policy = PaddingPolicy(settings['tag_padding_policy'])
+        except ValueError:
+            log.warning("Unknown tag padding policy %r, using default", settings['tag_padding_policy'])
+            policy = PaddingPolicy.DEFAULT
+        reserve = 0
+        if metadata is not None and settings['tag_padding_reserve_images']:
+            reserve = unembedded_images_size(metadata, settings)
+        return cls(
+            policy=policy,
+            size=settings['tag_padding_size_kb'] * 1024,
+            percent=settings['tag_padding_percent'],
+            reserve=reserve,
+        )
+
+    def target(self, info: PaddingInfo) -> int:
+        """Padding to reserve if the file has to be rewritten anyway"""
+        if self.policy == PaddingPolicy.FIXED:
+            padding = self.size
+        elif self.policy == PaddingPolicy.PERCENT:
+            padding = int(info.size * self.percent / 100)
+        else:
+            padding = info.get_default_padding()
+        return max(0, padding) + self.reserve
+
+    def __call__(self, info: PaddingInfo) -> int:
+        if self.policy == PaddingPolicy.DEFAULT and not self.reserve:
+            padding = info.get_default_padding()
+        elif info.padding >= 0:
+            # The tags fit, keep the existing padding to write in place
+            padding = info.padding
+        else:
+            padding = self.target(info)
+        if info.padding >= 0 and padding == info.padding:
+            self.mode = WriteMode.IN_PLACE
+            self.moved_bytes = 0
+        else:
+            self.mode = WriteMode.REWRITE
+            self.moved_bytes = info.size
+        self.padding = padding
+        self.data_size = info.size
+        return padding
+
+    def saved_info(self) -> PaddingInfo | None:
+        """Padding of the tags after saving, None if mutagen did not ask for it"""
+        if self.mode is None:
+            return None
+        return PaddingInfo(self.padding, self.data_size)
+
+    def record(self, file_format: str, filename: str):
+        """Records the write mode of a successful save in the metrics"""
+        if self.mode is None:
+            return
+        TAG_SAVES_TOTAL.inc(format=file_format, mode=self.mode.value)
+        if self.mode == WriteMode.REWRITE:
+            TAG_SAVE_REWRITTEN_BYTES.inc(self.moved_bytes, format=file_format)
+            log.debug("Saving %r rewrote the file, new padding %d bytes", filename, self.padding)
+        else:
+            log.debug("Saved tags of %r in place, padding %d bytes", filename, self.padding)
+
+
+def unembedded_images_size(metadata, settings=None) -> int:
+    """Size of the images of metadata which do not get embedded into the tags"""
+    embedded = {id(image) for image in metadata.images.to_be_saved_to_tags(settings=settings)}
+    return sum(
+        image.datalength for image in metadata.images if image.can_be_saved_to_tags and id(image) not in embedded
+    )
+
+
+def padding_changes(info: PaddingInfo, metadata=None, settings=None) -> bool:
+    """Returns whether saving unchanged tags with the configured policy changes the padding info
+
+    With the default policy mutagen picks the padding on each save, which is
+    not a reason to rewrite tags that did not change.
+    """
+    padding = TagPadding.from_config(metadata, settings)
+    if padding.policy == PaddingPolicy.DEFAULT:
+        return False
+    return padding(info) != info.padding
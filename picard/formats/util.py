@@ -24,9 +24,30 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+import os
+
 from picard.formats.registry import FormatRegistry
 
 
+def has_id3v1(filename: str) -> bool:
+    """Returns whether the file ends with an ID3v1 tag"""
+    try:
+        with open(filename, 'rb') as fh:
+            fh.seek(-128, os.SEEK_END)
+            return fh.read(3) == b'TAG'
+    except OSError:
+        return False
+
+
+def has_id3v2(filename: str) -> bool:
+    """Returns whether the file starts with an ID3v2 tag"""
+    try:
+        with open(filename, 'rb') as fh:
+            return fh.read(3) == b'ID3'
+    except OSError:
+        return False
+
+
 def _format_key_desc_generator(registry: FormatRegistry):
     """Yield (file_format, key, desc) for formats with key and description.
 
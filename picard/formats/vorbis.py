@@ -31,11 +31,16 @@
 
 
 import base64
+import os
 import re
 from types import MappingProxyType
 
-from mutagen import FileType
+from mutagen import (
+    FileType,
+    PaddingInfo,
+)
 import mutagen.flac
+from mutagen.id3 import BitPaddedInt
 import mutagen.oggflac
 import mutagen.oggopus
 import mutagen.oggspeex
@@ -52,7 +57,15 @@ from picard.coverart.image import (
     TagCoverArtImage,
 )
 from picard.coverart.utils import types_from_id3
-from picard.file import File
+from picard.file import (
+    File,
+    TagFormat,
+)
+from picard.formats.padding import TagPadding
+from picard.formats.util import (
+    has_id3v1,
+    has_id3v2,
+)
 from picard.i18n import N_
 from picard.metadata import Metadata
 from picard.util import sanitize_date
@@ -122,6 +135,36 @@ def flac_remove_empty_seektable(file):
         file.seektable = None
 
 
+def flac_audio_size(filename):
+    """Returns the size of the data after the metadata blocks of a FLAC file.
+
+    This is the size mutagen passes to the padding function when saving.
+    """
+    with open(filename, 'rb') as fh:
+        header = fh.read(10)
+        offset = 0
+        if header[:3] == b'ID3':
+            offset = 10 + BitPaddedInt(header[6:10])
+        fh.seek(offset + 4)  # Skip "fLaC"
+        is_last = False
+        while not is_last:
+            block_header = fh.read(4)
+            if len(block_header) < 4:
+                break
+            is_last = bool(block_header[0] & 0x80)
+            fh.seek(int.from_bytes(block_header[1:], 'big'), os.SEEK_CUR)
+        return max(0, os.path.getsize(filename) - fh.tell())
+
+
+def flac_tag_format(file, filename):
+    """Returns the layout of the tags of the loaded FLAC file"""
+    padding = sum(block.length for block in file.metadata_blocks if isinstance(block, mutagen.flac.Padding))
+    return TagFormat(
+        has_id3=has_id3v2(filename) or has_id3v1(filename),
+        padding=PaddingInfo(padding, flac_audio_size(filename)),
+    )
+
+
 class VCommentFile(File):
     """Generic VComment-based file."""
 
@@ -146,6 +189,8 @@ class VCommentFile(File):
         log.debug("Loading file %r", filename)
         config = get_config()
         file = self._File(filename)
+        if self._File == mutagen.flac.FLAC:
+            self._tag_format = flac_tag_format(file, filename)
         file.tags = file.tags or {}
         metadata = Metadata()
         for origname, values in file.tags.items():
@@ -366,7 +411,8 @@ class VCommentFile(File):
 
         self._remove_deleted_tags(metadata, file.tags)
 
-        kwargs = {}
+        padding = TagPadding.from_config(metadata)
+        kwargs = {'padding': padding}
         if is_flac:
             flac_sort_pics_after_tags(file.metadata_blocks)
             if config.setting['fix_missing_seekpoints_flac']:
@@ -377,6 +423,19 @@ class VCommentFile(File):
             file.save(**kwargs)
         except TypeError:
             file.save()
+        padding.record(type(self).__name__, filename)
+        if is_flac:
+            old_format = self._tag_format or TagFormat()
+            self._tag_format = TagFormat(
+                has_id3=old_format.has_id3 and not kwargs.get('deleteid3'),
+                padding=padding.saved_info(),
+            )
+
+    def _tag_format_changed(self, metadata, settings):
+        tag_format = self._tag_format
+        if tag_format is not None and tag_format.has_id3 and settings['remove_id3_from_flac']:
+            return True
+        return super()._tag_format_changed(metadata, settings)
 
     def _remove_deleted_tags(self, metadata, tags):
         """Remove the tags from the file that were deleted in the UI"""
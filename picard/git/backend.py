@@ -24,6 +24,8 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import Iterable
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -48,6 +50,10 @@ class GitCommitError(GitBackendError):
     """Exception for commit-related errors"""
 
 
+class GitFetchTimeoutError(GitBackendError):
+    """Exception for fetches exceeding their timeout"""
+
+
 class GitObjectType(Enum):
     COMMIT = "commit"
     TAG = "tag"
@@ -68,6 +74,24 @@ class GitCredentialType(Enum):
     USERPASS = 2
 
 
+class GitFetchStatus(Enum):
+    FETCHED = "fetched"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+
+
+# Defaults for fetching the remotes of several repositories
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_FETCH_TIMEOUT = 60.0  # seconds per remote
+
+
+@dataclass
+class GitFetchResult:
+    path: Path
+    status: GitFetchStatus
+    error: Exception | None = None
+
+
 class GitRefType(Enum):
     BRANCH = "branch"
     TAG = "tag"
@@ -371,6 +395,31 @@ class GitBackend(ABC):
     def create_remote_callbacks(self) -> GitRemoteCallbacks:
         """Create remote callbacks for authentication"""
 
+    def fetch_repositories(
+        self,
+        paths: Iterable[Path],
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        timeout: float | None = DEFAULT_FETCH_TIMEOUT,
+    ) -> dict[Path, GitFetchResult]:
+        """Fetch all remotes including tags of the repositories at paths.
+
+        Errors are reported in the results instead of being raised. This
+        implementation fetches one repository after the other, backends can
+        override it to fetch concurrently with at most max_workers threads,
+        and to abort fetches of a single remote taking longer than timeout.
+        """
+        results = {}
+        for path in paths:
+            try:
+                with self.create_repository(path) as repo:
+                    callbacks = self.create_remote_callbacks()
+                    for remote in repo.get_remotes():
+                        repo.fetch_remote_with_tags(remote, None, callbacks._callbacks)
+                results[path] = GitFetchResult(path, GitFetchStatus.FETCHED)
+            except Exception as e:
+                results[path] = GitFetchResult(path, GitFetchStatus.FAILED, e)
+        return results
+
     @abstractmethod
     def get_config_value(self, key: str, default: str = '') -> str:
         """Read a value from git config (merged system/global/local).
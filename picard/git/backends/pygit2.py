@@ -20,8 +20,13 @@
 
 """Pygit2 backend implementation."""
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 import tempfile
+import threading
+import time
 from typing import Any
 
 
@@ -35,8 +40,13 @@ except ImportError:
 
 from picard import log
 from picard.git.backend import (
+    DEFAULT_FETCH_TIMEOUT,
+    DEFAULT_FETCH_WORKERS,
     GitBackend,
     GitCommitError,
+    GitFetchResult,
+    GitFetchStatus,
+    GitFetchTimeoutError,
     GitObject,
     GitObjectType,
     GitRef,
@@ -51,17 +61,84 @@ from picard.git.backend import (
 )
 
 
+# Timeouts in ms of the active _server_timeout() contexts and the libgit2
+# timeouts to restore when the last one exits
+_server_timeout_lock = threading.Lock()
+_server_timeouts: list[int] = []
+_server_timeout_defaults: list[int] = []
+
+
+def _server_timeout_options():
+    return (
+        (pygit2.enums.Option.GET_SERVER_CONNECT_TIMEOUT, pygit2.enums.Option.SET_SERVER_CONNECT_TIMEOUT),
+        (pygit2.enums.Option.GET_SERVER_TIMEOUT, pygit2.enums.Option.SET_SERVER_TIMEOUT),
+    )
+
+
+def _set_server_timeouts(values: Iterable[int]):
+    for (_get_option, set_option), value in zip(_server_timeout_options(), values, strict=True):
+        pygit2.option(set_option, value)
+
+
+@contextmanager
+def _server_timeout(timeout: float | None):
+    """Limit connecting to and waiting for servers in libgit2.
+
+    Stalled connections do not call any of the remote callbacks, so the
+    deadline of Pygit2RemoteCallbacks can not catch them.
+
+    libgit2 only has process-wide server timeouts, they can not be set for
+    the operations of a single remote. While the context is active, other
+    git operations running at the same time, e.g. installing or cloning a
+    plugin, are limited by the timeout as well. Overlapping contexts use the
+    longest of their timeouts, the previous timeouts are restored when the
+    last one exits.
+    """
+    if not timeout:
+        yield
+        return
+    timeout_ms = int(timeout * 1000)
+    with _server_timeout_lock:
+        if not _server_timeouts:
+            _server_timeout_defaults[:] = [
+                pygit2.option(get_option) for get_option, _set_option in _server_timeout_options()
+            ]
+        _server_timeouts.append(timeout_ms)
+        longest = max(_server_timeouts)
+        _set_server_timeouts((longest, longest))
+    try:
+        yield
+    finally:
+        with _server_timeout_lock:
+            _server_timeouts.remove(timeout_ms)
+            if _server_timeouts:
+                longest = max(_server_timeouts)
+                _set_server_timeouts((longest, longest))
+            else:
+                _set_server_timeouts(_server_timeout_defaults)
+
+
 class Pygit2RemoteCallbacks(GitRemoteCallbacks):
-    def __init__(self):
+    def __init__(self, timeout: float | None = None):
         if not HAS_PYGIT2:
             return
         self._callbacks = pygit2.RemoteCallbacks()
         self._callbacks.transfer_progress = self._transfer_progress
+        self._callbacks.sideband_progress = self._sideband_progress
         self._callbacks.credentials = self._credentials
         self._attempted = False
+        self._deadline = time.monotonic() + timeout if timeout else None
+
+    def _check_deadline(self):
+        # Raising from a callback aborts the running operation
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise GitFetchTimeoutError("Fetch timed out")
 
     def _transfer_progress(self, stats):
-        pass  # Silent progress
+        self._check_deadline()  # Silent progress
+
+    def _sideband_progress(self, string):
+        self._check_deadline()
 
     def _credentials(self, url, username_from_url, allowed_types):
         if self._attempted:
@@ -340,6 +417,32 @@ class Pygit2Repository(GitRepository):
             refspecs = list(remote.fetch_refspecs) + ['+refs/tags/*:refs/tags/*']
         remote.fetch(refspecs, callbacks=callbacks)
 
+    def remote_refs_unchanged(self, remote, callbacks=None) -> bool:
+        """Check if the refs advertised by remote all match the local refs.
+
+        Branches are mapped to the local refs with the fetch refspecs of
+        remote, tags to the local tags. A fetch would not change anything
+        then, except for pruning.
+        """
+        refspecs = [remote.get_refspec(i) for i in range(remote.refspec_count)]
+        ret = True
+        for head in remote.list_heads(callbacks=callbacks):
+            name = head.name
+            if not name.startswith('refs/') or name.endswith('^{}'):
+                continue
+            if name.startswith('refs/tags/'):
+                local_name = name
+            else:
+                local_name = next((spec.transform(name) for spec in refspecs if spec.src_matches(name)), None)
+                if local_name is None:
+                    continue
+            local_ref = self._repo.references.get(local_name)
+            if local_ref is None or local_ref.target != head.oid:
+                ret = False
+                break
+        _log_git_call("remote_refs_unchanged", str(remote.name), retval=ret)
+        return ret
+
     def free(self):
         _log_git_call("free")
         self._repo.free()
@@ -527,6 +630,49 @@ class Pygit2Backend(GitBackend):
         _log_git_call("create_remote_callbacks")
         return Pygit2RemoteCallbacks()
 
+    def fetch_repositories(
+        self,
+        paths: Iterable[Path],
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        timeout: float | None = DEFAULT_FETCH_TIMEOUT,
+    ) -> dict[Path, GitFetchResult]:
+        """Fetch the remotes of the repositories at paths concurrently.
+
+        libgit2 releases the GIL during network operations, so the fetches of
+        different repositories run in parallel in up to max_workers threads.
+        Remotes whose advertised refs already match the local refs are not
+        fetched. Each remote is aborted after timeout seconds.
+        """
+        paths = list(paths)
+        _log_git_call("fetch_repositories", [str(path) for path in paths], max_workers, timeout)
+        if not paths:
+            return {}
+        workers = max(1, min(max_workers, len(paths)))
+        with _server_timeout(timeout), ThreadPoolExecutor(workers, thread_name_prefix='git-fetch') as executor:
+            results = executor.map(lambda path: self._fetch_repository(path, timeout), paths)
+            return {result.path: result for result in results}
+
+    def _fetch_repository(self, path: Path, timeout: float | None) -> GitFetchResult:
+        try:
+            repo = self.create_repository(path)
+        except GitRepositoryError as e:
+            return GitFetchResult(path, GitFetchStatus.FAILED, e)
+        status = GitFetchStatus.UNCHANGED
+        try:
+            for remote in repo.get_remotes():
+                # New callbacks for each remote, the timeout applies per remote
+                callbacks = Pygit2RemoteCallbacks(timeout)
+                if repo.remote_refs_unchanged(remote, callbacks._callbacks):
+                    log.debug("Refs of remote %s of %s unchanged, not fetching", remote.name, path)
+                    continue
+                repo.fetch_remote_with_tags(remote, None, callbacks._callbacks)
+                status = GitFetchStatus.FETCHED
+        except Exception as e:
+            return GitFetchResult(path, GitFetchStatus.FAILED, e)
+        finally:
+            repo.free()
+        return GitFetchResult(path, status)
+
     def get_config_value(self, key: str, default: str = '') -> str:
         try:
             cfg = pygit2.Config.get_global_config()
@@ -56,6 +56,7 @@ from picard.const.defaults import (
     DEFAULT_CURRENT_BROWSER_PATH,
     DEFAULT_DRIVES,
     DEFAULT_FILTER_COLUMNS,
+    DEFAULT_FINGERPRINT_CACHE_SIZE,
     DEFAULT_FPCALC_THREADS,
     DEFAULT_LOCAL_COVER_ART_REGEX,
     DEFAULT_LOG_LEVEL,
@@ -68,6 +69,9 @@ from picard.const.defaults import (
     DEFAULT_REPLACEMENT,
     DEFAULT_SHOW_MENU_ICONS,
     DEFAULT_STARTING_DIR,
+    DEFAULT_TAG_PADDING_PERCENT,
+    DEFAULT_TAG_PADDING_POLICY,
+    DEFAULT_TAG_PADDING_SIZE_KB,
     DEFAULT_THEME_NAME,
     DEFAULT_TOOLBAR_LAYOUT,
     DEFAULT_TOP_TAGS,
@@ -102,6 +106,10 @@ class StandardizeArtistNames(Enum):
     ALL = "all"  # standardize variations and name changes
 
 
+# picard/coverart/processing/executor.py
+# Cover art processing worker processes, 0 processes images on the shared thread pool
+IntOption('setting', 'cover_processing_processes', 0)
+
 # picard/coverart/providers/caa.py
 # Cover Art Archive Cover Art Archive: Release
 BoolOption('setting', 'caa_approved_only', False, title=N_("Download only approved images"), in_profile=True)
@@ -323,6 +331,7 @@ ListOption('persist', 'options_pages_tree_state', [])
 # Fingerprinting
 TextOption('setting', 'acoustid_apikey', '')
 TextOption('setting', 'acoustid_fpcalc', '')
+IntOption('setting', 'fingerprint_cache_size', DEFAULT_FINGERPRINT_CACHE_SIZE)
 TextOption('setting', 'fingerprinting_system', 'acoustid', title=N_('Use AcoustID fingerprinting'), in_profile=True)
 IntOption('setting', 'fpcalc_threads', DEFAULT_FPCALC_THREADS)
 BoolOption(
@@ -650,6 +659,13 @@ BoolOption('setting', 'preserve_images', False, title=N_("Keep embedded images")
 BoolOption('setting', 'preserve_timestamps', False, title=N_("Preserve timestamps"), in_profile=True)
 BoolOption('setting', 'remove_ape_from_mp3', False, title=N_("Remove APEv2 tags from MP3"), in_profile=True)
 BoolOption('setting', 'remove_id3_from_flac', False, title=N_("Remove ID3 tags from FLAC"), in_profile=True)
+BoolOption('setting', 'skip_unchanged_tag_writes', True, title=N_("Skip writing unchanged tags"), in_profile=True)
+TextOption('setting', 'tag_padding_policy', DEFAULT_TAG_PADDING_POLICY, title=N_("Tag padding"), in_profile=True)
+IntOption('setting', 'tag_padding_size_kb', DEFAULT_TAG_PADDING_SIZE_KB, title=N_("Tag padding size"), in_profile=True)
+IntOption(
+    'setting', 'tag_padding_percent', DEFAULT_TAG_PADDING_PERCENT, title=N_("Tag padding percentage"), in_profile=True
+)
+BoolOption('setting', 'tag_padding_reserve_images', False, title=N_("Reserve tag padding for images"), in_profile=True)
 
 # picard/ui/options/tags_compatibility_aac.py
 # AAC
@@ -727,6 +743,13 @@ BoolOption(
     title=N_("No MusicBrainz requests on restore"),
     in_profile=True,
 )
+BoolOption(
+    'setting',
+    'session_compact_format',
+    False,
+    title=N_("Save sessions in compact format"),
+    in_profile=True,
+)
 TextOption(
     'setting',
     'session_folder_path',
@@ -767,6 +790,10 @@ Option('persist', 'plugins3_updates', {})
 #
 ListOption('setting', 'custom_columns', [])
 
+# picard/util/stallwatchdog.py
+# Main thread stalls longer than this get reported, see DebugOpt.GUI_STALLS
+IntOption('setting', 'gui_stall_threshold_ms', 250)
+
 
 def init_options():
     pass
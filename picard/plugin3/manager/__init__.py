@@ -40,7 +40,10 @@ if TYPE_CHECKING:
 
 from picard.config import get_config
 from picard.const.appdirs import cache_folder
-from picard.git.backend import GitRefType
+from picard.git.backend import (
+    GitFetchStatus,
+    GitRefType,
+)
 from picard.git.factory import git_backend
 from picard.git.ops import GitOperations
 from picard.plugin3.manager.clean import PluginCleanupManager
@@ -61,10 +64,8 @@ from picard.plugin3.manager.errors import (  # noqa: F401
     PluginUUIDConflictError,
 )
 from picard.plugin3.manager.find import PluginFinder
-from picard.plugin3.manager.install import PluginInstaller
 from picard.plugin3.manager.lifecycle import PluginLifecycleManager
 from picard.plugin3.manager.registry import PluginRegistryManager
-from picard.plugin3.manager.update import PluginUpdater
 from picard.plugin3.manager.validation import PluginValidationManager
 from picard.plugin3.plugin import (
     Plugin,
@@ -118,11 +119,9 @@ class PluginManager(QObject):
         # Initialize metadata manager
         self._metadata = PluginMetadataManager(self._registry)
 
-        # Initialize installer
-        self._installer = PluginInstaller(self)
-
-        # Initialize updater
-        self._updater = PluginUpdater(self)
+        # Installer and updater are created on first use, see _installer and _updater
+        self._plugin_installer = None
+        self._plugin_updater = None
 
         # Initialize registry manager
         self._registry_manager = PluginRegistryManager(self)
@@ -141,6 +140,24 @@ class PluginManager(QObject):
             tagger.register_cleanup(self._cleanup_temp_directories)
         self._cleanup_temp_directories()
 
+    @property
+    def _installer(self):
+        if self._plugin_installer is None:
+            # Local import: the install machinery is rarely needed
+            from picard.plugin3.manager.install import PluginInstaller
+
+            self._plugin_installer = PluginInstaller(self)
+        return self._plugin_installer
+
+    @property
+    def _updater(self):
+        if self._plugin_updater is None:
+            # Local import: the update machinery is rarely needed
+            from picard.plugin3.manager.update import PluginUpdater
+
+            self._plugin_updater = PluginUpdater(self)
+        return self._plugin_updater
+
     @property
     def plugins(self):
         return self._plugins
@@ -705,25 +722,32 @@ class PluginManager(QObject):
 
     def refresh_all_plugin_refs(self):
         """Fetch remote refs for all plugins to ensure ref selectors have latest data."""
+        plugins = []
         for plugin in self._plugins:
             metadata = self._metadata.get_plugin_metadata(plugin.uuid) if plugin.uuid else None
-            if not self._should_fetch_plugin_refs(plugin, metadata):
-                continue
-
-            try:
+            if self._should_fetch_plugin_refs(plugin, metadata):
+                plugins.append(plugin)
+        self._fetch_plugins_refs(plugins)
 
-                def fetch_refs(repo):
-                    # Fetch without updating (suppress progress output)
-                    backend = git_backend()
-                    callbacks = backend.create_remote_callbacks()
-                    for remote in repo.get_remotes():
-                        # Fetch all refs including tags in a single operation
-                        repo.fetch_remote_with_tags(remote, None, callbacks._callbacks)
-                        log.debug("Fetched refs for plugin %s from remote %s", plugin.plugin_id, remote.name)
+    def _fetch_plugins_refs(self, plugins):
+        """Fetch remote refs including tags of plugins concurrently.
 
-                self._with_plugin_repo(plugin.local_path, fetch_refs)
-            except Exception as e:
-                log.warning("Failed to fetch refs for plugin %s: %s", plugin.plugin_id, e)
+        Returns:
+            set: The plugins whose refs could not be fetched
+        """
+        if not plugins:
+            return set()
+        plugins_by_path = {plugin.local_path: plugin for plugin in plugins}
+        results = git_backend().fetch_repositories(plugins_by_path)
+        failed = set()
+        for path, result in results.items():
+            plugin = plugins_by_path[path]
+            if result.status == GitFetchStatus.FAILED:
+                log.warning("Failed to fetch refs for plugin %s: %s", plugin.plugin_id, result.error)
+                failed.add(plugin)
+            else:
+                log.debug("Fetched refs for plugin %s: %s", plugin.plugin_id, result.status.value)
+        return failed
 
     def check_updates(self, skip_fetch=False, include_plugins=None):
         """Check which plugins have updates available without installing."""
@@ -309,7 +309,7 @@ class PluginUpdater:
 
     def check_updates(self, skip_fetch=False, include_plugins=None):
         """Check which plugins have updates available without installing."""
-        updates = {}
+        candidates = []
         for plugin in self.manager._plugins:
             if include_plugins is not None and plugin not in include_plugins:
                 continue
@@ -337,7 +337,18 @@ class PluginUpdater:
                     except Exception as e:
                         log.debug('Failed to update remote URL for %s: %s', plugin.plugin_id, e)
 
-            update_check = self._check_single_plugin_update(plugin, metadata, skip_fetch)
+            candidates.append((plugin, metadata))
+
+        failed = set()
+        if not skip_fetch:
+            # Fetching is the slow part, do it for all plugins at once
+            failed = self.manager._fetch_plugins_refs([plugin for plugin, _metadata in candidates])
+
+        updates = {}
+        for plugin, metadata in candidates:
+            if plugin in failed:
+                continue
+            update_check = self._check_single_plugin_update(plugin, metadata, skip_fetch=True)
             if update_check:
                 updates[plugin.plugin_id] = update_check
 
@@ -17,6 +17,8 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+from collections import defaultdict
+import json
 import os
 from pathlib import Path
 import re
@@ -44,6 +46,10 @@ except (ImportError, ModuleNotFoundError):
     import tomli as tomllib  # type: ignore[no-redef]
 
 
+# Version of the cache file format, cache files of other versions are ignored
+REGISTRY_CACHE_VERSION = 1
+
+
 class RegistryError(Exception):
     """Base exception for registry errors."""
 
@@ -100,6 +106,7 @@ class PluginRegistry:
         self._registry_data = None
         self._plugins = []  # List of RegistryPlugin objects
         self._logged_not_loaded = False
+        self._build_indexes()
 
     def _ensure_registry_loaded(self, operation_name='operation'):
         """Ensure registry data is loaded, with error handling.
@@ -169,21 +176,46 @@ class PluginRegistry:
             return False
 
         for url in self.registry_urls:
-            cache_path = self._cache_path_for_url(url)
-            if not cache_path or not cache_path.exists():
+            cache = self._read_cache(url)
+            if cache is None:
                 continue
-            try:
-                with open(cache_path, 'rb') as f:
-                    self._registry_data = tomllib.load(f)
-                self.cache_path = cache_path
-                self._process_plugins()
-                log.debug('Loaded registry from cache: %s', cache_path)
-                return True
-            except Exception as e:
-                log.debug('Failed to load registry cache: %s', e)
+            self._registry_data = cache['data']
+            self.cache_path = self._cache_path_for_url(url)
+            self._process_plugins()
+            log.debug('Loaded registry from cache: %s', self.cache_path)
+            return True
 
         return False
 
+    def _read_cache(self, url):
+        """Read the cache file of a registry URL.
+
+        Args:
+            url: Registry URL
+
+        Returns:
+            dict: Cache with the parsed registry in 'data' and the HTTP
+                validators 'etag' and 'last_modified', or None if there is
+                no usable cache
+        """
+        cache_path = self._cache_path_for_url(url)
+        if not cache_path or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = json.load(f)
+        except Exception as e:
+            log.debug('Failed to load registry cache: %s', e)
+            return None
+        if (
+            not isinstance(cache, dict)
+            or cache.get('version') != REGISTRY_CACHE_VERSION
+            or not isinstance(cache.get('data'), dict)
+        ):
+            log.debug('Ignoring registry cache with unsupported format: %s', cache_path)
+            return None
+        return cache
+
     def fetch_registry(self, use_cache=True, callback=None):
         """Fetch registry from URL or cache.
 
@@ -263,16 +295,41 @@ class PluginRegistry:
                 callback(False, error)
             return
 
+        # Revalidate the cached registry, the server only sends it again if it changed
+        cache = self._read_cache(url)
+        headers = {}
+        if cache is not None:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        if headers:
+            cacheloadcontrol = QNetworkRequest.CacheLoadControl.AlwaysNetwork
+        else:
+            cacheloadcontrol = QNetworkRequest.CacheLoadControl.PreferCache
+
         def handler(response, reply, error):
             if error:
                 fetch_error = RegistryFetchError(url, error)
                 if callback:
                     callback(False, fetch_error)
+            elif headers and _is_not_modified(reply):
+                log.debug('Registry not modified, using cache: %s', url)
+                self._registry_data = cache['data']
+                self._update_cache_path(url)
+                self.registry_url = url
+                self._process_plugins()
+                if callback:
+                    callback(True, None)
             else:
                 try:
                     self._registry_data = tomllib.loads(response.decode('utf-8'))
                     self._update_cache_path(url)
-                    self._save_cache(response)
+                    self._save_cache(
+                        self._registry_data,
+                        etag=_reply_header(reply, 'ETag'),
+                        last_modified=_reply_header(reply, 'Last-Modified'),
+                    )
                     self.registry_url = url
                     self._process_plugins()
                     if callback:
@@ -289,31 +346,46 @@ class PluginRegistry:
         app.webservice.get_url(
             url=QUrl(url),
             handler=handler,
-            cacheloadcontrol=QNetworkRequest.CacheLoadControl.PreferCache,
+            cacheloadcontrol=cacheloadcontrol,
             parse_response_type=None,  # Don't parse, we'll handle TOML ourselves
+            headers=headers or None,
         )
 
     def _cache_path_for_url(self, url):
         """Get cache file path for a registry URL."""
         if self._cache_dir:
-            return self._cache_dir / f'plugin_registry_{hash_string(url)}.toml'
+            return self._cache_dir / f'plugin_registry_{hash_string(url)}.json'
         return None
 
     def _update_cache_path(self, url):
         """Update cache path to match the URL that provided the data."""
         self.cache_path = self._cache_path_for_url(url)
 
-    def _save_cache(self, data):
-        """Save raw registry data to cache file atomically.
+    def _save_cache(self, data, etag=None, last_modified=None):
+        """Save parsed registry data to cache file atomically.
+
+        The registry is stored as JSON, which loads a lot faster than the TOML
+        sent by the server.
 
         Args:
-            data: Raw TOML bytes from the registry
+            data: Parsed registry data
+            etag: ETag header of the response, if any
+            last_modified: Last-Modified header of the response, if any
         """
         if not self.cache_path:
             return
+        cache = {
+            'version': REGISTRY_CACHE_VERSION,
+            'etag': etag,
+            'last_modified': last_modified,
+            'data': data,
+        }
         try:
-            atomic_write(self.cache_path, data)
+            # TOML dates and times are stored as strings
+            atomic_write(self.cache_path, json.dumps(cache, default=str).encode('utf-8'))
             log.debug('Saved registry to cache: %s', self.cache_path)
+            # Remove the TOML cache of older versions
+            self.cache_path.with_suffix('.toml').unlink(missing_ok=True)
         except Exception as e:
             log.warning('Failed to save registry cache: %s', e)
 
@@ -338,41 +410,25 @@ class PluginRegistry:
         # Normalize URL for comparison
         normalized_url = normalize_git_url(url) if url else None
 
-        blacklist = self._registry_data.get('blacklist', [])
-
-        for entry in blacklist:
-            # Check UUID + URL combination (most specific - blocks specific fork)
-            if 'uuid' in entry and 'url' in entry:
-                if plugin_uuid and plugin_uuid == entry['uuid']:
-                    blacklist_url = normalize_git_url(entry['url'])
-                    if normalized_url == blacklist_url:
-                        reason = entry.get('reason', 'Plugin is blacklisted')
-                        return True, reason
-
-            # Check UUID only (blocks all sources)
-            elif 'uuid' in entry:
-                if plugin_uuid and plugin_uuid == entry['uuid']:
-                    reason = entry.get('reason', 'Plugin UUID is blacklisted')
-                    return True, reason
-
-            # Check exact URL match
-            elif 'url' in entry:
-                if normalized_url:
-                    blacklist_url = normalize_git_url(entry['url'])
-                    if normalized_url == blacklist_url:
-                        reason = entry.get('reason', 'Plugin is blacklisted')
-                        return True, reason
-
-            # Check URL regex match
-            elif 'url_regex' in entry:
-                if normalized_url:
-                    try:
-                        if re.search(entry['url_regex'], normalized_url):
-                            reason = entry.get('reason', 'Plugin matches blacklisted pattern')
-                            return True, reason
-                    except re.error:
-                        log.warning('Invalid regex pattern in blacklist: %s', entry['url_regex'])
-
+        # Matching entries as (position, reason), the first entry in the blacklist wins
+        matches = []
+        if plugin_uuid:
+            # UUID + URL combination (most specific - blocks specific fork)
+            matches.append(self._blacklist_by_uuid_url.get((plugin_uuid, normalized_url)))
+            # UUID only (blocks all sources)
+            matches.append(self._blacklist_by_uuid.get(plugin_uuid))
+        if normalized_url:
+            # Exact URL match
+            matches.append(self._blacklist_by_url.get(normalized_url))
+            # URL regex match
+            for position, pattern, reason in self._blacklist_patterns:
+                if pattern.search(normalized_url):
+                    matches.append((position, reason))
+                    break
+
+        matches = [match for match in matches if match is not None]
+        if matches:
+            return True, min(matches)[1]
         return False, None
 
     def get_blacklist_types(self):
@@ -386,16 +442,7 @@ class PluginRegistry:
         if not self._registry_data:
             return set()
 
-        blacklist = self._registry_data.get('blacklist', [])
-        types = set()
-        for entry in blacklist:
-            if 'uuid' in entry:
-                types.add('uuid')
-            if 'url' in entry:
-                types.add('url')
-            if 'url_regex' in entry:
-                types.add('url_regex')
-        return types
+        return set(self._blacklist_types)
 
     def get_registry_info(self):
         """Get registry metadata.
@@ -428,13 +475,9 @@ class PluginRegistry:
             # Fail safe: if we can't fetch registry, treat as unregistered
             return 'unregistered'
 
-        # Normalize URL for comparison
-        normalized_url = normalize_git_url(url)
-
-        for plugin in self._plugins:
-            plugin_url = normalize_git_url(plugin.git_url or '')
-            if plugin_url == normalized_url:
-                return plugin.trust_level
+        index = self._index_by_url.get(normalize_git_url(url)) if url else None
+        if index is not None:
+            return self._plugins[index].trust_level
 
         return 'unregistered'
 
@@ -456,33 +499,29 @@ class PluginRegistry:
         # Normalize URL for comparison if provided
         normalized_url = normalize_git_url(url) if url else None
 
-        # First pass: search by current values (fast path)
-        for plugin in self._plugins:
-            if plugin_id and plugin.id == plugin_id:
-                return plugin
-            if uuid and plugin.uuid == uuid:
-                return plugin
-            if normalized_url:
-                plugin_url = normalize_git_url(plugin.git_url or '')
-                if plugin_url == normalized_url:
-                    return plugin
+        # First pass: search by current values, the first plugin in the registry wins
+        indexes = []
+        if plugin_id:
+            indexes.append(self._index_by_id.get(plugin_id))
+        if uuid:
+            indexes.append(self._index_by_uuid.get(uuid))
+        if normalized_url:
+            indexes.append(self._index_by_url.get(normalized_url))
+        indexes = [index for index in indexes if index is not None]
+        if indexes:
+            return self._plugins[min(indexes)]
 
         # Second pass: search redirects (only if not found above)
-        if normalized_url or uuid:
-            for plugin in self._plugins:
-                # Check URL redirects
-                if normalized_url and plugin.redirect_from:
-                    for old_url in plugin.redirect_from:
-                        old_url_normalized = normalize_git_url(old_url)
-                        if old_url_normalized == normalized_url:
-                            log.info('Found plugin via URL redirect: %s -> %s', url, plugin.git_url)
-                            return plugin
-
-                # Check UUID redirects
-                if uuid and plugin.redirect_from_uuid:
-                    if uuid in plugin.redirect_from_uuid:
-                        log.info('Found plugin via UUID redirect: %s -> %s', uuid, plugin.uuid)
-                        return plugin
+        url_index = self._index_by_redirect_url.get(normalized_url) if normalized_url else None
+        uuid_index = self._index_by_redirect_uuid.get(uuid) if uuid else None
+        if url_index is not None and (uuid_index is None or url_index <= uuid_index):
+            plugin = self._plugins[url_index]
+            log.info('Found plugin via URL redirect: %s -> %s', url, plugin.git_url)
+            return plugin
+        if uuid_index is not None:
+            plugin = self._plugins[uuid_index]
+            log.info('Found plugin via UUID redirect: %s -> %s', uuid, plugin.uuid)
+            return plugin
 
         return None
 
@@ -534,21 +573,16 @@ class PluginRegistry:
             # Fail safe: if we can't fetch registry, return empty list
             return []
 
-        result = []
-
-        for plugin in self._plugins:
-            # Filter by trust level
-            if trust_level and plugin.trust_level != trust_level:
-                continue
-
-            # Filter by category
-            if category:
-                if category not in plugin.categories:
-                    continue
-
-            result.append(plugin)
+        if category:
+            plugins = self._plugins_by_category.get(category, [])
+            if trust_level:
+                return [plugin for plugin in plugins if plugin.trust_level == trust_level]
+        elif trust_level:
+            plugins = self._plugins_by_trust_level.get(trust_level, [])
+        else:
+            plugins = self._plugins
 
-        return result
+        return list(plugins)
 
     @property
     def plugins(self):
@@ -571,7 +605,7 @@ class PluginRegistry:
         self._process_plugins()
 
     def _process_plugins(self):
-        """Process raw plugin data into RegistryPlugin objects."""
+        """Process raw plugin data into RegistryPlugin objects and index them."""
         self._plugins = []
         if self._registry_data and 'plugins' in self._registry_data:
             for plugin_data in self._registry_data['plugins']:
@@ -579,6 +613,78 @@ class PluginRegistry:
                     self._plugins.append(RegistryPlugin(plugin_data))
                 except Exception as e:
                     log.warning('Failed to process plugin %s: %s', plugin_data.get('id', 'unknown'), e)
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Build the lookup tables for plugins and blacklist entries.
+
+        Lookups are done on each keystroke and table row of the plugin
+        dialogs, the indexes avoid scanning the registry for each of them.
+        Plugins are indexed by their position in the registry, so that
+        lookups return the same plugin as a scan would.
+        """
+        self._index_by_id = {}
+        self._index_by_uuid = {}
+        self._index_by_url = {}
+        self._index_by_redirect_url = {}
+        self._index_by_redirect_uuid = {}
+        self._plugins_by_category = defaultdict(list)
+        self._plugins_by_trust_level = defaultdict(list)
+        for index, plugin in enumerate(self._plugins):
+            if plugin.id:
+                self._index_by_id.setdefault(plugin.id, index)
+            if plugin.uuid:
+                self._index_by_uuid.setdefault(plugin.uuid, index)
+            if plugin.git_url:
+                self._index_by_url.setdefault(normalize_git_url(plugin.git_url), index)
+            for old_url in plugin.redirect_from or ():
+                self._index_by_redirect_url.setdefault(normalize_git_url(old_url), index)
+            for old_uuid in plugin.redirect_from_uuid or ():
+                self._index_by_redirect_uuid.setdefault(old_uuid, index)
+            for category in dict.fromkeys(plugin.categories or ()):
+                self._plugins_by_category[category].append(plugin)
+            self._plugins_by_trust_level[plugin.trust_level].append(plugin)
+
+        # Blacklist entries as (position, reason)
+        self._blacklist_by_uuid_url = {}
+        self._blacklist_by_uuid = {}
+        self._blacklist_by_url = {}
+        self._blacklist_patterns = []
+        self._blacklist_types = set()
+        blacklist = self._registry_data.get('blacklist', []) if self._registry_data else []
+        for position, entry in enumerate(blacklist):
+            self._blacklist_types.update(key for key in ('uuid', 'url', 'url_regex') if key in entry)
+            if 'uuid' in entry and 'url' in entry:
+                key = (entry['uuid'], normalize_git_url(entry['url']))
+                reason = entry.get('reason', 'Plugin is blacklisted')
+                self._blacklist_by_uuid_url.setdefault(key, (position, reason))
+            elif 'uuid' in entry:
+                reason = entry.get('reason', 'Plugin UUID is blacklisted')
+                self._blacklist_by_uuid.setdefault(entry['uuid'], (position, reason))
+            elif 'url' in entry:
+                reason = entry.get('reason', 'Plugin is blacklisted')
+                self._blacklist_by_url.setdefault(normalize_git_url(entry['url']), (position, reason))
+            elif 'url_regex' in entry:
+                try:
+                    pattern = re.compile(entry['url_regex'])
+                except re.error:
+                    log.warning('Invalid regex pattern in blacklist: %s', entry['url_regex'])
+                    continue
+                reason = entry.get('reason', 'Plugin matches blacklisted pattern')
+                self._blacklist_patterns.append((position, pattern, reason))
+
+
+def _reply_header(reply, name):
+    """Get the value of a response header, or None if it is not set."""
+    value = reply.rawHeader(name.encode('ascii'))
+    if isinstance(value, QtCore.QByteArray) and not value.isEmpty():
+        return bytes(value).decode('latin-1')
+    return None
+
+
+def _is_not_modified(reply):
+    """Check whether the server answered a conditional request with 304 Not Modified."""
+    return reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) == 304
 
 
 class RegistryPlugin(InstallablePlugin):
@@ -586,6 +692,8 @@ class RegistryPlugin(InstallablePlugin):
 
     def __init__(self, data):
         self._data = data
+        # Lowercase search text by locale
+        self._search_text = {}
         # Call parent constructor with basic values
         super().__init__(source_url=data.get('git_url'), plugin_uuid=data.get('uuid'), name=data.get('name', ''))
 
@@ -639,6 +747,16 @@ class RegistryPlugin(InstallablePlugin):
             return i18n[lang]
         return self._data.get('description', '')
 
+    def search_text(self, locale=None):
+        """Get lowercase name, description and categories for searching."""
+        if locale is None:
+            locale = self._get_current_locale()
+        text = self._search_text.get(locale)
+        if text is None:
+            text = f"{self.name_i18n(locale)} {self.description_i18n(locale)} {' '.join(self.categories)}".lower()
+            self._search_text[locale] = text
+        return text
+
     @property
     def categories(self):
         """Get plugin categories."""
@@ -59,6 +59,7 @@ from picard.util.cdrom import (
     discid as _discid,
     get_cdrom_drives,
 )
+from picard.util.profiler import profiler
 
 
 REMOTE_COMMANDS = {}
@@ -223,6 +224,24 @@ class RemoteCommandHandlers:
         else:
             log.error("No command pause time specified.")
 
+    @remote_command(
+        "Profile CPU time and memory allocations of the running instance. 'stop' and 'dump' write the results "
+        "to the log folder, 'dump' continues profiling. Defaults to toggling the profiler.",
+        help_args="[start|stop|dump|toggle]",
+    )
+    def profile(self, argstring):
+        arg = argstring.strip().upper() or 'TOGGLE'
+        if arg == 'START':
+            profiler.start()
+        elif arg == 'STOP':
+            profiler.stop()
+        elif arg == 'DUMP':
+            profiler.dump()
+        elif arg == 'TOGGLE':
+            profiler.toggle()
+        else:
+            log.error("Invalid PROFILE command argument: %r", argstring)
+
     @remote_command(
         "Exit the running instance of Picard. Use the argument 'force' to bypass Picard's unsaved files check.",
         help_args="[force]",
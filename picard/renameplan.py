@@ -0,0 +1,208 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Planning of file renames and moves for a set of files.
+
+Saving renames each file on its own, a file getting the same target path as
+another one only gets noticed when it is moved. A rename plan evaluates the
+file naming script for all files up front and marks the entries whose target
+collides with another file, so a large reorganization can be checked before
+saving anything.
+
+The naming script is evaluated in chunks on the thread pool. Saving from the
+main window builds the plan first if files get renamed or moved and asks
+before saving files with conflicting targets. The plan can also be written to
+a CSV file as a dry run.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+import csv
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import Enum
+from functools import partial
+import os
+import unicodedata
+
+from picard import tagger_instance
+from picard.config import get_config
+from picard.metadata import Metadata
+from picard.util import (
+    samefile,
+    thread,
+)
+
+
+# Number of files to evaluate the naming script for in one task
+PLAN_CHUNK_SIZE = 200
+
+
+class RenameConflict(str, Enum):
+    # Several files get the same target
+    DUPLICATE = 'duplicate'
+    # Targets only differ by case, colliding on case-insensitive file systems
+    CASE = 'case'
+    # The target exists and is not one of the planned files
+    EXISTS = 'exists'
+
+
+@dataclass
+class RenamePlanEntry:
+    source: str
+    target: str
+    # Whether another file exists at target, checked when planning
+    target_exists: bool = False
+    conflicts: set[RenameConflict] = field(default_factory=set)
+
+    @property
+    def moved(self) -> bool:
+        return self.source != self.target
+
+
+def _case_key(path: str) -> str:
+    return unicodedata.normalize('NFC', path).casefold()
+
+
+class RenamePlan:
+    """Source and target paths of a set of files with detected conflicts"""
+
+    def __init__(self, entries: list[RenamePlanEntry]):
+        self.entries = entries
+        self._detect_conflicts()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def moves(self) -> list[RenamePlanEntry]:
+        return [entry for entry in self.entries if entry.moved]
+
+    @property
+    def conflicts(self) -> list[RenamePlanEntry]:
+        return [entry for entry in self.entries if entry.conflicts]
+
+    def _detect_conflicts(self):
+        # Files which are not moved still occupy their path
+        by_target = defaultdict(list)
+        by_case_key = defaultdict(list)
+        for entry in self.entries:
+            by_target[os.path.normcase(entry.target)].append(entry)
+            by_case_key[_case_key(entry.target)].append(entry)
+
+        for entries in by_target.values():
+            if len(entries) > 1:
+                for entry in entries:
+                    entry.conflicts.add(RenameConflict.DUPLICATE)
+
+        for entries in by_case_key.values():
+            if len({os.path.normcase(entry.target) for entry in entries}) > 1:
+                for entry in entries:
+                    entry.conflicts.add(RenameConflict.CASE)
+
+        sources = {os.path.normcase(entry.source) for entry in self.entries}
+        for entry in self.moves:
+            if entry.target_exists and os.path.normcase(entry.target) not in sources:
+                entry.conflicts.add(RenameConflict.EXISTS)
+
+    def write_csv(self, path: str):
+        """Writes the plan as CSV with the columns source, target and conflicts"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(('source', 'target', 'conflicts'))
+            for entry in self.entries:
+                conflicts = ' '.join(sorted(conflict.value for conflict in entry.conflicts))
+                writer.writerow((entry.source, entry.target, conflicts))
+
+
+def plan_target(file, metadata: Metadata, settings) -> str:
+    """Returns the path file gets saved to with metadata and settings"""
+    if not (settings['rename_files'] or settings['move_files']):
+        return file.filename
+    return file.make_filename(file.filename, metadata, settings)
+
+
+def _plan_entry(file, metadata: Metadata, settings) -> RenamePlanEntry:
+    source = file.filename
+    target = plan_target(file, metadata, settings)
+    target_exists = source != target and os.path.exists(target) and not samefile(source, target)
+    return RenamePlanEntry(source, target, target_exists)
+
+
+def _plan_entries(items, settings) -> list[RenamePlanEntry]:
+    return [_plan_entry(file, metadata, settings) for file, metadata in items]
+
+
+def _copy_metadata(files) -> list[tuple]:
+    items = []
+    for file in files:
+        metadata = Metadata()
+        metadata.copy(file.metadata)
+        items.append((file, metadata))
+    return items
+
+
+def plan_renames(files, settings=None) -> RenamePlan:
+    """Builds the rename plan for files in the calling thread"""
+    if settings is None:
+        settings = get_config().setting
+    return RenamePlan(_plan_entries(_copy_metadata(files), settings))
+
+
+def build_rename_plan(
+    files,
+    callback: Callable[..., None],
+    settings=None,
+    chunk_size=PLAN_CHUNK_SIZE,
+):
+    """Builds the rename plan for files on the thread pool.
+
+    callback is called in the main thread with either `plan` or `error` set.
+    """
+    if settings is None:
+        settings = get_config().setting
+    # Copied in the main thread, the metadata may change during planning
+    items = _copy_metadata(files)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if not chunks:
+        callback(plan=RenamePlan([]))
+        return
+
+    results = [None] * len(chunks)
+    state = {'remaining': len(chunks), 'error': None}
+
+    def chunk_finished(index, result=None, error=None):
+        if error is not None and state['error'] is None:
+            state['error'] = error
+        results[index] = result
+        state['remaining'] -= 1
+        if state['remaining']:
+            return
+        if state['error'] is not None:
+            callback(error=state['error'])
+        else:
+            callback(plan=RenamePlan([entry for entries in results for entry in entries]))
+
+    thread_pool = tagger_instance().thread_pool
+    for index, chunk in enumerate(chunks):
+        thread.run_task(
+            partial(_plan_entries, chunk, settings),
+            partial(chunk_finished, index),
+            thread_pool=thread_pool,
+        )
@@ -0,0 +1,240 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Memoization of tagging script results.
+
+The variables a script reads and writes are determined from its parsed
+form. The values of the read variables and of the written variables which
+are not always overwritten form the memo key, the values of the written
+variables after running the script the memoized result. If the same script runs again with the same inputs, the result is
+applied without evaluating the script.
+
+Only scripts for which all accessed variables are known in advance are
+memoized. Scripts using variable names computed at runtime, functions
+which depend on anything except the script's variables (e.g. `$datetime`
+or `$matchedtracks`) or functions not provided by Picard itself are always
+evaluated.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import picard.script.functions as builtin_functions
+from picard.script.parser import (
+    ScriptFunction,
+    ScriptText,
+    ScriptVariable,
+    normalize_tagname,
+)
+
+
+# Functions depending on more than the variables passed to them
+IMPURE_FUNCTIONS = {'datetime', 'get_new', 'get_original', 'is_complete', 'matchedtracks', 'performer'}
+
+# Positions of arguments which are variable names, with their access mode
+NAME_ARGUMENTS = {
+    'cleanmulti': ((0, 'rw'),),
+    'copy': ((0, 'w'), (1, 'r')),
+    'copymerge': ((0, 'rw'), (1, 'r')),
+    'delete': ((0, 'w'),),
+    'get': ((0, 'r'),),
+    'set': ((0, 'w'),),
+    'setmulti': ((0, 'w'),),
+    'unset': ((0, 'w'),),
+}
+
+IMPLICIT_READS = {
+    'is_audio': {'~video'},
+    'is_video': {'~video'},
+}
+
+IMPLICIT_WRITES = {
+    'foreach': {'~loop_count', '~loop_value'},
+    'map': {'~loop_count', '~loop_value'},
+    'while': {'~loop_count'},
+}
+
+
+class _NotMemoizable(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ScriptDependencies:
+    reads: tuple[str, ...]
+    writes: tuple[str, ...]
+    # Written variables which keep their previous state if not set by a condition
+    preserved: tuple[str, ...]
+    functions: frozenset[str]
+
+
+@dataclass
+class ScriptMemoStats:
+    hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+
+
+def _static_name(expression):
+    if not all(isinstance(item, ScriptText) for item in expression):
+        raise _NotMemoizable
+    name = normalize_tagname(''.join(expression))
+    if name.endswith('*'):
+        # Wildcard $unset
+        raise _NotMemoizable
+    return name
+
+
+def _collect(expression, reads, writes, functions, overwrites=None):
+    # overwrites collects the variables always written, it is only passed
+    # for the top level of the script where all functions get evaluated.
+    for item in expression:
+        if isinstance(item, ScriptVariable):
+            reads.add(normalize_tagname(item.name))
+        elif isinstance(item, ScriptFunction):
+            name = item.name
+            if name in IMPURE_FUNCTIONS:
+                raise _NotMemoizable
+            functions.add(name)
+            for index, mode in NAME_ARGUMENTS.get(name, ()):
+                if index < len(item.args):
+                    tag = _static_name(item.args[index])
+                    if 'r' in mode:
+                        reads.add(tag)
+                    if 'w' in mode:
+                        writes.add(tag)
+                        if overwrites is not None:
+                            overwrites.add(tag)
+            reads.update(IMPLICIT_READS.get(name, ()))
+            writes.update(IMPLICIT_WRITES.get(name, ()))
+            for arg in item.args:
+                _collect(arg, reads, writes, functions)
+
+
+def script_dependencies(expression):
+    """Returns the `ScriptDependencies` of a parsed script.
+
+    Returns None if the accessed variables can not be determined statically.
+    """
+    reads, writes, functions, overwrites = set(), set(), set(), set()
+    try:
+        _collect(expression, reads, writes, functions, overwrites)
+    except _NotMemoizable:
+        return None
+    return ScriptDependencies(
+        reads=tuple(sorted(reads)),
+        writes=tuple(sorted(writes)),
+        preserved=tuple(sorted(writes - overwrites)),
+        functions=frozenset(functions),
+    )
+
+
+def _target(context):
+    # Scripts running on a MultiMetadataProxy only write to its first metadata
+    return getattr(context, 'metadata', context)
+
+
+class ScriptMemo:
+    """Memoizes the results of tagging scripts, see module documentation.
+
+    Keeps the results of the `max_size` most recently used inputs.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.stats = ScriptMemoStats()
+        self._dependencies = {}
+        self._results = OrderedDict()
+
+    def clear(self):
+        self._dependencies.clear()
+        self._results.clear()
+
+    def dependencies(self, parser, script):
+        # Also loads the functions of parser
+        expression = parser.parse_cached(script)
+        key = hash(script)
+        try:
+            return self._dependencies[key]
+        except KeyError:
+            dependencies = script_dependencies(expression)
+            self._dependencies[key] = dependencies
+            return dependencies
+
+    @staticmethod
+    def _has_builtin_functions(parser, dependencies):
+        # Plugins can register additional functions or replace Picard's own
+        functions = parser.functions
+        return all(
+            name in functions and functions[name].function.__module__ == builtin_functions.__name__
+            for name in dependencies.functions
+        )
+
+    def eval(self, parser, script, context):
+        """Evaluates script on context or applies the memoized result.
+
+        Raises the same exceptions as `ScriptParser.eval`.
+        """
+        if self.max_size <= 0:
+            parser.eval(script, context)
+            return
+        dependencies = self.dependencies(parser, script)
+        if dependencies is None or not self._has_builtin_functions(parser, dependencies):
+            self.stats.uncacheable += 1
+            parser.eval(script, context)
+            return
+
+        key = (hash(script), self._inputs(context, dependencies))
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            self.stats.hits += 1
+            self._apply(context, result)
+            return
+
+        self.stats.misses += 1
+        parser.eval(script, context)
+        self._results[key] = self._outputs(context, dependencies)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    @staticmethod
+    def _inputs(context, dependencies):
+        target = _target(context)
+        return (
+            tuple(tuple(context.getall(name)) for name in dependencies.reads),
+            tuple((tuple(target.getall(name)), name in target.deleted_tags) for name in dependencies.preserved),
+        )
+
+    @staticmethod
+    def _outputs(context, dependencies):
+        target = _target(context)
+        return tuple((name, list(target.getall(name)), name in target.deleted_tags) for name in dependencies.writes)
+
+    @staticmethod
+    def _apply(context, result):
+        for name, values, deleted in result:
+            if values:
+                context[name] = values
+            elif deleted:
+                context.delete(name)
+            else:
+                context.unset(name)
+
+
+# Shared by all tracks
+script_memo = ScriptMemo()
@@ -370,11 +370,15 @@ class ScriptParser:
         """Parse and evaluate the script."""
         self.context: Metadata = context if context is not None else Metadata()
         self.file = file
+        return self.parse_cached(script).eval(self)
+
+    def parse_cached(self, script: str) -> ScriptExpression:
+        """Load the functions and return the parsed script, parsing only once."""
         self.load_functions()
         key = hash(script)
         if key not in ScriptParser._cache:
             ScriptParser._cache[key] = self.parse(script, True)
-        return ScriptParser._cache[key].eval(self)
+        return ScriptParser._cache[key]
 
 
 class MultiValue(MutableSequence):
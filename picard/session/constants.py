@@ -97,6 +97,12 @@ class SessionConstants:
     SESSION_FILE_EXTENSION = ".mbps.gz"
     SESSION_FORMAT_VERSION = 1
 
+    # Autosave journal, appended to the session file name
+    JOURNAL_FILE_SUFFIX = ".journal"
+    JOURNAL_PENDING_FILE_SUFFIX = ".journal.pending"
+    # Number of journal records after which the journal gets merged into the session file
+    JOURNAL_COMPACT_RECORDS = 2000
+
     # Recent sessions
     # Number of recent session entries shown in the UI flyout menu.
     RECENT_SESSIONS_MAX = 5
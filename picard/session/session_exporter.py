@@ -108,7 +108,7 @@ class SessionExporter:
         config = get_config()
         session_data = {
             'version': SessionConstants.SESSION_FORMAT_VERSION,
-            'options': self._export_options(config),
+            'options': self.export_options(config),
             'items': [],
             'album_track_overrides': {},
             'album_overrides': {},
@@ -120,7 +120,7 @@ class SessionExporter:
 
         # Export file items
         for file in tagger.iter_all_files():
-            item = self._export_file_item(file)
+            item = self.export_file_item(file)
             session_data['items'].append(item)
 
         # Export metadata overrides and unmatched albums
@@ -139,7 +139,7 @@ class SessionExporter:
             session_data['mb_cache'] = self._export_mb_cache(tagger)
 
         # Export UI state (expanded albums)
-        expanded_albums = self._export_expanded_albums(tagger)
+        expanded_albums = self.export_expanded_albums(tagger)
         if expanded_albums:
             session_data['expanded_albums'] = expanded_albums
 
@@ -160,13 +160,20 @@ class SessionExporter:
         """
         cache: MbReleaseCache = {}
         for album_id, album in getattr(tagger, 'albums', {}).items():
-            # Prefer cached node saved after tracks were loaded; fall back to live node if still present
-            node = getattr(album, '_release_node_cache', None) or getattr(album, '_release_node', None)
+            node = self.export_mb_node(album)
             if node:
                 cache[album_id] = node
         return cache
 
-    def _export_expanded_albums(self, tagger: Any) -> list[str]:
+    @staticmethod
+    def export_mb_node(album: Any) -> dict[str, Any] | None:
+        """Return the MB release data node of an album, if available."""
+        # Albums keep their release JSON on disk after loading, this reads it back
+        release_node = getattr(album, 'release_node', None)
+        node = release_node() if callable(release_node) else None
+        return node if isinstance(node, dict) and node else None
+
+    def export_expanded_albums(self, tagger: Any) -> list[str]:
         """Export UI expansion state for albums in album view.
 
         Parameters
@@ -186,7 +193,7 @@ class SessionExporter:
                 expanded.append(album.id)
         return expanded
 
-    def _export_options(self, config: Any) -> dict[str, Any]:
+    def export_options(self, config: Any) -> dict[str, Any]:
         """Export configuration options.
 
         Parameters
@@ -202,7 +209,7 @@ class SessionExporter:
         """
         return {key: config.setting[key] for key in RESTORABLE_CONFIG_KEYS}
 
-    def _export_file_item(self, file: Any) -> dict[str, Any]:
+    def export_file_item(self, file: Any) -> dict[str, Any]:
         """Export a single file item.
 
         Parameters
@@ -282,6 +289,33 @@ class SessionExporter:
         """
         return {k: MetadataHandler.as_list(v) for k, v in diff.rawitems() if k not in EXCLUDED_OVERRIDE_TAGS}
 
+    @staticmethod
+    def export_album_overrides(album: Any) -> tuple[TagOverrideMap | None, dict[str, TagOverrideMap]]:
+        """Export the metadata overrides of a single album.
+
+        Parameters
+        ----------
+        album : Any
+            The album to export overrides for.
+
+        Returns
+        -------
+        tuple[TagOverrideMap | None, dict[str, TagOverrideMap]]
+            Album-level overrides, None if the album metadata is unchanged,
+            and track-level overrides keyed by track ID.
+        """
+        album_diff = album.metadata.diff(album.orig_metadata)
+        album_overrides = SessionExporter._extract_metadata_overrides(album_diff) if album_diff else None
+
+        track_overrides: dict[str, TagOverrideMap] = {}
+        for track in album.tracks:
+            # The difference to scripted_metadata are user edits made in UI
+            diff = track.metadata.diff(track.scripted_metadata)
+            if diff:
+                track_overrides[track.id] = SessionExporter._extract_metadata_overrides(diff)
+
+        return album_overrides, track_overrides
+
     def _export_metadata_overrides(self, tagger: Any) -> MetadataOverridesResult:
         """Export metadata overrides for albums and tracks.
 
@@ -313,24 +347,14 @@ class SessionExporter:
             # Check if this album has any files matched to it
             has_files = album.id in albums_with_files
 
-            # Album-level diffs vs orig_metadata
-            album_diff = album.metadata.diff(album.orig_metadata)
-            if album_diff:
-                album_meta_overrides[album.id] = SessionExporter._extract_metadata_overrides(album_diff)
-
-            # Track-level overrides
-            overrides_for_album: dict[str, TagOverrideMap] = {}
-            for track in album.tracks:
-                # The difference to scripted_metadata are user edits made in UI
-                diff = track.metadata.diff(track.scripted_metadata)
-                if diff:
-                    overrides_for_album[track.id] = SessionExporter._extract_metadata_overrides(diff)
-
+            album_diff, overrides_for_album = self.export_album_overrides(album)
+            if album_diff is not None:
+                album_meta_overrides[album.id] = album_diff
             if overrides_for_album:
                 album_overrides[album.id] = overrides_for_album
 
             # If album has no files matched and no overrides, it's an unmatched album
-            if not has_files and not album_diff and not overrides_for_album:
+            if not has_files and album_diff is None and not overrides_for_album:
                 unmatched_albums.append(album.id)
 
         return MetadataOverridesResult(
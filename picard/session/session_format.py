@@ -0,0 +1,172 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Serialization of session files.
+
+Sessions are stored either as gzip-compressed YAML or in a compact
+streaming format. Both use the .mbps.gz extension, the format is detected
+when reading.
+
+The compact format consists of gzip-compressed JSON lines, one record per
+line. The first record is a header with the session wide state, followed
+by the MB release data, the file items and the overrides. This allows the
+loader to process records while the rest of the file is still being
+decoded.
+
+Record types
+------------
+session
+    Header with ``format``, ``version``, ``options``, ``expanded_albums``
+    and the number of ``albums`` and ``items`` in the file.
+mb_cache
+    ``album_id`` and ``node``: MB release data of an album.
+item
+    ``item``: a session item, see `SessionExporter.export_file_item`.
+album_overrides, album_track_overrides
+    ``album_id`` and ``overrides`` of an album.
+unmatched_albums
+    ``album_ids``: albums without files.
+"""
+
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+from picard.config import get_config
+
+
+COMPACT_FORMAT_NAME = 'picard-session-stream'
+
+_COMPACT_HEADER_PREFIX = b'{"type": "session"'
+
+
+def iter_session_records(session_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Convert session data to records of the compact format"""
+    mb_cache = session_data.get('mb_cache') or {}
+    items = session_data.get('items') or []
+    header = {
+        'type': 'session',
+        'format': COMPACT_FORMAT_NAME,
+        'version': session_data.get('version'),
+        'options': session_data.get('options', {}),
+        'albums': len(mb_cache),
+        'items': len(items),
+    }
+    if 'expanded_albums' in session_data:
+        header['expanded_albums'] = session_data['expanded_albums']
+    yield header
+    for album_id, node in mb_cache.items():
+        yield {'type': 'mb_cache', 'album_id': album_id, 'node': node}
+    for item in items:
+        yield {'type': 'item', 'item': item}
+    for record_type in ('album_overrides', 'album_track_overrides'):
+        for album_id, overrides in (session_data.get(record_type) or {}).items():
+            yield {'type': record_type, 'album_id': album_id, 'overrides': overrides}
+    unmatched_albums = session_data.get('unmatched_albums')
+    if unmatched_albums:
+        yield {'type': 'unmatched_albums', 'album_ids': unmatched_albums}
+
+
+def session_from_records(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Build session data from records of the compact format"""
+    session_data: dict[str, Any] = {
+        'items': [],
+        'album_track_overrides': {},
+        'album_overrides': {},
+        'unmatched_albums': [],
+        'mb_cache': {},
+    }
+    for record in records:
+        add_record(session_data, record)
+    return session_data
+
+
+def add_record(session_data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Add a single record of the compact format to session data"""
+    record_type = record.get('type')
+    if record_type == 'item':
+        session_data['items'].append(record['item'])
+    elif record_type == 'mb_cache':
+        session_data['mb_cache'][record['album_id']] = record['node']
+    elif record_type in {'album_overrides', 'album_track_overrides'}:
+        session_data[record_type][record['album_id']] = record['overrides']
+    elif record_type == 'unmatched_albums':
+        session_data['unmatched_albums'].extend(record['album_ids'])
+    elif record_type == 'session':
+        session_data['version'] = record.get('version')
+        session_data['options'] = record.get('options', {})
+        if 'expanded_albums' in record:
+            session_data['expanded_albums'] = record['expanded_albums']
+
+
+def is_compact_session(path: str | Path) -> bool:
+    """Returns True if path is a session file in the compact format"""
+    try:
+        with gzip.open(path, 'rb') as f:
+            return f.read(len(_COMPACT_HEADER_PREFIX)) == _COMPACT_HEADER_PREFIX
+    except (OSError, EOFError):
+        return False
+
+
+def read_compact_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Read the records of a compact session file one by one.
+
+    Raises ValueError if the file is not in the compact format.
+    """
+    with gzip.open(path, 'rb') as f:
+        header = json.loads(f.readline())
+        if header.get('type') != 'session' or header.get('format') != COMPACT_FORMAT_NAME:
+            raise ValueError("Not a compact session file: %s" % path)
+        yield header
+        for line in f:
+            yield json.loads(line)
+
+
+def dump_compact(session_data: dict[str, Any]) -> bytes:
+    """Serialize session data to the compact format"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
+        for record in iter_session_records(session_data):
+            f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+            f.write(b'\n')
+    return buffer.getvalue()
+
+
+def dump_yaml(session_data: dict[str, Any]) -> bytes:
+    """Serialize session data to gzip-compressed YAML"""
+    # Local import to avoid module-level dependency during static analysis
+    import yaml
+
+    yaml_text = yaml.dump(session_data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    return gzip.compress(yaml_text.encode("utf-8"))
+
+
+def dump_session(session_data: dict[str, Any], compact: bool | None = None) -> bytes:
+    """Serialize session data in the configured session file format.
+
+    If compact is None the `session_compact_format` setting is used.
+    """
+    if compact is None:
+        compact = get_config().setting['session_compact_format']
+    return dump_compact(session_data) if compact else dump_yaml(session_data)
@@ -0,0 +1,355 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Journaled session autosave.
+
+Instead of exporting and writing the complete session on every autosave,
+only the files and albums which changed since the last autosave get
+exported. They are appended as JSON records to a journal file next to the
+session file. Once the journal has grown large enough it gets merged into
+the session file on a worker thread.
+
+Journal records are full replacements of the exported state of a file or
+album, so applying them repeatedly or on top of a newer session file is
+safe. `SessionFileReader` applies the journal files when reading a session.
+
+Record types
+------------
+file
+    ``item``: an exported session item, replaces the item with the same path.
+file_removed
+    ``file_path``: the item with this path gets removed.
+album
+    ``album_id``, ``album_overrides``, ``track_overrides``, ``unmatched``
+    and optionally ``mb_cache``: replaces the state of the album.
+album_removed
+    ``album_id``: removes all state of the album.
+state
+    ``options`` and ``expanded_albums``: replace the session wide state.
+"""
+
+import json
+from pathlib import Path
+import time
+from typing import Any
+import weakref
+
+from picard import log
+from picard.config import get_config
+from picard.session.constants import SessionConstants
+from picard.session.session_format import dump_session
+from picard.util import (
+    atomic_write,
+    thread,
+)
+
+
+def journal_paths(path: str | Path) -> tuple[Path, Path]:
+    """Return the paths of the pending and the active journal of a session file.
+
+    The pending journal is being merged into the session file, records are
+    appended to the active journal. They are applied in this order.
+    """
+    p = Path(path)
+    journal = p.with_name(p.name + SessionConstants.JOURNAL_FILE_SUFFIX)
+    pending = p.with_name(p.name + SessionConstants.JOURNAL_PENDING_FILE_SUFFIX)
+    return pending, journal
+
+
+def read_journal(path: Path) -> list[dict[str, Any]]:
+    """Read the records of a journal file.
+
+    A truncated last record, e.g. caused by a crash while appending, is ignored.
+    """
+    records = []
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    log.warning("Session journal %s: ignoring invalid record", path)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def apply_journal(session_data: dict[str, Any], records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply journal records to session data, modifies session_data in place"""
+    items = {item['file_path']: item for item in session_data.get('items', [])}
+    album_overrides = session_data.setdefault('album_overrides', {})
+    album_track_overrides = session_data.setdefault('album_track_overrides', {})
+    mb_cache = session_data.setdefault('mb_cache', {})
+    unmatched = dict.fromkeys(session_data.get('unmatched_albums', []))
+
+    for record in records:
+        record_type = record.get('type')
+        if record_type == 'file':
+            item = record['item']
+            items[item['file_path']] = item
+        elif record_type == 'file_removed':
+            items.pop(record['file_path'], None)
+        elif record_type in {'album', 'album_removed'}:
+            album_id = record['album_id']
+            album_overrides.pop(album_id, None)
+            album_track_overrides.pop(album_id, None)
+            unmatched.pop(album_id, None)
+            if record_type == 'album_removed':
+                mb_cache.pop(album_id, None)
+                continue
+            if record.get('album_overrides') is not None:
+                album_overrides[album_id] = record['album_overrides']
+            if record.get('track_overrides'):
+                album_track_overrides[album_id] = record['track_overrides']
+            if record.get('unmatched'):
+                unmatched[album_id] = None
+            if record.get('mb_cache'):
+                mb_cache[album_id] = record['mb_cache']
+        elif record_type == 'state':
+            session_data['options'] = record['options']
+            session_data['expanded_albums'] = record['expanded_albums']
+
+    session_data['items'] = list(items.values())
+    session_data['unmatched_albums'] = list(unmatched)
+    return session_data
+
+
+def discard_journal(path: str | Path) -> None:
+    """Remove the journal files of a session file"""
+    for journal_path in journal_paths(path):
+        journal_path.unlink(missing_ok=True)
+
+
+class SessionJournal:
+    """Tracks session changes and autosaves them to a journal.
+
+    The first autosave to a path writes a full session file, later ones only
+    append the changes recorded by the ``*_changed`` and ``*_removed``
+    methods. Those are called for all objects and cheap if no journaled
+    autosave is active.
+    """
+
+    def __init__(self):
+        self.path: Path | None = None
+        self._exporter = None
+        self._changed_files = weakref.WeakSet()
+        self._changed_albums = weakref.WeakSet()
+        self._removed_files: set[str] = set()
+        self._removed_albums: set[str] = set()
+        # Path each journaled file was last written with
+        self._file_paths = weakref.WeakKeyDictionary()
+        # Albums whose MB data was already written
+        self._album_ids: set[str] = set()
+        self._state = None
+        self._records = 0
+        self._busy = False
+
+    @property
+    def active(self) -> bool:
+        return self.path is not None
+
+    def file_changed(self, file) -> None:
+        if self.path is not None:
+            self._changed_files.add(file)
+
+    def file_removed(self, file) -> None:
+        if self.path is not None:
+            self._changed_files.discard(file)
+            path = self._file_paths.pop(file, None)
+            if path is not None:
+                self._removed_files.add(path)
+
+    def album_changed(self, album) -> None:
+        if self.path is not None and album is not None:
+            self._changed_albums.add(album)
+
+    def album_removed(self, album) -> None:
+        if self.path is not None:
+            self._changed_albums.discard(album)
+            self._album_ids.discard(album.id)
+            self._removed_albums.add(album.id)
+
+    def reset(self) -> None:
+        """Stop journaling, the next autosave writes a full session file"""
+        self.path = None
+        self._changed_files.clear()
+        self._changed_albums.clear()
+        self._removed_files.clear()
+        self._removed_albums.clear()
+        self._file_paths.clear()
+        self._album_ids.clear()
+        self._state = None
+        self._records = 0
+
+    def autosave(self, tagger: Any, path: str | Path) -> None:
+        """Save the session to path, writing only changes if possible"""
+        path = Path(path)
+        if not str(path).lower().endswith(SessionConstants.SESSION_FILE_EXTENSION):
+            path = Path(str(path) + SessionConstants.SESSION_FILE_EXTENSION)
+        if self._busy and path != self.path:
+            # Wait for the running write before switching to another file
+            return
+        if path != self.path or (not self._busy and not path.exists()):
+            self._save_snapshot(tagger, path)
+            return
+        records = self._collect_records(tagger)
+        if records:
+            self._append(records)
+        if self._records >= SessionConstants.JOURNAL_COMPACT_RECORDS and not self._busy:
+            self._compact()
+
+    def _get_exporter(self):
+        if self._exporter is None:
+            # Local import, the exporter depends on the album and file modules
+            from picard.session.session_exporter import SessionExporter
+
+            self._exporter = SessionExporter()
+        return self._exporter
+
+    def _save_snapshot(self, tagger: Any, path: Path) -> None:
+        exporter = self._get_exporter()
+        self.reset()
+        start = time.perf_counter()
+        session_data = exporter.export_session(tagger)
+        for file in tagger.iter_all_files():
+            self._file_paths[file] = file.filename
+        self._album_ids.update(session_data['mb_cache'])
+        self._state = (session_data['options'], session_data['expanded_albums'])
+        self.path = path
+        # Journal records of earlier runs are obsolete once the session file is written
+        self._rotate()
+        log.debug("Session autosave: exported %s in %.1f ms", path, (time.perf_counter() - start) * 1000)
+        self._write_in_background(path, lambda: session_data)
+
+    def _collect_records(self, tagger: Any) -> list[dict[str, Any]]:
+        exporter = self._get_exporter()
+        records: list[dict[str, Any]] = []
+
+        for album_id in self._removed_albums:
+            records.append({'type': 'album_removed', 'album_id': album_id})
+        self._removed_albums.clear()
+        for file_path in self._removed_files:
+            records.append({'type': 'file_removed', 'file_path': file_path})
+        self._removed_files.clear()
+
+        changed_files, self._changed_files = self._changed_files, weakref.WeakSet()
+        for file in changed_files:
+            if file.state == file.State.REMOVED:
+                continue
+            old_path = self._file_paths.get(file)
+            if old_path is not None and old_path != file.filename:
+                records.append({'type': 'file_removed', 'file_path': old_path})
+            records.append({'type': 'file', 'item': exporter.export_file_item(file)})
+            self._file_paths[file] = file.filename
+
+        # Local import, the album module depends on this module
+        from picard.album import NatAlbum
+
+        changed_albums, self._changed_albums = self._changed_albums, weakref.WeakSet()
+        for album in changed_albums:
+            if isinstance(album, NatAlbum) or tagger.albums.get(album.id) is not album:
+                continue
+            records.append(self._album_record(album))
+
+        state = (exporter.export_options(get_config()), exporter.export_expanded_albums(tagger))
+        if state != self._state:
+            self._state = state
+            records.append({'type': 'state', 'options': state[0], 'expanded_albums': state[1]})
+        return records
+
+    def _album_record(self, album) -> dict[str, Any]:
+        exporter = self._get_exporter()
+        album_overrides, track_overrides = exporter.export_album_overrides(album)
+        has_files = next(album.iterfiles(), None) is not None
+        record = {
+            'type': 'album',
+            'album_id': album.id,
+            'album_overrides': album_overrides,
+            'track_overrides': track_overrides,
+            'unmatched': not has_files and album_overrides is None and not track_overrides,
+        }
+        if album.id not in self._album_ids and get_config().setting['session_include_mb_data']:
+            node = exporter.export_mb_node(album)
+            if node:
+                record['mb_cache'] = node
+                self._album_ids.add(album.id)
+        return record
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        _pending, journal = journal_paths(self.path)
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with open(journal, 'a', encoding='utf-8') as f:
+            f.write(data)
+        self._records += len(records)
+        log.debug("Session autosave: appended %d records to %s", len(records), journal)
+
+    def _rotate(self) -> None:
+        """Move the active journal to the pending journal"""
+        pending, journal = journal_paths(self.path)
+        if not journal.exists():
+            return
+        if pending.exists():
+            # A previous merge failed, keep its records in front
+            with open(pending, 'ab') as f:
+                f.write(journal.read_bytes())
+            journal.unlink()
+        else:
+            journal.replace(pending)
+        self._records = 0
+
+    def _compact(self) -> None:
+        path = self.path
+        pending, _journal = journal_paths(path)
+        self._rotate()
+
+        def merge():
+            # Local import to avoid an import cycle with the loader
+            from picard.session.session_loader import SessionFileReader
+
+            session_data = SessionFileReader().read_snapshot(path)
+            return apply_journal(session_data, read_journal(pending))
+
+        self._write_in_background(path, merge)
+
+    def _write_in_background(self, path: Path, get_session_data) -> None:
+        pending, _journal = journal_paths(path)
+        compact = get_config().setting['session_compact_format']
+        self._busy = True
+
+        def write():
+            start = time.perf_counter()
+            atomic_write(path, dump_session(get_session_data(), compact=compact))
+            # Everything in the pending journal is part of the session file now
+            pending.unlink(missing_ok=True)
+            return time.perf_counter() - start
+
+        def done(result=None, error=None):
+            self._busy = False
+            if error is not None:
+                log.error("Session autosave: writing %s failed: %s", path, error)
+                if path == self.path:
+                    # The session file might be missing changes, write it completely next time
+                    self.reset()
+            else:
+                log.debug("Session autosave: wrote %s in %.1f ms", path, result * 1000)
+
+        thread.run_task(write, done)
+
+
+# Shared by the objects reporting changes and the autosave timer
+session_journal = SessionJournal()
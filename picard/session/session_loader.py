@@ -25,9 +25,14 @@ This module handles loading and restoring Picard sessions from files,
 breaking down the complex loading logic into focused, manageable components.
 """
 
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
 from contextlib import suppress
 from dataclasses import dataclass
 import gzip
+import json
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -39,6 +44,7 @@ import yaml
 
 from PyQt6 import QtCore
 
+from picard import log
 from picard.album import Album
 from picard.album_requests import TaskType
 from picard.config import get_config
@@ -54,6 +60,17 @@ from picard.session.session_data import (
     AlbumItems,
     GroupedItems,
 )
+from picard.session.session_format import (
+    add_record,
+    is_compact_session,
+    read_compact_records,
+    session_from_records,
+)
+from picard.session.session_journal import (
+    apply_journal,
+    journal_paths,
+    read_journal,
+)
 from picard.session.track_mover import TrackMover
 
 
@@ -132,6 +149,9 @@ class SessionFileReader:
     def read(self, path: str | Path) -> dict[str, Any]:
         """Read and parse a session file.
 
+        Records of an autosave journal next to the session file get applied
+        to the session data.
+
         Parameters
         ----------
         path : str | Path
@@ -149,12 +169,51 @@ class SessionFileReader:
         yaml.YAMLError
             If the file cannot be parsed as YAML.
         """
+        data = self.read_snapshot(path)
+        records = [record for journal_path in journal_paths(path) for record in read_journal(journal_path)]
+        if records and isinstance(data, dict):
+            log.debug("Applying %d session journal records to %s", len(records), path)
+            apply_journal(data, records)
+        return data
+
+    def read_snapshot(self, path: str | Path) -> dict[str, Any]:
+        """Read and parse a session file without applying its journal.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the session file.
+
+        Returns
+        -------
+        dict[str, Any]
+            Parsed session data.
+        """
         p = Path(path)
         raw = p.read_bytes()
         is_gzip = len(raw) >= 2 and raw[0] == 0x1F and raw[1] == 0x8B
         payload = gzip.decompress(raw) if is_gzip else raw
+        if is_gzip and payload.startswith(b'{'):
+            return session_from_records(json.loads(line) for line in payload.splitlines())
         return yaml.safe_load(payload.decode("utf-8"))
 
+    def iter_records(self, path: str | Path) -> Iterator[dict[str, Any]] | None:
+        """Read a session file incrementally.
+
+        Returns an iterator over the records of a compact session file, see
+        `picard.session.session_format`. Returns None if the session can
+        not be read incrementally, because it is stored as YAML or has an
+        autosave journal which needs to be applied.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the session file.
+        """
+        if not is_compact_session(path) or any(p.exists() for p in journal_paths(path)):
+            return None
+        return read_compact_records(path)
+
 
 class ConfigurationManager:
     """Restore configuration and manage safe-restore lifecycle flags."""
@@ -187,13 +246,14 @@ class ConfigurationManager:
 class ItemGrouper:
     """Group raw session items and extract metadata deltas."""
 
-    def group(self, items: list[dict[str, Any]]) -> GroupedItems:
+    def group(self, items: Iterable[dict[str, Any]]) -> GroupedItems:
         """Group items by their destination (unclustered, clusters, albums, NAT).
 
         Parameters
         ----------
-        items : list[dict[str, Any]]
-            Raw item entries from the session payload.
+        items : Iterable[dict[str, Any]]
+            Raw item entries from the session payload. Items are processed
+            as they are produced, so this can be a generator reading them.
 
         Returns
         -------
@@ -393,15 +453,18 @@ class AlbumManager:
         needed_album_ids = set(grouped_items.by_album.keys()) | set(mb_cache.keys())
         for album_id in needed_album_ids:
             node = mb_cache.get(album_id)
-            if not node:
-                continue
-            album = self._tagger.albums.get(album_id)
-            if not album:
-                album = self._build_from_cache(album_id, node)
-            self.loaded_albums[album_id] = album
-            self._ui_state.ensure_album_visible(album, self._saved_expanded_albums)
-            if not self._suppress_network:
-                album.load()
+            if node:
+                self.preload_album(album_id, node)
+
+    def preload_album(self, album_id: str, node: dict[str, Any]) -> None:
+        """Preload a single album from its embedded MB cache data."""
+        album = self._tagger.albums.get(album_id)
+        if not album:
+            album = self._build_from_cache(album_id, node)
+        self.loaded_albums[album_id] = album
+        self._ui_state.ensure_album_visible(album, self._saved_expanded_albums)
+        if not self._suppress_network:
+            album.load()
 
     def load_needed_albums(self, grouped_items: GroupedItems, mb_cache: dict[str, Any]) -> None:
         """Ensure albums referenced by grouped items are available."""
@@ -621,7 +684,7 @@ class SessionLoader(QtCore.QObject):
         ctx = self._build_context(Path(path))
 
         # Preload albums from embedded cache if available
-        if self._mb_cache:
+        if self._mb_cache and not ctx.preloaded:
             self._progress.emit("preload_cache", details={'albums': len(self._mb_cache)})
             self._albums.preload_from_cache(self._mb_cache, ctx.grouped_items)
 
@@ -662,8 +725,32 @@ class SessionLoader(QtCore.QObject):
             Context holding parsed data, grouping, and metadata map.
         """
         self._progress.emit("read", details={'path': str(path)})
+        records = self._file_reader.iter_records(path)
+        if records is not None:
+            return self._build_context_from_records(path, records)
         data = self._file_reader.read(path)
+        self._prepare(data)
 
+        items = data.get('items', [])
+        grouped_items = self._grouper.group(items)
+        metadata_map = self._grouper.extract_metadata(items)
+        self._mb_cache = data.get('mb_cache', {})
+
+        return SessionLoadContext(
+            path=path,
+            data=data,
+            grouped_items=grouped_items,
+            metadata_map=metadata_map,
+        )
+
+    def _prepare(self, data: dict[str, Any]) -> None:
+        """Prepare the session and restore options from the session header.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Session data, only options and expanded albums are used.
+        """
         self._config_mgr.prepare_session(self.tagger)
         self._config_mgr.restore_options(data.get('options', {}))
 
@@ -676,16 +763,50 @@ class SessionLoader(QtCore.QObject):
         saved_expanded_albums = set(data.get('expanded_albums', [])) if 'expanded_albums' in data else None
         self._albums.configure(self._suppress_mb_requests, saved_expanded_albums)
 
-        items = data.get('items', [])
-        grouped_items = self._grouper.group(items)
-        metadata_map = self._grouper.extract_metadata(items)
-        self._mb_cache = data.get('mb_cache', {})
+    def _build_context_from_records(self, path: Path, records: Iterator[dict[str, Any]]) -> "SessionLoadContext":
+        """Build the load context while reading a compact session file.
+
+        Albums get preloaded from their cached MB data and items get grouped
+        as soon as their records are decoded.
+
+        Parameters
+        ----------
+        path : Path
+            Session file path to read.
+        records : Iterator[dict[str, Any]]
+            Records read from the session file, starting with the header.
+
+        Returns
+        -------
+        SessionLoadContext
+            Context holding parsed data, grouping, and metadata map.
+        """
+        header = next(records)
+        data = session_from_records([header])
+        self._prepare(data)
+        self._mb_cache = data['mb_cache']
+        if header.get('albums'):
+            self._progress.emit("preload_cache", details={'albums': header['albums']})
+
+        def iter_items():
+            for record in records:
+                if record.get('type') == 'item':
+                    data['items'].append(record['item'])
+                    yield record['item']
+                    continue
+                add_record(data, record)
+                if record.get('type') == 'mb_cache' and record.get('node'):
+                    self._albums.preload_album(record['album_id'], record['node'])
+
+        grouped_items = self._grouper.group(iter_items())
+        metadata_map = self._grouper.extract_metadata(data['items'])
 
         return SessionLoadContext(
             path=path,
             data=data,
             grouped_items=grouped_items,
             metadata_map=metadata_map,
+            preloaded=True,
         )
 
     def _compute_total_files(self, grouped_items: GroupedItems) -> int:
@@ -781,9 +902,12 @@ class SessionLoadContext:
         Items grouped by destination.
     metadata_map : dict[Path, dict[str, list[Any]]]
         Per-file tag deltas to apply after load.
+    preloaded : bool
+        True if albums were already preloaded from the MB cache while reading.
     """
 
     path: Path
     data: dict[str, Any]
     grouped_items: GroupedItems
     metadata_map: dict[Path, dict[str, list[Any]]]
+    preloaded: bool = False
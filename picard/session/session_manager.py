@@ -41,14 +41,20 @@ Notes
 -----
 Session files use the .mbps.gz extension and contain gzip-compressed YAML data
 with version information, options, file locations, and metadata overrides.
+Optionally a compact format of gzip-compressed JSON lines is written, which
+can be read incrementally (see `picard.session.session_format`).
 """
 
-import gzip
 from pathlib import Path
 from typing import Any
 
 from picard.session.constants import SessionConstants
 from picard.session.session_exporter import SessionExporter
+from picard.session.session_format import dump_session
+from picard.session.session_journal import (
+    discard_journal,
+    session_journal,
+)
 from picard.session.session_loader import SessionLoader
 from picard.util import atomic_write
 
@@ -95,23 +101,22 @@ def save_session_to_path(tagger: Any, path: str | Path) -> None:
 
     Notes
     -----
-    The session is saved as YAML (UTF-8) and gzip-compressed. If the
+    The session is saved as YAML (UTF-8) and gzip-compressed, or in the
+    compact streaming format if enabled in the settings. If the
     file already exists, it will be overwritten. The write operation is atomic
-    to prevent file corruption in case of crashes.
+    to prevent file corruption in case of crashes. An autosave journal of
+    the file is removed, as it is outdated by the complete session.
     """
     p = Path(path)
     if not str(p).lower().endswith(SessionConstants.SESSION_FILE_EXTENSION):
         p = Path(str(p) + SessionConstants.SESSION_FILE_EXTENSION)
 
-    # Local import to avoid module-level dependency during static analysis
-    import yaml
-
     data = export_session(tagger)
 
-    yaml_text = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    compressed = gzip.compress(yaml_text.encode("utf-8"))
-
-    atomic_write(p, compressed)
+    atomic_write(p, dump_session(data))
+    if session_journal.path == p:
+        session_journal.reset()
+    discard_journal(p)
 
 
 def load_session_from_path(tagger: Any, path: str | Path) -> None:
@@ -52,6 +52,7 @@ from functools import partial
 from hashlib import blake2b
 from io import StringIO
 import logging
+import multiprocessing
 import os
 from pathlib import Path
 import platform
@@ -118,13 +119,17 @@ from picard.const.sys import (
     IS_WIN,
 )
 from picard.coverart.image import DataHash
+from picard.coverart.processing.executor import shutdown_process_executor
 from picard.debug_opts import DebugOpt
 from picard.disc import (
     Disc,
 )
 from picard.extension_points.disc_log_readers import ext_point_disc_log_readers
 from picard.extension_points.event_hooks import register_file_post_save_processor
-from picard.file import File
+from picard.file import (
+    File,
+    SaveBatch,
+)
 from picard.formats import DEFAULT_FORMATS
 from picard.formats.registry import FormatRegistry
 from picard.i18n import (
@@ -156,6 +161,7 @@ except ImportError:
 from picard.releasegroup import ReleaseGroup
 from picard.remotecommands import RemoteCommands
 from picard.session.constants import SessionConstants
+from picard.session.session_journal import session_journal
 from picard.session.session_manager import (
     export_session as _export_session,
     load_session_from_path,
@@ -182,7 +188,11 @@ from picard.util import (
     webbrowser2,
 )
 from picard.util.checkupdate import UpdateCheckManager
+from picard.util.metrics import metrics
+from picard.util.profiler import profiler
 from picard.util.readthedocs import ReadTheDocs
+from picard.util.settingscache import settings_cache
+from picard.util.stallwatchdog import stall_watchdog
 from picard.util.toc import (
     parse_toc_itunes_cddb,
 )
@@ -208,6 +218,15 @@ from picard.ui.util import (
 )
 
 
+def _compile_ignore_regex(pattern):
+    if pattern:
+        try:
+            return re.compile(pattern)
+        except re.error as e:
+            log.error("Failed evaluating regular expression for ignore_regex: %s", e)
+    return None
+
+
 # A "fix" for https://bugs.python.org/issue1438480
 def _patched_shutil_copystat(src, dst, *, follow_symlinks=True):
     try:
@@ -331,6 +350,28 @@ class Tagger(QtWidgets.QApplication):
         self.register_cleanup(self.save_thread_pool.waitForDone)
         self.save_thread_pool.setMaxThreadCount(1)
 
+        active_threads = metrics.gauge('thread_pool_active_threads', "Number of busy threads per thread pool")
+        max_threads = metrics.gauge('thread_pool_max_threads', "Maximum number of threads per thread pool")
+        for name, pool in (
+            ('main', self.thread_pool),
+            ('priority', self.priority_thread_pool),
+            ('save', self.save_thread_pool),
+        ):
+            active_threads.set_function(pool.activeThreadCount, pool=name)
+            max_threads.set_function(pool.maxThreadCount, pool=name)
+
+        # Optional worker processes for CPU heavy cover art processing,
+        # those are started on first use.
+        self.register_cleanup(shutdown_process_executor)
+
+        # Samples the main thread when it stalls, see DebugOpt.GUI_STALLS
+        stall_watchdog.set_enabled(DebugOpt.GUI_STALLS.enabled)
+        self.register_cleanup(stall_watchdog.stop)
+
+        # Profiling from startup, see DebugOpt.PROFILING
+        profiler.set_enabled(DebugOpt.PROFILING.enabled)
+        self.register_cleanup(profiler.stop)
+
     def _init_pipe_server(self, pipe_handler):
         """Setup pipe handler for managing single app instance and commands."""
         self.pipe_handler = pipe_handler
@@ -789,9 +830,11 @@ class Tagger(QtWidgets.QApplication):
                     config.persist['session_autosave_path'] = path
 
                 with contextlib.suppress(OSError, PermissionError, FileNotFoundError, ValueError, OverflowError):
-                    # Best effort autosave; do not crash programme
-                    save_session_to_path(self, path)
+                    # Best effort autosave; do not crash programme.
+                    # Only changes get written, the session file is updated in the background.
+                    session_journal.autosave(self, path)
 
+            self.album_removed.connect(session_journal.album_removed)
             self._session_autosave_timer.timeout.connect(_autosave)
             self._session_autosave_timer.start()
 
@@ -1005,14 +1048,8 @@ class Tagger(QtWidgets.QApplication):
 
     def add_files(self, filenames, target=None):
         """Add files to the tagger."""
-        ignoreregex = None
         config = get_config()
-        pattern = config.setting['ignore_regex']
-        if pattern:
-            try:
-                ignoreregex = re.compile(pattern)
-            except re.error as e:
-                log.error("Failed evaluating regular expression for ignore_regex: %s", e)
+        ignoreregex = settings_cache.get('ignore_regex', _compile_ignore_regex)
         ignore_hidden = config.setting["ignore_hidden_files"]
         new_files = []
         for filename in filenames:
@@ -1026,7 +1063,7 @@ class Tagger(QtWidgets.QApplication):
                 log.debug("File ignored (.smbdelete): %r", filename)
                 continue
             if ignoreregex is not None and ignoreregex.search(filename):
-                log.info("File ignored (matching %r): %r", pattern, filename)
+                log.info("File ignored (matching %r): %r", ignoreregex.pattern, filename)
                 continue
             if filename not in self.files:
                 file = self.format_registry.open(filename)
@@ -1134,8 +1171,21 @@ class Tagger(QtWidgets.QApplication):
 
     def save(self, objects):
         """Save the specified objects."""
-        for file in iter_files_from_objects(objects, save=True):
-            file.save()
+        files = list(iter_files_from_objects(objects, save=True))
+        if not files:
+            return
+        batch = SaveBatch(len(files), self._save_finished)
+        for file in files:
+            file.save(batch=batch)
+
+    def _save_finished(self, batch):
+        if batch.skipped:
+            self.window.set_statusbar_message(
+                N_("Saved %(written)i files, skipped %(skipped)i files with unchanged tags"),
+                {'written': batch.written, 'skipped': batch.skipped},
+            )
+        elif batch.written:
+            self.window.set_statusbar_message(N_("Saved %(written)i files"), {'written': batch.written})
 
     def load_mbid(self, type, mbid):
         self.bring_tagger_front()
@@ -1808,6 +1858,8 @@ def setup_dbus():
 
 
 def main(localedir=None, autoupdate=True):
+    # Required for worker processes in frozen builds, see picard.coverart.processing.executor
+    multiprocessing.freeze_support()
     log.enable_default_handlers()
 
     """Main entry point to the program"""
@@ -82,11 +82,14 @@ from picard.script import (
     ScriptParser,
     iter_active_tagging_scripts,
 )
+from picard.script.memo import script_memo
+from picard.session.session_journal import session_journal
 from picard.util import (
     pattern_as_regex,
     titlecase,
 )
 from picard.util.imagelist import ImageList
+from picard.util.settingscache import settings_cache
 from picard.util.textencoding import asciipunct
 
 
@@ -242,13 +245,15 @@ class Track(FileListItem):
         for script in iter_active_tagging_scripts():
             parser = ScriptParser()
             try:
-                parser.eval(script.content, metadata)
+                # Skips evaluation if the script already ran with the same inputs
+                script_memo.eval(parser, script.content, metadata)
             except ScriptError:
                 log.exception("Failed to run tagger script %s on track", script.name)
             if strip_whitespace:
                 metadata.strip_whitespace()
 
     def update(self):
+        session_journal.album_changed(self.album)
         if self.ui_item:
             self.ui_item.update()
 
@@ -359,7 +364,7 @@ class Track(FileListItem):
             return []
 
         # Filter by name and usage
-        genres_filter = TagGenreFilter(filters)
+        genres_filter = filters if isinstance(filters, TagGenreFilter) else TagGenreFilter(filters)
         genres = genres_filter.filter(genres, minusage=minusage)
 
         # Find most common genres
@@ -383,7 +388,7 @@ class Track(FileListItem):
             genres,
             limit=config.setting['max_genres'],
             minusage=config.setting['min_genre_usage'],
-            filters=config.setting['genres_filter'],
+            filters=settings_cache.get('genres_filter', TagGenreFilter),
             join_with=config.setting['join_genres'],
         )
 
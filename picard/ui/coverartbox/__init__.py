@@ -73,6 +73,7 @@ from picard.util.lrucache import LRUCache
 
 from .coverartthumbnail import CoverArtThumbnail
 from .imageurldialog import ImageURLDialog
+from .thumbnailloader import ThumbnailLoader
 
 from picard.ui.util import (
     FileDialog,
@@ -108,10 +109,13 @@ class CoverArtBox(QtWidgets.QGroupBox):
         # cleared it from orig_metadata.images (see update_metadata).
         self._exported_images = None
         self.pixmap_cache = LRUCache(40)
+        self.thumbnail_loader = ThumbnailLoader()
         self.cover_art_label = QtWidgets.QLabel('')
         self.cover_art_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.cover_art_label.setWordWrap(True)
-        self.cover_art = CoverArtThumbnail(drops=True, pixmap_cache=self.pixmap_cache, parent=self)
+        self.cover_art = CoverArtThumbnail(
+            drops=True, pixmap_cache=self.pixmap_cache, thumbnail_loader=self.thumbnail_loader, parent=self
+        )
         self.cover_art.image_dropped.connect(self.fetch_remote_image)
         self.cover_art_info_label = QtWidgets.QLabel('')
         self.cover_art_info_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
@@ -120,7 +124,9 @@ class CoverArtBox(QtWidgets.QGroupBox):
             40, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding
         )
         self.orig_cover_art_label = QtWidgets.QLabel('')
-        self.orig_cover_art = CoverArtThumbnail(drops=False, pixmap_cache=self.pixmap_cache, parent=self)
+        self.orig_cover_art = CoverArtThumbnail(
+            drops=False, pixmap_cache=self.pixmap_cache, thumbnail_loader=self.thumbnail_loader, parent=self
+        )
         self.orig_cover_art_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.orig_cover_art_label.setWordWrap(True)
         self.orig_cover_art_info_label = QtWidgets.QLabel('')
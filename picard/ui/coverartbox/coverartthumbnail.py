@@ -33,6 +33,8 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+from functools import partial
+
 from PyQt6 import (
     QtCore,
     QtGui,
@@ -43,10 +45,10 @@ from picard import (
     tagger_instance,
 )
 from picard.const import MAX_COVERS_TO_STACK
-from picard.coverart.image import CoverArtImageIOError
 from picard.i18n import gettext as _
 
 from picard.ui.colors import interface_colors
+from picard.ui.coverartbox.thumbnailloader import ThumbnailLoader
 from picard.ui.util import apply_removal_overlay
 from picard.ui.widgets import ActiveLabel
 
@@ -58,7 +60,7 @@ COVERART_WIDTH = THUMBNAIL_WIDTH - 7
 class CoverArtThumbnail(ActiveLabel):
     image_dropped = QtCore.pyqtSignal(QtCore.QUrl, bytes)
 
-    def __init__(self, active=False, drops=False, pixmap_cache=None, parent=None):
+    def __init__(self, active=False, drops=False, pixmap_cache=None, thumbnail_loader=None, parent=None):
         super().__init__(active=active, parent=parent)
         self.data = None
         self.has_common_images = None
@@ -73,6 +75,7 @@ class CoverArtThumbnail(ActiveLabel):
         if pixmap_cache is None:
             raise ValueError("pixmap_cache is required")
         self._pixmap_cache = pixmap_cache
+        self._thumbnail_loader = thumbnail_loader or ThumbnailLoader()
         self._update_default_pixmaps()
         self.setPixmap(self.shadow)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
@@ -203,15 +206,18 @@ class CoverArtThumbnail(ActiveLabel):
         try:
             pixmap = self._pixmap_cache[cache_key]
         except KeyError:
+            images = self._painted_images(self.data)
+            thumbnail_size = self._thumbnail_size()
+            if any(self._thumbnail_loader.get(image, thumbnail_size) is None for image in images):
+                # Show a placeholder until the images got decoded in the background
+                self.setPixmap(self.shadow)
+                self.current_pixmap_key = key
+                self._thumbnail_loader.request(images, thumbnail_size, partial(self._thumbnails_decoded, self.data))
+                return
             if len(self.data) == 1:
-                pixmap = QtGui.QPixmap()
-                try:
-                    if pixmap.loadFromData(self.data[0].data):
-                        pixmap = self.decorate_cover(pixmap)
-                    else:
-                        pixmap = self.file_missing_pixmap
-                except CoverArtImageIOError:
-                    pixmap = self.file_missing_pixmap
+                pixmap = self._thumbnail_pixmap(self.data[0])
+                if pixmap is not self.file_missing_pixmap:
+                    pixmap = self.decorate_cover(pixmap)
             else:
                 pixmap = self.render_cover_stack(self.data, has_common_images)
             if self.marked_for_removal:
@@ -221,6 +227,26 @@ class CoverArtThumbnail(ActiveLabel):
         self.setPixmap(pixmap)
         self.current_pixmap_key = key
 
+    def _thumbnails_decoded(self, data):
+        # Ignore results for data which is not shown anymore
+        if self.data is data:
+            self.set_data(data, force=True, has_common_images=self.has_common_images)
+
+    def _thumbnail_size(self):
+        return QtCore.QSize(*self.scaled(COVERART_WIDTH, COVERART_WIDTH))
+
+    def _thumbnail_pixmap(self, image):
+        thumbnail = self._thumbnail_loader.get(image, self._thumbnail_size())
+        if thumbnail is None or thumbnail.isNull():
+            return self.file_missing_pixmap
+        return QtGui.QPixmap.fromImage(thumbnail)
+
+    @staticmethod
+    def _painted_images(data):
+        if len(data) > MAX_COVERS_TO_STACK:
+            return data[: MAX_COVERS_TO_STACK - 1]
+        return data
+
     def decorate_cover(self, pixmap):
         offx = offy = 1
         w = h = COVERART_WIDTH
@@ -250,11 +276,10 @@ class CoverArtThumbnail(ActiveLabel):
         w = h = THUMBNAIL_WIDTH
         displacements = 20
         limited = len(data) > MAX_COVERS_TO_STACK
+        data_to_paint = self._painted_images(data)
         if limited:
-            data_to_paint = data[: MAX_COVERS_TO_STACK - 1]
             offset = displacements * len(data_to_paint)
         else:
-            data_to_paint = data
             offset = displacements * (len(data_to_paint) - 1)
         stack_width, stack_height = (w + offset, h + offset)
         pixmap = QtGui.QPixmap(*self.scaled(stack_width, stack_height))
@@ -288,12 +313,7 @@ class CoverArtThumbnail(ActiveLabel):
             if isinstance(image, QtGui.QPixmap):
                 thumb = image
             else:
-                thumb = QtGui.QPixmap()
-                try:
-                    if not thumb.loadFromData(image.data):
-                        thumb = self.file_missing_pixmap
-                except CoverArtImageIOError:
-                    thumb = self.file_missing_pixmap
+                thumb = self._thumbnail_pixmap(image)
             thumb = self.decorate_cover(thumb)
             x, y = calculate_cover_coordinates(thumb, cx, cy)
             painter.drawPixmap(x, y, thumb)
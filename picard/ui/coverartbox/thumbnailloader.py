@@ -0,0 +1,130 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Decoding of cover art thumbnails on a worker thread.
+
+Cover images can be several thousand pixels wide, decoding them at full
+resolution on the GUI thread for each selection change is slow. The images
+are read from the temporary file of their `DataHash` and decoded directly at
+the size they are displayed with, using `QImageReader.setScaledSize`.
+
+The decoded images are cached by data hash and size, the cache is limited by
+the number of bytes of the decoded images.
+"""
+
+from collections.abc import Callable
+from functools import partial
+
+from PyQt6 import (
+    QtCore,
+    QtGui,
+)
+
+from picard import (
+    log,
+    tagger_instance,
+)
+from picard.util import thread
+from picard.util.lrucache import SizedLRUCache
+
+
+# Bytes of decoded images to keep, about 140 thumbnails at pixel ratio 2
+THUMBNAIL_CACHE_SIZE = 32 * 1024 * 1024
+
+
+def decode_thumbnail(datahash, size: QtCore.QSize) -> QtGui.QImage:
+    """Decodes the image data of datahash scaled down to fit into size.
+
+    Images smaller than size are not scaled. Returns a null image if the data
+    can not be read or decoded. Safe to be called from any thread.
+    """
+    reader = QtGui.QImageReader(datahash.filename)
+    image_size = reader.size()
+    if image_size.isValid() and (image_size.width() > size.width() or image_size.height() > size.height()):
+        reader.setScaledSize(image_size.scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        log.debug("Failed decoding thumbnail of %r: %s", datahash, reader.errorString())
+    return image
+
+
+class ThumbnailLoader:
+    """Decodes cover art thumbnails asynchronously and caches the results"""
+
+    def __init__(self, max_size=THUMBNAIL_CACHE_SIZE):
+        self._cache = SizedLRUCache(max_size, sizeof=lambda image: image.sizeInBytes())
+        # Callbacks waiting for each key being decoded
+        self._pending: dict[tuple, list[Callable[[], None]]] = {}
+
+    @staticmethod
+    def _key(image, size: QtCore.QSize) -> tuple | None:
+        datahash = getattr(image, 'datahash', None)
+        if datahash is None:
+            return None
+        return (datahash.hash, size.width(), size.height())
+
+    def get(self, image, size: QtCore.QSize) -> QtGui.QImage | None:
+        """Returns the decoded thumbnail of image, or None if not decoded yet.
+
+        A null image is returned for images without data or failing to decode.
+        """
+        key = self._key(image, size)
+        if key is None:
+            return QtGui.QImage()
+        return self._cache.get(key)
+
+    def request(self, images, size: QtCore.QSize, callback: Callable[[], None]):
+        """Decodes the thumbnails of images and calls callback once all are available"""
+        keys = {}
+        for image in images:
+            key = self._key(image, size)
+            if key is not None and key not in self._cache:
+                keys[key] = image.datahash
+        if not keys:
+            callback()
+            return
+
+        remaining = set(keys)
+
+        def decoded(key):
+            remaining.discard(key)
+            if not remaining:
+                callback()
+
+        for key, datahash in keys.items():
+            callbacks = self._pending.get(key)
+            if callbacks is not None:
+                # Already being decoded for another request
+                callbacks.append(partial(decoded, key))
+                continue
+            self._pending[key] = [partial(decoded, key)]
+            # The datahash is passed along to keep its temporary file alive
+            thread.run_task(
+                partial(decode_thumbnail, datahash, size),
+                partial(self._decoded, key),
+                thread_pool=tagger_instance().priority_thread_pool,
+            )
+
+    def _decoded(self, key, result=None, error=None):
+        if error is not None or result is None:
+            result = QtGui.QImage()
+        self._cache[key] = result
+        for callback in self._pending.pop(key, ()):
+            callback()
+
+    def clear(self):
+        self._cache.clear()
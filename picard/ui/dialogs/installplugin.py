@@ -372,10 +372,7 @@ class InstallPluginDialog(PicardDialog):
             'unregistered': _("Unregistered plugin - not in official registry"),
         }
 
-        for plugin in self._all_plugins:
-            # Create registry plugin wrapper for i18n support
-            registry_plugin = RegistryPlugin(plugin)
-
+        for registry_plugin in self._all_plugins:
             # Skip if already installed
             if registry_plugin.uuid and registry_plugin.uuid in installed_uuids:
                 continue
@@ -385,10 +382,8 @@ class InstallPluginDialog(PicardDialog):
                 continue
 
             # Search filter
-            if search_text:
-                searchable = f"{registry_plugin.name_i18n()} {registry_plugin.description_i18n()} {' '.join(registry_plugin.categories)}".lower()
-                if search_text not in searchable:
-                    continue
+            if search_text and search_text not in registry_plugin.search_text():
+                continue
 
             row = self.plugin_table.rowCount()
             self.plugin_table.insertRow(row)
@@ -397,11 +392,10 @@ class InstallPluginDialog(PicardDialog):
             trust_item = QtWidgets.QTableWidgetItem(trust_badges.get(registry_plugin.trust_level, '?'))
             trust_item.setToolTip(trust_tooltips.get(registry_plugin.trust_level, registry_plugin.trust_level))
             trust_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            trust_item.setData(QtCore.Qt.ItemDataRole.UserRole, plugin)
+            trust_item.setData(QtCore.Qt.ItemDataRole.UserRole, registry_plugin)
             self.plugin_table.setItem(row, 0, trust_item)
 
             # Name column
-            registry_plugin = RegistryPlugin(plugin)
             name_item = QtWidgets.QTableWidgetItem(registry_plugin.name_i18n() or registry_plugin.id)
             desc = registry_plugin.description_i18n()
 
@@ -75,6 +75,7 @@ class MainAction(str, Enum):
     DISCID_FROM_TAGS = 'discid_from_tags_action'
     DONATE = 'donate_action'
     EXIT = 'exit_action'
+    EXPORT_RENAME_PLAN = 'export_rename_plan_action'
     GENERATE_FINGERPRINTS = 'generate_fingerprints_action'
     HELP = 'help_action'
     OPEN_COLLECTION_IN_BROWSER = 'open_collection_in_browser_action'
@@ -51,6 +51,8 @@ class Filter(QtWidgets.QWidget):
     filterable_tags: ClassVar[set[str]] = set()
     instances: ClassVar[set] = set()
     suspended = False
+    # Delay in milliseconds before filtering after the last keystroke
+    debounce_interval = 200
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -76,9 +78,14 @@ class Filter(QtWidgets.QWidget):
         self.filter_query_box = QtWidgets.QLineEdit(self)
         self.filter_query_box.setPlaceholderText(_("Type to filter…"))
         self.filter_query_box.setClearButtonEnabled(True)
-        self.filter_query_box.textChanged.connect(self._query_changed)
+        self.filter_query_box.textChanged.connect(self._text_changed)
         layout.addWidget(self.filter_query_box)
 
+        self._debounce_timer = QtCore.QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.debounce_interval)
+        self._debounce_timer.timeout.connect(self._apply_query_text)
+
         self.initializing = False
 
     def _get_saved_selected_filters(self):
@@ -156,7 +163,17 @@ class Filter(QtWidgets.QWidget):
             label = _(self.default_filter_button_label)
         self.filter_button.setText(label)
 
+    def _text_changed(self, text):
+        if text:
+            self._debounce_timer.start()
+        else:
+            self._query_changed(text)
+
+    def _apply_query_text(self):
+        self._query_changed(self.filter_query_box.text())
+
     def _query_changed(self, text):
+        self._debounce_timer.stop()
         self.filterChanged.emit(text, self.selected_filters)
 
     def clear(self):
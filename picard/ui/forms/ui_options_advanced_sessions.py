@@ -87,6 +87,9 @@ class Ui_SessionsOptionsPage(object):
         self.no_mb_requests_checkbox.setObjectName("no_mb_requests_checkbox")
         self.child_layout.addWidget(self.no_mb_requests_checkbox)
         self.vboxlayout.addLayout(self.child_layout)
+        self.compact_format_checkbox = QtWidgets.QCheckBox(parent=SessionsOptionsPage)
+        self.compact_format_checkbox.setObjectName("compact_format_checkbox")
+        self.vboxlayout.addWidget(self.compact_format_checkbox)
         spacerItem4 = QtWidgets.QSpacerItem(20, 12, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
         self.vboxlayout.addItem(spacerItem4)
         self.loading_sessions_label = QtWidgets.QLabel(parent=SessionsOptionsPage)
@@ -118,6 +121,8 @@ class Ui_SessionsOptionsPage(object):
         self.backup_checkbox.setText(_("Attempt session backup on unexpected shutdown"))
         self.include_mb_data_checkbox.setText(_("Include MusicBrainz data in saved sessions"))
         self.no_mb_requests_checkbox.setText(_("Do not make MusicBrainz requests on restore"))
+        self.compact_format_checkbox.setToolTip(_("Compact session files load faster, but can not be read by older versions of Picard"))
+        self.compact_format_checkbox.setText(_("Save sessions in compact format"))
         self.loading_sessions_label.setText(_("Loading sessions:"))
         self.load_last_checkbox.setText(_("Load last saved session on startup"))
         self.safe_restore_checkbox.setText(_("No auto-matching on load"))
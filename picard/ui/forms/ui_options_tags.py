@@ -26,6 +26,9 @@ class Ui_TagsOptionsPage(object):
         self.preserve_timestamps = QtWidgets.QCheckBox(parent=TagsOptionsPage)
         self.preserve_timestamps.setObjectName("preserve_timestamps")
         self.vboxlayout.addWidget(self.preserve_timestamps)
+        self.skip_unchanged_tag_writes = QtWidgets.QCheckBox(parent=TagsOptionsPage)
+        self.skip_unchanged_tag_writes.setObjectName("skip_unchanged_tag_writes")
+        self.vboxlayout.addWidget(self.skip_unchanged_tag_writes)
         self.before_tagging = QtWidgets.QGroupBox(parent=TagsOptionsPage)
         self.before_tagging.setObjectName("before_tagging")
         self.vboxlayout1 = QtWidgets.QVBoxLayout(self.before_tagging)
@@ -49,6 +52,32 @@ class Ui_TagsOptionsPage(object):
         self.fix_missing_seekpoints_flac.setObjectName("fix_missing_seekpoints_flac")
         self.vboxlayout1.addWidget(self.fix_missing_seekpoints_flac)
         self.vboxlayout.addWidget(self.before_tagging)
+        self.tag_padding_groupbox = QtWidgets.QGroupBox(parent=TagsOptionsPage)
+        self.tag_padding_groupbox.setObjectName("tag_padding_groupbox")
+        self.tag_padding_layout = QtWidgets.QGridLayout(self.tag_padding_groupbox)
+        self.tag_padding_layout.setObjectName("tag_padding_layout")
+        self.tag_padding_policy_label = QtWidgets.QLabel(parent=self.tag_padding_groupbox)
+        self.tag_padding_policy_label.setObjectName("tag_padding_policy_label")
+        self.tag_padding_layout.addWidget(self.tag_padding_policy_label, 0, 0, 1, 1)
+        self.tag_padding_policy = QtWidgets.QComboBox(parent=self.tag_padding_groupbox)
+        self.tag_padding_policy.setObjectName("tag_padding_policy")
+        self.tag_padding_layout.addWidget(self.tag_padding_policy, 0, 1, 1, 1)
+        self.tag_padding_size_kb = QtWidgets.QSpinBox(parent=self.tag_padding_groupbox)
+        self.tag_padding_size_kb.setMaximum(16384)
+        self.tag_padding_size_kb.setObjectName("tag_padding_size_kb")
+        self.tag_padding_layout.addWidget(self.tag_padding_size_kb, 0, 2, 1, 1)
+        self.tag_padding_percent = QtWidgets.QSpinBox(parent=self.tag_padding_groupbox)
+        self.tag_padding_percent.setMaximum(100)
+        self.tag_padding_percent.setObjectName("tag_padding_percent")
+        self.tag_padding_layout.addWidget(self.tag_padding_percent, 0, 3, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(
+            0, 0, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum
+        )
+        self.tag_padding_layout.addItem(spacerItem, 0, 4, 1, 1)
+        self.tag_padding_reserve_images = QtWidgets.QCheckBox(parent=self.tag_padding_groupbox)
+        self.tag_padding_reserve_images.setObjectName("tag_padding_reserve_images")
+        self.tag_padding_layout.addWidget(self.tag_padding_reserve_images, 1, 0, 1, 5)
+        self.vboxlayout.addWidget(self.tag_padding_groupbox)
         self.preserved_tags_groupbox = QtWidgets.QGroupBox(parent=TagsOptionsPage)
         self.preserved_tags_groupbox.setObjectName("preserved_tags_groupbox")
         self.preserved_tags_layout = QtWidgets.QVBoxLayout(self.preserved_tags_groupbox)
@@ -78,26 +107,38 @@ class Ui_TagsOptionsPage(object):
         self.do_not_sanitize_layout.setObjectName("do_not_sanitize_layout")
         self.verticalLayout_2.addLayout(self.do_not_sanitize_layout)
         self.vboxlayout.addWidget(self.do_not_sanitize_container)
+        self.tag_padding_policy_label.setBuddy(self.tag_padding_policy)
 
         self.retranslateUi(TagsOptionsPage)
         self.clear_existing_tags.toggled['bool'].connect(self.preserve_images.setEnabled)  # type: ignore
         QtCore.QMetaObject.connectSlotsByName(TagsOptionsPage)
         TagsOptionsPage.setTabOrder(self.write_tags, self.preserve_timestamps)
-        TagsOptionsPage.setTabOrder(self.preserve_timestamps, self.clear_existing_tags)
+        TagsOptionsPage.setTabOrder(self.preserve_timestamps, self.skip_unchanged_tag_writes)
+        TagsOptionsPage.setTabOrder(self.skip_unchanged_tag_writes, self.clear_existing_tags)
         TagsOptionsPage.setTabOrder(self.clear_existing_tags, self.preserve_images)
         TagsOptionsPage.setTabOrder(self.preserve_images, self.remove_id3_from_flac)
         TagsOptionsPage.setTabOrder(self.remove_id3_from_flac, self.remove_ape_from_mp3)
         TagsOptionsPage.setTabOrder(self.remove_ape_from_mp3, self.fix_missing_seekpoints_flac)
+        TagsOptionsPage.setTabOrder(self.fix_missing_seekpoints_flac, self.tag_padding_policy)
+        TagsOptionsPage.setTabOrder(self.tag_padding_policy, self.tag_padding_size_kb)
+        TagsOptionsPage.setTabOrder(self.tag_padding_size_kb, self.tag_padding_percent)
+        TagsOptionsPage.setTabOrder(self.tag_padding_percent, self.tag_padding_reserve_images)
 
     def retranslateUi(self, TagsOptionsPage):
         self.write_tags.setText(_("Write tags to files"))
         self.preserve_timestamps.setText(_("Preserve timestamps of tagged files"))
+        self.skip_unchanged_tag_writes.setText(_("Do not write tags to files whose tags are unchanged"))
         self.before_tagging.setTitle(_("Before Tagging"))
         self.clear_existing_tags.setText(_("Clear existing tags"))
         self.preserve_images.setText(_("Keep embedded images when clearing tags"))
         self.remove_id3_from_flac.setText(_("Remove ID3 tags from FLAC files"))
         self.remove_ape_from_mp3.setText(_("Remove APEv2 tags from MP3 files"))
         self.fix_missing_seekpoints_flac.setText(_("Fix missing seekpoints for FLAC files"))
+        self.tag_padding_groupbox.setTitle(_("Tag Padding"))
+        self.tag_padding_policy_label.setText(_("Padding if a file has to be rewritten:"))
+        self.tag_padding_size_kb.setSuffix(_(" KiB"))
+        self.tag_padding_percent.setSuffix(_(" %"))
+        self.tag_padding_reserve_images.setText(_("Also reserve space for the images which are not embedded"))
         self.preserved_tags_groupbox.setTitle(
             _("Preserve these tags from being cleared or overwritten with MusicBrainz data:")
         )
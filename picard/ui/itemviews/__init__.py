@@ -82,7 +82,11 @@ from picard.ui.itemviews.columns import (
     ALBUMVIEW_COLUMNS,
     FILEVIEW_COLUMNS,
 )
-from picard.ui.itemviews.custom_columns import DelegateColumn
+from picard.ui.itemviews.custom_columns import (
+    CustomColumn,
+    DelegateColumn,
+)
+from picard.ui.itemviews.filterindex import filter_index
 from picard.ui.match_icons import (
     load_match_icons,
     match_icons,
@@ -171,6 +175,11 @@ class MainPanel(QtWidgets.QSplitter):
     def set_processing(self, processing=True):
         self._ignore_selection_changes = processing
 
+    def set_filters(self, processing=True):
+        if processing:
+            for view in self._views:
+                view.filter_pending_items()
+
     def tab_order(self, tab_order, before, after):
         prev = before
         for view in self._views:
@@ -347,6 +356,9 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
     (Album, Track, File) with a visual row. Handles sorting/filtering flags.
     """
 
+    # Positions of custom columns evaluated on demand when their text is requested
+    _lazy_columns = frozenset()
+
     def __init__(self, obj, sortable=False, filterable=True, parent=None):
         super().__init__(parent)
         self._obj = None
@@ -391,6 +403,23 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
         self._sortkeys[column] = None
         return super().setText(column, text)
 
+    def data(self, column, role):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and column in self._lazy_columns:
+            return self._custom_column_text(column)
+        return super().data(column, role)
+
+    def _custom_column_text(self, column):
+        columns = self.columns
+        if self.obj is None or column >= len(columns) or not isinstance(columns[column], CustomColumn):
+            return super().data(column, QtCore.Qt.ItemDataRole.DisplayRole)
+        this_column = columns[column]
+        try:
+            # Cached by the provider until the item gets updated
+            return this_column.provider.evaluate(self.obj)
+        except (AttributeError, TypeError, ValueError, KeyError, NotImplementedError) as exc:
+            log.debug("Custom column '%s' evaluate failed: %r", this_column.key, exc)
+            return ""
+
     def __lt__(self, other):
         tree_widget = self.treeWidget()
         if not self.sortable or not tree_widget:
@@ -415,9 +444,12 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
         return sortkey
 
     def update_colums_text(self, color=None, bgcolor=None):
-        # Local import to avoid cycles
-        from picard.ui.itemviews.custom_columns import CustomColumn
-
+        # The values shown have changed, the filter index entry is outdated
+        filter_index.invalidate(self.obj)
+        tree_widget = self.treeWidget()
+        if tree_widget is not None:
+            tree_widget.queue_filter_item(self)
+        lazy_columns = set()
         for i, column in enumerate(self.columns):
             if color is not None:
                 self.setForeground(i, color)
@@ -447,13 +479,15 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
                         self.setText(i, "")
                         continue
 
-                    try:
-                        self.setText(i, column.provider.evaluate(self.obj))
-                    except (AttributeError, TypeError, ValueError, KeyError, NotImplementedError) as exc:
-                        log.debug("Custom column '%s' evaluate failed: %r", column.key, exc)
+                    # Scripts only get evaluated for rows being shown or sorted, see data()
+                    lazy_columns.add(i)
+                    self._sortkeys[i] = None
                     continue
 
                 self.setText(i, self.obj.column(column.key))
+        self._lazy_columns = frozenset(lazy_columns)
+        if lazy_columns:
+            self.emitDataChanged()
 
 
 class ClusterListItem(TreeItem):
@@ -101,15 +101,16 @@ from picard.ui.itemviews.custom_columns import (
 )
 from picard.ui.itemviews.custom_columns.shared import get_recognized_view_columns
 from picard.ui.itemviews.events import header_events
+from picard.ui.itemviews.filterindex import (
+    FilterQuery,
+    filter_index,
+)
 from picard.ui.ratingwidget import RatingWidget
 from picard.ui.scriptsmenu import ScriptsMenu
 from picard.ui.util import menu_builder
 from picard.ui.widgets.configurablecolumnsheader import ConfigurableColumnsHeader
 
 
-FILE_FILTERS = {'~filename', '~filepath'}
-
-
 def _alternative_versions(album):
     config = get_config()
     versions = album.release_group.versions
@@ -176,6 +177,9 @@ def _add_other_versions(releases_menu, album, action_loading):
 
 
 class BaseTreeView(QtWidgets.QTreeWidget):
+    # Delay in milliseconds to collect added or updated items before filtering them
+    pending_filter_interval = 100
+
     def __init__(self, columns, window, parent=None):
         super().__init__(parent=parent)
         self.columns = columns
@@ -190,6 +194,15 @@ class BaseTreeView(QtWidgets.QTreeWidget):
         # Should multiple files dropped be assigned to tracks sequentially?
         self._move_to_multi_tracks = True
 
+        # Last applied filter query, used to narrow down the next one
+        self._filter_query = None
+        # Items added or updated since, checked against the query in batches
+        self._pending_filter_items = {}
+        self._pending_filter_timer = QtCore.QTimer(self)
+        self._pending_filter_timer.setSingleShot(True)
+        self._pending_filter_timer.setInterval(self.pending_filter_interval)
+        self._pending_filter_timer.timeout.connect(self.filter_pending_items)
+
         self._init_header()
 
         self.setAcceptDrops(True)
@@ -716,96 +729,114 @@ class BaseTreeView(QtWidgets.QTreeWidget):
         return self.filter_box
 
     def filter_items(self, text, filters):
+        self._pending_filter_items.clear()
+        self._pending_filter_timer.stop()
         if not text or not filters:  # When text or filters is empty, show all items
+            self._filter_query = None
             self._restore_all_items()
             return
 
-        self._filter_tree_items(self.invisibleRootItem(), text, filters)
+        # The index only covers the filterable tags, they are loaded by the
+        # first Filter widget
+        Filter.load_filterable_tags()
+        filter_index.set_tags(Filter.filterable_tags)
+        query = FilterQuery(filter_index, text, filters, previous=self._filter_query)
+        self._filter_tree_items(self.invisibleRootItem(), query)
+        self._filter_query = query
+
+    def queue_filter_item(self, item):
+        """Check item against the active filter with the next batch of added or updated items"""
+        if self._filter_query is None:
+            return
+        self._pending_filter_items[id(item)] = item
+        if not self._pending_filter_timer.isActive():
+            self._pending_filter_timer.start()
+
+    def filter_pending_items(self):
+        """Apply the active filter to the queued items only, and update their parents"""
+        if Filter.suspended:
+            # Processed once loading has finished, see MainPanel.set_filters
+            return
+        self._pending_filter_timer.stop()
+        items = self._pending_filter_items
+        self._pending_filter_items = {}
+        query = self._filter_query
+        if query is None or not items:
+            return
 
-    def _filter_tree_items(self, parent, text, filters):
-        text = text.lower()
+        parents = {}
+        for item in items.values():
+            # Skip items removed from the view in the meantime
+            if item.treeWidget() is not self:
+                continue
+            self._filter_tree_item(item, query)
+            parent = item.parent()
+            if parent is not None:
+                parents[id(parent)] = parent
+        # Each parent is visible if it matches itself or any child is visible
+        while parents:
+            grandparents = {}
+            for parent in parents.values():
+                self._filter_parent_item(parent, query)
+                grandparent = parent.parent()
+                if grandparent is not None:
+                    grandparents[id(grandparent)] = grandparent
+            parents = grandparents
+
+    def _filter_tree_items(self, parent, query):
         match_found = False
-
         for i in range(parent.childCount()):
-            child = parent.child(i)
-            child_match = False
-            child_tags = False
-
-            if hasattr(child, 'obj'):
-                obj = child.obj
-                matched_filters = set()
-
-                for matcher in [self._matches_file_properties, self._matches_metadata]:
-                    has_tags, matches = matcher(obj, text, filters)
-                    child_tags |= has_tags
-                    if matches:
-                        child_match = True
-                        matched_filters = matched_filters.union(matches)
-
-            if child.childCount() > 0:
-                child_match |= self._filter_tree_items(child, text, filters)
-
-            if not child_match and not child_tags:
-                child_match = True
-
-            if child_match and child.filterable:
-                self._set_item_tooltip(
-                    item=child,
-                    text=(
-                        _('Matches on: %s') % ', '.join(sorted([ALL_TAGS.display_name(x) for x in matched_filters]))
-                        if matched_filters
-                        else _('No tags found for selected filters.')
-                    ),
-                )
-
-            # Hide/show based on match
-            if child.filterable:
-                child.setHidden(not child_match)
-            match_found |= child_match
-
+            match_found |= self._filter_tree_item(parent.child(i), query)
         return match_found
 
-    @staticmethod
-    def _matches_file_properties(obj, text: str, filters: set):
-        matches: set[str] = set()
-        has_tags = False
-        if not filters.intersection(FILE_FILTERS):  # No file filters to check
-            return has_tags, matches
-        if hasattr(obj, 'iterfiles'):
-            has_tags = True
-            for file_ in obj.iterfiles():
-                if "~filename" in filters and text in file_.base_filename.lower():
-                    matches.add('~filename')
-                if "~filepath" in filters and text in file_.filename.lower():
-                    matches.add('~filepath')
-
-        return has_tags, matches
-
-    @staticmethod
-    def _matches_metadata(obj, text: str, filters: set):
-        matches: set[str] = set()
-        has_tags = False
-        test_filters = filters - FILE_FILTERS
-        if not test_filters:  # No metadata filters to check
-            return has_tags, matches
-
-        if hasattr(obj, 'metadata'):
-            for tag, values in obj.metadata.rawitems():
-                tag = tag.lower()
-                if tag not in test_filters:
-                    continue
-                has_tags = True
-                if isinstance(values, list):
-                    for value in values:
-                        if text in str(value).lower():
-                            matches.add(tag)
-                else:
-                    if text in str(values).lower():
-                        matches.add(tag)
+    def _filter_tree_item(self, item, query):
+        """Filter item and its children, returns True if item is shown"""
+        child_match = False
+        child_tags = False
+        matched_filters = set()
+
+        if hasattr(item, 'obj'):
+            child_tags, matched_filters = query.match(item.obj)
+            child_match = bool(matched_filters)
+
+        if item.childCount() > 0:
+            child_match |= self._filter_tree_items(item, query)
+
+        if not child_match and not child_tags:
+            child_match = True
+
+        self._set_item_filtered(item, child_match, matched_filters)
+        return child_match
+
+    def _filter_parent_item(self, item, query):
+        """Filter item by its own match and the current visibility of its children"""
+        child_tags = False
+        matched_filters = set()
+        if hasattr(item, 'obj'):
+            child_tags, matched_filters = query.match(item.obj)
+        child_match = bool(matched_filters) or not child_tags
+        if not child_match:
+            child_match = any(not item.child(i).isHidden() for i in range(item.childCount()))
+        self._set_item_filtered(item, child_match, matched_filters)
+
+    def _set_item_filtered(self, item, match, matched_filters):
+        if match and item.filterable:
+            self._set_item_tooltip(
+                item=item,
+                text=(
+                    _('Matches on: %s') % ', '.join(sorted([ALL_TAGS.display_name(x) for x in matched_filters]))
+                    if matched_filters
+                    else _('No tags found for selected filters.')
+                ),
+            )
 
-        return has_tags, matches
+        # Hide/show based on match, only touch items whose visibility changes
+        if item.filterable and item.isHidden() == match:
+            item.setHidden(not match)
 
     def _set_item_tooltip(self, item: QtWidgets.QTreeWidgetItem, text: str):
+        if item.toolTip(0) == text:
+            return
         for i in range(item.columnCount()):
             item.setToolTip(i, text)
 
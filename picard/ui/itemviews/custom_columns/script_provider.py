@@ -20,37 +20,59 @@
 
 """Script-based provider with caching and performance thresholds."""
 
-from collections import deque
 from collections.abc import Callable
-import contextlib
 import re
+import sys
 from time import perf_counter
-from weakref import WeakKeyDictionary
+import weakref
 
-from picard import log
 from picard.item import Item
 from picard.script import ScriptParser
+from picard.util.lrucache import SizedLRUCache
 
 from picard.ui.itemviews.custom_columns.context import ContextStrategyManager
 from picard.ui.itemviews.custom_columns.resolve import ValueResolverChain
 
 
+# Estimated bytes per cache entry besides the value: key, tuple, reference and ordering
+CACHE_ENTRY_OVERHEAD = 200
+
+
+class _StrongRef:
+    """Reference to an object which cannot be weakly referenced."""
+
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __call__(self):
+        return self._obj
+
+
+def _entry_size(entry: tuple[Callable[[], object], str]) -> int:
+    return sys.getsizeof(entry[1]) + CACHE_ENTRY_OVERHEAD
+
+
 class ChainedValueProvider:
     """Provide script-evaluated values with caching and performance limits.
 
     Caching strategy
     ----------------
-    - Primary cache: WeakKeyDictionary keyed by the item when it supports
-      weak references. This avoids retaining objects strongly.
-    - Fallback id-cache: A bounded FIFO cache keyed by ``id(obj)`` for
-      objects that cannot be weakly referenced. Evictions use O(1)
-      ``deque.popleft``.
+    - Values are kept in a least recently used cache keyed by ``id(obj)``,
+      limited by the number of entries and by the estimated memory used.
+    - Each entry references its item weakly, a value is never returned for
+      another object reusing the id of a collected one. Objects that cannot
+      be weakly referenced are kept alive until their entry is evicted.
+    - Items are invalidated one by one when their metadata changes, see
+      :meth:`invalidate`.
     """
 
     # Defaults can be overridden by subclasses or patched in tests
     DEFAULT_MAX_RUNTIME_MS: int = 25
     DEFAULT_CACHE_SIZE: int = 1024
-    DEFAULT_MIN_ID_CACHE_SIZE: int = 16
+    DEFAULT_MIN_CACHE_SIZE: int = 16
+    DEFAULT_CACHE_BYTES: int = 1024 * 1024
 
     def __init__(
         self,
@@ -58,6 +80,7 @@ class ChainedValueProvider:
         max_runtime_ms: int | None = None,
         cache_size: int | None = None,
         *,
+        cache_bytes: int | None = None,
         parser: ScriptParser | None = None,
         parser_factory: Callable[[], ScriptParser] | None = None,
     ):
@@ -71,8 +94,11 @@ class ChainedValueProvider:
             Limit execution time for caching. If ``None`` uses
             ``self.DEFAULT_MAX_RUNTIME_MS``.
         cache_size
-            Set size of the fallback id-based cache. If ``None`` uses
+            Set maximum number of cached values. If ``None`` uses
             ``self.DEFAULT_CACHE_SIZE``.
+        cache_bytes
+            Set maximum estimated memory of the cached values. If ``None``
+            uses ``self.DEFAULT_CACHE_BYTES``.
         """
         self._script = script
 
@@ -80,6 +106,8 @@ class ChainedValueProvider:
             max_runtime_ms = self.DEFAULT_MAX_RUNTIME_MS
         if cache_size is None:
             cache_size = self.DEFAULT_CACHE_SIZE
+        if cache_bytes is None:
+            cache_bytes = self.DEFAULT_CACHE_BYTES
 
         self._max_runtime_ms = max_runtime_ms
 
@@ -87,10 +115,10 @@ class ChainedValueProvider:
         # Reuse a parser instance or factory through resolver chain
         self._value_resolver = ValueResolverChain(parser=parser, parser_factory=parser_factory)
 
-        self._cache: WeakKeyDictionary[Item, str] = WeakKeyDictionary()
-        self._id_cache: dict[int, str] = {}
-        self._id_order: deque[int] = deque()
-        self._id_cache_max = max(self.DEFAULT_MIN_ID_CACHE_SIZE, int(cache_size))
+        self._cache: SizedLRUCache[int, tuple[Callable[[], object], str]] = SizedLRUCache(
+            cache_bytes, sizeof=_entry_size
+        )
+        self._max_entries = max(self.DEFAULT_MIN_CACHE_SIZE, int(cache_size))
 
         m = re.fullmatch(r"%([a-zA-Z0-9_]+)%", script)
         self._simple_var: str | None = m.group(1) if m else None
@@ -108,23 +136,14 @@ class ChainedValueProvider:
         str
             Computed value (empty on failure).
         """
-        can_cache = True
-        avoid_cache_for_obj = False
-        try:
-            if obj in self._cache:
-                return self._cache[obj]
-        except TypeError as e:
-            log.debug("Weak cache lookup failed (non-weakrefable object): %r", e)
-            can_cache = False
-        # Avoid caching for album-like objects that are not fully loaded yet
-        if getattr(obj, "is_album_like", False) and not getattr(obj, "loaded", True):
-            avoid_cache_for_obj = True
-
         obj_id = id(obj)
-        if not can_cache:
-            cached = self._id_cache.get(obj_id)
-            if cached is not None:
+        entry = self._cache.get(obj_id)
+        if entry is not None:
+            ref, cached = entry
+            if ref() is obj:
                 return cached
+            # The id was reused after the cached object got collected
+            del self._cache[obj_id]
 
         start = perf_counter()
 
@@ -132,26 +151,27 @@ class ChainedValueProvider:
         result = self._value_resolver.resolve_value(obj, self._simple_var, self._script, ctx, file_obj)
 
         elapsed_ms = (perf_counter() - start) * 1000.0
-        should_cache = (result != "") and (elapsed_ms <= self._max_runtime_ms) and not avoid_cache_for_obj
-        if can_cache and should_cache:
-            try:
-                self._cache[obj] = result
-            except TypeError:
-                pass
-        elif not can_cache and should_cache:
-            self._id_cache[obj_id] = result
-            self._id_order.append(obj_id)
-            if len(self._id_order) > self._id_cache_max:
-                oldest = self._id_order.popleft()
-                self._id_cache.pop(oldest, None)
+        # Avoid caching for album-like objects that are not fully loaded yet
+        avoid_cache_for_obj = getattr(obj, "is_album_like", False) and not getattr(obj, "loaded", True)
+        if elapsed_ms <= self._max_runtime_ms and not avoid_cache_for_obj:
+            self._store(obj, result)
 
         return result
 
+    def _store(self, obj: Item, value: str) -> None:
+        try:
+            ref = weakref.ref(obj)
+        except TypeError:
+            ref = _StrongRef(obj)
+        self._cache[id(obj)] = (ref, value)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem()
+
     def __repr__(self) -> str:  # pragma: no cover - debug helper
         cls_name = self.__class__.__name__
         return (
             f"{cls_name}(script={self._script!r}, max_runtime_ms={self._max_runtime_ms}, "
-            f"cache_size={self._id_cache_max})"
+            f"cache_size={self._max_entries})"
         )
 
     # Optional cache invalidation API (duck-typed via protocol)
@@ -165,21 +185,6 @@ class ChainedValueProvider:
             clear the entire cache.
         """
         if obj is None:
-            # Clear all caches
             self._cache.clear()
-            self._id_cache.clear()
-            self._id_order.clear()
-            return
-
-        # Try to remove from weak cache
-        with contextlib.suppress(TypeError):  # Not weakrefable; fall back to id-cache removal
-            if obj in self._cache:
-                del self._cache[obj]
-
-        # Remove from id-based cache if present
-        obj_id = id(obj)
-        if obj_id in self._id_cache:
-            self._id_cache.pop(obj_id, None)
-            with contextlib.suppress(ValueError):
-                # Remove one occurrence from order deque
-                self._id_order.remove(obj_id)
+        else:
+            self._cache.pop(id(obj), None)
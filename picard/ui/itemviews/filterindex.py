@@ -0,0 +1,170 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Search index used for filtering the main tree views.
+
+For each object shown in the views the index keeps the lowercased values of
+the filterable tags and the names of the contained files, so filtering does
+not need to walk the files and lowercase all tag values on each keystroke.
+Entries are built on first use and dropped whenever the item of an object
+gets updated.
+
+A `FilterQuery` remembers which tags matched for each object. If the text
+of the following query extends the previous text, only those tags can
+match again and all other objects are rejected without looking at their
+values.
+"""
+
+from collections.abc import Iterable
+from dataclasses import (
+    dataclass,
+    field,
+)
+import weakref
+
+
+FILE_FILTERS = {'~filename', '~filepath'}
+
+# Separator between multiple values of a field, can not be part of a query
+_VALUE_SEPARATOR = '\n'
+
+
+@dataclass
+class FilterIndexEntry:
+    # Lowercased values by tag, multiple values are joined by _VALUE_SEPARATOR
+    fields: dict[str, str] = field(default_factory=dict)
+    # True if the object can contain files, even if it currently has none
+    has_files: bool = False
+
+    def has_tags(self, filters: set[str]) -> bool:
+        if self.has_files and not filters.isdisjoint(FILE_FILTERS):
+            return True
+        return not filters.isdisjoint(self.fields.keys() - FILE_FILTERS)
+
+    def matches(self, text: str, tags: Iterable[str]) -> set[str]:
+        fields = self.fields
+        return {tag for tag in tags if tag in fields and text in fields[tag]}
+
+
+def _add_value(fields: dict[str, str], tag: str, value: str):
+    if tag in fields:
+        fields[tag] += _VALUE_SEPARATOR + value
+    else:
+        fields[tag] = value
+
+
+class FilterIndex:
+    """Lowercased filterable values of the objects shown in the tree views."""
+
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._tags = frozenset()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def set_tags(self, tags: Iterable[str]):
+        """Set the tags to index, all entries get dropped if these changed"""
+        tags = frozenset(tags) | FILE_FILTERS
+        if tags != self._tags:
+            self._tags = tags
+            self.clear()
+
+    def clear(self):
+        self._entries.clear()
+
+    def invalidate(self, obj):
+        try:
+            self._entries.pop(obj, None)
+        except TypeError:
+            pass
+
+    def entry(self, obj) -> FilterIndexEntry:
+        try:
+            entry = self._entries.get(obj)
+        except TypeError:
+            # Not hashable or weak referenceable, e.g. ClusterList
+            return self._build_entry(obj)
+        if entry is None:
+            entry = self._build_entry(obj)
+            self._entries[obj] = entry
+        return entry
+
+    def _build_entry(self, obj) -> FilterIndexEntry:
+        entry = FilterIndexEntry()
+        fields = entry.fields
+        tags = self._tags
+        if hasattr(obj, 'iterfiles'):
+            entry.has_files = True
+            for file_ in obj.iterfiles():
+                _add_value(fields, '~filename', file_.base_filename.lower())
+                _add_value(fields, '~filepath', file_.filename.lower())
+        if hasattr(obj, 'metadata'):
+            for tag, values in obj.metadata.rawitems():
+                tag = tag.lower()
+                if tag not in tags or tag in FILE_FILTERS:
+                    continue
+                if isinstance(values, list):
+                    value = _VALUE_SEPARATOR.join(str(v).lower() for v in values)
+                else:
+                    value = str(values).lower()
+                _add_value(fields, tag, value)
+        return entry
+
+
+class FilterQuery:
+    """A filter text and the selected filters evaluated against a `FilterIndex`.
+
+    Pass the previous query of the same view as `previous` to narrow down
+    the search if the text was extended.
+    """
+
+    def __init__(self, index: FilterIndex, text: str, filters: set[str], previous: 'FilterQuery | None' = None):
+        self.index = index
+        self.text = text.lower()
+        self.filters = frozenset(filters)
+        self._results = weakref.WeakKeyDictionary()
+        self._previous = None
+        if previous is not None and previous.filters == self.filters and previous.text in self.text:
+            self._previous = previous._results
+
+    def match(self, obj) -> tuple[bool, set[str]]:
+        """Returns a tuple (has_tags, matches) for obj.
+
+        has_tags is True if obj has any of the selected tags, matches is the
+        set of tags containing the query text.
+        """
+        entry = self.index.entry(obj)
+        tags = self.filters
+        if self._previous is not None:
+            try:
+                previous = self._previous.get(obj)
+            except TypeError:
+                previous = None
+            # Only reuse results computed for the same, unchanged entry
+            if previous is not None and previous[0] is entry:
+                tags = previous[1]
+        matches = entry.matches(self.text, tags)
+        try:
+            self._results[obj] = (entry, frozenset(matches))
+        except TypeError:
+            pass
+        return entry.has_tags(self.filters), matches
+
+
+# Shared by all views, objects can move between them
+filter_index = FilterIndex()
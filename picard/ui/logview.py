@@ -41,6 +41,8 @@ from picard import log
 from picard.debug_opts import DebugOpt
 from picard.i18n import gettext as _
 from picard.util import reconnect
+from picard.util.profiler import profiler
+from picard.util.stallwatchdog import stall_watchdog
 
 from picard.ui import (
     FONT_FAMILY_MONOSPACE,
@@ -53,6 +55,8 @@ from picard.ui.logviewmodel import (
     LogItemDelegate,
     LogItemModel,
 )
+from picard.ui.metricsview import MetricsView
+from picard.ui.stallreportview import StallReportView
 from picard.ui.util import FileDialog
 
 
@@ -316,9 +320,19 @@ class DebugOptsMenu(QtWidgets.QMenu):
             action.triggered.connect(partial(self.debug_opt_changed, debug_opt))
             self.addAction(action)
             self.action_map[debug_opt] = action
+        self.aboutToShow.connect(self.update_checked)
+
+    def update_checked(self):
+        # Options can also change elsewhere, e.g. by the PROFILE remote command
+        for debug_opt, action in self.action_map.items():
+            action.setChecked(debug_opt.enabled)
 
     def debug_opt_changed(self, debug_opt, checked):
         debug_opt.enabled = checked
+        if debug_opt == DebugOpt.GUI_STALLS:
+            stall_watchdog.set_enabled(checked)
+        elif debug_opt == DebugOpt.PROFILING:
+            profiler.set_enabled(checked)
 
     def mouseReleaseEvent(self, event):
         action = self.activeAction()
@@ -408,6 +422,22 @@ class LogView(LogViewCommon):
         self.filter_button.toggled.connect(self._on_filter_toggled)
         self.hbox.addWidget(self.filter_button)
 
+        # runtime metrics
+        self._metrics_view = None
+        self.metrics_button = QtWidgets.QPushButton(_("Metrics…"))
+        self.metrics_button.setAutoDefault(False)
+        self.metrics_button.setToolTip(_("Show timings, queue depths and other runtime metrics"))
+        self.metrics_button.clicked.connect(self._show_metrics)
+        self.hbox.addWidget(self.metrics_button)
+
+        # main thread stalls
+        self._stall_report_view = None
+        self.stall_report_button = QtWidgets.QPushButton(_("Stalls…"))
+        self.stall_report_button.setAutoDefault(False)
+        self.stall_report_button.setToolTip(_("Show where the user interface stalled"))
+        self.stall_report_button.clicked.connect(self._show_stall_report)
+        self.hbox.addWidget(self.stall_report_button)
+
         # save as
         self.save_log_as_button = QtWidgets.QPushButton(_("Save As…"))
         self.save_log_as_button.setAutoDefault(False)
@@ -500,6 +530,20 @@ class LogView(LogViewCommon):
                     _('Something prevented data to be written to "%s".') % path,
                 )
 
+    def _show_metrics(self):
+        if self._metrics_view is None:
+            self._metrics_view = MetricsView(parent=self)
+        self._metrics_view.show()
+        self._metrics_view.raise_()
+        self._metrics_view.activateWindow()
+
+    def _show_stall_report(self):
+        if self._stall_report_view is None:
+            self._stall_report_view = StallReportView(parent=self)
+        self._stall_report_view.show()
+        self._stall_report_view.raise_()
+        self._stall_report_view.activateWindow()
+
     def show(self):
         self.filter_input.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
         super().show()
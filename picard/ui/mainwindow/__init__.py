@@ -53,6 +53,7 @@ from functools import partial
 import itertools
 import os.path
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
@@ -103,6 +104,7 @@ from picard.options import (
     get_option_title,
 )
 from picard.plugin3.manager.update_checker import PluginUpdateChecker
+from picard.renameplan import build_rename_plan
 from picard.script import get_file_naming_script_presets
 from picard.session.constants import SessionConstants
 from picard.session.session_manager import (
@@ -164,15 +166,11 @@ from picard.ui.logview import (
 from picard.ui.mainwindow.actions import create_actions
 from picard.ui.metadatabox import MetadataBox
 from picard.ui.newuserdialog import NewUserDialog
-from picard.ui.options.dialog import OptionsDialog
 from picard.ui.passworddialog import (
     PasswordDialog,
     ProxyDialog,
 )
-from picard.ui.player import NowPlayingService
 from picard.ui.savewarningdialog import SaveWarningDialog
-from picard.ui.scripteditor import ScriptEditorDialog
-from picard.ui.scripteditor.examples import ScriptEditorExamples
 from picard.ui.searchdialog.album import AlbumSearchDialog
 from picard.ui.searchdialog.track import TrackSearchDialog
 from picard.ui.setupwizard import SetupWizard
@@ -192,6 +190,10 @@ from picard.ui.util import (
 from picard.ui.widgets.checkboxmenuitem import CheckboxMenuItem
 
 
+if TYPE_CHECKING:
+    from picard.ui.player import NowPlayingService
+
+
 SuspendWhileLoadingFuncs = namedtuple('SuspendWhileLoadingFuncs', ('on_enter', 'on_exit'))
 
 
@@ -385,6 +387,7 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
 
     def set_filters(self, processing=True):
         Filter.suspended = not processing
+        self.panel.set_filters(processing)
 
     def keyPressEvent(self, event):
         # On macOS Command+Backspace triggers the so called "Forward Delete".
@@ -966,6 +969,7 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
             MainAction.OPEN_FOLDER,
             '-',
             MainAction.SAVE,
+            MainAction.EXPORT_RENAME_PLAN,
             MainAction.SUBMIT_ACOUSTID,
             MainAction.SUBMIT_ISRC,
             MainAction.TRASH,
@@ -1345,6 +1349,9 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
         return AboutDialog.show_instance(self)
 
     def show_options(self, page=None):
+        # Local import: importing the dialog imports all the option pages
+        from picard.ui.options.dialog import OptionsDialog
+
         ReadTheDocs.update_documentation_items()  # Retry updates if required
         options_dialog = OptionsDialog.show_instance(page, self)
         options_dialog.finished.connect(self._options_closed)
@@ -1408,7 +1415,90 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
         else:
             proceed_with_save = True
         if proceed_with_save:
-            self.tagger.save(self.selected_objects)
+            self.save_objects(list(self.selected_objects))
+
+    def save_objects(self, objects):
+        """Save objects, checking the planned renames first if files get renamed or moved."""
+        config = get_config()
+        if not (config.setting['rename_files'] or config.setting['move_files']):
+            self.tagger.save(objects)
+            return
+        files = list(iter_files_from_objects(objects, save=True))
+        if not files:
+            return
+        self.set_statusbar_message(N_("Planning renames of %(count)i files…"), {'count': len(files)})
+        build_rename_plan(files, partial(self._save_rename_plan_built, objects))
+
+    def _save_rename_plan_built(self, objects, plan=None, error=None):
+        if error is not None:
+            # Saving reports the errors for the single files
+            log.error("Failed planning renames before saving: %s", error)
+        elif plan.conflicts and not self._confirm_rename_conflicts(plan):
+            self.set_statusbar_message(
+                N_("Saving cancelled, %(conflicts)i files have conflicting target paths"),
+                {'conflicts': len(plan.conflicts)},
+            )
+            return
+        self.tagger.save(objects)
+
+    def _confirm_rename_conflicts(self, plan):
+        """Asks whether to save although files get conflicting target paths."""
+        QMessageBox = QtWidgets.QMessageBox
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Icon.Warning)
+        msg.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        msg.setWindowTitle(_("Conflicting file names"))
+        count = len(plan.conflicts)
+        msg.setText(
+            ngettext(
+                "{count} file gets a target path which conflicts with another file.",
+                "{count} files get target paths which conflict with other files.",
+                count,
+            ).format(count=count)
+        )
+        msg.setInformativeText(
+            _("Files are not overwritten, conflicting names get a number appended. Do you want to save anyway?")
+        )
+        msg.setDetailedText(
+            '\n'.join(
+                '%s → %s (%s)'
+                % (entry.source, entry.target, ', '.join(sorted(conflict.value for conflict in entry.conflicts)))
+                for entry in plan.conflicts
+            )
+        )
+        msg.setStandardButtons(QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Cancel)
+        msg.setDefaultButton(QMessageBox.StandardButton.Cancel)
+        return msg.exec() == QMessageBox.StandardButton.Save
+
+    def export_rename_plan(self):
+        """Write the planned renames and moves of the selected files to a CSV file."""
+        files = list(iter_files_from_objects(self.selected_objects))
+        if not files:
+            return
+        path, _filter = FileDialog.getSaveFileName(
+            parent=self,
+            directory='rename-plan.csv',
+            filter=_("CSV files (*.csv);;All files (*)"),
+        )
+        if not path:
+            return
+        self.set_statusbar_message(N_("Planning renames of %(count)i files…"), {'count': len(files)})
+        build_rename_plan(files, partial(self._rename_plan_built, path))
+
+    def _rename_plan_built(self, path, plan=None, error=None):
+        if error is None:
+            try:
+                plan.write_csv(path)
+            except OSError as why:
+                error = why
+        if error is not None:
+            log.error("Failed exporting rename plan to %r: %s", path, error)
+            self.set_statusbar_message(N_('Failed exporting rename plan to "%(path)s"'), {'path': path})
+            return
+        self.set_statusbar_message(
+            N_('Exported rename plan with %(moves)i moves and %(conflicts)i conflicts to "%(path)s"'),
+            {'moves': len(plan.moves), 'conflicts': len(plan.conflicts), 'path': path},
+        )
 
     def trash_files(self):
         files = list(iter_files_from_objects(self.selected_objects))
@@ -1872,6 +1962,7 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
         self.enable_action(MainAction.REMOVE, can_remove)
         self.enable_action(MainAction.TRASH, can_trash)
         self.enable_action(MainAction.SAVE, can_save)
+        self.enable_action(MainAction.EXPORT_RENAME_PLAN, have_files)
         self.enable_action(MainAction.VIEW_INFO, can_view_info)
         self.enable_action(MainAction.ANALYZE, can_analyze)
         self.enable_action(MainAction.GENERATE_FINGERPRINTS, have_files)
@@ -2233,7 +2324,12 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
 
         # Tooltips require ScriptEditorExamples which accesses tagger.window;
         # skip on the initial build since the window isn't assigned yet.
-        examples = ScriptEditorExamples(tagger=self.tagger) if self._menus_created else None
+        if self._menus_created:
+            from picard.ui.scripteditor.examples import ScriptEditorExamples
+
+            examples = ScriptEditorExamples(tagger=self.tagger)
+        else:
+            examples = None
 
         # Insert script actions before the separator
         insert_before = self.file_naming_scripts_menu.actions()[0] if self.file_naming_scripts_menu.actions() else None
@@ -2279,6 +2375,10 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
 
     def open_file_naming_script_editor(self):
         """Open the file naming script editor / manager in a new window."""
+        # Local import: the script editor is only needed once opened
+        from picard.ui.scripteditor import ScriptEditorDialog
+        from picard.ui.scripteditor.examples import ScriptEditorExamples
+
         ReadTheDocs.update_documentation_items()  # Retry updates if required
         examples = ScriptEditorExamples(tagger=self.tagger)
         self.script_editor_dialog = ScriptEditorDialog.show_instance(parent=self, examples=examples)
@@ -190,6 +190,15 @@ def _create_save_action(parent):
     return action
 
 
+@add_action(MainAction.EXPORT_RENAME_PLAN)
+def _create_export_rename_plan_action(parent):
+    action = QtGui.QAction(_("Export &Rename Plan…"), parent)
+    action.setStatusTip(_("Export the paths the selected files would be renamed or moved to, without saving them"))
+    action.setEnabled(False)
+    action.triggered.connect(parent.export_rename_plan)
+    return action
+
+
 @add_action(MainAction.TRASH)
 def _create_trash_action(parent):
     icon = parent.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_TrashIcon)
@@ -0,0 +1,139 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from PyQt6 import (
+    QtCore,
+    QtGui,
+    QtWidgets,
+)
+
+from picard.i18n import gettext as _
+from picard.util.metrics import (
+    Histogram,
+    metrics,
+)
+
+from picard.ui import PicardDialog
+from picard.ui.util import FileDialog
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return '%.2f s' % seconds
+    return '%.1f ms' % (seconds * 1000)
+
+
+def format_sample(metric, value):
+    if isinstance(metric, Histogram):
+        count = value['count']
+        mean = value['sum'] / count if count else 0
+        return _("count %(count)d, mean %(mean)s, p50 %(p50)s, p95 %(p95)s") % {
+            'count': count,
+            'mean': format_seconds(mean),
+            'p50': format_seconds(value['p50']),
+            'p95': format_seconds(value['p95']),
+        }
+    if float(value).is_integer():
+        return str(int(value))
+    return '%.3f' % value
+
+
+class MetricsView(PicardDialog):
+    defaultsize = QtCore.QSize(640, 400)
+    modality = QtCore.Qt.WindowModality.NonModal
+
+    _UPDATE_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowFlags(QtCore.Qt.WindowType.Window)
+        self.set_window_title(_("Metrics"))
+        vbox = QtWidgets.QVBoxLayout(self)
+
+        self.tree = QtWidgets.QTreeWidget()
+        self.tree.setHeaderLabels([_("Metric"), _("Labels"), _("Value")])
+        self.tree.setRootIsDecorated(True)
+        self.tree.setUniformRowHeights(True)
+        vbox.addWidget(self.tree)
+
+        hbox = QtWidgets.QHBoxLayout()
+        vbox.addLayout(hbox)
+        self.reset_button = QtWidgets.QPushButton(QtGui.QIcon.fromTheme("edit-clear"), _("&Reset"))
+        self.reset_button.setAutoDefault(False)
+        self.reset_button.clicked.connect(self._reset)
+        hbox.addWidget(self.reset_button)
+        self.save_as_button = QtWidgets.QPushButton(_("Save As…"))
+        self.save_as_button.setAutoDefault(False)
+        self.save_as_button.clicked.connect(self._save_as)
+        hbox.addWidget(self.save_as_button)
+        hbox.addStretch()
+
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setInterval(self._UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self.update_metrics)
+
+    def showEvent(self, event):
+        self.update_metrics()
+        self._update_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._update_timer.stop()
+        super().hideEvent(event)
+
+    def update_metrics(self):
+        expanded = {
+            self.tree.topLevelItem(i).text(0)
+            for i in range(self.tree.topLevelItemCount())
+            if self.tree.topLevelItem(i).isExpanded()
+        }
+        self.tree.clear()
+        for metric in metrics:
+            samples = metric.samples()
+            item = QtWidgets.QTreeWidgetItem([metric.name, '', ''])
+            item.setToolTip(0, metric.documentation)
+            if len(samples) == 1 and not samples[0][0]:
+                item.setText(2, format_sample(metric, samples[0][1]))
+            else:
+                for key, value in samples:
+                    labels = ', '.join(f'{name}={label}' for name, label in key)
+                    item.addChild(QtWidgets.QTreeWidgetItem(['', labels, format_sample(metric, value)]))
+            self.tree.addTopLevelItem(item)
+            item.setExpanded(metric.name in expanded)
+        self.tree.resizeColumnToContents(0)
+
+    def _reset(self):
+        metrics.clear()
+        self.update_metrics()
+
+    def _save_as(self):
+        path, ok = FileDialog.getSaveFileName(
+            parent=self,
+            caption=_("Save Metrics to File"),
+            filter=_("JSON files (*.json);;All files (*)"),
+        )
+        if ok and path:
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(metrics.to_json())
+            except OSError:
+                QtWidgets.QMessageBox.critical(
+                    self,
+                    _("Failed to save metrics to file"),
+                    _('Something prevented data to be written to "%s".') % path,
+                )
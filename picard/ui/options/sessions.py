@@ -55,6 +55,7 @@ class SessionsOptionsPage(OptionsPage):
         'session_backup_on_crash': {'widgets': ['backup_checkbox']},
         'session_include_mb_data': {'widgets': ['include_mb_data_checkbox']},
         'session_no_mb_requests_on_load': {'widgets': ['no_mb_requests_checkbox']},
+        'session_compact_format': {'widgets': ['compact_format_checkbox']},
         'session_folder_path': {'widgets': ['folder_path_edit']},
     }
 
@@ -86,6 +87,7 @@ class SessionsOptionsPage(OptionsPage):
         self.ui.no_mb_requests_checkbox.setChecked(config.setting['session_no_mb_requests_on_load'])
         # Enforce dependency (child enabled only when parent is on)
         self.ui.no_mb_requests_checkbox.setEnabled(self.ui.include_mb_data_checkbox.isChecked())
+        self.ui.compact_format_checkbox.setChecked(config.setting['session_compact_format'])
         self.ui.folder_path_edit.setText(config.setting['session_folder_path'])
 
     def save(self):
@@ -100,6 +102,7 @@ class SessionsOptionsPage(OptionsPage):
         config.setting['session_no_mb_requests_on_load'] = (
             self.ui.no_mb_requests_checkbox.isChecked() if include_mb else False
         )
+        config.setting['session_compact_format'] = self.ui.compact_format_checkbox.isChecked()
         config.setting['session_folder_path'] = self.ui.folder_path_edit.text().strip()
 
     def _browse_sessions_folder(self):
@@ -33,6 +33,7 @@ from PyQt6 import QtWidgets
 
 from picard.config import get_config
 from picard.extension_points.options_pages import register_options_page
+from picard.formats.padding import PaddingPolicy
 from picard.formats.util import date_sanitization_format_entries
 from picard.i18n import (
     N_,
@@ -46,6 +47,13 @@ from picard.ui.options import (
 )
 
 
+PADDING_POLICY_TITLES = (
+    (PaddingPolicy.DEFAULT, N_("Automatic")),
+    (PaddingPolicy.FIXED, N_("Fixed size")),
+    (PaddingPolicy.PERCENT, N_("Percentage of the audio size")),
+)
+
+
 class TagsOptionsPage(OptionsPage):
     NAME = 'tags'
     TITLE = N_("Tags")
@@ -57,11 +65,16 @@ class TagsOptionsPage(OptionsPage):
     OPTIONS: ClassVar[PageOptionConfigs] = {
         'enable_tag_saving': {'widgets': ['write_tags']},
         'preserve_timestamps': {'widgets': ['preserve_timestamps']},
+        'skip_unchanged_tag_writes': {'widgets': ['skip_unchanged_tag_writes']},
         'clear_existing_tags': {'widgets': ['clear_existing_tags']},
         'preserve_images': {'widgets': ['preserve_images']},
         'remove_id3_from_flac': {'widgets': ['remove_id3_from_flac']},
         'remove_ape_from_mp3': {'widgets': ['remove_ape_from_mp3']},
         'fix_missing_seekpoints_flac': {'widgets': ['fix_missing_seekpoints_flac']},
+        'tag_padding_policy': {'widgets': ['tag_padding_policy']},
+        'tag_padding_size_kb': {'widgets': ['tag_padding_size_kb']},
+        'tag_padding_percent': {'widgets': ['tag_padding_percent']},
+        'tag_padding_reserve_images': {'widgets': ['tag_padding_reserve_images']},
         'preserved_tags': {'widgets': ['preserved_tags_groupbox']},
         'disable_date_sanitization_formats': {'widgets': ['do_not_sanitize_container']},
     }
@@ -71,6 +84,10 @@ class TagsOptionsPage(OptionsPage):
         self.ui = Ui_TagsOptionsPage()
         self.ui.setupUi(self)
 
+        for policy, title in PADDING_POLICY_TITLES:
+            self.ui.tag_padding_policy.addItem(_(title), policy.value)
+        self.ui.tag_padding_policy.currentIndexChanged.connect(self._tag_padding_policy_changed)
+
         # Add multi-select combo for disabling date sanitization per format
         self._init_disable_date_sanitization_formats_control()
         self.tagger.format_registry.formats_changed.connect(self._rebuild_date_sanitization_model)
@@ -79,11 +96,18 @@ class TagsOptionsPage(OptionsPage):
         config = get_config()
         self.ui.write_tags.setChecked(config.setting['enable_tag_saving'])
         self.ui.preserve_timestamps.setChecked(config.setting['preserve_timestamps'])
+        self.ui.skip_unchanged_tag_writes.setChecked(config.setting['skip_unchanged_tag_writes'])
         self.ui.clear_existing_tags.setChecked(config.setting['clear_existing_tags'])
         self.ui.preserve_images.setChecked(config.setting['preserve_images'])
         self.ui.remove_ape_from_mp3.setChecked(config.setting['remove_ape_from_mp3'])
         self.ui.remove_id3_from_flac.setChecked(config.setting['remove_id3_from_flac'])
         self.ui.fix_missing_seekpoints_flac.setChecked(config.setting['fix_missing_seekpoints_flac'])
+        index = self.ui.tag_padding_policy.findData(config.setting['tag_padding_policy'])
+        self.ui.tag_padding_policy.setCurrentIndex(max(index, 0))
+        self._tag_padding_policy_changed()
+        self.ui.tag_padding_size_kb.setValue(config.setting['tag_padding_size_kb'])
+        self.ui.tag_padding_percent.setValue(config.setting['tag_padding_percent'])
+        self.ui.tag_padding_reserve_images.setChecked(config.setting['tag_padding_reserve_images'])
         self.ui.preserved_tags.update(config.setting['preserved_tags'])
         self.ui.preserved_tags.set_user_sortable(False)
 
@@ -95,14 +119,24 @@ class TagsOptionsPage(OptionsPage):
         config = get_config()
         config.setting['enable_tag_saving'] = self.ui.write_tags.isChecked()
         config.setting['preserve_timestamps'] = self.ui.preserve_timestamps.isChecked()
+        config.setting['skip_unchanged_tag_writes'] = self.ui.skip_unchanged_tag_writes.isChecked()
         config.setting['clear_existing_tags'] = self.ui.clear_existing_tags.isChecked()
         config.setting['preserve_images'] = self.ui.preserve_images.isChecked()
         config.setting['remove_ape_from_mp3'] = self.ui.remove_ape_from_mp3.isChecked()
         config.setting['remove_id3_from_flac'] = self.ui.remove_id3_from_flac.isChecked()
         config.setting['fix_missing_seekpoints_flac'] = self.ui.fix_missing_seekpoints_flac.isChecked()
+        config.setting['tag_padding_policy'] = self.ui.tag_padding_policy.currentData()
+        config.setting['tag_padding_size_kb'] = self.ui.tag_padding_size_kb.value()
+        config.setting['tag_padding_percent'] = self.ui.tag_padding_percent.value()
+        config.setting['tag_padding_reserve_images'] = self.ui.tag_padding_reserve_images.isChecked()
         config.setting['preserved_tags'] = list(self.ui.preserved_tags.tags)
         config.setting['disable_date_sanitization_formats'] = self._get_disable_date_sanitization_checked()
 
+    def _tag_padding_policy_changed(self):
+        policy = self.ui.tag_padding_policy.currentData()
+        self.ui.tag_padding_size_kb.setEnabled(policy == PaddingPolicy.FIXED)
+        self.ui.tag_padding_percent.setEnabled(policy == PaddingPolicy.PERCENT)
+
     # --- Disable date sanitization formats control ---
     def _init_disable_date_sanitization_formats_control(self):
         self._disable_date_sanitization_checkboxes: dict[str, QtWidgets.QCheckBox] = {}
@@ -0,0 +1,114 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from PyQt6 import (
+    QtCore,
+    QtGui,
+    QtWidgets,
+)
+
+from picard.config import get_config
+from picard.debug_opts import DebugOpt
+from picard.i18n import gettext as _
+from picard.util.stallwatchdog import stall_watchdog
+
+from picard.ui import (
+    FONT_FAMILY_MONOSPACE,
+    PicardDialog,
+)
+
+
+class StallReportView(PicardDialog):
+    defaultsize = QtCore.QSize(720, 480)
+    modality = QtCore.Qt.WindowModality.NonModal
+
+    _UPDATE_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowFlags(QtCore.Qt.WindowType.Window)
+        self.set_window_title(_("GUI Stalls"))
+        vbox = QtWidgets.QVBoxLayout(self)
+
+        self.status_label = QtWidgets.QLabel()
+        self.status_label.setWordWrap(True)
+        vbox.addWidget(self.status_label)
+
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text.setFont(QtGui.QFont(FONT_FAMILY_MONOSPACE))
+        vbox.addWidget(self.text)
+
+        hbox = QtWidgets.QHBoxLayout()
+        vbox.addLayout(hbox)
+        hbox.addWidget(QtWidgets.QLabel(_("Threshold:")))
+        self.threshold_spinbox = QtWidgets.QSpinBox()
+        self.threshold_spinbox.setRange(50, 10000)
+        self.threshold_spinbox.setSingleStep(50)
+        self.threshold_spinbox.setSuffix(_(" ms"))
+        self.threshold_spinbox.setValue(get_config().setting['gui_stall_threshold_ms'])
+        self.threshold_spinbox.valueChanged.connect(self._threshold_changed)
+        hbox.addWidget(self.threshold_spinbox)
+        self.clear_button = QtWidgets.QPushButton(QtGui.QIcon.fromTheme("edit-clear"), _("&Clear"))
+        self.clear_button.setAutoDefault(False)
+        self.clear_button.clicked.connect(self._clear)
+        hbox.addWidget(self.clear_button)
+        self.copy_button = QtWidgets.QPushButton(QtGui.QIcon.fromTheme("edit-copy"), _("&Copy"))
+        self.copy_button.setAutoDefault(False)
+        self.copy_button.clicked.connect(self._copy)
+        hbox.addWidget(self.copy_button)
+        hbox.addStretch()
+
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setInterval(self._UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self.update_report)
+
+    def showEvent(self, event):
+        self.update_report()
+        self._update_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._update_timer.stop()
+        super().hideEvent(event)
+
+    def update_report(self):
+        if stall_watchdog.running:
+            self.status_label.setText(
+                _("Recording stalls of the user interface longer than %d ms.") % (stall_watchdog.threshold * 1000)
+            )
+        else:
+            self.status_label.setText(
+                _('Enable the "%s" debug option to record stalls of the user interface.') % _(DebugOpt.GUI_STALLS.title)
+            )
+        text = stall_watchdog.format_report()
+        if text != self.text.toPlainText():
+            self.text.setPlainText(text)
+
+    def _threshold_changed(self, value):
+        get_config().setting['gui_stall_threshold_ms'] = value
+        stall_watchdog.set_threshold_ms(value)
+        self.update_report()
+
+    def _clear(self):
+        stall_watchdog.clear()
+        self.update_report()
+
+    def _copy(self):
+        QtWidgets.QApplication.clipboard().setText(self.text.toPlainText())
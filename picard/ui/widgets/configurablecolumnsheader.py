@@ -56,7 +56,6 @@ from picard.ui.columns import (
     ColumnGroup,
     ImageColumn,
 )
-from picard.ui.itemviews.custom_columns.manager_dialog import CustomColumnsManagerDialog
 from picard.ui.widgets.checkboxmenuitem import CheckboxMenuItem
 from picard.ui.widgets.lockableheaderview import LockableHeaderView
 
@@ -216,6 +215,9 @@ class ConfigurableColumnsHeader(LockableHeaderView):
         """
 
         def _open_manager():
+            # Local import: the manager dialog is only needed once opened
+            from picard.ui.itemviews.custom_columns.manager_dialog import CustomColumnsManagerDialog
+
             dlg = CustomColumnsManagerDialog(parent=self)
             dlg.exec()
 
@@ -17,7 +17,9 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+from collections import OrderedDict
 from collections.abc import (
+    Callable,
     Iterator,
     MutableMapping,
 )
@@ -97,3 +99,60 @@ class LRUCache(MutableMapping[_KT, _VT]):
 
     def __repr__(self) -> str:
         return repr(self._dict)
+
+
+class SizedLRUCache(MutableMapping[_KT, _VT]):
+    """
+    Least Recently Used cache limited by the total size of its values.
+
+    The size of each value is given by `sizeof`, e.g. the number of bytes of
+    an image. The least recently used items get discarded until the total
+    size fits into max_size again. A single value larger than max_size is
+    not kept at all.
+
+    >>> cache = SizedLRUCache(10, sizeof=len)
+    >>> cache['item1'] = 'abcd'
+    >>> cache['item2'] = 'efgh'
+    >>> cache['item3'] = 'ijkl'
+    >>> 'item1' in cache
+    False
+    >>> cache.size
+    8
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[_VT], int]) -> None:
+        self._max_size = max_size
+        self._sizeof = sizeof
+        self._dict: OrderedDict[_KT, tuple[_VT, int]] = OrderedDict()
+        self.size = 0
+
+    def __getitem__(self, key: _KT) -> _VT:
+        value, _size = self._dict[key]
+        self._dict.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        if key in self._dict:
+            del self[key]
+        size = self._sizeof(value)
+        if size > self._max_size:
+            return
+        self._dict[key] = (value, size)
+        self.size += size
+        while self.size > self._max_size:
+            _key, (_value, old_size) = self._dict.popitem(last=False)
+            self.size -= old_size
+
+    def __delitem__(self, key: _KT) -> None:
+        _value, size = self._dict.pop(key)
+        self.size -= size
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self._dict)
+
+    def clear(self) -> None:
+        self._dict.clear()
+        self.size = 0
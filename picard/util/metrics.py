@@ -0,0 +1,366 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""In-process runtime metrics.
+
+Counters, gauges and histograms are registered by name in a
+`MetricsRegistry`, each metric can have samples for several label sets,
+e.g. one per host. Recording a value is cheap and thread safe. The registry
+can be exported as JSON or in the Prometheus text exposition format.
+
+Usage:
+    FILE_LOAD_SECONDS = metrics.histogram('file_load_seconds', "Time to load a file")
+
+    with FILE_LOAD_SECONDS.time(format='MP3File'):
+        load()
+"""
+
+from bisect import bisect_left
+from collections.abc import (
+    Callable,
+    Generator,
+)
+from contextlib import contextmanager
+import json
+import math
+import threading
+import time
+from typing import Any
+
+from picard import log
+
+
+# Upper bounds in seconds, suitable for file I/O and network requests
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PROMETHEUS_PREFIX = 'picard_'
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    labels = key + extra
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    type = ''
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def clear(self):
+        raise NotImplementedError
+
+    def samples(self) -> list[tuple[LabelKey, Any]]:
+        """Returns the current samples as list of (label key, value)"""
+        raise NotImplementedError
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'type': self.type,
+            'help': self.documentation,
+            'samples': [{'labels': dict(key), 'value': value} for key, value in self.samples()],
+        }
+
+    def prometheus_lines(self) -> list[str]:
+        name = PROMETHEUS_PREFIX + self.name
+        lines = [
+            f'# HELP {name} {self.documentation}',
+            f'# TYPE {name} {self.type}',
+        ]
+        for key, value in self.samples():
+            lines.append(f'{name}{_format_labels(key)} {_format_value(value)}')
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count, e.g. of requests"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            return sorted(self._values.items())
+
+
+class Gauge(Metric):
+    """Value which can go up and down, e.g. a queue depth.
+
+    Instead of setting the value, a function returning the current value
+    can be registered. It is called when the metrics are collected, possibly
+    from a thread other than the main thread.
+    """
+
+    type = 'gauge'
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: dict[LabelKey, float] = {}
+        self._functions: dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], float], **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._functions[key] = function
+
+    def value(self, **labels) -> float:
+        return dict(self.samples()).get(_label_key(labels), 0)
+
+    def clear(self):
+        # Registered functions stay, they always provide the current value
+        with self._lock:
+            self._values.clear()
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+            functions = list(self._functions.items())
+        for key, function in functions:
+            try:
+                values[key] = function()
+            except Exception as e:
+                # The object providing the value might be gone, e.g. on exit
+                log.debug("Metrics: failed reading gauge %s%s: %s", self.name, _format_labels(key), e)
+        return sorted(values.items())
+
+
+class _HistogramData:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int):
+        # Counts per bucket, the last one is the +Inf bucket
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Distribution of observed values, e.g. latencies in seconds"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        self._data: dict[LabelKey, _HistogramData] = {}
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._data.get(key)
+            if data is None:
+                data = self._data[key] = _HistogramData(len(self.buckets) + 1)
+            data.counts[index] += 1
+            data.sum += value
+            data.count += 1
+
+    @contextmanager
+    def time(self, **labels) -> Generator[None]:
+        """Context manager observing the elapsed time in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        data = self._data.get(_label_key(labels))
+        return data.count if data else 0
+
+    def quantile(self, q: float, **labels) -> float:
+        """Estimates the q-quantile by interpolating within the buckets.
+
+        Returns NaN if nothing was observed. Values in the +Inf bucket are
+        estimated as the largest bucket bound.
+        """
+        with self._lock:
+            data = self._data.get(_label_key(labels))
+            counts = list(data.counts) if data else []
+        return self._quantile(q, counts)
+
+    def _quantile(self, q: float, counts: list[int]) -> float:
+        total = sum(counts)
+        if not total:
+            return math.nan
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def samples(self):
+        """Returns (label key, dict with count, sum and cumulative buckets)"""
+        with self._lock:
+            items = sorted((key, list(data.counts), data.sum, data.count) for key, data in self._data.items())
+        samples = []
+        for key, counts, total, count in items:
+            cumulative = 0
+            buckets = []
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                buckets.append((bound, cumulative))
+            samples.append(
+                (
+                    key,
+                    {
+                        'count': count,
+                        'sum': total,
+                        'buckets': buckets,
+                        'p50': self._quantile(0.5, counts),
+                        'p95': self._quantile(0.95, counts),
+                    },
+                )
+            )
+        return samples
+
+    def as_dict(self):
+        return {
+            'type': self.type,
+            'help': self.documentation,
+            'samples': [
+                {
+                    'labels': dict(key),
+                    'count': value['count'],
+                    'sum': value['sum'],
+                    'p50': value['p50'],
+                    'p95': value['p95'],
+                    'buckets': {_format_value(bound): count for bound, count in value['buckets']},
+                }
+                for key, value in self.samples()
+            ],
+        }
+
+    def prometheus_lines(self):
+        name = PROMETHEUS_PREFIX + self.name
+        lines = [
+            f'# HELP {name} {self.documentation}',
+            f'# TYPE {name} {self.type}',
+        ]
+        for key, value in self.samples():
+            for bound, count in value['buckets']:
+                lines.append(f'{name}_bucket{_format_labels(key, (("le", _format_value(bound)),))} {count}')
+            lines.append(f'{name}_sum{_format_labels(key)} {_format_value(value["sum"])}')
+            lines.append(f'{name}_count{_format_labels(key)} {value["count"]}')
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics, registering a name again returns the existing metric"""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as {metric.type}")
+            return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._get_or_create(Counter, name, documentation)
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation)
+
+    def histogram(self, name: str, documentation: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, buckets=buckets)
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def __iter__(self):
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return iter(metrics)
+
+    def clear(self):
+        """Resets the values of all metrics, the metrics stay registered"""
+        for metric in self:
+            metric.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {metric.name: metric.as_dict() for metric in self}
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for metric in self:
+            lines.extend(metric.prometheus_lines())
+        return '\n'.join(lines) + '\n'
+
+
+# Shared by all of Picard
+metrics = MetricsRegistry()
@@ -0,0 +1,156 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Profiling of a running Picard instance.
+
+While profiling, cProfile records the CPU time spent in the functions called
+on the main thread and tracemalloc traces the memory allocations of all
+threads. On stop, or on each dump, the results are written to the log folder:
+
+- `picard-profile-<time>.pstats`, to be inspected with `python -m pstats`
+  or tools like snakeviz
+- `picard-profile-<time>.allocations`, a `tracemalloc.Snapshot`. Comparing
+  two snapshots with `Snapshot.compare_to` shows where memory grows.
+
+Profiling runs while `DebugOpt.PROFILING` is enabled, it can also be
+controlled with the PROFILE remote command.
+"""
+
+import cProfile
+import os
+import time
+import tracemalloc
+
+from picard import log
+from picard.const.appdirs import log_folder
+from picard.debug_opts import DebugOpt
+
+
+class Profiler:
+    """Starts and stops cProfile and tracemalloc in the running process"""
+
+    # Frames stored per traced allocation, more frames give better
+    # tracebacks but slow down allocations further
+    TRACEMALLOC_FRAMES = 10
+
+    def __init__(self, folder=None):
+        self._folder = folder
+        self._profile = None
+        self._started_tracemalloc = False
+        self._start_time = 0.0
+
+    @property
+    def folder(self) -> str:
+        return self._folder or log_folder()
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    def set_enabled(self, enabled: bool):
+        if enabled:
+            self.start()
+        else:
+            self.stop()
+
+    def toggle(self) -> list[str]:
+        if self.running:
+            return self.stop()
+        self.start()
+        return []
+
+    def start(self):
+        """Starts profiling, must be called from the main thread"""
+        if self.running:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler, e.g. a debugger, is active already
+            log.error("Profiler: failed to start: %s", e)
+            DebugOpt.PROFILING.enabled = False
+            return
+        self._profile = profile
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start(self.TRACEMALLOC_FRAMES)
+        self._start_time = time.monotonic()
+        DebugOpt.PROFILING.enabled = True
+        log.info("Profiler: started, results will be written to %r", self.folder)
+
+    def stop(self) -> list[str]:
+        """Stops profiling and writes the results, returns the written files"""
+        if not self.running:
+            return []
+        self._profile.disable()
+        filenames = self._dump()
+        self._profile = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        DebugOpt.PROFILING.enabled = False
+        log.info("Profiler: stopped after %.1f s", time.monotonic() - self._start_time)
+        return filenames
+
+    def dump(self) -> list[str]:
+        """Writes the results collected so far and continues profiling"""
+        if not self.running:
+            log.warning("Profiler: not running, nothing to dump")
+            return []
+        self._profile.disable()
+        try:
+            return self._dump()
+        finally:
+            self._profile.enable()
+
+    def _dump(self) -> list[str]:
+        filenames = []
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            basename = self._unique_basename()
+            pstats_filename = basename + '.pstats'
+            self._profile.dump_stats(pstats_filename)
+            filenames.append(pstats_filename)
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                snapshot_filename = basename + '.allocations'
+                tracemalloc.take_snapshot().dump(snapshot_filename)
+                filenames.append(snapshot_filename)
+                log.info(
+                    "Profiler: traced memory %.1f MiB, peak %.1f MiB",
+                    current / 1024 / 1024,
+                    peak / 1024 / 1024,
+                )
+        except OSError as e:
+            log.error("Profiler: failed writing results to %r: %s", self.folder, e)
+        for filename in filenames:
+            log.info("Profiler: wrote %r", filename)
+        return filenames
+
+    def _unique_basename(self) -> str:
+        prefix = os.path.join(self.folder, 'picard-profile-' + time.strftime('%Y%m%d-%H%M%S'))
+        basename = prefix
+        counter = 1
+        while os.path.exists(basename + '.pstats'):
+            counter += 1
+            basename = f'{prefix}-{counter}'
+        return basename
+
+
+# Shared by the tagger, the log view and the remote commands
+profiler = Profiler()
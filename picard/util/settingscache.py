@@ -0,0 +1,96 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Cache for objects derived from setting values.
+
+Compiled filters and regular expressions are built once per setting value
+instead of on each use. Entries are dropped when the setting changes.
+
+The cache is used from worker threads, e.g. when saving files, while setting
+changes are handled in the main thread, access to the entries holds a lock.
+"""
+
+from collections.abc import Callable
+import threading
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from picard.config import get_config
+
+
+T = TypeVar('T')
+
+
+class SettingsCache:
+    """Caches the result of factory(value) for the value of a setting.
+
+    The current setting value is compared to the value the cached object was
+    built from on each access, so a changed value is never missed, e.g. when
+    switching profiles. `ConfigSection.setting_changed` only drops outdated
+    entries early.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, Callable], tuple[Any, Any]] = {}
+        self._section = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, name: str, factory: Callable[[Any], T]) -> T:
+        """Returns factory(value) for the current value of setting name"""
+        setting = get_config().setting
+        value = setting[name]
+        key = (name, factory)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == value:
+            return entry[1]
+        # Built without holding the lock, factory may use the cache itself
+        result = factory(value)
+        with self._lock:
+            self._entries[key] = (value, result)
+            self._connect(setting)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _connect(self, setting):
+        if setting is self._section:
+            return
+        signal = getattr(setting, 'setting_changed', None)
+        if signal is None:
+            return
+        if self._section is not None:
+            self._section.setting_changed.disconnect(self._setting_changed)
+        signal.connect(self._setting_changed)
+        self._section = setting
+
+    def _setting_changed(self, name, old_value, new_value):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+
+# Shared cache for objects derived from the "setting" config section
+settings_cache = SettingsCache()
@@ -0,0 +1,281 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""Detection of main thread stalls.
+
+A timer on the main thread records a heartbeat. A watchdog thread checks the
+heartbeat and, while it is overdue by more than the threshold, samples the
+Python stack of the main thread with `sys._current_frames`. Once the main
+thread gets back to the event loop the stall and its samples are added to
+the `StallReport`, so the code paths blocking the user interface can be
+found by the number of samples taken in them.
+
+The watchdog runs while `DebugOpt.GUI_STALLS` is enabled.
+"""
+
+from collections import (
+    Counter,
+    deque,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PyQt6 import QtCore
+
+from picard import log
+from picard.config import get_config
+from picard.debug_opts import DebugOpt
+from picard.util.metrics import metrics
+
+
+# A stack as (filename, line number, function name) tuples, innermost first
+StackKey = tuple[tuple[str, int, str], ...]
+
+_PICARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SOURCE_ROOT = os.path.dirname(_PICARD_DIR)
+
+GUI_STALL_SECONDS = metrics.histogram(
+    'gui_stall_seconds',
+    "Duration of main thread stalls longer than the threshold",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+def stack_key(frame, limit=None) -> StackKey:
+    """Returns the stack starting at frame as hashable tuple"""
+    summary = traceback.StackSummary.extract(traceback.walk_stack(frame), limit=limit, lookup_lines=False)
+    return tuple((f.filename, f.lineno, f.name) for f in summary)
+
+
+def is_picard_frame(filename: str) -> bool:
+    return filename.startswith(_PICARD_DIR)
+
+
+def format_frame(frame: tuple[str, int, str]) -> str:
+    filename, lineno, name = frame
+    if filename.startswith(_SOURCE_ROOT):
+        filename = os.path.relpath(filename, _SOURCE_ROOT)
+    return f"{filename}:{lineno} in {name}"
+
+
+def stall_site(stack: StackKey) -> str:
+    """Returns the innermost Picard frame of a stack, e.g. 'picard/file.py:12 in load'"""
+    for frame in stack:
+        if is_picard_frame(frame[0]):
+            return format_frame(frame)
+    return format_frame(stack[0]) if stack else '?'
+
+
+@dataclass
+class Stall:
+    start: float
+    duration: float
+    samples: int
+    site: str
+
+
+@dataclass
+class StallSite:
+    stack: StackKey
+    # Samples taken in this stack
+    samples: int = 0
+    # Number of stalls in which this stack was sampled
+    stalls: int = 0
+
+
+@dataclass
+class StallReport:
+    """Aggregated stalls, grouped by the sampled stacks"""
+
+    max_recent: int = 50
+    count: int = 0
+    total_time: float = 0.0
+    longest: float = 0.0
+    sites: dict[StackKey, StallSite] = field(default_factory=dict)
+    recent: deque = field(default_factory=deque)
+
+    def add(self, start: float, duration: float, samples: Counter) -> Stall:
+        self.count += 1
+        self.total_time += duration
+        self.longest = max(self.longest, duration)
+        for stack, count in samples.items():
+            site = self.sites.get(stack)
+            if site is None:
+                site = self.sites[stack] = StallSite(stack)
+            site.samples += count
+            site.stalls += 1
+        top_stack = samples.most_common(1)[0][0] if samples else ()
+        stall = Stall(start, duration, samples.total(), stall_site(top_stack))
+        self.recent.append(stall)
+        while len(self.recent) > self.max_recent:
+            self.recent.popleft()
+        return stall
+
+    def top_sites(self, limit: int = 10) -> list[StallSite]:
+        return sorted(self.sites.values(), key=lambda site: site.samples, reverse=True)[:limit]
+
+    def format(self, sample_interval: float, limit: int = 10, stack_depth: int = 8) -> str:
+        if not self.count:
+            return "No stalls recorded."
+        lines = [
+            "Stalls: %d, total %.2f s, longest %.2f s" % (self.count, self.total_time, self.longest),
+            "",
+            "Stall sites by sampled time:",
+        ]
+        for site in self.top_sites(limit):
+            lines.append(
+                "%8.2f s  %d samples in %d stalls  %s"
+                % (site.samples * sample_interval, site.samples, site.stalls, stall_site(site.stack))
+            )
+            for frame in site.stack[:stack_depth]:
+                lines.append("              " + format_frame(frame))
+            lines.append("")
+        lines.append("Recent stalls:")
+        for stall in reversed(self.recent):
+            lines.append(
+                "%s  %8.0f ms  %s"
+                % (time.strftime('%H:%M:%S', time.localtime(stall.start)), stall.duration * 1000, stall.site)
+            )
+        return '\n'.join(lines)
+
+
+class StallWatchdog:
+    """Samples the main thread's stack while the event loop is stalled"""
+
+    HEARTBEAT_INTERVAL = 0.05
+    SAMPLE_INTERVAL = 0.02
+    STACK_LIMIT = 32
+
+    def __init__(self):
+        self.report = StallReport()
+        self.threshold = 0.25
+        self._lock = threading.Lock()
+        self._timer = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._main_thread_id = None
+        self._last_beat = 0.0
+        self._samples = None
+        self._stall_start = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def set_enabled(self, enabled: bool):
+        if enabled:
+            self.start()
+        else:
+            self.stop()
+
+    def set_threshold_ms(self, threshold_ms: int):
+        self.threshold = max(threshold_ms, 1) / 1000
+
+    def start(self):
+        """Starts the watchdog, must be called from the main thread"""
+        if self.running:
+            return
+        self.set_threshold_ms(get_config().setting['gui_stall_threshold_ms'])
+        self._main_thread_id = threading.get_ident()
+        if self._timer is None:
+            self._timer = QtCore.QTimer()
+            self._timer.setInterval(int(self.HEARTBEAT_INTERVAL * 1000))
+            self._timer.timeout.connect(self._heartbeat)
+        with self._lock:
+            self._last_beat = time.monotonic()
+            self._samples = None
+        self._timer.start()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='StallWatchdog', daemon=True)
+        self._thread.start()
+        log.debug("Stall watchdog: started with threshold %.0f ms", self.threshold * 1000)
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._timer.stop()
+        log.debug("Stall watchdog: stopped")
+
+    def clear(self):
+        with self._lock:
+            self.report = StallReport()
+
+    def _heartbeat(self):
+        now = time.monotonic()
+        with self._lock:
+            samples, self._samples = self._samples, None
+            start = self._stall_start
+            self._last_beat = now
+        if samples:
+            # The stall began at some point within the heartbeat interval
+            self._stall_finished(start, max(now - start - self.HEARTBEAT_INTERVAL, 0), samples)
+
+    def _stall_finished(self, start, duration, samples):
+        wall_start = time.time() - (time.monotonic() - start)
+        with self._lock:
+            stall = self.report.add(wall_start, duration, samples)
+        GUI_STALL_SECONDS.observe(duration)
+        log.debug_if(
+            DebugOpt.GUI_STALLS,
+            "GUI stalled for %.0f ms, %d samples, mostly in %s",
+            duration * 1000,
+            stall.samples,
+            stall.site,
+        )
+
+    def _run(self):
+        while not self._stop_event.wait(self.SAMPLE_INTERVAL):
+            with self._lock:
+                last_beat = self._last_beat
+            if time.monotonic() - last_beat - self.HEARTBEAT_INTERVAL > self.threshold:
+                self._sample(last_beat)
+
+    def _sample(self, last_beat):
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        try:
+            stack = stack_key(frame, limit=self.STACK_LIMIT)
+        finally:
+            # Avoid keeping the frame's locals alive
+            del frame
+        with self._lock:
+            if self._last_beat != last_beat:
+                # The main thread got back to the event loop meanwhile
+                return
+            if self._samples is None:
+                self._samples = Counter()
+                self._stall_start = last_beat
+            self._samples[stack] += 1
+
+    def format_report(self) -> str:
+        with self._lock:
+            return self.report.format(self.SAMPLE_INTERVAL)
+
+
+# Shared by the tagger and the log view
+stall_watchdog = StallWatchdog()
@@ -35,6 +35,7 @@ from functools import partial
 import os.path
 import platform
 import sys
+import time
 from typing import (
     Any,
     ClassVar,
@@ -74,6 +75,7 @@ from picard.util import (
     encoded_queryargs,
     parse_json,
 )
+from picard.util.metrics import metrics
 from picard.util.xml import parse_xml
 from picard.webservice import ratecontrol
 from picard.webservice.utils import port_from_qurl
@@ -96,6 +98,11 @@ CLIENT_STRING = '%s %s-%s' % (PICARD_ORG_NAME, PICARD_APP_NAME, PICARD_VERSION_S
 
 DEFAULT_RESPONSE_PARSER_TYPE = "json"
 
+WS_REQUEST_SECONDS = metrics.histogram('webservice_request_seconds', "Time from sending a web request to its reply")
+WS_REQUESTS_TOTAL = metrics.counter('webservice_requests_total', "Number of finished web requests by HTTP status")
+WS_QUEUE_DEPTH = metrics.gauge('webservice_queue_depth', "Number of web requests waiting to be sent")
+WS_ACTIVE_REQUESTS = metrics.gauge('webservice_active_requests', "Number of web requests waiting for a reply")
+
 # MusicBrainz Web Service inc params that require authentication.
 # Requests with these params will get a 401 if not logged in.
 _AUTH_REQUIRED_INC_PARAMS = frozenset(
@@ -233,6 +240,8 @@ class WSRequest(QNetworkRequest):
 
         # set headers and attributes
         self.access_token = None  # call _update_authorization_header
+        # time.monotonic() when the request was sent
+        self.send_time: float | None = None
 
         if self.method == 'GET':
             self._high_prio_no_cache = self.refresh
@@ -445,6 +454,8 @@ class WebService(QtCore.QObject):
         self._active_requests = {}
         self._task_to_reply: dict[PendingRequest, QNetworkReply] = {}
         self._queue = RequestPriorityQueue()
+        WS_QUEUE_DEPTH.set_function(self._queue.count)
+        WS_ACTIVE_REQUESTS.set_function(lambda: len(self._active_requests))
         self.num_pending_web_requests = 0
         self._notify_on_cancel = False
         self._awaiting_authorization: list[WSRequest] = []
@@ -522,6 +533,7 @@ class WebService(QtCore.QObject):
         ratecontrol.increment_requests(hostkey)
 
         request.access_token = access_token
+        request.send_time = time.monotonic()
         send = self._request_methods[request.method]
         data = request.data
         if data is not None:
@@ -613,6 +625,7 @@ class WebService(QtCore.QObject):
 
         handler = request.handler
         response_code = self.http_response_code(reply)
+        self._record_metrics(request, response_code, error)
         display_reply_url = self.display_url(reply.request().url())
         if reply.attribute(QNetworkRequest.Attribute.Http2WasUsedAttribute):
             proto = 'HTTP2'
@@ -702,6 +715,19 @@ class WebService(QtCore.QObject):
 
         ratecontrol.adjust(hostkey, slow_down)
 
+    @staticmethod
+    def _record_metrics(request: WSRequest, response_code: int, error: QNetworkReply.NetworkError):
+        host = request.host
+        if request.send_time is not None:
+            WS_REQUEST_SECONDS.observe(time.monotonic() - request.send_time, host=host)
+        if response_code:
+            status = str(response_code)
+        elif error != QNetworkReply.NetworkError.NoError:
+            status = 'error'
+        else:
+            status = 'ok'
+        WS_REQUESTS_TOTAL.inc(host=host, status=status)
+
     def _process_reply(self, reply: QNetworkReply):
         try:
             request = self._active_requests.pop(reply)
@@ -69,6 +69,15 @@ class AcoustIdAPIHelper(APIHelper):
             request_mimetype='application/x-www-form-urlencoded',
         )
 
+    def query_acoustid_batch(
+        self, handler: ReplyHandler, fingerprints: 'Iterable[tuple[str, int]]', **args
+    ) -> PendingRequest:
+        """Look up several fingerprints, given as (fingerprint, duration) tuples, in a single request."""
+        for i, (fingerprint, duration) in enumerate(fingerprints):
+            args[f'fingerprint.{i}'] = fingerprint
+            args[f'duration.{i}'] = str(duration)
+        return self.query_acoustid(handler, **args)
+
     @staticmethod
     def _submissions_to_args(submissions: 'Iterable[Submission]') -> dict[str, str]:
         config = get_config()
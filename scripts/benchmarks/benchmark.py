@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Benchmarks for Picard's hot paths.
+
+Usage:
+    python scripts/benchmarks/benchmark.py [-k PATTERN] [--save FILE] [--compare FILE]
+    python scripts/benchmarks/benchmark.py --compare BASELINE --against RESULTS
+
+Each benchmark is timed in a number of samples. A sample runs the benchmark
+often enough to take at least --min-time seconds and records the mean time
+per run. Results are stored as JSON including all samples, so two results
+can be compared later.
+
+A benchmark counts as a regression if its median got slower by more than
+--threshold and a two-sided Mann-Whitney U test over the samples is
+significant at --alpha. The command exits with status 1 on regressions.
+
+Extending:
+    Add a function decorated with @benchmark to cases.py. It prepares the
+    fixtures and returns the callable to time.
+"""
+
+import argparse
+import gc
+import json
+import math
+from pathlib import Path
+import platform
+import re
+import statistics
+import sys
+import time
+
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from cases import (  # noqa: E402
+    BENCHMARKS,
+    setup_environment,
+)
+
+
+DEFAULT_SAMPLES = 15
+DEFAULT_MIN_TIME = 0.02
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.01
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def calibrate(func, min_time):
+    """Returns the number of runs needed for a sample to take min_time"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _i in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return number
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+
+def measure(func, samples=DEFAULT_SAMPLES, min_time=DEFAULT_MIN_TIME):
+    """Returns a list of mean run times in seconds, one per sample"""
+    # Warm up caches and lazy initialization
+    func()
+    number = calibrate(func, min_time)
+    results = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _i in range(samples):
+            start = time.perf_counter()
+            for _j in range(number):
+                func()
+            results.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return results
+
+
+def run(pattern=None, samples=DEFAULT_SAMPLES, min_time=DEFAULT_MIN_TIME):
+    regex = re.compile(pattern) if pattern else None
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if regex and not regex.search(name):
+            continue
+        func = setup()
+        times = measure(func, samples=samples, min_time=min_time)
+        results[name] = times
+        print(f"{name:<40} {format_time(statistics.median(times)):>10}  (±{format_time(spread(times))})")
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.time(),
+        'benchmarks': results,
+    }
+
+
+# =============================================================================
+# Statistics
+# =============================================================================
+
+
+def spread(times):
+    """Returns the median absolute deviation"""
+    median = statistics.median(times)
+    return statistics.median(abs(t - median) for t in times)
+
+
+def mann_whitney_u(a, b):
+    """Two-sided Mann-Whitney U test using the normal approximation.
+
+    Returns the p-value for the hypothesis that a and b come from the
+    same distribution.
+    """
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 1.0
+    values = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(values)
+    tie_term = 0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+    rank_sum = sum(rank for rank, (_v, group) in zip(ranks, values, strict=True) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, alpha=DEFAULT_ALPHA):
+    """Compares the benchmarks of two results.
+
+    Returns a list of tuples (name, baseline median, current median, ratio,
+    p-value, status) with status one of "slower", "faster" or "".
+    """
+    rows = []
+    for name, current_times in current['benchmarks'].items():
+        baseline_times = baseline['benchmarks'].get(name)
+        if not baseline_times:
+            continue
+        old = statistics.median(baseline_times)
+        new = statistics.median(current_times)
+        ratio = new / old if old else 1.0
+        p = mann_whitney_u(baseline_times, current_times)
+        status = ''
+        if p < alpha:
+            if ratio > 1 + threshold:
+                status = 'slower'
+            elif ratio < 1 - threshold:
+                status = 'faster'
+        rows.append((name, old, new, ratio, p, status))
+    return rows
+
+
+def format_time(seconds):
+    for unit, factor in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_comparison(rows):
+    print()
+    print(f"{'Benchmark':<40} {'Baseline':>10} {'Current':>10} {'Change':>8} {'p':>7}")
+    for name, old, new, ratio, p, status in rows:
+        line = f"{name:<40} {format_time(old):>10} {format_time(new):>10} {ratio - 1:>+8.1%} {p:>7.4f}"
+        print(f"{line}  {status.upper() if status == 'slower' else status}".rstrip())
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Picard's hot paths")
+    parser.add_argument('-k', '--filter', help="only run benchmarks matching this regular expression")
+    parser.add_argument('-l', '--list', action='store_true', help="list the available benchmarks")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help="samples per benchmark")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME, help="minimum seconds per sample")
+    parser.add_argument('--save', metavar='FILE', help="save the results as JSON")
+    parser.add_argument('--compare', metavar='FILE', help="compare against baseline results")
+    parser.add_argument('--against', metavar='FILE', help="compare saved results instead of running")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="relative slowdown to report")
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="significance level")
+    args = parser.parse_args()
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    if args.against:
+        if not args.compare:
+            parser.error("--against requires --compare")
+        current = load_results(args.against)
+    else:
+        setup_environment()
+        current = run(args.filter, samples=args.samples, min_time=args.min_time)
+        if args.save:
+            with open(args.save, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+            print(f"\nSaved results to {args.save}")
+
+    if args.compare:
+        rows = compare(load_results(args.compare), current, threshold=args.threshold, alpha=args.alpha)
+        print_comparison(rows)
+        regressions = [row[0] for row in rows if row[5] == 'slower']
+        if regressions:
+            print(f"\n{len(regressions)} significant slowdown(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
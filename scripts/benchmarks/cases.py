@@ -0,0 +1,457 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Benchmark cases for scripts/benchmarks/benchmark.py.
+
+All fixtures are generated or read from test/data, the benchmarks run
+without network access.
+"""
+
+import atexit
+import copy
+import json
+from pathlib import Path
+import random
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import uuid
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TEST_DATA_DIR = PROJECT_ROOT / 'test' / 'data'
+
+# Fixed seed, all runs must use the same fixtures
+SEED = 4711
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registers a benchmark setup function.
+
+    The setup function prepares the fixtures and returns the callable to time.
+    """
+
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+# =============================================================================
+# Environment
+# =============================================================================
+
+
+class _DefaultingSection(dict):
+    """Settings section falling back to the default of registered options"""
+
+    def __init__(self, name, data=None):
+        super().__init__(data or {})
+        self._name = name
+
+    def __missing__(self, name):
+        from picard.config import Option
+
+        option = Option.get(self._name, name)
+        if option is None:
+            raise KeyError(name)
+        return option.default
+
+    def raw_value(self, name, qtype=None):
+        return self.get(name)
+
+
+def setup_environment():
+    """Sets up config, i18n and a mocked tagger instead of a running Picard"""
+    import picard.config as config_mod
+    from picard.i18n import setup_i18n
+    import picard.item as item_mod
+    import picard.options  # noqa: F401
+    from picard.tagger import Tagger
+
+    setup_i18n(None, 'C')
+    config = SimpleNamespace(
+        setting=_DefaultingSection('setting'),
+        persist=_DefaultingSection('persist'),
+        profiles=_DefaultingSection('profiles'),
+    )
+    config.setting.update(
+        {
+            'enabled_plugins': [],
+            'va_name': 'Various Artists',
+            'windows_compatibility': False,
+            'translation_locales': ['en'],
+            'write_id3v1': True,
+            'write_id3v23': False,
+            'id3v2_encoding': 'utf-8',
+            'track_ars': True,
+        }
+    )
+    config_mod.config = config
+    config_mod.setting = config.setting
+    config_mod.persist = config.persist
+    config_mod.profiles = config.profiles
+
+    from picard.formats import DEFAULT_FORMATS
+    from picard.formats.registry import FormatRegistry
+
+    tagger = MagicMock(spec=Tagger)
+    tagger.format_registry = FormatRegistry()
+    for format in DEFAULT_FORMATS:
+        tagger.format_registry.register(format)
+    item_mod.tagger_instance = lambda: tagger
+
+
+def load_test_json(filename):
+    with open(TEST_DATA_DIR / 'ws_data' / filename, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _copy_test_file(name):
+    tmpdir = tempfile.mkdtemp(prefix='picard-benchmark-')
+    atexit.register(shutil.rmtree, tmpdir, ignore_errors=True)
+    target = Path(tmpdir) / name
+    shutil.copy(TEST_DATA_DIR / name, target)
+    return str(target)
+
+
+WORDS = (
+    'love', 'night', 'dream', 'heart', 'fire', 'rain', 'light', 'summer', 'blue', 'road',
+    'dance', 'river', 'song', 'time', 'world', 'shadow', 'golden', 'wild', 'home', 'star',
+)  # fmt: skip
+
+
+def _random_title(rng, words=3):
+    return ' '.join(rng.choice(WORDS) for _i in range(words)).title()
+
+
+def _typo(rng, text):
+    if len(text) < 2:
+        return text
+    i = rng.randrange(len(text) - 1)
+    return text[:i] + text[i + 1] + text[i] + text[i + 2 :]
+
+
+# =============================================================================
+# Similarity and metadata comparison
+# =============================================================================
+
+
+@benchmark('similarity2')
+def bench_similarity2():
+    from picard.similarity import similarity2
+
+    rng = random.Random(SEED)
+    pairs = []
+    for _i in range(100):
+        a = _random_title(rng, 4)
+        pairs.append((a, _typo(rng, a)))
+        pairs.append((a, _random_title(rng, 4)))
+
+    def run():
+        for a, b in pairs:
+            similarity2(a, b)
+
+    return run
+
+
+def _track_metadata(rng, tracknumber, album='Some Album', artist='Some Artist'):
+    from picard.metadata import Metadata
+
+    return Metadata(
+        {
+            'title': _random_title(rng),
+            'artist': artist,
+            'album': album,
+            'albumartist': artist,
+            'tracknumber': str(tracknumber),
+            'totaltracks': '12',
+            'discnumber': '1',
+            'totaldiscs': '1',
+            'date': '2001-05-14',
+            'releasecountry': 'GB',
+            '~length': str(180000 + tracknumber * 1000),
+        },
+        length=180000 + tracknumber * 1000,
+    )
+
+
+def _perturbed(rng, metadata):
+    from picard.metadata import Metadata
+
+    perturbed = Metadata(metadata)
+    perturbed['title'] = _typo(rng, metadata['title'])
+    perturbed.length = metadata.length + rng.randint(-2000, 2000)
+    return perturbed
+
+
+@benchmark('metadata_compare')
+def bench_metadata_compare():
+    rng = random.Random(SEED)
+    pairs = []
+    for i in range(1, 51):
+        a = _track_metadata(rng, i)
+        pairs.append((a, _perturbed(rng, a)))
+
+    def run():
+        for a, b in pairs:
+            a.compare(b)
+
+    return run
+
+
+# =============================================================================
+# Scripting
+# =============================================================================
+
+NAMING_SCRIPT = (
+    '$if2(%albumartist%,%artist%)/'
+    '$if(%albumartist%,%album%/,)'
+    '$if($gt(%totaldiscs%,1),%discnumber%-,)'
+    '$if($and(%albumartist%,%tracknumber%),$num(%tracknumber%,2) ,)'
+    '$if(%_multiartist%,%artist% - ,)'
+    '%title%'
+)
+
+TAGGING_SCRIPT = (
+    '$set(album,$rreplace(%album%, [\\(]disc [0-9]+[\\)],))'
+    '$set(genre,$title(%genre%))'
+    '$if($startswith(%artist%,The ),$set(artistsort,$swapprefix(%artist%)))'
+    '$set(comment,$lower(%title%) $len(%title%))'
+)
+
+
+def _script_benchmark(script):
+    from picard.metadata import Metadata
+    from picard.script import ScriptParser
+
+    rng = random.Random(SEED)
+    metadata = [_track_metadata(rng, i) for i in range(1, 21)]
+    for m in metadata:
+        m['genre'] = 'rock; pop'
+
+    def run():
+        parser = ScriptParser()
+        for m in metadata:
+            parser.eval(script, Metadata(m))
+
+    return run
+
+
+@benchmark('script_eval_naming')
+def bench_script_eval_naming():
+    return _script_benchmark(NAMING_SCRIPT)
+
+
+@benchmark('script_eval_tagging')
+def bench_script_eval_tagging():
+    return _script_benchmark(TAGGING_SCRIPT)
+
+
+# =============================================================================
+# Matching and clustering
+# =============================================================================
+
+
+@benchmark('album_match_files')
+def bench_album_match_files():
+    from picard.album import Album
+    from picard.file import File
+    from picard.metadata import Metadata
+    from picard.track import Track
+
+    rng = random.Random(SEED)
+    tracks = []
+    files = []
+    for i in range(1, 41):
+        track = Track(f'track-{i}')
+        track.metadata = _track_metadata(rng, i)
+        tracks.append(track)
+        file = File(f'/music/{i:03d}.mp3')
+        file.orig_metadata = _perturbed(rng, track.metadata)
+        # No MBIDs, all files get matched by similarity
+        file.metadata = Metadata(file.orig_metadata)
+        files.append(file)
+    rng.shuffle(files)
+    unmatched = object()
+
+    def run():
+        for _match in Album._match_files(files, tracks, unmatched):
+            pass
+
+    return run
+
+
+@benchmark('cluster_10k_files')
+def bench_cluster():
+    from picard.cluster import Cluster
+    from picard.file import File
+
+    rng = random.Random(SEED)
+    albums = [(_random_title(rng), _random_title(rng, 2)) for _i in range(500)]
+    files = []
+    for i in range(10000):
+        album, artist = rng.choice(albums)
+        file = File(f'/music/{artist}/{album}/{i:05d}.mp3')
+        file.metadata['album'] = _typo(rng, album) if rng.random() < 0.1 else album
+        file.metadata['artist'] = artist
+        files.append(file)
+
+    def run():
+        list(Cluster.cluster(files))
+
+    return run
+
+
+# =============================================================================
+# MusicBrainz JSON processing
+# =============================================================================
+
+
+# Recordings with artist, recording and work relationships
+RECORDING_TEMPLATES = (
+    'recording.json',
+    'recording_composer.json',
+    'recording_credits.json',
+    'recording_instrumental.json',
+)
+
+
+def _random_mbid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _large_release(media=10, tracks=25):
+    """Builds a release with many media and tracks based on release.json.
+
+    The recordings are copies of the recording test data, including their
+    relationships, with new IDs and titles.
+    """
+    rng = random.Random(SEED)
+    release = load_test_json('release.json')
+    recordings = [load_test_json(name) for name in RECORDING_TEMPLATES]
+    release['media'] = []
+    for position in range(1, media + 1):
+        medium_tracks = []
+        for number in range(1, tracks + 1):
+            recording = copy.deepcopy(rng.choice(recordings))
+            recording['id'] = _random_mbid(rng)
+            recording['title'] = _random_title(rng)
+            medium_tracks.append(
+                {
+                    'id': _random_mbid(rng),
+                    'number': str(number),
+                    'position': number,
+                    'title': recording['title'],
+                    'length': recording.get('length'),
+                    'recording': recording,
+                }
+            )
+        release['media'].append(
+            {
+                'position': position,
+                'format': 'CD',
+                'title': '',
+                'track-count': tracks,
+                'track-offset': 0,
+                'tracks': medium_tracks,
+            }
+        )
+    return release
+
+
+@benchmark('mbjson_release_to_metadata')
+def bench_release_to_metadata():
+    from picard.album import Album
+    from picard.mbjson import (
+        medium_to_metadata,
+        release_to_metadata,
+        track_to_metadata,
+    )
+    from picard.metadata import Metadata
+    from picard.track import Track
+
+    node = _large_release()
+    album = Album(node['id'])
+    track = Track(node['media'][0]['tracks'][0]['id'], album)
+
+    def run():
+        release_to_metadata(node, Metadata(), album)
+        for medium_node in node['media']:
+            medium_to_metadata(medium_node, Metadata())
+            for track_node in medium_node['tracks']:
+                track.metadata = Metadata()
+                track_to_metadata(track_node, track)
+
+    return run
+
+
+@benchmark('mbjson_recording_to_metadata')
+def bench_recording_to_metadata():
+    from picard.mbjson import recording_to_metadata
+    from picard.metadata import Metadata
+    from picard.track import Track
+
+    nodes = [track['recording'] for medium in _large_release()['media'] for track in medium['tracks']]
+    track = Track(nodes[0]['id'])
+
+    def run():
+        for node in nodes:
+            recording_to_metadata(node, Metadata(), track)
+
+    return run
+
+
+# =============================================================================
+# File formats
+# =============================================================================
+
+
+def _format_file(name):
+    from picard.item import tagger_instance
+
+    filename = _copy_test_file(name)
+    return filename, tagger_instance().format_registry.open(filename)
+
+
+@benchmark('id3_load')
+def bench_id3_load():
+    filename, file = _format_file('test.mp3')
+    return lambda: file._load(filename)
+
+
+@benchmark('id3_save')
+def bench_id3_save():
+    filename, file = _format_file('test.mp3')
+    file._copy_loaded_metadata(file._load(filename))
+    metadata = _track_metadata(random.Random(SEED), 1)
+
+    def run():
+        file._save(filename, metadata)
+
+    return run
+
+
+@benchmark('vorbis_load')
+def bench_vorbis_load():
+    filename, file = _format_file('test.flac')
+    return lambda: file._load(filename)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Cold start import time of Picard.
+
+Usage:
+    python scripts/benchmarks/importtime.py [--runs N] [--budget MS] [--top N]
+
+Imports `picard.tagger` in fresh interpreters and reports the median time.
+A run with `python -X importtime` lists the modules taking the most time,
+by their own import time and including the modules they imported first.
+
+The command exits with status 1 if the median exceeds --budget.
+"""
+
+import argparse
+import os
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Target for importing picard.tagger, most of Picard's start up time
+DEFAULT_BUDGET_MS = 1500
+DEFAULT_RUNS = 7
+DEFAULT_TOP = 25
+
+MODULE = 'picard.tagger'
+
+_TIMED_IMPORT = f"import time; t = time.perf_counter(); import {MODULE}; print(time.perf_counter() - t)"
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)$')
+
+
+def _environment():
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (str(PROJECT_ROOT), env.get('PYTHONPATH'))))
+    return env
+
+
+def measure(runs):
+    """Returns the import times in seconds of `runs` fresh interpreters"""
+    times = []
+    for _i in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', _TIMED_IMPORT],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+            env=_environment(),
+        )
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def parse_importtime(output):
+    """Returns (module, self µs, cumulative µs) for each import"""
+    imports = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            imports.append((match[3], int(match[1]), int(match[2])))
+    return imports
+
+
+def importtime():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {MODULE}'],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+        env=_environment(),
+    )
+    return parse_importtime(result.stderr)
+
+
+def print_top(imports, top):
+    slowest = sorted(imports, key=lambda i: i[1], reverse=True)[:top]
+    width = max(len(name) for name, _self_us, _cumulative_us in slowest)
+    print(f"\n{'Module':<{width}}  {'Self':>9}  {'Cumulative':>10}")
+    for name, self_us, cumulative_us in slowest:
+        print(f"{name:<{width}}  {self_us / 1000:7.1f}ms  {cumulative_us / 1000:8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold start import time of Picard")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="number of fresh interpreters")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS, help="maximum median in milliseconds")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    if args.top:
+        print_top(importtime(), args.top)
+
+    times = measure(args.runs)
+    median_ms = statistics.median(times) * 1000
+    print(
+        f"\nimport {MODULE}: median {median_ms:.0f}ms, min {min(times) * 1000:.0f}ms, "
+        f"max {max(times) * 1000:.0f}ms ({args.runs} runs, budget {args.budget:.0f}ms)"
+    )
+    if median_ms > args.budget:
+        print(f"Over budget by {median_ms - args.budget:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
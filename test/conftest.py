@@ -32,8 +32,9 @@ What this conftest currently does:
   config for `setting`/`persist`/`profiles`.
 - For registered options it falls back to their default; for unknown keys it
   raises KeyError (preserving tests that expect missing keys).
-- Overrides `picard.config.get_config` and module-level exports to point to
-  the fake config, and updates `PicardTestCase.init_config` accordingly.
+- Overrides the module-level exports of `picard.config`, as returned by
+  `picard.config.get_config`, to point to the fake config, and updates
+  `PicardTestCase.init_config` accordingly.
 """
 
 from contextlib import suppress
@@ -122,8 +123,8 @@ def _install_defaulting_config(monkeypatch):
     monkeypatch.setattr(cfg_mod, "persist", persist, raising=False)
     monkeypatch.setattr(cfg_mod, "profiles", profiles, raising=False)
 
-    # Provide get_config() that returns our fake config unless overridden by other fixtures
-    monkeypatch.setattr(cfg_mod, "get_config", lambda: fake_config, raising=False)
+    # The real get_config() returns the patched module-level config. It is not
+    # replaced, modules imported during a test would keep the replacement.
 
     # Patch PicardTestCase.init_config to use our defaulting config as well
     with suppress(ModuleNotFoundError):
@@ -696,6 +696,100 @@ class MP3Test(CommonId3Tests.Id3TestCase):
         save_metadata(self.format_registry, self.filename, Metadata())
         self.assertRaises(mutagen.apev2.APENoHeaderError, mutagen.apev2.APEv2, self.filename)
 
+    def _load_file(self):
+        f = self.format_registry.open(self.filename)
+        f._copy_loaded_metadata(f._load(self.filename))
+        return f
+
+    @skipUnlessTestfile
+    def test_tag_format_changed(self):
+        config.setting['write_id3v1'] = False
+        f = self._load_file()
+        self.assertEqual(4, f._tag_format.id3_version)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        self.assertFalse(f._tags_changed(f.metadata, config.setting))
+        for name in ('write_id3v23', 'write_id3v1'):
+            with self.subTest(name=name):
+                config.setting[name] = True
+                self.assertTrue(f._tags_changed(f.metadata, config.setting))
+                config.setting[name] = False
+
+    @skipUnlessTestfile
+    def test_tag_format_updated_on_save(self):
+        config.setting['write_id3v23'] = True
+        f = self._load_file()
+        self.assertTrue(f._tag_format_changed(f.metadata, config.setting))
+        f._save(self.filename, f.metadata)
+        self.assertEqual(3, f._tag_format.id3_version)
+        self.assertTrue(f._tag_format.has_id3v1)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        loaded_format = self._load_file()._tag_format
+        self.assertEqual(f._tag_format.id3_version, loaded_format.id3_version)
+        self.assertEqual(f._tag_format.padding.padding, loaded_format.padding.padding)
+
+    @skipUnlessTestfile
+    def test_tag_format_changed_encoding(self):
+        config.setting['write_id3v1'] = False
+        config.setting['id3v2_encoding'] = 'utf-8'
+        f = self._load_file()
+        f.metadata['title'] = 'foo'
+        f._save(self.filename, f.metadata)
+        f = self._load_file()
+        self.assertEqual(frozenset({id3.Id3Encoding.UTF8}), f._tag_format.id3_encodings)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        config.setting['id3v2_encoding'] = 'utf-16'
+        self.assertTrue(f._tags_changed(f.metadata, config.setting))
+        f._save(self.filename, f.metadata)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        self.assertEqual(frozenset({id3.Id3Encoding.UTF16}), self._load_file()._tag_format.id3_encodings)
+
+    @skipUnlessTestfile
+    def test_tag_format_changed_id3v23_encoding(self):
+        config.setting['write_id3v1'] = False
+        config.setting['write_id3v23'] = True
+        config.setting['id3v2_encoding'] = 'utf-8'
+        f = self._load_file()
+        f.metadata['title'] = 'foo'
+        f._save(self.filename, f.metadata)
+        f = self._load_file()
+        # ID3v2.3 does not support UTF-8
+        self.assertEqual(frozenset({id3.Id3Encoding.UTF16}), f._tag_format.id3_encodings)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        config.setting['id3v2_encoding'] = 'iso-8859-1'
+        self.assertTrue(f._tag_format_changed(f.metadata, config.setting))
+
+    @skipUnlessTestfile
+    def test_tag_format_changed_id3v23_join_with(self):
+        config.setting['write_id3v1'] = False
+        config.setting['write_id3v23'] = True
+        config.setting['id3v23_join_with'] = '/'
+        f = self._load_file()
+        f._save(self.filename, f.metadata)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        config.setting['id3v23_join_with'] = '; '
+        self.assertTrue(f._tags_changed(f.metadata, config.setting))
+        f._save(self.filename, f.metadata)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        # Not relevant for ID3v2.4
+        config.setting['write_id3v23'] = False
+        f._save(self.filename, f.metadata)
+        config.setting['id3v23_join_with'] = '/'
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+
+    @skipUnlessTestfile
+    def test_tag_format_changed_apev2(self):
+        config.setting['write_id3v1'] = False
+        apev2_tags = mutagen.apev2.APEv2()
+        apev2_tags['Title'] = 'foo'
+        apev2_tags.save(self.filename)
+        f = self._load_file()
+        self.assertTrue(f._tag_format.has_apev2)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+        config.setting['remove_ape_from_mp3'] = True
+        self.assertTrue(f._tag_format_changed(f.metadata, config.setting))
+        f._save(self.filename, f.metadata)
+        self.assertFalse(f._tag_format_changed(f.metadata, config.setting))
+
 
 class TTATest(CommonId3Tests.Id3TestCase):
     testfile = 'test.tta'
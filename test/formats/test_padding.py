@@ -0,0 +1,199 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+
+from mutagen import PaddingInfo
+
+from test.picardtestcase import PicardTestCase
+
+from picard.coverart.image import CoverArtImage
+from picard.formats.padding import (
+    TAG_SAVES_TOTAL,
+    PaddingPolicy,
+    TagPadding,
+    WriteMode,
+    padding_changes,
+    unembedded_images_size,
+)
+from picard.metadata import Metadata
+
+from .common import (
+    CommonTests,
+    save_metadata,
+)
+from .coverart import load_coverart_file
+
+
+class TagPaddingTest(PicardTestCase):
+    def test_saved_info(self):
+        padding = TagPadding()
+        self.assertIsNone(padding.saved_info())
+        padding(PaddingInfo(2000, 10_000_000))
+        info = padding.saved_info()
+        self.assertEqual((2000, 10_000_000), (info.padding, info.size))
+
+    def test_default_policy(self):
+        padding = TagPadding()
+        info = PaddingInfo(2000, 10_000_000)
+        self.assertEqual(padding(info), info.get_default_padding())
+        self.assertEqual(padding.mode, WriteMode.IN_PLACE)
+        info = PaddingInfo(-100, 10_000_000)
+        self.assertEqual(padding(info), info.get_default_padding())
+        self.assertEqual(padding.mode, WriteMode.REWRITE)
+        self.assertEqual(padding.moved_bytes, 10_000_000)
+
+    def test_fixed_policy(self):
+        padding = TagPadding(PaddingPolicy.FIXED, size=64 * 1024)
+        self.assertEqual(padding(PaddingInfo(-1, 10_000_000)), 64 * 1024)
+        self.assertEqual(padding.mode, WriteMode.REWRITE)
+        # Any existing padding gets reused, even if it is large
+        self.assertEqual(padding(PaddingInfo(500_000, 10_000_000)), 500_000)
+        self.assertEqual(padding.mode, WriteMode.IN_PLACE)
+        self.assertEqual(padding(PaddingInfo(0, 10_000_000)), 0)
+        self.assertEqual(padding.mode, WriteMode.IN_PLACE)
+
+    def test_percent_policy(self):
+        padding = TagPadding(PaddingPolicy.PERCENT, percent=2)
+        self.assertEqual(padding(PaddingInfo(-1, 10_000_000)), 200_000)
+        self.assertEqual(padding(PaddingInfo(10, 10_000_000)), 10)
+
+    def test_reserve(self):
+        padding = TagPadding(PaddingPolicy.FIXED, size=1000, reserve=5000)
+        self.assertEqual(padding(PaddingInfo(-1, 10_000_000)), 6000)
+        padding = TagPadding(reserve=5000)
+        self.assertEqual(padding(PaddingInfo(100, 10_000_000)), 100)
+        info = PaddingInfo(-1, 10_000_000)
+        self.assertEqual(padding(info), info.get_default_padding() + 5000)
+
+    def test_from_config(self):
+        settings = {
+            'tag_padding_policy': 'percent',
+            'tag_padding_size_kb': 16,
+            'tag_padding_percent': 3,
+            'tag_padding_reserve_images': False,
+        }
+        padding = TagPadding.from_config(Metadata(), settings)
+        self.assertEqual(padding.policy, PaddingPolicy.PERCENT)
+        self.assertEqual(padding.size, 16 * 1024)
+        self.assertEqual(padding.percent, 3)
+        self.assertEqual(padding.reserve, 0)
+
+    def test_from_config_invalid_policy(self):
+        self.set_config_values({'tag_padding_policy': 'invalid'})
+        self.assertEqual(TagPadding.from_config().policy, PaddingPolicy.DEFAULT)
+
+    def test_record(self):
+        padding = TagPadding()
+        padding.record('TestFormat', 'test.mp3')
+        self.assertEqual(TAG_SAVES_TOTAL.value(format='TestFormat', mode='in_place'), 0)
+        padding(PaddingInfo(10, 1000))
+        padding.record('TestFormat', 'test.mp3')
+        self.assertEqual(TAG_SAVES_TOTAL.value(format='TestFormat', mode='in_place'), 1)
+
+    def test_padding_changes(self):
+        settings = {
+            'tag_padding_policy': 'default',
+            'tag_padding_size_kb': 16,
+            'tag_padding_percent': 3,
+            'tag_padding_reserve_images': False,
+        }
+        self.assertFalse(padding_changes(PaddingInfo(2000, 10_000_000), Metadata(), settings))
+        # mutagen would shrink the large padding, but that is no reason to rewrite the tags
+        self.assertFalse(padding_changes(PaddingInfo(1_000_000, 10_000), Metadata(), settings))
+        settings['tag_padding_policy'] = 'fixed'
+        self.assertFalse(padding_changes(PaddingInfo(1_000_000, 10_000), Metadata(), settings))
+        self.assertTrue(padding_changes(PaddingInfo(-1, 10_000), Metadata(), settings))
+
+    def test_unembedded_images_size(self):
+        front = CoverArtImage(data=load_coverart_file('mb.png'), types=['front'])
+        back = CoverArtImage(data=load_coverart_file('mb.jpg'), types=['back'])
+        metadata = Metadata(images=[front, back])
+        settings = {
+            'save_images_to_tags': True,
+            'embed_only_one_front_image': True,
+        }
+        self.assertEqual(unembedded_images_size(metadata, settings), back.datalength)
+        settings['save_images_to_tags'] = False
+        self.assertEqual(unembedded_images_size(metadata, settings), front.datalength + back.datalength)
+        settings['save_images_to_tags'] = True
+        settings['embed_only_one_front_image'] = False
+        self.assertEqual(unembedded_images_size(metadata, settings), 0)
+
+
+class CommonPaddingTests:
+    class PaddingTestCase(CommonTests.BaseFileTestCase):
+        def setUp(self):
+            super().setUp()
+            self.set_config_values(
+                {
+                    'tag_padding_policy': 'fixed',
+                    'tag_padding_size_kb': 32,
+                    'tag_padding_percent': 1,
+                    'tag_padding_reserve_images': False,
+                }
+            )
+
+        def save(self, metadata):
+            before = TAG_SAVES_TOTAL.value(format=self.format.__name__, mode='in_place')
+            save_metadata(self.format_registry, self.filename, metadata)
+            return TAG_SAVES_TOTAL.value(format=self.format.__name__, mode='in_place') > before
+
+        def test_saves_in_place_after_first_write(self):
+            # Larger than the padding of the test file, forces a rewrite
+            self.assertFalse(self.save(Metadata({'title': 'x' * 20_000})))
+            size = os.path.getsize(self.filename)
+            self.assertTrue(self.save(Metadata({'title': 'Foo', 'lyrics': 'x' * 10_000})))
+            self.assertEqual(os.path.getsize(self.filename), size)
+
+        def test_reserve_images(self):
+            self.set_config_values(
+                {
+                    'tag_padding_size_kb': 1,
+                    'tag_padding_reserve_images': True,
+                    'save_images_to_tags': False,
+                }
+            )
+            image = CoverArtImage(data=load_coverart_file('mb.jpg'), types=['front'])
+            title = 'x' * 20_000
+            self.assertFalse(self.save(Metadata({'title': title}, images=[image])))
+            size = os.path.getsize(self.filename)
+            # The image is larger than the fixed padding, but room was reserved for it
+            self.set_config_values({'save_images_to_tags': True})
+            self.assertTrue(self.save(Metadata({'title': title}, images=[image])))
+            self.assertEqual(os.path.getsize(self.filename), size)
+
+        def test_without_reserve_images(self):
+            self.set_config_values({'tag_padding_size_kb': 1, 'save_images_to_tags': False})
+            image = CoverArtImage(data=load_coverart_file('mb.jpg'), types=['front'])
+            title = 'x' * 20_000
+            self.save(Metadata({'title': title}, images=[image]))
+            self.set_config_values({'save_images_to_tags': True})
+            self.assertFalse(self.save(Metadata({'title': title}, images=[image])))
+
+
+class MP3PaddingTest(CommonPaddingTests.PaddingTestCase):
+    testfile = 'test.mp3'
+
+
+class FLACPaddingTest(CommonPaddingTests.PaddingTestCase):
+    testfile = 'test.flac'
+
+
+class MP4PaddingTest(CommonPaddingTests.PaddingTestCase):
+    testfile = 'test.m4a'
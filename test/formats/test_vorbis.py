@@ -32,6 +32,7 @@ from mutagen.flac import (
     SeekTable,
     VCFLACDict,
 )
+import mutagen.id3
 
 from test.picardtestcase import (
     PicardTestCase,
@@ -307,6 +308,32 @@ class FLACTest(CommonVorbisTests.VorbisTestCase):
                 self.assertGreater(f.metadata_blocks.index(b), tagindex)
         self.assertTrue(haspics, "Picture block expected, none found")
 
+    @skipUnlessTestfile
+    def test_tag_format_changed_remove_id3(self):
+        mutagen.id3.ID3().save(self.filename)
+        f = self.format_registry.open(self.filename)
+        f._copy_loaded_metadata(f._load(self.filename))
+        self.assertTrue(f._tag_format.has_id3)
+        self.assertEqual(4059, f._tag_format.padding.padding)
+        self.assertFalse(f._tags_changed(f.metadata, config.setting))
+        config.setting['remove_id3_from_flac'] = True
+        self.assertTrue(f._tags_changed(f.metadata, config.setting))
+        f._save(self.filename, f.metadata)
+        self.assertFalse(f._tag_format.has_id3)
+        self.assertFalse(f._tags_changed(f.metadata, config.setting))
+
+    @skipUnlessTestfile
+    def test_flac_audio_size(self):
+        mutagen.id3.ID3().save(self.filename)
+        sizes = []
+
+        def padding(info):
+            sizes.append(info.size)
+            return info.padding
+
+        load_raw(self.filename).save(padding=padding)
+        self.assertEqual(sizes, [vorbis.flac_audio_size(self.filename)])
+
     @patch.object(vorbis, 'flac_remove_empty_seektable')
     def test_setting_fix_missing_seekpoints_flac(self, mock_flac_remove_empty_seektable):
         save_metadata(self.format_registry, self.filename, Metadata())
@@ -26,6 +26,9 @@ from unittest.mock import (
     patch,
 )
 
+from PyQt6 import QtCore
+from PyQt6.QtNetwork import QNetworkRequest
+
 from test.picardtestcase import PicardTestCase
 from test.plugins3.helpers import (
     MockPlugin,
@@ -39,7 +42,10 @@ from picard.plugin3.manager import (
     PluginManager,
     PluginMetadata,
 )
-from picard.plugin3.plugin import Plugin
+from picard.plugin3.plugin import (
+    Plugin,
+    hash_string,
+)
 from picard.plugin3.plugin_metadata import PluginMetadataManager
 from picard.plugin3.registry import (
     PluginRegistry,
@@ -915,3 +921,147 @@ class TestPluginRegistry(PicardTestCase):
         url, uuid = metadata_mgr.get_original_metadata(True, 'https://example.com/B', test_uuid)
         self.assertEqual(url, 'https://example.com/A')
         self.assertEqual(uuid, 'original-uuid-A')
+
+
+class TestRegistryIndexes(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.registry = PluginRegistry()
+        self.registry.set_raw_registry_data(
+            {
+                'plugins': [
+                    {
+                        'id': 'first',
+                        'uuid': 'uuid-1',
+                        'git_url': 'https://example.com/first.git',
+                        'categories': ['metadata'],
+                        'trust_level': 'official',
+                        'redirect_from': ['https://example.com/old.git'],
+                    },
+                    {
+                        'id': 'second',
+                        'name': 'Second',
+                        'description': 'Second Plugin',
+                        'name_i18n': {'de': 'Zweites'},
+                        'uuid': 'uuid-2',
+                        'git_url': 'https://example.com/second',
+                        'categories': ['metadata', 'coverart'],
+                        'trust_level': 'community',
+                        'redirect_from': ['https://example.com/old.git'],
+                        'redirect_from_uuid': ['old-uuid'],
+                    },
+                ],
+                'blacklist': [
+                    {'url_regex': r'^https://example\.com/bad', 'reason': 'Pattern'},
+                    {'url': 'https://example.com/bad.git', 'reason': 'URL'},
+                    {'uuid': 'bad-uuid', 'reason': 'UUID'},
+                ],
+            }
+        )
+
+    def test_find_plugin_first_match(self):
+        self.assertEqual('first', self.registry.find_plugin(plugin_id='first', uuid='uuid-2').id)
+        self.assertEqual('first', self.registry.find_plugin(plugin_id='second', uuid='uuid-1').id)
+        self.assertEqual('second', self.registry.find_plugin(url='https://example.com/second').id)
+        self.assertIsNone(self.registry.find_plugin(plugin_id='missing'))
+
+    def test_find_plugin_redirects(self):
+        self.assertEqual('first', self.registry.find_plugin(url='https://example.com/old.git').id)
+        self.assertEqual('second', self.registry.find_plugin(uuid='old-uuid').id)
+        self.assertEqual('first', self.registry.find_plugin(url='https://example.com/old.git', uuid='old-uuid').id)
+
+    def test_list_plugins(self):
+        self.assertEqual(['first', 'second'], [p.id for p in self.registry.list_plugins(category='metadata')])
+        self.assertEqual(['second'], [p.id for p in self.registry.list_plugins(category='coverart')])
+        self.assertEqual(['second'], [p.id for p in self.registry.list_plugins(trust_level='community')])
+        self.assertEqual(
+            ['first'], [p.id for p in self.registry.list_plugins(category='metadata', trust_level='official')]
+        )
+        self.assertEqual([], self.registry.list_plugins(category='missing'))
+        # The result can be modified without changing the registry
+        self.registry.list_plugins().clear()
+        self.assertEqual(2, len(self.registry.list_plugins()))
+
+    def test_blacklist_first_entry_wins(self):
+        self.assertEqual((True, 'Pattern'), self.registry.is_blacklisted('https://example.com/bad.git'))
+        self.assertEqual((True, 'UUID'), self.registry.is_blacklisted('https://example.com/ok.git', 'bad-uuid'))
+        self.assertEqual((False, None), self.registry.is_blacklisted('https://example.com/ok.git', 'uuid-1'))
+        self.assertEqual({'url', 'uuid', 'url_regex'}, self.registry.get_blacklist_types())
+
+    def test_get_trust_level(self):
+        self.assertEqual('official', self.registry.get_trust_level('https://example.com/first.git'))
+        self.assertEqual('unregistered', self.registry.get_trust_level('https://example.com/missing.git'))
+        self.assertEqual('unregistered', self.registry.get_trust_level(''))
+
+    def test_search_text(self):
+        plugin = self.registry.find_plugin(plugin_id='second')
+        self.assertEqual('second second plugin metadata coverart', plugin.search_text('en'))
+        self.assertEqual('zweites second plugin metadata coverart', plugin.search_text('de_DE'))
+
+
+class TestRegistryConditionalFetch(PicardTestCase):
+    URL = 'https://test.example.com/registry.toml'
+
+    def setUp(self):
+        super().setUp()
+        self.patch_app_instance('picard.plugin3.registry')
+        self.cache_dir = self.mktmpdir()
+        self.requests = []
+
+    def fetch(self, response, status=200, headers=None):
+        def get_url_mock(url, handler, **kwargs):
+            self.requests.append(kwargs)
+            reply = Mock()
+            reply.attribute.return_value = status
+            reply.rawHeader.side_effect = lambda name: QtCore.QByteArray((headers or {}).get(name, b''))
+            handler(response, reply, None)
+
+        self.tagger.webservice.get_url = get_url_mock
+        result = {}
+
+        def callback(success, error):
+            result['success'] = success
+            result['error'] = error
+
+        registry = PluginRegistry(registry_url=self.URL, cache_dir=self.cache_dir)
+        registry.fetch_registry(use_cache=False, callback=callback)
+        return registry, result
+
+    def test_cache_is_json(self):
+        registry, result = self.fetch(b'[[plugins]]\nid = "test"\n', headers={b'ETag': b'"v1"'})
+        self.assertTrue(result['success'])
+        self.assertEqual('.json', registry.cache_path.suffix)
+        registry2 = PluginRegistry(registry_url=self.URL, cache_dir=self.cache_dir)
+        self.assertEqual('test', registry2.find_plugin(plugin_id='test').id)
+
+    def test_legacy_toml_cache_removed(self):
+        legacy_path = Path(self.cache_dir) / f'plugin_registry_{hash_string(self.URL)}.toml'
+        legacy_path.write_text('plugins = []')
+        self.fetch(b'plugins = []')
+        self.assertFalse(legacy_path.exists())
+
+    def test_no_validators_without_cache(self):
+        self.fetch(b'plugins = []')
+        self.assertIsNone(self.requests[0]['headers'])
+
+    def test_conditional_request(self):
+        self.fetch(
+            b'[[plugins]]\nid = "test"\n',
+            headers={b'ETag': b'"v1"', b'Last-Modified': b'Sat, 17 Oct 2026 10:00:00 GMT'},
+        )
+        registry, result = self.fetch(b'', status=304)
+        self.assertEqual(
+            {'If-None-Match': '"v1"', 'If-Modified-Since': 'Sat, 17 Oct 2026 10:00:00 GMT'},
+            self.requests[1]['headers'],
+        )
+        self.assertEqual(QNetworkRequest.CacheLoadControl.AlwaysNetwork, self.requests[1]['cacheloadcontrol'])
+        self.assertTrue(result['success'])
+        self.assertEqual('test', registry.find_plugin(plugin_id='test').id)
+
+    def test_conditional_request_modified(self):
+        self.fetch(b'[[plugins]]\nid = "old"\n', headers={b'ETag': b'"v1"'})
+        registry, result = self.fetch(b'[[plugins]]\nid = "new"\n', headers={b'ETag': b'"v2"'})
+        self.assertTrue(result['success'])
+        self.assertEqual(['new'], [p.id for p in registry.plugins])
+        self.fetch(b'', status=304)
+        self.assertEqual({'If-None-Match': '"v2"'}, self.requests[2]['headers'])
@@ -83,8 +83,8 @@ class TestRegistryAdvanced(PicardTestCase):
 
             test_url = 'https://test.example.com/registry.toml'
             url_hash = hash_string(test_url)
-            cache_file = cache_dir / f'plugin_registry_{url_hash}.toml'
-            cache_file.write_text('invalid toml{{{')
+            cache_file = cache_dir / f'plugin_registry_{url_hash}.json'
+            cache_file.write_text('invalid json{{{')
 
             # Mock WebService to return valid TOML data
             self.tagger.webservice.get_url = mock_webservice_fetch(b'plugins = []\nblacklist = []')
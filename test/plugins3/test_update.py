@@ -798,3 +798,20 @@ class TestCheckUpdates(PicardTestCase):
         calls = self.updater._check_single_plugin_update.call_args_list
         plugin_ids = [c[0][0].plugin_id for c in calls]
         self.assertNotIn('plugin2', plugin_ids)
+
+    def test_fetches_all_plugins_at_once(self):
+        plugin1 = Mock(uuid='uuid1', plugin_id='plugin1')
+        plugin2 = Mock(uuid='uuid2', plugin_id='plugin2')
+        self.updater.manager._plugins = [plugin1, plugin2]
+        self.updater.manager._should_fetch_plugin_refs = Mock(return_value=True)
+        self.updater.manager._registry.is_blacklisted = Mock(return_value=(False, None))
+        self.updater.manager._fetch_plugins_refs = Mock(return_value={plugin2})
+        self.updater._check_single_plugin_update = Mock(return_value=None)
+
+        self.updater.check_updates()
+
+        self.updater.manager._fetch_plugins_refs.assert_called_once_with([plugin1, plugin2])
+        # The plugin which failed fetching is not checked
+        calls = self.updater._check_single_plugin_update.call_args_list
+        self.assertEqual([plugin1], [c[0][0] for c in calls])
+        self.assertTrue(calls[0].kwargs['skip_fetch'])
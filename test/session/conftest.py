@@ -115,16 +115,20 @@ def _fake_script_config(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
         def key(self, name):
             return name
 
-    cfg = SimpleNamespace(setting=_FakeSetting({'enabled_plugins': []}), sync=lambda: None)
+    cfg = SimpleNamespace(
+        setting=_FakeSetting({'enabled_plugins': [], 'session_compact_format': False}), sync=lambda: None
+    )
     import picard.config as picard_config_mod
     import picard.extension_points as ext_points_mod
     import picard.session.session_exporter as session_exporter_mod
+    import picard.session.session_format as session_format_mod
     import picard.session.session_loader as session_loader_mod
 
     monkeypatch.setattr(picard_config_mod, 'get_config', lambda: cfg, raising=True)
     monkeypatch.setattr(ext_points_mod, 'get_config', lambda: cfg, raising=True)
     monkeypatch.setattr(session_exporter_mod, 'get_config', lambda: cfg, raising=True)
     monkeypatch.setattr(session_loader_mod, 'get_config', lambda: cfg, raising=True)
+    monkeypatch.setattr(session_format_mod, 'get_config', lambda: cfg, raising=True)
     return cfg
 
 
@@ -137,6 +141,7 @@ def cfg_options() -> None:
     cfg.setting['move_files'] = False
     cfg.setting['enable_tag_saving'] = False
     cfg.setting['session_include_mb_data'] = False
+    cfg.setting['session_compact_format'] = False
 
 
 # =============================================================================
@@ -445,10 +450,12 @@ def patch_get_config(monkeypatch: pytest.MonkeyPatch, **settings) -> Mock:
     }
 
     import picard.session.session_exporter as session_exporter_mod
+    import picard.session.session_format as session_format_mod
     import picard.session.session_loader as session_loader_mod
 
     monkeypatch.setattr(session_exporter_mod, 'get_config', lambda: config_mock, raising=True)
     monkeypatch.setattr(session_loader_mod, 'get_config', lambda: config_mock, raising=True)
+    monkeypatch.setattr(session_format_mod, 'get_config', lambda: config_mock, raising=True)
 
     return config_mock
 
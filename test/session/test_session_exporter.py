@@ -279,6 +279,16 @@ def test_session_exporter_export_albums_with_files(session_exporter: SessionExpo
     assert data['unmatched_albums'] == []
 
 
+def test_session_exporter_export_mb_node() -> None:
+    album_mock = Mock(spec=Album)
+    album_mock.release_node.return_value = {'id': 'album-123'}
+    assert SessionExporter.export_mb_node(album_mock) == {'id': 'album-123'}
+
+    album_mock.release_node.return_value = None
+    assert SessionExporter.export_mb_node(album_mock) is None
+    assert SessionExporter.export_mb_node(Mock(spec=NatAlbum, release_node=Mock(return_value=Mock()))) is None
+
+
 def test_session_exporter_serialize_location() -> None:
     """Test location serialization."""
     exporter = SessionExporter()
@@ -349,7 +359,7 @@ def test_session_exporter_export_options() -> None:
         'enable_tag_saving': True,
     }
 
-    options = exporter._export_options(config_mock)
+    options = exporter.export_options(config_mock)
 
     assert options == {
         'rename_files': True,
@@ -369,7 +379,7 @@ def test_session_exporter_export_options_with_falsy_values() -> None:
         'enable_tag_saving': None,
     }
 
-    options = exporter._export_options(config_mock)
+    options = exporter.export_options(config_mock)
 
     assert options == {
         'rename_files': 0,
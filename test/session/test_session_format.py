@@ -0,0 +1,125 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Tests for the session file formats."""
+
+import gzip
+from pathlib import Path
+from typing import Any
+
+from picard.session.session_format import (
+    COMPACT_FORMAT_NAME,
+    dump_session,
+    is_compact_session,
+    iter_session_records,
+    read_compact_records,
+    session_from_records,
+)
+from picard.session.session_journal import journal_paths
+from picard.session.session_loader import SessionFileReader
+
+import pytest
+
+
+@pytest.fixture
+def session_data() -> dict[str, Any]:
+    return {
+        'version': 1,
+        'options': {'rename_files': False},
+        'items': [
+            {'file_path': '/music/ä.flac', 'location': {'type': 'album_unmatched', 'album_id': 'album-1'}},
+            {'file_path': '/music/b.flac', 'location': {'type': 'unclustered'}},
+        ],
+        'album_track_overrides': {'album-1': {'track-1': {'title': ['Bar']}}},
+        'album_overrides': {'album-1': {'album': ['Foo']}},
+        'unmatched_albums': ['album-2'],
+        'expanded_albums': ['album-1'],
+        'mb_cache': {'album-1': {'id': 'album-1'}, 'album-2': {'id': 'album-2'}},
+    }
+
+
+def test_records_order(session_data: dict[str, Any]) -> None:
+    records = list(iter_session_records(session_data))
+    header = records[0]
+    assert header['type'] == 'session'
+    assert header['format'] == COMPACT_FORMAT_NAME
+    assert header['albums'] == 2
+    assert header['items'] == 2
+    assert [r['type'] for r in records[1:]] == [
+        'mb_cache',
+        'mb_cache',
+        'item',
+        'item',
+        'album_overrides',
+        'album_track_overrides',
+        'unmatched_albums',
+    ]
+
+
+def test_records_round_trip(session_data: dict[str, Any]) -> None:
+    assert session_from_records(iter_session_records(session_data)) == session_data
+
+
+def test_round_trip_without_expanded_albums(session_data: dict[str, Any]) -> None:
+    del session_data['expanded_albums']
+    assert 'expanded_albums' not in session_from_records(iter_session_records(session_data))
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_session_file_reader(tmp_path: Path, session_data: dict[str, Any], compact: bool) -> None:
+    path = tmp_path / "test.mbps.gz"
+    path.write_bytes(dump_session(session_data, compact=compact))
+    assert is_compact_session(path) == compact
+    assert SessionFileReader().read(path) == session_data
+
+
+def test_dump_session_uses_setting(session_data: dict[str, Any], _fake_script_config) -> None:
+    _fake_script_config.setting['session_compact_format'] = True
+    assert gzip.decompress(dump_session(session_data)).startswith(b'{"type": "session"')
+    _fake_script_config.setting['session_compact_format'] = False
+    assert not gzip.decompress(dump_session(session_data)).startswith(b'{')
+
+
+def test_is_compact_session_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "test.mbps"
+    path.write_text("version: 1\n", encoding='utf-8')
+    assert not is_compact_session(path)
+    assert not is_compact_session(tmp_path / "missing.mbps.gz")
+
+
+def test_read_compact_records_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "test.mbps.gz"
+    path.write_bytes(gzip.compress(b'{"type": "other"}\n'))
+    with pytest.raises(ValueError):
+        list(read_compact_records(path))
+
+
+def test_iter_records(tmp_path: Path, session_data: dict[str, Any]) -> None:
+    path = tmp_path / "test.mbps.gz"
+    path.write_bytes(dump_session(session_data, compact=True))
+    reader = SessionFileReader()
+    assert session_from_records(reader.iter_records(path)) == session_data
+
+    # Journaled sessions need to be read completely
+    _pending, journal = journal_paths(path)
+    journal.write_text('{"type": "file_removed", "file_path": "/music/b.flac"}\n', encoding='utf-8')
+    assert reader.iter_records(path) is None
+
+    path.write_bytes(dump_session(session_data, compact=False))
+    journal.unlink()
+    assert reader.iter_records(path) is None
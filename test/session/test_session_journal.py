@@ -0,0 +1,216 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Tests for the journaled session autosave."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from picard.file import File
+from picard.session.constants import SessionConstants
+from picard.session.session_journal import (
+    SessionJournal,
+    apply_journal,
+    dump_session,
+    journal_paths,
+    read_journal,
+)
+from picard.session.session_loader import SessionFileReader
+
+import pytest
+
+
+class _JournalFile:
+    State = File.State
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.state = File.State.NORMAL
+
+
+def _run_task(func, next_func):
+    try:
+        result = func()
+    except Exception as e:
+        next_func(error=e)
+    else:
+        next_func(result=result)
+
+
+@pytest.fixture
+def session_data() -> dict[str, Any]:
+    return {
+        'version': 1,
+        'options': {'rename_files': False},
+        'items': [
+            {'file_path': '/music/a.flac', 'location': {'type': 'unclustered'}},
+            {'file_path': '/music/b.flac', 'location': {'type': 'unclustered'}},
+        ],
+        'album_track_overrides': {},
+        'album_overrides': {'album-1': {'album': ['Foo']}},
+        'unmatched_albums': ['album-2'],
+        'expanded_albums': [],
+        'mb_cache': {'album-1': {'id': 'album-1'}},
+    }
+
+
+def test_apply_journal_files(session_data: dict[str, Any]) -> None:
+    records = [
+        {'type': 'file', 'item': {'file_path': '/music/a.flac', 'location': {'type': 'track'}}},
+        {'type': 'file', 'item': {'file_path': '/music/c.flac', 'location': {'type': 'unclustered'}}},
+        {'type': 'file_removed', 'file_path': '/music/b.flac'},
+    ]
+    data = apply_journal(session_data, records)
+    assert data['items'] == [
+        {'file_path': '/music/a.flac', 'location': {'type': 'track'}},
+        {'file_path': '/music/c.flac', 'location': {'type': 'unclustered'}},
+    ]
+
+
+def test_apply_journal_albums(session_data: dict[str, Any]) -> None:
+    records = [
+        {
+            'type': 'album',
+            'album_id': 'album-1',
+            'album_overrides': None,
+            'track_overrides': {'track-1': {'title': ['Bar']}},
+            'unmatched': False,
+        },
+        {'type': 'album_removed', 'album_id': 'album-2'},
+        {
+            'type': 'album',
+            'album_id': 'album-3',
+            'album_overrides': None,
+            'track_overrides': {},
+            'unmatched': True,
+            'mb_cache': {'id': 'album-3'},
+        },
+        {'type': 'state', 'options': {'rename_files': True}, 'expanded_albums': ['album-1']},
+    ]
+    data = apply_journal(session_data, records)
+    assert data['album_overrides'] == {}
+    assert data['album_track_overrides'] == {'album-1': {'track-1': {'title': ['Bar']}}}
+    assert data['unmatched_albums'] == ['album-3']
+    assert data['mb_cache'] == {'album-1': {'id': 'album-1'}, 'album-3': {'id': 'album-3'}}
+    assert data['options'] == {'rename_files': True}
+    assert data['expanded_albums'] == ['album-1']
+
+
+def test_read_journal_ignores_truncated_record(tmp_path: Path) -> None:
+    journal = tmp_path / "test.journal"
+    journal.write_text('{"type": "file_removed", "file_path": "/a"}\n{"type": "fi', encoding='utf-8')
+    assert read_journal(journal) == [{'type': 'file_removed', 'file_path': '/a'}]
+
+
+def test_read_journal_missing(tmp_path: Path) -> None:
+    assert read_journal(tmp_path / "missing.journal") == []
+
+
+def test_session_file_reader_applies_journal(tmp_path: Path, session_data: dict[str, Any]) -> None:
+    session_file = tmp_path / "test.mbps.gz"
+    session_file.write_bytes(dump_session(session_data))
+    pending, journal = journal_paths(session_file)
+    pending.write_text('{"type": "file_removed", "file_path": "/music/a.flac"}\n', encoding='utf-8')
+    journal.write_text('{"type": "file_removed", "file_path": "/music/b.flac"}\n', encoding='utf-8')
+
+    reader = SessionFileReader()
+    assert len(reader.read_snapshot(session_file)['items']) == 2
+    assert reader.read(session_file)['items'] == []
+
+
+class TestSessionJournal:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path, cfg_options) -> None:
+        self.path = tmp_path / ("autosave" + SessionConstants.SESSION_FILE_EXTENSION)
+        self.files = [_JournalFile('/music/a.flac'), _JournalFile('/music/b.flac')]
+        self.tagger = SimpleNamespace(albums={}, iter_all_files=lambda: iter(self.files))
+        self.exporter = Mock()
+        self.exporter.export_session.side_effect = lambda tagger: {
+            'version': 1,
+            'options': {'rename_files': False},
+            'items': [{'file_path': f.filename} for f in self.files],
+            'expanded_albums': [],
+            'mb_cache': {},
+        }
+        self.exporter.export_file_item.side_effect = lambda file: {'file_path': file.filename}
+        self.exporter.export_options.return_value = {'rename_files': False}
+        self.exporter.export_expanded_albums.return_value = []
+        self.journal = SessionJournal()
+        self.journal._exporter = self.exporter
+        with patch('picard.session.session_journal.thread.run_task', _run_task):
+            yield
+
+    def read_items(self) -> list[str]:
+        return [item['file_path'] for item in SessionFileReader().read(self.path)['items']]
+
+    def test_first_autosave_writes_session(self) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        assert self.journal.active
+        assert self.read_items() == ['/music/a.flac', '/music/b.flac']
+        assert not any(p.exists() for p in journal_paths(self.path))
+
+    def test_changes_only_are_journaled(self) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        new_file = _JournalFile('/music/c.flac')
+        self.files.append(new_file)
+        self.journal.file_changed(new_file)
+        self.journal.file_removed(self.files[0])
+        self.journal.autosave(self.tagger, self.path)
+
+        self.exporter.export_session.assert_called_once()
+        self.exporter.export_file_item.assert_called_once_with(new_file)
+        _pending, journal = journal_paths(self.path)
+        assert len(read_journal(journal)) == 2
+        assert self.read_items() == ['/music/b.flac', '/music/c.flac']
+
+    def test_renamed_file(self) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        self.files[0].filename = '/music/renamed.flac'
+        self.journal.file_changed(self.files[0])
+        self.journal.autosave(self.tagger, self.path)
+        assert self.read_items() == ['/music/b.flac', '/music/renamed.flac']
+
+    def test_no_changes_no_records(self) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        self.journal.autosave(self.tagger, self.path)
+        _pending, journal = journal_paths(self.path)
+        assert not journal.exists()
+
+    def test_compaction(self) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        with patch.object(SessionConstants, 'JOURNAL_COMPACT_RECORDS', 1):
+            self.journal.file_removed(self.files[0])
+            self.journal.autosave(self.tagger, self.path)
+        assert not any(p.exists() for p in journal_paths(self.path))
+        assert SessionFileReader().read_snapshot(self.path)['items'] == [{'file_path': '/music/b.flac'}]
+
+    def test_changes_ignored_when_inactive(self) -> None:
+        self.journal.file_changed(self.files[0])
+        assert not self.journal._changed_files
+
+    def test_new_path_writes_session(self, tmp_path: Path) -> None:
+        self.journal.autosave(self.tagger, self.path)
+        other_path = tmp_path / ("other" + SessionConstants.SESSION_FILE_EXTENSION)
+        self.journal.autosave(self.tagger, other_path)
+        assert self.exporter.export_session.call_count == 2
+        assert self.journal.path == other_path
@@ -32,6 +32,7 @@ import PyQt6.QtCore
 
 import picard.config as picard_config
 from picard.metadata import Metadata
+from picard.session.session_format import dump_session
 from picard.session.session_loader import SessionLoader
 
 import pytest
@@ -332,3 +333,36 @@ def test_session_loader_request_suppression_matrix_cached(
 
     # With cache, suppression controls whether album.load() is called
     assert album_mock.load.called == (not expected_suppressed)
+
+
+def test_session_loader_compact_session(tmp_path: Path, mock_single_shot, cfg_options) -> None:
+    cfg = picard_config.get_config()
+    cfg.setting['session_no_mb_requests_on_load'] = False
+    cfg.setting['session_safe_restore'] = False
+
+    tagger = MockQtTagger()
+    album_mock = Mock()
+    album_mock.unmatched_files = Mock()
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    tagger.albums = {"album-123": album_mock}
+
+    loader = SessionLoader(tagger)  # type: ignore
+
+    data = {
+        'version': 1,
+        'options': {},
+        'mb_cache': {"album-123": {"id": "album-123"}},
+        'items': [],
+        'unmatched_albums': ["album-123"],
+        'expanded_albums': ["album-123"],
+    }
+    path = tmp_path / "session.mbps.gz"
+    path.write_bytes(dump_session(data, compact=True))
+
+    with patch.object(loader._albums, 'preload_from_cache') as preload_from_cache:
+        loader.load_from_path(path)
+
+    # Albums get preloaded while the records are read
+    preload_from_cache.assert_not_called()
+    assert loader._albums.loaded_albums == {"album-123": album_mock}
+    assert album_mock.load.called
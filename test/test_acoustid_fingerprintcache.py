@@ -0,0 +1,173 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import sqlite3
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.acoustid import AcoustIDClient
+from picard.acoustid.fingerprintcache import FingerprintCache
+from picard.file import (
+    File,
+    FileIdentity,
+)
+from picard.metadata import Metadata
+
+
+def run_task_sync(func, next_func=None, **kwargs):
+    try:
+        result = func()
+    except Exception as e:
+        next_func(error=e)
+    else:
+        next_func(result=result)
+
+
+class FingerprintCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.mktmpdir(), 'cache', 'fingerprints.sqlite')
+        self.cache = FingerprintCache(self.path, max_size=10)
+        self.addCleanup(self.cache.close)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.stats.misses, 1)
+
+    def test_get_no_key(self):
+        self.assertIsNone(self.cache.get(None))
+        self.cache.put(None, 'fp', 100, 1.0)
+        self.assertEqual(self.cache.stats.stored, 0)
+
+    def test_put_get(self):
+        self.cache.put('key', 'fp', 100, 1.5)
+        self.assertEqual(self.cache.get('key'), ('fp', 100))
+        self.assertEqual(self.cache.stats.hits, 1)
+        self.assertEqual(self.cache.stats.saved_time, 1.5)
+
+    def test_persistent(self):
+        self.cache.put('key', 'fp', 100, 1.5)
+        self.cache.close()
+        cache = FingerprintCache(self.path, max_size=10)
+        self.addCleanup(cache.close)
+        self.assertEqual(cache.get('key'), ('fp', 100))
+
+    def test_evict_least_recently_used(self):
+        for i in range(12):
+            self.cache.put(f'key{i}', 'fp', i, 1.0)
+        self.cache.get('key0')
+        self.cache.evict()
+        self.assertEqual(len(self.cache), 10)
+        self.assertEqual(self.cache.stats.evicted, 2)
+        self.assertIsNotNone(self.cache.get('key0'))
+        self.assertIsNone(self.cache.get('key1'))
+        self.assertIsNone(self.cache.get('key2'))
+
+    def _last_used(self, key):
+        db = sqlite3.connect(self.path)
+        try:
+            return db.execute("SELECT last_used FROM fingerprints WHERE key = ?", (key,)).fetchone()[0]
+        finally:
+            db.close()
+
+    def test_hits_written_in_batches(self):
+        self.cache.TOUCH_INTERVAL = 2
+        self.cache.put('key0', 'fp', 100, 1.0)
+        self.cache.put('key1', 'fp', 100, 1.0)
+        last_used = self._last_used('key0')
+        with patch('picard.acoustid.fingerprintcache.time.time', return_value=last_used + 10):
+            self.cache.get('key0')
+            self.assertEqual(last_used, self._last_used('key0'))
+            self.cache.get('key1')
+        self.assertEqual(last_used + 10, self._last_used('key0'))
+        self.assertEqual(last_used + 10, self._last_used('key1'))
+
+    def test_hits_written_on_close(self):
+        self.cache.put('key', 'fp', 100, 1.0)
+        last_used = self._last_used('key')
+        with patch('picard.acoustid.fingerprintcache.time.time', return_value=last_used + 10):
+            self.cache.get('key')
+        self.cache.close()
+        self.assertEqual(last_used + 10, self._last_used('key'))
+
+    def test_disabled(self):
+        cache = FingerprintCache(self.path, max_size=0)
+        cache.put('key', 'fp', 100, 1.0)
+        self.assertIsNone(cache.get('key'))
+        self.assertFalse(os.path.exists(self.path))
+
+
+class AcoustIDClientFingerprintCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.acoustid')
+        tmpdir = self.mktmpdir()
+        self.filename = os.path.join(tmpdir, 'test.flac')
+        with open(self.filename, 'wb') as f:
+            f.write(b'audio')
+        self.client = AcoustIDClient(Mock())
+        self.client._fingerprint_cache = FingerprintCache(os.path.join(tmpdir, 'fingerprints.sqlite'), 10)
+        self.addCleanup(self.client._fingerprint_cache.close)
+        self.file = Mock(filename=self.filename, state=File.State.NORMAL, orig_metadata=Metadata())
+        patcher = patch('picard.acoustid.thread.run_task', side_effect=run_task_sync)
+        self.run_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fingerprint_from_cache(self):
+        key = FileIdentity(self.filename).cache_key
+        self.client._fingerprint_cache.put(key, 'fp', 120, 2.0)
+        next_func = Mock()
+        with patch.object(self.client, '_run_next_task') as run_next_task:
+            self.client.fingerprint(self.file, next_func)
+            run_next_task.assert_not_called()
+        next_func.assert_called_once_with(('fingerprint', 'fp', 120))
+        self.file.set_acoustid_fingerprint.assert_called_once_with('fp', 120)
+
+    def test_fingerprint_not_cached(self):
+        next_func = Mock()
+        with patch.object(self.client, '_run_next_task') as run_next_task:
+            self.client.fingerprint(self.file, next_func)
+            run_next_task.assert_called_once()
+        next_func.assert_not_called()
+        task = next(iter(self.client._queue))
+        self.assertEqual(task.cache_key, FileIdentity(self.filename).cache_key)
+
+    def test_lookup_in_thread(self):
+        with patch.object(self.client, '_run_next_task'):
+            self.client.fingerprint(self.file, Mock())
+        self.run_task.assert_called_once()
+        self.assertEqual(self.filename, self.run_task.call_args.args[0].args[0])
+
+    def test_file_removed_during_lookup(self):
+        next_func = Mock()
+
+        def remove_file(func, next_func=None, **kwargs):
+            result = func()
+            self.file.state = File.State.REMOVED
+            next_func(result=result)
+
+        self.run_task.side_effect = remove_file
+        with patch.object(self.client, '_run_next_task') as run_next_task:
+            self.client.fingerprint(self.file, next_func)
+            run_next_task.assert_not_called()
+        next_func.assert_not_called()
@@ -0,0 +1,95 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from unittest.mock import (
+    MagicMock,
+    Mock,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.acoustid.lookup import LookupBatcher
+
+
+class LookupBatcherTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.api = MagicMock()
+        self.batcher = LookupBatcher(self.api, max_size=3, meta='recordings')
+
+    def test_single_lookup(self):
+        handler = Mock()
+        self.batcher.add('fp1', 100, handler)
+        self.api.query_acoustid.assert_not_called()
+        self.batcher.flush()
+        self.api.query_acoustid.assert_called_once_with(handler, fingerprint='fp1', duration='100', meta='recordings')
+        self.api.query_acoustid_batch.assert_not_called()
+
+    def test_batch_lookup(self):
+        handlers = [Mock(), Mock()]
+        self.batcher.add('fp1', 100, handlers[0])
+        self.batcher.add('fp2', 200, handlers[1])
+        self.batcher.flush()
+        self.api.query_acoustid.assert_not_called()
+        self.api.query_acoustid_batch.assert_called_once()
+        callback, fingerprints = self.api.query_acoustid_batch.call_args.args
+        self.assertEqual(fingerprints, [('fp1', 100), ('fp2', 200)])
+        self.assertEqual(self.api.query_acoustid_batch.call_args.kwargs, {'meta': 'recordings'})
+
+        http = Mock()
+        document = {
+            'status': 'ok',
+            'fingerprints': [
+                {'index': '1', 'results': [{'id': 'b'}]},
+                {'index': '0', 'results': [{'id': 'a'}]},
+            ],
+        }
+        callback(document, http, None)
+        handlers[0].assert_called_once_with({'status': 'ok', 'results': [{'id': 'a'}]}, http, None)
+        handlers[1].assert_called_once_with({'status': 'ok', 'results': [{'id': 'b'}]}, http, None)
+
+    def test_batch_flushed_when_full(self):
+        for i in range(4):
+            self.batcher.add(f'fp{i}', 100, Mock())
+        self.api.query_acoustid_batch.assert_called_once()
+        fingerprints = self.api.query_acoustid_batch.call_args.args[1]
+        self.assertEqual(len(fingerprints), 3)
+        self.batcher.flush()
+        self.api.query_acoustid.assert_called_once()
+
+    def test_batch_network_error(self):
+        handlers = [Mock(), Mock()]
+        self.batcher.add('fp1', 100, handlers[0])
+        self.batcher.add('fp2', 200, handlers[1])
+        self.batcher.flush()
+        callback = self.api.query_acoustid_batch.call_args.args[0]
+        http = Mock()
+        callback(b'error', http, 'some error')
+        for handler in handlers:
+            handler.assert_called_once_with(b'error', http, 'some error')
+
+    def test_batch_status_error_retries_individually(self):
+        handlers = [Mock(), Mock()]
+        self.batcher.add('fp1', 100, handlers[0])
+        self.batcher.add('fp2', 200, handlers[1])
+        self.batcher.flush()
+        callback = self.api.query_acoustid_batch.call_args.args[0]
+        callback({'status': 'error', 'error': {'message': 'invalid fingerprint'}}, Mock(), None)
+        self.assertEqual(self.api.query_acoustid.call_count, 2)
+        for handler in handlers:
+            handler.assert_not_called()
@@ -0,0 +1,106 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from test.picardtestcase import PicardTestCase
+
+from picard.acoustid.scheduler import (
+    FpcalcScheduler,
+    expected_cost,
+)
+
+
+class ExpectedCostTest(PicardTestCase):
+    def test_short_file(self):
+        self.assertEqual(expected_cost(1000, 60000), 1000)
+
+    def test_long_file_limited_by_decode_length(self):
+        self.assertEqual(expected_cost(1000, 240000), 500)
+
+    def test_unknown_length(self):
+        self.assertEqual(expected_cost(1000, 0), 1000)
+
+    def test_unknown_size(self):
+        self.assertEqual(expected_cost(0, 60000), 0)
+
+
+class FpcalcSchedulerTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.max_processes = 2
+        self.scheduler = FpcalcScheduler(lambda: self.max_processes)
+
+    def test_orders_by_cost(self):
+        self.scheduler.push('big', '/', 300)
+        self.scheduler.push('small', '/', 100)
+        self.scheduler.push('medium', '/', 200)
+        self.assertEqual(self.scheduler.pop(), ('small', '/', 100))
+        self.assertEqual(self.scheduler.pop(), ('medium', '/', 200))
+        self.assertIsNone(self.scheduler.pop())
+        self.assertEqual(self.scheduler.running, 2)
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_same_cost_keeps_order(self):
+        for task in ('a', 'b', 'c'):
+            self.scheduler.push(task, '/', 0)
+        self.assertEqual(self.scheduler.pop()[0], 'a')
+        self.assertEqual(self.scheduler.pop()[0], 'b')
+
+    def test_alternates_devices(self):
+        self.scheduler.push('nas1', '/mnt/nas', 100)
+        self.scheduler.push('nas2', '/mnt/nas', 100)
+        self.scheduler.push('local1', '/', 500)
+        self.assertEqual(self.scheduler.pop()[0], 'nas1')
+        self.assertEqual(self.scheduler.pop()[0], 'local1')
+
+    def test_io_bound_device_limited_to_one_process(self):
+        self.max_processes = 4
+        self.scheduler.push('nas1', '/mnt/nas', 100)
+        self.scheduler.pop()
+        self.scheduler.finished('/mnt/nas', 100, wall_time=10.0, cpu_time=1.0)
+        self.assertTrue(self.scheduler.devices['/mnt/nas'].io_bound)
+        self.scheduler.push('nas2', '/mnt/nas', 100)
+        self.scheduler.push('nas3', '/mnt/nas', 100)
+        self.scheduler.push('local1', '/', 100)
+        started = [self.scheduler.pop()[0] for i in range(2)]
+        self.assertCountEqual(started, ['nas2', 'local1'])
+        self.assertIsNone(self.scheduler.pop())
+
+    def test_max_running_scales_with_cpu_ratio(self):
+        self.assertEqual(self.scheduler.max_running, 2)
+        self.scheduler.push('a', '/', 100)
+        self.scheduler.pop()
+        self.scheduler.finished('/', 100, wall_time=10.0, cpu_time=10.0)
+        self.assertEqual(self.scheduler.max_running, 2)
+        self.scheduler.push('b', '/', 100)
+        self.scheduler.pop()
+        self.scheduler.finished('/', 100, wall_time=10.0, cpu_time=0.5)
+        self.assertEqual(self.scheduler.max_running, 3)
+
+    def test_remove(self):
+        self.scheduler.push('a', '/', 100)
+        self.scheduler.push('b', '/mnt/nas', 100)
+        self.scheduler.remove(lambda task: task == 'a')
+        self.assertEqual(list(self.scheduler), ['b'])
+
+    def test_report(self):
+        self.scheduler.push('a', '/', 2048)
+        self.scheduler.pop()
+        self.scheduler.finished('/', 2048, wall_time=2.0, cpu_time=1.0)
+        report = list(self.scheduler.report())
+        self.assertEqual(len(report), 1)
+        self.assertTrue(report[0].startswith('/: 1 files'))
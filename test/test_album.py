@@ -19,6 +19,7 @@
 
 from unittest.mock import (
     Mock,
+    patch,
 )
 
 from test.picardtestcase import PicardTestCase
@@ -28,6 +29,7 @@ from picard.album import (
     AlbumStatus,
 )
 from picard.file import File
+from picard.metadata import Metadata
 from picard.track import Track
 
 
@@ -98,3 +100,59 @@ class TrackTest(PicardTestCase):
         self.album.metadata.images.append(image)
         self.assertEqual(self.album.column('covercount'), '1')
         self.assertEqual(self.album.column('coverdimensions'), '100x100')
+
+
+class AlbumReleaseNodeTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.item')
+        self.node = {'id': '123', 'title': 'Foo', 'media': [{'position': 1, 'tracks': []}]}
+
+    def test_release_node_while_loading(self):
+        album = Album('123')
+        self.assertIsNone(album.release_node())
+        album._release_node = self.node
+        self.assertIs(album.release_node(), self.node)
+
+    def test_release_node_stored(self):
+        album = Album('123')
+        album._release_data = Album._store_release_node(self.node)
+        self.assertEqual(album.release_node(), self.node)
+        self.assertIsNot(album.release_node(), self.node)
+
+    def test_release_node_shared(self):
+        data1 = Album._store_release_node(self.node)
+        data2 = Album._store_release_node(dict(self.node))
+        self.assertIs(data1, data2)
+
+    def test_release_node_stored_in_thread(self):
+        album = Album('123')
+        album._release_node = self.node
+        album._release_artist_nodes = {}
+        album._new_metadata = Metadata()
+        album._new_tracks = []
+        with patch('picard.album.thread.run_task') as run_task:
+            album._load_tracks()
+        func, callback = run_task.call_args.args
+        # The live node is used until it has been stored
+        self.assertIs(album.release_node(), self.node)
+        callback(result=func())
+        self.assertFalse(hasattr(album, '_release_node'))
+        self.assertEqual(album.release_node(), self.node)
+        self.assertIsNot(album.release_node(), self.node)
+
+    def test_release_node_stored_after_reload(self):
+        album = Album('123')
+        album._release_node = self.node
+        new_node = dict(self.node)
+        album._release_node = new_node
+        album._release_node_stored(self.node, result=Album._store_release_node(self.node))
+        self.assertIs(album.release_node(), new_node)
+        self.assertIsNone(album._release_data)
+
+    def test_release_node_missing_file(self):
+        album = Album('123')
+        # Use a node of its own, identical nodes share the deleted file
+        album._release_data = Album._store_release_node(dict(self.node, title='Missing'))
+        album._release_data._delete_file()
+        self.assertIsNone(album.release_node())
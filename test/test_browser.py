@@ -32,7 +32,11 @@ from urllib.parse import (
 from test.picardtestcase import PicardTestCase
 
 from picard.browser.filelookup import FileLookup
-from picard.browser.server import clean_header
+from picard.browser.server import (
+    RequestHandler,
+    clean_header,
+)
+from picard.file import FILE_LOAD_SECONDS
 from picard.util import webbrowser2
 
 
@@ -256,3 +260,18 @@ class BrowserIntegrationTest(PicardTestCase):
     def test_clean_header(self):
         bad_header = "foo\nSome-Header: bar"
         self.assertEqual("fooSome-Header bar", clean_header(bad_header))
+
+    def test_metrics(self):
+        handler = RequestHandler.__new__(RequestHandler)
+        handler._response = Mock()
+        handler.path = '/metrics'
+        handler._handle_get()
+        code, content, content_type = handler._response.call_args.args
+        self.assertEqual(code, 200)
+        self.assertTrue(content_type.startswith('text/plain; version=0.0.4'))
+        self.assertIn(f'# TYPE picard_{FILE_LOAD_SECONDS.name} histogram', content)
+        handler.path = '/metrics?format=json'
+        handler._handle_get()
+        code, content, content_type = handler._response.call_args.args
+        self.assertEqual(content_type, 'application/json')
+        self.assertIn(FILE_LOAD_SECONDS.name, content)
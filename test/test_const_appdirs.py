@@ -25,6 +25,7 @@ from test.picardtestcase import PicardTestCase
 from picard.const.appdirs import (
     cache_folder,
     config_folder,
+    log_folder,
     plugin_folder,
 )
 from picard.const.sys import (
@@ -62,6 +63,9 @@ class AppPathsTest(PicardTestCase):
     def test_cache_folder_linux(self):
         self.assert_home_path_equals('~/.cache/MusicBrainz/Picard', cache_folder())
 
+    def test_log_folder(self):
+        self.assertEqual(os.path.join(cache_folder(), 'logs'), log_folder())
+
     @unittest.skipUnless(IS_WIN, "Windows test")
     def test_plugin_folder_win(self):
         self.assert_home_path_equals('~/AppData/Roaming/MusicBrainz/Picard/plugins3', plugin_folder())
@@ -21,8 +21,10 @@
 
 from collections import Counter
 import os.path
+import shutil
 from tempfile import TemporaryDirectory
 import unittest
+from unittest.mock import patch
 
 from test.picardtestcase import (
     PicardTestCase,
@@ -341,6 +343,40 @@ class CoverArtImageTest(PicardTestCase):
             self.assertEqual(len(image2.data), os.path.getsize(expected_filename_2))
             self.assertEqual(2, counters[counter_filename])
 
+    def test_save_once_per_batch(self):
+        self.set_config_values(
+            {
+                'image_type_as_filename': True,
+                'windows_compatibility': True,
+                'win_compat_replacements': {},
+                'windows_long_paths': False,
+                'replace_spaces_with_underscores': False,
+                'replace_dir_separator': '_',
+                'enabled_plugins': [],
+                'ascii_filenames': False,
+                'save_images_overwrite': True,
+            }
+        )
+        metadata = Metadata()
+        saved_images = set()
+        with TemporaryDirectory() as d:
+            image = create_image(b'a', types=['back'], support_types=True)
+            expected_filename = os.path.join(d, 'back.png')
+            with patch('picard.coverart.image.shutil.copyfile', wraps=shutil.copyfile) as copyfile:
+                image.save(d, metadata, Counter(), saved_images)
+                os.remove(expected_filename)
+                # Saving the same image for the next file of the batch is skipped
+                image.save(d, metadata, Counter(), saved_images)
+                self.assertFalse(os.path.exists(expected_filename))
+                image.save(d, metadata, Counter())
+                self.assertTrue(os.path.exists(expected_filename))
+            self.assertEqual(2, copyfile.call_count)
+            self.assertEqual({(expected_filename, image.datahash.hash)}, saved_images)
+            # Another image with the same file name is still saved
+            image2 = create_image(b'bb', types=['back'], support_types=True)
+            image2.save(d, metadata, Counter(), saved_images)
+            self.assertEqual(len(image2.data), os.path.getsize(expected_filename))
+
     def test_set_external_file_data(self):
         image = CoverArtImage(comment='Foo', types=['back', 'spine'], support_types=True, support_multi_types=True)
         self.assertIsNone(image.external_file_coverart)
@@ -19,6 +19,7 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+import concurrent.futures
 from copy import copy
 from unittest.mock import (
     Mock,
@@ -39,6 +40,11 @@ from picard.const.cover_processing import (
 )
 from picard.coverart.image import CoverArtImage
 from picard.coverart.processing import CoverArtImageProcessing
+from picard.coverart.processing.executor import (
+    CoverArtProcessExecutor,
+    process_image_data,
+    processors_are_process_safe,
+)
 from picard.coverart.processing.filters import (
     bigger_previous_image_filter,
     image_types_filter,
@@ -418,3 +424,108 @@ class ProcessingImageTest(PicardTestCase):
 
         # Image data should be identical to original (no re-encoding)
         self.assertEqual(coverartimage.data, original_data)
+
+
+class ProcessExecutorTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.util.thread')
+        self.settings = {
+            'enabled_plugins': [],
+            'cover_tags_resize': True,
+            'cover_tags_enlarge': True,
+            'cover_tags_resize_target_width': 500,
+            'cover_tags_resize_target_height': 500,
+            'cover_tags_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
+            'cover_tags_convert_images': False,
+            'cover_tags_convert_to_format': ImageFormat.JPEG,
+            'cover_file_resize': True,
+            'cover_file_enlarge': True,
+            'cover_file_resize_target_width': 750,
+            'cover_file_resize_target_height': 750,
+            'cover_file_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
+            'save_images_to_tags': True,
+            'save_images_to_files': True,
+            'cover_file_convert_images': False,
+            'cover_file_convert_to_format': ImageFormat.JPEG,
+            'cover_image_quality': 90,
+        }
+        self.set_config_values(self.settings)
+        # Run the worker function in threads, spawning processes is too slow for tests
+        thread_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(thread_executor.shutdown)
+        patcher = patch.object(CoverArtProcessExecutor, '_get_executor', return_value=thread_executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_process_image_data(self):
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        result = process_image_data(data, info, self.settings)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(imageinfo.identify(result.tags_data).width, 500)
+        self.assertEqual(imageinfo.identify(result.file_data).width, 750)
+
+    def test_process_image_data_save_to_none(self):
+        settings = copy(self.settings)
+        settings['save_images_to_tags'] = False
+        settings['save_images_to_files'] = False
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        result = process_image_data(data, info, settings)
+        self.assertEqual(result.tags_data, data)
+        self.assertIsNone(result.file_data)
+
+    def test_builtin_processors_are_process_safe(self):
+        self.assertTrue(processors_are_process_safe({ImageProcessor.Target.SAME: [ResizeImage(), ConvertImage()]}))
+        self.assertFalse(processors_are_process_safe({ImageProcessor.Target.TAGS: [ImageProcessor()]}))
+
+    def test_run_image_processors_in_process(self):
+        self.set_config_values({'cover_processing_processes': 2})
+        coverartimage = CoverArtImage()
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        image_processing = CoverArtImageProcessing(Album(None))
+        callback = Mock()
+        with patch('picard.util.thread.to_main', mock_to_main):
+            image_processing.run_image_processors(coverartimage, data, info, callback)
+            image_processing.wait_for_processing()
+        callback.assert_called_once_with(coverartimage, None)
+        self.assertEqual((coverartimage.width, coverartimage.height), (500, 500))
+        external_cover = coverartimage.external_file_coverart
+        self.assertEqual((external_cover.width, external_cover.height), (750, 750))
+
+    def test_run_image_processors_in_process_error(self):
+        self.set_config_values({'cover_processing_processes': 2})
+        coverartimage = CoverArtImage()
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        album = Album(None)
+        image_processing = CoverArtImageProcessing(album)
+        callback = Mock()
+        error = RuntimeError("worker failed")
+        with (
+            patch('picard.util.thread.to_main', mock_to_main),
+            patch('picard.coverart.processing.executor.process_image_data', side_effect=error),
+        ):
+            image_processing.run_image_processors(coverartimage, data, info, callback)
+            image_processing.wait_for_processing()
+        callback.assert_called_once_with(coverartimage, error)
+        self.assertEqual(coverartimage.data, data)
+        self.assertEqual(len(album.errors), 1)
+        self.assertIsInstance(album.errors[0], CoverArtProcessingError)
+
+    def test_submit_rejected_if_queue_full(self):
+        executor = CoverArtProcessExecutor(max_workers=1, max_queued=0)
+        data, info = create_fake_image(100, 100, 'jpg')
+        callback = Mock()
+        self.assertFalse(executor.submit(data, info, self.settings, callback))
+        self.assertEqual(executor.stats.rejected, 1)
+        callback.assert_not_called()
+
+    def test_submit_stats(self):
+        executor = CoverArtProcessExecutor(max_workers=1)
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        done = concurrent.futures.Future()
+        self.assertTrue(executor.submit(data, info, self.settings, lambda result, error: done.set_result(error)))
+        self.assertIsNone(done.result(timeout=10))
+        self.assertEqual(executor.stats.submitted, 1)
+        self.assertEqual(executor.stats.completed, 1)
+        self.assertEqual(executor.stats.bytes_in, len(data))
+        self.assertEqual(executor.pending, 0)
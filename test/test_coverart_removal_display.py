@@ -30,6 +30,7 @@ from PyQt6 import (
 
 from picard.cluster import Cluster
 from picard.config import get_config
+from picard.coverart.image import DataHash
 from picard.util.imagelist import ImageList
 from picard.util.lrucache import LRUCache
 
@@ -57,6 +58,7 @@ class FakeImage:
 
     def __init__(self, data: bytes = b'') -> None:
         self._data = data
+        self.datahash = DataHash(data) if data else None
 
     @property
     def data(self) -> bytes:
@@ -129,6 +131,15 @@ def thumbnail(qapp, monkeypatch):
         'picard.ui.coverartbox.coverartthumbnail.tagger_instance',
         lambda: mock_tagger,
     )
+    monkeypatch.setattr(
+        'picard.ui.coverartbox.thumbnailloader.tagger_instance',
+        lambda: mock_tagger,
+    )
+    # Decode thumbnails synchronously
+    monkeypatch.setattr(
+        'picard.ui.coverartbox.thumbnailloader.thread.run_task',
+        lambda func, next_func, **kwargs: next_func(result=func()),
+    )
     from picard.ui.coverartbox.coverartthumbnail import CoverArtThumbnail
 
     parent = QtWidgets.QWidget()
@@ -141,6 +152,7 @@ def test_thumbnail_removal_overlay_changes_pixmap(thumbnail) -> None:
     image = FakeImage(_png_bytes())
     thumbnail.set_data([image], force=True)
     unmarked = thumbnail.pixmap().toImage()
+    assert unmarked != thumbnail.file_missing_pixmap.toImage()
     key = thumbnail.current_pixmap_key
 
     thumbnail.set_marked_for_removal(True)
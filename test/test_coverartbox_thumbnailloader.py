@@ -0,0 +1,191 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from unittest.mock import (
+    MagicMock,
+    Mock,
+    patch,
+)
+
+from PyQt6 import (
+    QtCore,
+    QtGui,
+    QtWidgets,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.coverart.image import DataHash
+from picard.util.lrucache import LRUCache
+
+from picard.ui.coverartbox.coverartthumbnail import (
+    COVERART_WIDTH,
+    CoverArtThumbnail,
+)
+from picard.ui.coverartbox.thumbnailloader import (
+    ThumbnailLoader,
+    decode_thumbnail,
+)
+
+
+def image_bytes(width, height, color='blue', fmt='PNG'):
+    image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+    image.fill(QtGui.QColor(color))
+    data = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(data)
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, fmt)
+    buffer.close()
+    return bytes(data)
+
+
+class FakeImage:
+    def __init__(self, data=b''):
+        self.datahash = DataHash(data) if data else None
+
+    def types_as_string(self):
+        return 'front'
+
+
+class DeferredTasks:
+    """Collects the tasks passed to thread.run_task to run them later"""
+
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, func, next_func, **kwargs):
+        self.tasks.append((func, next_func))
+
+    def run(self):
+        tasks, self.tasks = self.tasks, []
+        for func, next_func in tasks:
+            next_func(result=func())
+
+
+class DecodeThumbnailTest(PicardTestCase):
+    def test_scaled_decode(self):
+        datahash = DataHash(image_bytes(400, 200))
+        image = decode_thumbnail(datahash, QtCore.QSize(100, 100))
+        self.assertEqual(image.size(), QtCore.QSize(100, 50))
+
+    def test_small_image_not_scaled(self):
+        datahash = DataHash(image_bytes(40, 20))
+        image = decode_thumbnail(datahash, QtCore.QSize(100, 100))
+        self.assertEqual(image.size(), QtCore.QSize(40, 20))
+
+    def test_invalid_data(self):
+        datahash = DataHash(b'not an image')
+        self.assertTrue(decode_thumbnail(datahash, QtCore.QSize(100, 100)).isNull())
+
+
+class ThumbnailLoaderTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tasks = DeferredTasks()
+        patcher = patch('picard.ui.coverartbox.thumbnailloader.thread.run_task', self.tasks)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.patch_tagger_instance('picard.ui.coverartbox.thumbnailloader')
+        self.loader = ThumbnailLoader()
+        self.size = QtCore.QSize(50, 50)
+
+    def test_request(self):
+        image = FakeImage(image_bytes(100, 100))
+        callback = Mock()
+        self.assertIsNone(self.loader.get(image, self.size))
+        self.loader.request([image], self.size, callback)
+        callback.assert_not_called()
+        self.tasks.run()
+        callback.assert_called_once_with()
+        self.assertEqual(self.loader.get(image, self.size).size(), self.size)
+        # Other sizes are decoded separately
+        self.assertIsNone(self.loader.get(image, QtCore.QSize(20, 20)))
+
+    def test_cached(self):
+        image = FakeImage(image_bytes(100, 100))
+        self.loader.request([image], self.size, Mock())
+        self.tasks.run()
+        callback = Mock()
+        self.loader.request([image], self.size, callback)
+        callback.assert_called_once_with()
+        self.assertEqual(self.tasks.tasks, [])
+
+    def test_same_data_decoded_once(self):
+        data = image_bytes(100, 100)
+        callback1 = Mock()
+        callback2 = Mock()
+        self.loader.request([FakeImage(data)], self.size, callback1)
+        self.loader.request([FakeImage(data), FakeImage(image_bytes(10, 10, 'red'))], self.size, callback2)
+        self.assertEqual(len(self.tasks.tasks), 2)
+        self.tasks.run()
+        callback1.assert_called_once_with()
+        callback2.assert_called_once_with()
+
+    def test_image_without_data(self):
+        callback = Mock()
+        image = FakeImage()
+        self.assertTrue(self.loader.get(image, self.size).isNull())
+        self.loader.request([image], self.size, callback)
+        callback.assert_called_once_with()
+
+    def test_cache_size(self):
+        loader = ThumbnailLoader(max_size=self.size.width() * self.size.height() * 4)
+        images = [FakeImage(image_bytes(100, 100, color)) for color in ('red', 'blue')]
+        loader.request(images, self.size, Mock())
+        self.tasks.run()
+        self.assertIsNone(loader.get(images[0], self.size))
+        self.assertIsNotNone(loader.get(images[1], self.size))
+
+
+class CoverArtThumbnailAsyncTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tasks = DeferredTasks()
+        patcher = patch('picard.ui.coverartbox.thumbnailloader.thread.run_task', self.tasks)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tagger = MagicMock()
+        tagger.primaryScreen.return_value.devicePixelRatio.return_value = 1.0
+        for module in ('picard.ui.coverartbox.thumbnailloader', 'picard.ui.coverartbox.coverartthumbnail'):
+            patcher = patch(f'{module}.tagger_instance', return_value=tagger)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.parent = QtWidgets.QWidget()
+        self.addCleanup(self.parent.deleteLater)
+        self.thumbnail = CoverArtThumbnail(pixmap_cache=LRUCache(10), parent=self.parent)
+
+    def test_placeholder_until_decoded(self):
+        self.thumbnail.set_data([FakeImage(image_bytes(1000, 1000))], force=True)
+        self.assertEqual(self.thumbnail.pixmap().toImage(), self.thumbnail.shadow.toImage())
+        (func, _next_func), *_rest = self.tasks.tasks
+        self.assertEqual(func().size(), QtCore.QSize(COVERART_WIDTH, COVERART_WIDTH))
+        self.tasks.run()
+        self.assertNotEqual(self.thumbnail.pixmap().toImage(), self.thumbnail.shadow.toImage())
+
+    def test_stale_result_ignored(self):
+        self.thumbnail.set_data([FakeImage(image_bytes(100, 100))], force=True)
+        self.thumbnail.set_data(None, force=True)
+        self.tasks.run()
+        self.assertEqual(self.thumbnail.pixmap().toImage(), self.thumbnail.shadow.toImage())
+
+    def test_stack(self):
+        images = [FakeImage(image_bytes(100, 100, color)) for color in ('red', 'green', 'blue')]
+        self.thumbnail.set_data(images, force=True)
+        self.assertEqual(len(self.tasks.tasks), 3)
+        self.tasks.run()
+        self.assertNotEqual(self.thumbnail.pixmap().toImage(), self.thumbnail.shadow.toImage())
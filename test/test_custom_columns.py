@@ -759,8 +759,8 @@ def test_chained_value_provider_defaults_via_class_injection(
     provider = provider_cls("%artist%", max_runtime_ms=None, cache_size=None)
     # When None is passed, provider should use class-level defaults
     assert provider._max_runtime_ms == expected_runtime
-    # id-cache size is bounded by minimum 16
-    assert provider._id_cache_max == max(16, expected_cache_size)
+    # cache size is bounded by minimum 16
+    assert provider._max_entries == max(16, expected_cache_size)
 
 
 def test_chained_value_provider_defaults_via_monkeypatch(fake_item: _FakeItem, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -774,17 +774,15 @@ def test_chained_value_provider_defaults_via_monkeypatch(fake_item: _FakeItem, m
     fake_item.values["artist"] = "Artist B"
     assert provider.evaluate(fake_item) == "Artist B"
     # Cache size honors lower bound
-    assert provider._id_cache_max == 16
+    assert provider._max_entries == 16
 
 
 @pytest.mark.parametrize("min_size, requested, expected", [(1, 1, 1), (32, 2, 32), (64, 128, 128)])
-def test_id_cache_minimum_injection(
-    min_size: int, requested: int, expected: int, monkeypatch: pytest.MonkeyPatch
-) -> None:
+def test_cache_minimum_injection(min_size: int, requested: int, expected: int, monkeypatch: pytest.MonkeyPatch) -> None:
     # Ensure the minimum bound is injectible and respected
-    monkeypatch.setattr(ChainedValueProvider, "DEFAULT_MIN_ID_CACHE_SIZE", min_size, raising=False)
+    monkeypatch.setattr(ChainedValueProvider, "DEFAULT_MIN_CACHE_SIZE", min_size, raising=False)
     provider = ChainedValueProvider("%artist%", max_runtime_ms=1000, cache_size=requested)
-    assert provider._id_cache_max == expected
+    assert provider._max_entries == expected
 
 
 def test_album_like_object_avoids_caching_until_loaded() -> None:
@@ -823,3 +821,46 @@ def test_album_like_object_avoids_caching_until_loaded() -> None:
     obj._artist = "Artist 3"
     obj._album = "Album 3"
     assert col.provider.evaluate(obj) == "Artist 2 - Album 2"
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    provider = ChainedValueProvider("%artist%", max_runtime_ms=1000, cache_size=16)
+    items = [_FakeItem(values={"artist": f"Artist {i}"}) for i in range(16)]
+    for item in items:
+        provider.evaluate(item)
+    # Using the oldest entry keeps it in the cache
+    provider.evaluate(items[0])
+    provider.evaluate(_FakeItem(values={"artist": "Other"}))
+    items[0].values["artist"] = "Changed"
+    items[1].values["artist"] = "Changed"
+    assert provider.evaluate(items[0]) == "Artist 0"
+    assert provider.evaluate(items[1]) == "Changed"
+
+
+def test_cache_limited_by_memory() -> None:
+    provider = ChainedValueProvider("%artist%", max_runtime_ms=1000, cache_bytes=1000)
+    items = [_FakeItem(values={"artist": "x" * 300}) for _i in range(3)]
+    for item in items:
+        provider.evaluate(item)
+    assert len(provider._cache) == 1
+    assert provider._cache.size <= 1000
+
+
+def test_cache_ignores_reused_id() -> None:
+    provider = ChainedValueProvider("%artist%", max_runtime_ms=1000)
+    item = _FakeItem(values={"artist": "Artist A"})
+    provider.evaluate(item)
+    # Simulate another object getting the id of a collected one
+    _ref, value = provider._cache[id(item)]
+    provider._cache[id(item)] = (lambda: None, value)
+    item.values["artist"] = "Artist B"
+    assert provider.evaluate(item) == "Artist B"
+
+
+def test_empty_value_is_cached(fake_item: _FakeItem) -> None:
+    provider = ChainedValueProvider("%missing%", max_runtime_ms=1000)
+    assert provider.evaluate(fake_item) == ""
+    fake_item.values["missing"] = "Found"
+    assert provider.evaluate(fake_item) == ""
+    provider.invalidate(fake_item)
+    assert provider.evaluate(fake_item) == "Found"
@@ -30,15 +30,24 @@ from unittest.mock import (
     patch,
 )
 
+from mutagen import PaddingInfo
+
 from test.picardtestcase import PicardTestCase
 from test.test_coverart_image import create_image
 
 from picard import config
+from picard.config import get_config
 from picard.const.sys import (
     IS_MACOS,
     IS_WIN,
 )
-from picard.file import File
+from picard.file import (
+    File,
+    FileIdentity,
+    FileSaveResult,
+    SaveBatch,
+    TagFormat,
+)
 from picard.metadata import Metadata
 from picard.tags import (
     calculated_tag_names,
@@ -783,6 +792,37 @@ class FileUpdateTest(PicardTestCase):
         self.assertNotIn('a', metadata)
 
 
+class FileLoadIdentityTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.item')
+        self.tagger.stopping = False
+        self.set_config_values(
+            {
+                'guess_tracknumber_and_title': False,
+                'ignore_existing_acoustid_fingerprints': True,
+                'enabled_plugins': [],
+            }
+        )
+        self.filename = os.path.join(self.mktmpdir(), 'somefile.mp3')
+        with open(self.filename, 'wb') as f:
+            f.write(b'data')
+        self.file = FakeMp3File(self.filename)
+        self.file._load = lambda filename: Metadata(title='foo')
+
+    def test_identity_captured_in_worker(self):
+        result = self.file._load_check(self.filename)
+        self.assertEqual('foo', result.metadata['title'])
+        self.assertEqual(FileIdentity(self.filename), result.identity)
+        callback = MagicMock()
+        with patch('picard.file.FileIdentity') as mock_identity:
+            self.file._loading_finished(callback, result=result)
+        mock_identity.assert_not_called()
+        self.assertIs(result.identity, self.file._loaded_identity)
+        self.assertEqual('foo', self.file.orig_metadata['title'])
+        callback.assert_called_once_with(self.file)
+
+
 class FileSavingFinishedImagesTest(PicardTestCase):
     """Regression tests for PICARD-3380: orig_metadata.images must reflect
     what actually ended up embedded in tags after a save, not just whatever
@@ -803,7 +843,8 @@ class FileSavingFinishedImagesTest(PicardTestCase):
         )
 
     def _finish_saving(self):
-        self.file._saving_finished(result=self.file.filename)
+        result = FileSaveResult(self.file.filename, FileIdentity(self.file.filename))
+        self.file._saving_finished(result=result)
 
     def test_removed_from_tags_with_no_replacement(self):
         """No new image was fetched, only the previously tagged image kept
@@ -880,6 +921,127 @@ class FileSavingFinishedImagesTest(PicardTestCase):
         self.assertEqual([True], received)
 
 
+class FileSkipUnchangedTagsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.item')
+        self.tagger.stopping = False
+        self.set_config_values(
+            {
+                'enable_tag_saving': True,
+                'skip_unchanged_tag_writes': True,
+                'clear_existing_tags': False,
+                'preserve_timestamps': False,
+                'rename_files': False,
+                'move_files': False,
+                'delete_empty_dirs': False,
+                'save_images_to_files': False,
+                'save_images_to_tags': True,
+                'enabled_plugins': [],
+            }
+        )
+        self.filename = os.path.join(self.mktmpdir(), 'somefile.mp3')
+        with open(self.filename, 'wb') as f:
+            f.write(b'data')
+        self.file = FakeMp3File(self.filename)
+        self.file._save = MagicMock()
+        self.file._loaded_identity = FileIdentity(self.filename)
+        self.file.orig_metadata = Metadata(title='foo', artist='bar')
+        self.file.metadata.copy(self.file.orig_metadata)
+
+    def save(self):
+        config = get_config()
+        write_tags = self.file._tags_changed(self.file.metadata, config.setting)
+        return self.file._save_check(self.filename, self.file.metadata, write_tags)
+
+    def test_unchanged(self):
+        result = self.save()
+        self.file._save.assert_not_called()
+        self.assertFalse(result.tags_written)
+        self.assertEqual(self.filename, result.filename)
+
+    def test_changed_tag(self):
+        self.file.metadata['title'] = 'new'
+        self.assertTrue(self.save().tags_written)
+        self.file._save.assert_called_once()
+
+    def test_new_tag(self):
+        self.file.metadata['album'] = 'new'
+        self.assertTrue(self.save().tags_written)
+
+    def test_deleted_tag(self):
+        self.file.metadata.delete('artist')
+        self.assertTrue(self.save().tags_written)
+
+    def test_hidden_variables_ignored(self):
+        self.file.metadata['~releasecomment'] = 'foo'
+        self.assertFalse(self.save().tags_written)
+
+    def test_rating(self):
+        self.file.metadata['~rating'] = '3'
+        self.assertTrue(self.save().tags_written)
+
+    def test_new_image(self):
+        self.file.metadata.images = ImageList([create_image(b'a', types=['front'], support_types=True)])
+        self.assertTrue(self.save().tags_written)
+
+    def test_clear_existing_tags(self):
+        self.set_config_values({'clear_existing_tags': True})
+        self.assertTrue(self.save().tags_written)
+
+    def test_padding_changed(self):
+        self.set_config_values({'tag_padding_policy': 'default', 'tag_padding_reserve_images': False})
+        self.file._tag_format = TagFormat(padding=PaddingInfo(1_000_000, 10_000))
+        self.assertFalse(self.save().tags_written)
+        self.set_config_values({'tag_padding_policy': 'fixed'})
+        self.assertFalse(self.save().tags_written)
+        self.file._tag_format = TagFormat(padding=PaddingInfo(-1, 10_000))
+        self.assertTrue(self.save().tags_written)
+
+    def test_modified_since_loading(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'changed')
+        self.assertTrue(self.save().tags_written)
+        self.file._save.assert_called_once()
+
+    def test_renamed_without_writing_tags(self):
+        self.set_config_values({'rename_files': True})
+        new_filename = os.path.join(os.path.dirname(self.filename), 'renamed.mp3')
+        with patch.object(self.file, '_rename', return_value=new_filename) as mock_rename:
+            result = self.save()
+        mock_rename.assert_called_once()
+        self.file._save.assert_not_called()
+        self.assertEqual(new_filename, result.filename)
+
+    def test_batch_saved_images(self):
+        self.set_config_values({'save_images_to_files': True})
+        batch = SaveBatch(1, MagicMock())
+        with patch.object(self.file, '_save_images') as mock_save_images:
+            self.file._save_check(self.filename, self.file.metadata, False, batch)
+        mock_save_images.assert_called_once_with(os.path.dirname(self.filename), self.file.metadata, batch.saved_images)
+
+
+class SaveBatchTest(PicardTestCase):
+    def test_summary(self):
+        callback = MagicMock()
+        batch = SaveBatch(4, callback)
+        batch.add(FileSaveResult('a', None, True))
+        batch.add(FileSaveResult('b', None, False))
+        batch.add(error=OSError())
+        callback.assert_not_called()
+        batch.add(FileSaveResult('c', None, False))
+        callback.assert_called_once_with(batch)
+        self.assertEqual((1, 2, 1), (batch.written, batch.skipped, batch.failed))
+
+    def test_not_saved(self):
+        callback = MagicMock()
+        batch = SaveBatch(2, callback)
+        batch.add(FileSaveResult('a', None, True))
+        batch.add(None)
+        callback.assert_called_once_with(batch)
+        self.assertEqual(1, batch.total)
+
+
 class FileCopyMetadataTest(PicardTestCase):
     def setUp(self):
         super().setUp()
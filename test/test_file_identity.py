@@ -298,3 +298,17 @@ class TestFileIdentity(PicardTestCase):
         os.utime(fname, (stat.st_atime, stat.st_mtime))
         id2 = FileIdentity(fname)
         self.assertNotEqual(id1, id2)
+
+    def test_cache_key(self):
+        """Test that the cache key is stable for unchanged files and changes with the content."""
+        fname = self._write_temp(b"abcdef")
+        key = FileIdentity(fname).cache_key
+        self.assertIsNotNone(key)
+        self.assertEqual(key, FileIdentity(fname).cache_key)
+        with open(fname, "wb") as f:
+            f.write(b"abcdefgh")
+        self.assertNotEqual(key, FileIdentity(fname).cache_key)
+
+    def test_cache_key_missing_file(self):
+        """Test that missing files have no cache key."""
+        self.assertIsNone(FileIdentity("/nonexistent/file/path").cache_key)
@@ -29,11 +29,14 @@ from test.plugins3.helpers import skip_if_no_git_backend
 
 from picard.git.backend import (
     GitBackend,
+    GitFetchStatus,
+    GitFetchTimeoutError,
     GitObject,
     GitObjectType,
     GitRef,
     GitRefType,
     GitRepository,
+    GitRepositoryError,
     GitStatusFlag,
 )
 from picard.git.factory import git_backend
@@ -387,5 +390,114 @@ class TestGitBackend(unittest.TestCase):
             repo.free()
 
 
+class TestFetchRepositories(unittest.TestCase):
+    """Fetching several plugin clones of file:// bare repositories"""
+
+    def setUp(self):
+        import tempfile
+
+        from test.plugins3.helpers import create_git_repo_with_backend
+
+        skip_if_no_git_backend()
+        self.backend = git_backend()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = Path(tmpdir.name)
+        self.source = self.tmpdir / 'source'
+        create_git_repo_with_backend(self.source, {'README.md': '# Test'})
+        self.bare = self.tmpdir / 'bare.git'
+        self.backend.clone_repository(self.source.as_uri(), self.bare, bare=True).free()
+        self.clones = []
+        for name in ('clone1', 'clone2', 'clone3'):
+            path = self.tmpdir / name
+            self.backend.clone_repository(self.bare.as_uri(), path).free()
+            self.clones.append(path)
+
+    def push_source(self):
+        """Update the bare repository from the source repository"""
+        with self.backend.create_repository(self.bare) as repo:
+            remote = repo.create_remote('source', self.source.as_uri())
+            repo.fetch_remote(remote, '+refs/heads/*:refs/heads/*')
+            repo.fetch_remote(remote, '+refs/tags/*:refs/tags/*')
+
+    def statuses(self, results):
+        return [results[path].status for path in self.clones]
+
+    def test_unchanged(self):
+        results = self.backend.fetch_repositories(self.clones, max_workers=2)
+        self.assertEqual([GitFetchStatus.UNCHANGED] * 3, self.statuses(results))
+
+    def test_new_commit_and_tag(self):
+        from test.plugins3.helpers import (
+            backend_add_and_commit,
+            backend_create_tag,
+        )
+
+        (self.source / 'file.txt').write_text('new')
+        commit_id = backend_add_and_commit(self.source, 'Second commit')
+        backend_create_tag(self.source, 'v1.0', commit_id, 'Version 1.0')
+        self.push_source()
+
+        results = self.backend.fetch_repositories(self.clones, max_workers=2)
+        self.assertEqual([GitFetchStatus.FETCHED] * 3, self.statuses(results))
+        with self.backend.create_repository(self.clones[0]) as repo:
+            self.assertEqual(commit_id, repo.revparse_to_commit('refs/remotes/origin/main').id)
+            self.assertEqual(commit_id, repo.revparse_to_commit('refs/tags/v1.0').id)
+
+        # Nothing changed since the last fetch
+        results = self.backend.fetch_repositories(self.clones)
+        self.assertEqual([GitFetchStatus.UNCHANGED] * 3, self.statuses(results))
+
+    def test_failures(self):
+        missing = self.tmpdir / 'missing'
+        with self.backend.create_repository(self.clones[0]) as repo:
+            repo.set_remote_url('origin', (self.tmpdir / 'nonexistent.git').as_uri())
+        results = self.backend.fetch_repositories([missing, self.clones[0], self.clones[1]])
+        self.assertEqual(GitFetchStatus.FAILED, results[missing].status)
+        self.assertIsInstance(results[missing].error, GitRepositoryError)
+        self.assertEqual(GitFetchStatus.FAILED, results[self.clones[0]].status)
+        self.assertIsNotNone(results[self.clones[0]].error)
+        self.assertEqual(GitFetchStatus.UNCHANGED, results[self.clones[1]].status)
+
+    def test_callbacks_timeout(self):
+        from picard.git.backends.pygit2 import Pygit2RemoteCallbacks
+
+        callbacks = Pygit2RemoteCallbacks(timeout=60)
+        callbacks._transfer_progress(None)
+        callbacks = Pygit2RemoteCallbacks(timeout=0.001)
+        with patch('picard.git.backends.pygit2.time.monotonic', return_value=float('inf')):
+            with self.assertRaises(GitFetchTimeoutError):
+                callbacks._transfer_progress(None)
+            with self.assertRaises(GitFetchTimeoutError):
+                callbacks._sideband_progress('')
+
+    def test_server_timeout_overlapping(self):
+        from picard.git.backends.pygit2 import _server_timeout
+
+        import pygit2
+
+        def timeouts():
+            return (
+                pygit2.option(pygit2.enums.Option.GET_SERVER_CONNECT_TIMEOUT),
+                pygit2.option(pygit2.enums.Option.GET_SERVER_TIMEOUT),
+            )
+
+        defaults = timeouts()
+        with _server_timeout(10):
+            self.assertEqual((10000, 10000), timeouts())
+            with _server_timeout(30):
+                self.assertEqual((30000, 30000), timeouts())
+            with _server_timeout(5):
+                self.assertEqual((10000, 10000), timeouts())
+            self.assertEqual((10000, 10000), timeouts())
+        self.assertEqual(defaults, timeouts())
+
+    def test_default_implementation(self):
+        backend = MockGitBackend()
+        results = backend.fetch_repositories([Path('a'), Path('b')])
+        self.assertEqual(GitFetchStatus.FETCHED, results[Path('a')].status)
+        self.assertEqual(GitFetchStatus.FETCHED, results[Path('b')].status)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,110 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import pytest
+
+from picard.ui.columns import (
+    Column,
+    Columns,
+)
+from picard.ui.itemviews import TreeItem
+from picard.ui.itemviews.custom_columns import CustomColumn
+
+
+class _Obj:
+    ui_item: TreeItem | None = None
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def column(self, key: str) -> str:
+        return self.value
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.invalidated: list[object] = []
+
+    def evaluate(self, obj: _Obj) -> str:
+        self.calls += 1
+        if obj.value == "error":
+            raise ValueError(obj.value)
+        return f"custom {obj.value}"
+
+    def invalidate(self, obj: object | None = None) -> None:
+        self.invalidated.append(obj)
+
+
+class _Holder:
+    def __init__(self, columns: Columns) -> None:
+        self.columns = columns
+
+    def queue_filter_item(self, item: TreeItem) -> None:
+        pass
+
+
+@pytest.fixture
+def provider() -> _CountingProvider:
+    return _CountingProvider()
+
+
+@pytest.fixture
+def columns(provider: _CountingProvider) -> Columns:
+    return Columns([Column("Title", "title"), CustomColumn("Custom", "custom", provider)])
+
+
+def _make_item(columns: Columns, value: str) -> TreeItem:
+    item = TreeItem(_Obj(value))
+    item.treeWidget = lambda: _Holder(columns)  # type: ignore[method-assign]
+    return item
+
+
+def test_custom_column_evaluated_on_demand(columns: Columns, provider: _CountingProvider) -> None:
+    item = _make_item(columns, "a")
+    item.update_colums_text()
+    assert provider.calls == 0
+    assert provider.invalidated == [item.obj]
+    assert item.text(0) == "a"
+    assert item.text(1) == "custom a"
+    assert provider.calls == 1
+
+
+def test_sortkey_reset_on_update(columns: Columns, provider: _CountingProvider) -> None:
+    item = _make_item(columns, "a")
+    item.update_colums_text()
+    first = item.sortkey(1)
+    item.obj.value = "b"
+    assert item.sortkey(1) == first
+    item.update_colums_text()
+    assert item.sortkey(1) != first
+    assert provider.calls == 2
+
+
+def test_evaluate_error_shows_empty_text(columns: Columns) -> None:
+    item = _make_item(columns, "error")
+    item.update_colums_text()
+    assert item.text(1) == ""
+
+
+def test_removed_column_falls_back_to_stored_text(columns: Columns, provider: _CountingProvider) -> None:
+    item = _make_item(columns, "a")
+    item.update_colums_text()
+    del columns[1]
+    assert item.text(1) == ""
+    assert provider.calls == 0
@@ -0,0 +1,105 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+"""Tests for checking the rename plan before saving in the main window."""
+
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from picard import config
+from picard.renameplan import (
+    RenamePlan,
+    RenamePlanEntry,
+)
+
+import pytest
+
+from picard.ui.mainwindow import MainWindow
+
+
+@pytest.fixture
+def mainwindow() -> Mock:
+    window = Mock(spec=MainWindow)
+    window.tagger = Mock()
+    for name in ('save_objects', '_save_rename_plan_built'):
+        setattr(window, name, getattr(MainWindow, name).__get__(window, MainWindow))
+    return window
+
+
+@pytest.fixture
+def files() -> list[Mock]:
+    return [Mock(filename='/music/a.mp3'), Mock(filename='/music/b.mp3')]
+
+
+def _set_rename(rename_files: bool, move_files: bool = False):
+    config.setting['rename_files'] = rename_files
+    config.setting['move_files'] = move_files
+
+
+@patch('picard.ui.mainwindow.build_rename_plan')
+def test_save_without_renaming_skips_plan(build_rename_plan, mainwindow, files):
+    _set_rename(False)
+    mainwindow.save_objects(files)
+    build_rename_plan.assert_not_called()
+    mainwindow.tagger.save.assert_called_once_with(files)
+
+
+@pytest.mark.parametrize('rename_files,move_files', [(True, False), (False, True)])
+@patch('picard.ui.mainwindow.iter_files_from_objects', side_effect=lambda objects, save: iter(objects))
+@patch('picard.ui.mainwindow.build_rename_plan')
+def test_save_builds_plan(build_rename_plan, _iter_files, mainwindow, files, rename_files, move_files):
+    _set_rename(rename_files, move_files)
+    mainwindow.save_objects(files)
+    mainwindow.tagger.save.assert_not_called()
+    build_rename_plan.assert_called_once()
+    assert files == build_rename_plan.call_args.args[0]
+    callback = build_rename_plan.call_args.args[1]
+    callback(plan=RenamePlan([RenamePlanEntry('/music/a.mp3', '/music/x/a.mp3')]))
+    mainwindow._confirm_rename_conflicts.assert_not_called()
+    mainwindow.tagger.save.assert_called_once_with(files)
+
+
+def _conflicting_plan() -> RenamePlan:
+    return RenamePlan(
+        [
+            RenamePlanEntry('/music/a.mp3', '/music/x.mp3'),
+            RenamePlanEntry('/music/b.mp3', '/music/x.mp3'),
+        ]
+    )
+
+
+def test_conflicts_confirmed(mainwindow, files):
+    mainwindow._confirm_rename_conflicts.return_value = True
+    plan = _conflicting_plan()
+    mainwindow._save_rename_plan_built(files, plan=plan)
+    mainwindow._confirm_rename_conflicts.assert_called_once_with(plan)
+    mainwindow.tagger.save.assert_called_once_with(files)
+
+
+def test_conflicts_cancelled(mainwindow, files):
+    mainwindow._confirm_rename_conflicts.return_value = False
+    mainwindow._save_rename_plan_built(files, plan=_conflicting_plan())
+    mainwindow.tagger.save.assert_not_called()
+    mainwindow.set_statusbar_message.assert_called_once()
+
+
+def test_plan_error_saves(mainwindow, files):
+    mainwindow._save_rename_plan_built(files, error=ValueError())
+    mainwindow.tagger.save.assert_called_once_with(files)
@@ -0,0 +1,188 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import csv
+import os
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.file import File
+from picard.renameplan import (
+    RenameConflict,
+    RenamePlan,
+    RenamePlanEntry,
+    build_rename_plan,
+    plan_renames,
+)
+
+
+def run_task_sync(func, next_func=None, **kwargs):
+    try:
+        result = func()
+    except Exception as e:
+        next_func(error=e)
+    else:
+        next_func(result=result)
+
+
+class RenamePlanTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.item', 'picard.renameplan')
+        self.tmpdir = self.mktmpdir()
+        self.set_config_values(
+            {
+                'ascii_filenames': False,
+                'clear_existing_tags': False,
+                'enabled_plugins': [],
+                'move_files_to': os.path.join(self.tmpdir, 'music'),
+                'move_files': True,
+                'rename_files': True,
+                'windows_compatibility': False,
+                'win_compat_replacements': {},
+                'windows_long_paths': False,
+                'replace_spaces_with_underscores': False,
+                'replace_dir_separator': '_',
+                'file_renaming_scripts': {'test_id': {'script': '%album%/%title%'}},
+                'active_file_naming_script_id': 'test_id',
+            }
+        )
+
+    def make_file(self, name, **tags):
+        file = File(os.path.join(self.tmpdir, name))
+        file.metadata.update(tags)
+        return file
+
+    def target(self, *parts):
+        return os.path.join(self.tmpdir, 'music', *parts)
+
+    def test_plan(self):
+        files = [
+            self.make_file('a.mp3', album='Album', title='One'),
+            self.make_file('b.mp3', album='Album', title='Two'),
+        ]
+        plan = plan_renames(files)
+        self.assertEqual(
+            [
+                (files[0].filename, self.target('Album', 'One.mp3')),
+                (files[1].filename, self.target('Album', 'Two.mp3')),
+            ],
+            [(entry.source, entry.target) for entry in plan.entries],
+        )
+        self.assertEqual(2, len(plan.moves))
+        self.assertEqual([], plan.conflicts)
+
+    def test_rename_disabled(self):
+        self.set_config_values({'move_files': False, 'rename_files': False})
+        file = self.make_file('a.mp3', album='Album', title='One')
+        plan = plan_renames([file])
+        self.assertEqual([], plan.moves)
+
+    def test_duplicate_targets(self):
+        files = [
+            self.make_file('a.mp3', album='Album', title='Same'),
+            self.make_file('b.mp3', album='Album', title='Same'),
+            self.make_file('c.mp3', album='Album', title='Other'),
+        ]
+        plan = plan_renames(files)
+        self.assertEqual([files[0].filename, files[1].filename], [entry.source for entry in plan.conflicts])
+        self.assertEqual({RenameConflict.DUPLICATE}, plan.conflicts[0].conflicts)
+
+    def test_duplicate_with_unmoved_file(self):
+        entries = [
+            RenamePlanEntry('/music/a.mp3', '/music/a.mp3'),
+            RenamePlanEntry('/music/b.mp3', '/music/a.mp3'),
+        ]
+        plan = RenamePlan(entries)
+        self.assertEqual(2, len(plan.conflicts))
+
+    def test_case_conflict(self):
+        files = [
+            self.make_file('a.mp3', album='Album', title='Title'),
+            self.make_file('b.mp3', album='album', title='title'),
+        ]
+        plan = plan_renames(files)
+        for entry in plan.conflicts:
+            self.assertIn(RenameConflict.CASE, entry.conflicts)
+        self.assertEqual(2, len(plan.conflicts))
+
+    def test_existing_target(self):
+        os.makedirs(self.target('Album'))
+        with open(self.target('Album', 'One.mp3'), 'wb') as f:
+            f.write(b'data')
+        file = self.make_file('a.mp3', album='Album', title='One')
+        with open(file.filename, 'wb') as f:
+            f.write(b'data')
+        plan = plan_renames([file])
+        self.assertEqual({RenameConflict.EXISTS}, plan.entries[0].conflicts)
+
+    def test_existing_target_moved_away(self):
+        entries = [
+            RenamePlanEntry('/music/a.mp3', '/music/b.mp3', target_exists=True),
+            RenamePlanEntry('/music/b.mp3', '/music/c.mp3'),
+        ]
+        plan = RenamePlan(entries)
+        self.assertEqual([], plan.conflicts)
+
+    def test_write_csv(self):
+        plan = RenamePlan(
+            [
+                RenamePlanEntry('/music/a.mp3', '/music/x.mp3'),
+                RenamePlanEntry('/music/b.mp3', '/music/x.mp3'),
+            ]
+        )
+        path = os.path.join(self.tmpdir, 'plan.csv')
+        plan.write_csv(path)
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(
+            [
+                ['source', 'target', 'conflicts'],
+                ['/music/a.mp3', '/music/x.mp3', 'duplicate'],
+                ['/music/b.mp3', '/music/x.mp3', 'duplicate'],
+            ],
+            rows,
+        )
+
+    @patch('picard.renameplan.thread.run_task', side_effect=run_task_sync)
+    def test_build_rename_plan(self, run_task):
+        files = [self.make_file(f'{i}.mp3', album='Album', title=str(i)) for i in range(5)]
+        callback = MagicMock()
+        build_rename_plan(files, callback, chunk_size=2)
+        self.assertEqual(3, run_task.call_count)
+        callback.assert_called_once()
+        plan = callback.call_args.kwargs['plan']
+        self.assertEqual([file.filename for file in files], [entry.source for entry in plan.entries])
+        self.assertEqual(self.target('Album', '4.mp3'), plan.entries[4].target)
+
+    @patch('picard.renameplan.thread.run_task', side_effect=run_task_sync)
+    def test_build_rename_plan_error(self, run_task):
+        file = self.make_file('a.mp3', album='Album', title='One')
+        callback = MagicMock()
+        with patch.object(File, 'make_filename', side_effect=ValueError):
+            build_rename_plan([file], callback)
+        self.assertIsInstance(callback.call_args.kwargs['error'], ValueError)
+
+    def test_build_rename_plan_no_files(self):
+        callback = MagicMock()
+        build_rename_plan([], callback)
+        self.assertEqual(0, len(callback.call_args.kwargs['plan']))
@@ -0,0 +1,147 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from unittest.mock import patch
+
+from test.picardtestcase import PicardTestCase
+
+from picard.extension_points.script_functions import register_script_function
+from picard.metadata import (
+    Metadata,
+    MultiMetadataProxy,
+)
+from picard.script import ScriptParser
+from picard.script.memo import (
+    ScriptMemo,
+    script_dependencies,
+)
+
+
+def func_memotest(parser, text):
+    return text
+
+
+class ScriptDependenciesTest(PicardTestCase):
+    def dependencies(self, script):
+        parser = ScriptParser()
+        parser.load_functions()
+        return script_dependencies(parser.parse(script, True))
+
+    def test_reads_and_writes(self):
+        dependencies = self.dependencies(
+            '$set(_sort,$lower(%artist%))$copy(albumsort,_title)$if($get(date),$delete(comment))'
+        )
+        self.assertEqual(dependencies.reads, ('artist', 'date', '~title'))
+        self.assertEqual(dependencies.writes, ('albumsort', 'comment', '~sort'))
+        self.assertEqual(dependencies.preserved, ('comment',))
+        self.assertEqual(dependencies.functions, {'set', 'lower', 'copy', 'if', 'get', 'delete'})
+
+    def test_implicit(self):
+        dependencies = self.dependencies('$foreach(%genre%,$is_video())')
+        self.assertEqual(dependencies.reads, ('genre', '~video'))
+        self.assertEqual(dependencies.writes, ('~loop_count', '~loop_value'))
+        self.assertEqual(dependencies.preserved, ('~loop_count', '~loop_value'))
+
+    def test_dynamic_name(self):
+        self.assertIsNone(self.dependencies('$set(%name%,foo)'))
+
+    def test_impure_function(self):
+        self.assertIsNone(self.dependencies('$set(date,$datetime())'))
+
+    def test_wildcard_unset(self):
+        self.assertIsNone(self.dependencies('$unset(performer:*)'))
+
+
+class ScriptMemoTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.memo = ScriptMemo()
+
+    def run_script(self, script, metadata):
+        self.memo.eval(ScriptParser(), script, metadata)
+
+    def test_memoized(self):
+        script = '$set(title,$upper(%title%))$delete(comment)'
+        m1 = Metadata(title='foo', comment='bar')
+        m2 = Metadata(title='foo', comment='baz')
+        self.run_script(script, m1)
+        with patch.object(ScriptParser, 'eval') as mock_eval:
+            self.run_script(script, m2)
+            mock_eval.assert_not_called()
+        self.assertEqual(self.memo.stats.hits, 1)
+        self.assertEqual(self.memo.stats.misses, 1)
+        self.assertEqual(m2['title'], 'FOO')
+        self.assertNotIn('comment', m2)
+        self.assertIn('comment', m2.deleted_tags)
+
+    def test_different_inputs(self):
+        script = '$set(title,$upper(%title%))'
+        m1 = Metadata(title='foo')
+        m2 = Metadata(title='bar')
+        self.run_script(script, m1)
+        self.run_script(script, m2)
+        self.assertEqual(self.memo.stats.misses, 2)
+        self.assertEqual(m2['title'], 'BAR')
+
+    def test_conditional_write(self):
+        script = '$if(%flag%,$set(genre,Rock))'
+        m1 = Metadata(genre='Pop')
+        m2 = Metadata(genre='Jazz')
+        self.run_script(script, m1)
+        self.run_script(script, m2)
+        self.assertEqual(m1['genre'], 'Pop')
+        self.assertEqual(m2['genre'], 'Jazz')
+        m3 = Metadata(genre='Pop')
+        self.run_script(script, m3)
+        self.assertEqual(self.memo.stats.hits, 1)
+        self.assertEqual(m3['genre'], 'Pop')
+
+    def test_multi_metadata_proxy(self):
+        script = '$set(comment,%comment% 2)'
+        file_metadata = Metadata(comment='file')
+        m1 = Metadata()
+        m2 = Metadata()
+        self.run_script(script, MultiMetadataProxy(m1, file_metadata))
+        self.run_script(script, MultiMetadataProxy(m2, file_metadata))
+        self.assertEqual(self.memo.stats.hits, 1)
+        self.assertEqual(m2['comment'], 'file 2')
+        self.assertEqual(file_metadata['comment'], 'file')
+
+    def test_uncacheable(self):
+        self.run_script('$set(date,$datetime())', Metadata())
+        self.run_script('$set(date,$datetime())', Metadata())
+        self.assertEqual(self.memo.stats.uncacheable, 2)
+        self.assertEqual(self.memo.stats.hits, 0)
+
+    def test_plugin_function(self):
+        register_script_function(func_memotest, 'memotest')
+        metadata = Metadata()
+        self.run_script('$set(title,$memotest(foo))', metadata)
+        self.assertEqual(metadata['title'], 'foo')
+        self.assertEqual(self.memo.stats.uncacheable, 1)
+
+    def test_max_size(self):
+        self.memo.max_size = 2
+        for title in ('a', 'b', 'c'):
+            self.run_script('$set(title,$upper(%title%))', Metadata(title=title))
+        self.assertEqual(len(self.memo._results), 2)
+        self.memo.max_size = 0
+        metadata = Metadata(title='c')
+        self.run_script('$set(title,$upper(%title%))', metadata)
+        self.assertEqual(metadata['title'], 'C')
+        self.assertEqual(self.memo.stats.hits, 0)
@@ -0,0 +1,63 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import re
+import subprocess
+import sys
+
+from test.picardtestcase import PicardTestCase
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only needed on user request, those must be imported on first use
+LAZY_MODULES = (
+    'picard.plugin3.manager.install',
+    'picard.plugin3.manager.update',
+    'picard.ui.cdlookup',
+    'picard.ui.itemviews.custom_columns.manager_dialog',
+    'picard.ui.options.dialog',
+    'picard.ui.options.general',
+    'picard.ui.player',
+    'picard.ui.scripteditor',
+)
+
+
+def imported_modules(module):
+    """Returns the modules imported by importing module in a fresh interpreter"""
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONPATH'] = PROJECT_ROOT
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    return set(re.findall(r'^import time:.*\| *(\S+)$', result.stderr, re.MULTILINE))
+
+
+class StartupImportsTest(PicardTestCase):
+    def test_lazy_modules(self):
+        modules = imported_modules('picard.tagger')
+        self.assertIn('picard.ui.mainwindow', modules)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
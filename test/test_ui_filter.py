@@ -21,7 +21,12 @@
 
 
 from collections import namedtuple
-from unittest.mock import patch
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from PyQt6 import QtCore
 
 from test.picardtestcase import (
     PicardTestCase,
@@ -39,7 +44,14 @@ from picard.tags.tagvar import (
 )
 
 from picard.ui.filter import Filter
+from picard.ui.itemviews import TreeItem
 from picard.ui.itemviews.basetreeview import BaseTreeView
+from picard.ui.itemviews.columns import FILEVIEW_COLUMNS
+from picard.ui.itemviews.filterindex import (
+    FilterIndex,
+    FilterQuery,
+    filter_index,
+)
 
 
 TEST_TAGS = TagVars(
@@ -135,6 +147,12 @@ class FilterTestFiltering(PicardTestCase):
 
     TestConditions = namedtuple('TestConditions', 'text filters has_tags matches')
 
+    @staticmethod
+    def match(obj, text, filters):
+        index = FilterIndex()
+        index.set_tags(filters)
+        return FilterQuery(index, text, filters).match(obj)
+
     def test_filter_file_1(self):
         """Test with file-related filters"""
 
@@ -218,7 +236,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_file_properties(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -251,7 +269,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_file_properties(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -284,7 +302,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_file_properties(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -356,7 +374,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_metadata(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -392,7 +410,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_metadata(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -434,7 +452,7 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_metadata(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
 
@@ -476,6 +494,162 @@ class FilterTestFiltering(PicardTestCase):
 
         for test in tests:
             text = f"Error testing: filters={test.filters}  text={repr(test.text)}"
-            has_tags, matches = BaseTreeView._matches_metadata(test_object, test.text, test.filters)
+            has_tags, matches = self.match(test_object, test.text, test.filters)
             self.assertEqual(has_tags, test.has_tags, text)
             self.assertEqual(matches, test.matches, text)
+
+
+class _MetadataObject:
+    def __init__(self, metadata):
+        self.metadata = Metadata(metadata)
+
+
+class FilterIndexTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.item')
+        self.index = FilterIndex()
+        self.index.set_tags({'title', 'artist'})
+
+    def test_multiple_values(self):
+        test_object = _MetadataObject({'artist': ['Foo', 'Bar']})
+        query = FilterQuery(self.index, 'bar', {'artist'})
+        self.assertEqual(query.match(test_object), (True, {'artist'}))
+        query = FilterQuery(self.index, 'foobar', {'artist'})
+        self.assertEqual(query.match(test_object), (True, set()))
+
+    def test_unindexed_tag(self):
+        test_object = _MetadataObject({'album': 'Foo'})
+        query = FilterQuery(self.index, 'foo', {'album'})
+        self.assertEqual(query.match(test_object), (False, set()))
+
+    def test_entry_cached_until_invalidated(self):
+        test_object = _MetadataObject({'title': 'Foo'})
+        entry = self.index.entry(test_object)
+        self.assertIs(self.index.entry(test_object), entry)
+        test_object.metadata['title'] = 'Bar'
+        self.assertEqual(FilterQuery(self.index, 'bar', {'title'}).match(test_object), (True, set()))
+        self.index.invalidate(test_object)
+        self.assertEqual(FilterQuery(self.index, 'bar', {'title'}).match(test_object), (True, {'title'}))
+
+    def test_set_tags_clears_entries(self):
+        self.index.entry(_MetadataObject({'title': 'Foo'}))
+        test_object = _MetadataObject({'title': 'Foo'})
+        self.index.entry(test_object)
+        self.index.set_tags({'title', 'artist'})
+        self.assertEqual(len(self.index), 1)
+        self.index.set_tags({'title'})
+        self.assertEqual(len(self.index), 0)
+
+    def test_narrowing_query(self):
+        test_object = _MetadataObject({'title': 'foo', 'artist': 'foobar'})
+        filters = {'title', 'artist'}
+        query = FilterQuery(self.index, 'foo', filters)
+        self.assertEqual(query.match(test_object), (True, {'title', 'artist'}))
+        narrowed = FilterQuery(self.index, 'foob', filters, previous=query)
+        entry = self.index.entry(test_object)
+        entry.fields['title'] = 'foobar'
+        # Only tags which matched the previous text get checked
+        self.assertEqual(narrowed.match(test_object), (True, {'artist', 'title'}))
+        query = FilterQuery(self.index, 'bar', filters, previous=narrowed)
+        self.assertEqual(query.match(test_object), (True, {'artist', 'title'}))
+
+    def test_narrowing_skips_rejected_tags(self):
+        test_object = _MetadataObject({'title': 'foo', 'artist': 'bar'})
+        filters = {'title', 'artist'}
+        query = FilterQuery(self.index, 'foo', filters)
+        self.assertEqual(query.match(test_object), (True, {'title'}))
+        self.index.entry(test_object).fields['artist'] = 'foob'
+        narrowed = FilterQuery(self.index, 'foob', filters, previous=query)
+        self.assertEqual(narrowed.match(test_object), (True, set()))
+
+    def test_narrowing_ignores_invalidated_entries(self):
+        test_object = _MetadataObject({'title': 'foo'})
+        query = FilterQuery(self.index, 'x', {'title'})
+        self.assertEqual(query.match(test_object), (True, set()))
+        test_object.metadata['title'] = 'xy'
+        self.index.invalidate(test_object)
+        narrowed = FilterQuery(self.index, 'xy', {'title'}, previous=query)
+        self.assertEqual(narrowed.match(test_object), (True, {'title'}))
+
+
+class _FilterTestView(BaseTreeView):
+    NAME = 'test view'
+    DESCRIPTION = 'test view'
+    pending_filter_interval = 0
+
+
+class FilterPendingItemsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_tagger_instance('picard.util', 'picard.ui.itemviews.basetreeview')
+        # Do not restore the header state of the view from the config
+        self.tagger._no_restore = True
+        filterable_tags = patch.object(Filter, 'filterable_tags', {'title'})
+        filterable_tags.start()
+        self.addCleanup(filterable_tags.stop)
+        self.view = _FilterTestView(FILEVIEW_COLUMNS, Mock())
+        self.cluster = TreeItem(_MetadataObject({'title': 'cluster'}), parent=self.view)
+        self.foo = TreeItem(_MetadataObject({'title': 'foo'}), parent=self.cluster)
+        self.view.filter_items('foo', {'title'})
+        self.assertFalse(self.cluster.isHidden())
+        self.assertFalse(self.foo.isHidden())
+
+    def add_item(self, title, parent):
+        item = TreeItem(_MetadataObject({'title': title}), parent=parent)
+        self.view.queue_filter_item(item)
+        return item
+
+    def test_filters_only_queued_items(self):
+        bar = self.add_item('bar', self.cluster)
+        self.assertFalse(bar.isHidden())
+        with patch.object(self.view, '_filter_tree_items') as full_refilter:
+            self.view.filter_pending_items()
+        full_refilter.assert_not_called()
+        self.assertTrue(bar.isHidden())
+        self.assertFalse(self.foo.isHidden())
+
+    def test_coalesced_batch(self):
+        items = [self.add_item(title, self.cluster) for title in ('bar', 'foobar', 'baz')]
+        self.assertEqual(len(self.view._pending_filter_items), 3)
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(self.view._pending_filter_items, {})
+        self.assertEqual([item.isHidden() for item in items], [True, False, True])
+
+    def test_parents_updated(self):
+        other = TreeItem(_MetadataObject({'title': 'other'}), parent=self.view)
+        self.view.filter_items('foo', {'title'})
+        self.assertTrue(other.isHidden())
+        self.add_item('foo 2', other)
+        self.foo.obj.metadata['title'] = 'bar'
+        filter_index.invalidate(self.foo.obj)
+        self.view.queue_filter_item(self.foo)
+        self.view.filter_pending_items()
+        self.assertFalse(other.isHidden())
+        self.assertTrue(self.foo.isHidden())
+        self.assertTrue(self.cluster.isHidden())
+
+    def test_suspended(self):
+        bar = self.add_item('bar', self.cluster)
+        with patch.object(Filter, 'suspended', True):
+            self.view.filter_pending_items()
+            self.assertFalse(bar.isHidden())
+        self.view.filter_pending_items()
+        self.assertTrue(bar.isHidden())
+
+    def test_no_active_filter(self):
+        self.view.filter_items('', {'title'})
+        self.add_item('bar', self.cluster)
+        self.assertEqual(self.view._pending_filter_items, {})
+
+    def test_query_change_drops_pending_items(self):
+        self.add_item('bar', self.cluster)
+        self.view.filter_items('ba', {'title'})
+        self.assertEqual(self.view._pending_filter_items, {})
+        self.assertTrue(self.foo.isHidden())
+
+    def test_loads_filterable_tags(self):
+        with patch.object(Filter, 'filterable_tags', set()):
+            self.view.filter_items('bar', {'title'})
+            self.assertIn('title', Filter.filterable_tags)
+        self.assertTrue(self.foo.isHidden())
@@ -0,0 +1,88 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from unittest.mock import MagicMock
+
+from picard.config import get_config
+
+import pytest
+
+from picard.ui.options.tags import TagsOptionsPage
+
+
+@pytest.fixture()
+def tags_options_page(qapp, patch_tagger_instance):
+    tagger = patch_tagger_instance('picard.ui.options')
+    tagger.format_registry = MagicMock()
+    config = get_config()
+    config.setting['tag_padding_policy'] = 'fixed'
+    config.setting['tag_padding_size_kb'] = 128
+    config.setting['tag_padding_percent'] = 2
+    config.setting['tag_padding_reserve_images'] = True
+
+    page = TagsOptionsPage()
+    page.load()
+    return page
+
+
+def test_load_tag_padding(tags_options_page):
+    ui = tags_options_page.ui
+    assert ui.tag_padding_policy.currentData() == 'fixed'
+    assert ui.tag_padding_size_kb.value() == 128
+    assert ui.tag_padding_percent.value() == 2
+    assert ui.tag_padding_reserve_images.isChecked()
+
+
+def test_tag_padding_widgets_follow_policy(tags_options_page):
+    ui = tags_options_page.ui
+    assert ui.tag_padding_size_kb.isEnabled()
+    assert not ui.tag_padding_percent.isEnabled()
+    ui.tag_padding_policy.setCurrentIndex(ui.tag_padding_policy.findData('percent'))
+    assert not ui.tag_padding_size_kb.isEnabled()
+    assert ui.tag_padding_percent.isEnabled()
+    ui.tag_padding_policy.setCurrentIndex(ui.tag_padding_policy.findData('default'))
+    assert not ui.tag_padding_size_kb.isEnabled()
+    assert not ui.tag_padding_percent.isEnabled()
+
+
+def test_save_tag_padding(tags_options_page):
+    ui = tags_options_page.ui
+    ui.tag_padding_policy.setCurrentIndex(ui.tag_padding_policy.findData('percent'))
+    ui.tag_padding_percent.setValue(5)
+    ui.tag_padding_reserve_images.setChecked(False)
+    tags_options_page.save()
+
+    config = get_config()
+    assert config.setting['tag_padding_policy'] == 'percent'
+    assert config.setting['tag_padding_percent'] == 5
+    assert config.setting['tag_padding_reserve_images'] is False
+
+
+def test_load_unknown_tag_padding_policy(tags_options_page):
+    get_config().setting['tag_padding_policy'] = 'invalid'
+    tags_options_page.load()
+    assert tags_options_page.ui.tag_padding_policy.currentData() == 'default'
+
+
+def test_save_skip_unchanged_tag_writes(tags_options_page):
+    get_config().setting['skip_unchanged_tag_writes'] = True
+    tags_options_page.load()
+    assert tags_options_page.ui.skip_unchanged_tag_writes.isChecked()
+    tags_options_page.ui.skip_unchanged_tag_writes.setChecked(False)
+    tags_options_page.save()
+    assert get_config().setting['skip_unchanged_tag_writes'] is False
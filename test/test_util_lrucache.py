@@ -19,7 +19,10 @@
 
 from test.picardtestcase import PicardTestCase
 
-from picard.util.lrucache import LRUCache
+from picard.util.lrucache import (
+    LRUCache,
+    SizedLRUCache,
+)
 
 
 class LRUCacheTest(PicardTestCase):
@@ -76,3 +79,50 @@ class LRUCacheTest(PicardTestCase):
         lrucache = LRUCache(3)
         with self.assertRaises(KeyError):
             del lrucache['notakey']
+
+
+class SizedLRUCacheTest(PicardTestCase):
+    def test_max_size(self):
+        cache = SizedLRUCache(10, sizeof=len)
+        cache['test1'] = 'abcd'
+        cache['test2'] = 'efgh'
+        self.assertEqual(cache.size, 8)
+        cache['test3'] = 'ijkl'
+        self.assertNotIn('test1', cache)
+        self.assertEqual(list(cache), ['test2', 'test3'])
+        self.assertEqual(cache.size, 8)
+
+    def test_lru(self):
+        cache = SizedLRUCache(10, sizeof=len)
+        cache['test1'] = 'abcd'
+        cache['test2'] = 'efgh'
+        self.assertEqual(cache['test1'], 'abcd')
+        cache['test3'] = 'ijkl'
+        self.assertNotIn('test2', cache)
+        self.assertIn('test1', cache)
+
+    def test_replace(self):
+        cache = SizedLRUCache(10, sizeof=len)
+        cache['test1'] = 'abcd'
+        cache['test1'] = 'ab'
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_too_large(self):
+        cache = SizedLRUCache(10, sizeof=len)
+        cache['test1'] = 'abcd'
+        cache['test2'] = 'a' * 11
+        self.assertNotIn('test2', cache)
+        self.assertIn('test1', cache)
+
+    def test_del_clear(self):
+        cache = SizedLRUCache(10, sizeof=len)
+        cache['test1'] = 'abcd'
+        cache['test2'] = 'efgh'
+        del cache['test1']
+        self.assertEqual(cache.size, 4)
+        cache.clear()
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(KeyError):
+            del cache['test1']
@@ -0,0 +1,100 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+import math
+
+from test.picardtestcase import PicardTestCase
+
+from picard.util.metrics import MetricsRegistry
+
+
+class MetricsRegistryTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.counter('requests_total', "Requests")
+        counter.inc(host='a')
+        counter.inc(2, host='a')
+        counter.inc(host='b')
+        self.assertEqual(counter.value(host='a'), 3)
+        self.assertEqual(counter.value(host='b'), 1)
+        self.assertEqual(counter.value(host='c'), 0)
+
+    def test_get_existing(self):
+        counter = self.registry.counter('requests_total', "Requests")
+        self.assertIs(self.registry.counter('requests_total', "Requests"), counter)
+        with self.assertRaises(ValueError):
+            self.registry.gauge('requests_total', "Requests")
+
+    def test_gauge_function(self):
+        gauge = self.registry.gauge('queue_depth', "Queue depth")
+        gauge.set(3, queue='a')
+        gauge.set_function(lambda: 7, queue='b')
+        gauge.set_function(lambda: 1 / 0, queue='c')
+        self.assertEqual(gauge.samples(), [((('queue', 'a'),), 3), ((('queue', 'b'),), 7)])
+        self.registry.clear()
+        self.assertEqual(gauge.samples(), [((('queue', 'b'),), 7)])
+
+    def test_histogram(self):
+        histogram = self.registry.histogram('load_seconds', "Load time", buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.count(), 4)
+        ((key, sample),) = histogram.samples()
+        self.assertEqual(key, ())
+        self.assertEqual(sample['buckets'], [(0.1, 2), (1.0, 3), (math.inf, 4)])
+        self.assertAlmostEqual(sample['sum'], 5.6)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.1)
+        self.assertAlmostEqual(histogram.quantile(0.625), 0.55)
+        self.assertEqual(histogram.quantile(1.0), 1.0)
+        self.assertTrue(math.isnan(histogram.quantile(0.5, host='other')))
+
+    def test_histogram_time(self):
+        histogram = self.registry.histogram('load_seconds', "Load time")
+        with self.assertRaises(RuntimeError), histogram.time(format='MP3File'):
+            raise RuntimeError
+        self.assertEqual(histogram.count(format='MP3File'), 1)
+
+    def test_to_prometheus(self):
+        self.registry.counter('requests_total', "Requests").inc(host='a"b')
+        self.registry.histogram('load_seconds', "Load time", buckets=(0.5,)).observe(0.25)
+        self.assertEqual(
+            self.registry.to_prometheus(),
+            '# HELP picard_load_seconds Load time\n'
+            '# TYPE picard_load_seconds histogram\n'
+            'picard_load_seconds_bucket{le="0.5"} 1\n'
+            'picard_load_seconds_bucket{le="+Inf"} 1\n'
+            'picard_load_seconds_sum 0.25\n'
+            'picard_load_seconds_count 1\n'
+            '# HELP picard_requests_total Requests\n'
+            '# TYPE picard_requests_total counter\n'
+            'picard_requests_total{host="a\\"b"} 1\n',
+        )
+
+    def test_to_json(self):
+        self.registry.gauge('queue_depth', "Queue depth").set(2)
+        self.registry.histogram('load_seconds', "Load time", buckets=(0.5,)).observe(0.25, format='FLACFile')
+        data = json.loads(self.registry.to_json())
+        self.assertEqual(data['queue_depth']['samples'], [{'labels': {}, 'value': 2}])
+        sample = data['load_seconds']['samples'][0]
+        self.assertEqual(sample['labels'], {'format': 'FLACFile'})
+        self.assertEqual(sample['count'], 1)
+        self.assertEqual(sample['buckets'], {'0.5': 1, '+Inf': 1})
@@ -0,0 +1,82 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import pstats
+import tracemalloc
+
+from test.picardtestcase import PicardTestCase
+
+from picard.debug_opts import DebugOpt
+from picard.util.profiler import Profiler
+
+
+def busy_function():
+    return [str(i) for i in range(1000)]
+
+
+class ProfilerTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.folder = os.path.join(self.mktmpdir(), 'logs')
+        self.profiler = Profiler(self.folder)
+        self.addCleanup(self.profiler.stop)
+        self.addCleanup(setattr, DebugOpt.PROFILING, 'enabled', False)
+
+    def test_start_stop(self):
+        self.profiler.start()
+        self.assertTrue(self.profiler.running)
+        self.assertTrue(DebugOpt.PROFILING.enabled)
+        self.assertTrue(tracemalloc.is_tracing())
+        busy_function()
+        pstats_filename, snapshot_filename = self.profiler.stop()
+        self.assertFalse(self.profiler.running)
+        self.assertFalse(DebugOpt.PROFILING.enabled)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(os.path.dirname(pstats_filename), self.folder)
+        self.assertTrue(pstats_filename.endswith('.pstats'))
+        stats = pstats.Stats(pstats_filename)
+        self.assertIn('busy_function', {name for _file, _line, name in stats.stats})
+        snapshot = tracemalloc.Snapshot.load(snapshot_filename)
+        self.assertTrue(snapshot.traces)
+
+    def test_stop_not_running(self):
+        self.assertEqual(self.profiler.stop(), [])
+        self.assertFalse(os.path.exists(self.folder))
+
+    def test_dump(self):
+        self.profiler.start()
+        first = self.profiler.dump()
+        self.assertTrue(self.profiler.running)
+        second = self.profiler.stop()
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 2)
+        self.assertEqual(len(set(first) | set(second)), 4)
+
+    def test_toggle(self):
+        self.assertEqual(self.profiler.toggle(), [])
+        self.assertTrue(self.profiler.running)
+        self.assertEqual(len(self.profiler.toggle()), 2)
+        self.assertFalse(self.profiler.running)
+
+    def test_keeps_tracemalloc_started_elsewhere(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        self.profiler.start()
+        self.profiler.stop()
+        self.assertTrue(tracemalloc.is_tracing())
@@ -0,0 +1,104 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from PyQt6 import QtCore
+
+from test.picardtestcase import PicardTestCase
+
+from picard.util.settingscache import SettingsCache
+
+
+class _Section(QtCore.QObject):
+    setting_changed = QtCore.pyqtSignal(str, object, object)
+
+    def __init__(self, values):
+        super().__init__()
+        self.values = values
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def __setitem__(self, name, value):
+        old_value = self.values.get(name)
+        self.values[name] = value
+        self.setting_changed.emit(name, old_value, value)
+
+
+class SettingsCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values({'ignore_regex': 'foo', 'genres_filter': '-bar'})
+        self.cache = SettingsCache()
+
+    def test_cached(self):
+        factory = Mock(side_effect=lambda value: [value])
+        result = self.cache.get('ignore_regex', factory)
+        self.assertEqual(result, ['foo'])
+        self.assertIs(self.cache.get('ignore_regex', factory), result)
+        factory.assert_called_once_with('foo')
+
+    def test_value_changed(self):
+        factory = Mock(side_effect=lambda value: [value])
+        self.cache.get('ignore_regex', factory)
+        self.set_config_values({'ignore_regex': 'baz'})
+        self.assertEqual(self.cache.get('ignore_regex', factory), ['baz'])
+        self.assertEqual(factory.call_count, 2)
+
+    def test_factories_are_separate(self):
+        self.assertEqual(self.cache.get('ignore_regex', str.upper), 'FOO')
+        self.assertEqual(self.cache.get('ignore_regex', str.lower), 'foo')
+        self.assertEqual(len(self.cache), 2)
+
+    def test_setting_changed_drops_entries(self):
+        section = _Section({'ignore_regex': 'foo', 'genres_filter': '-bar'})
+        with patch('picard.util.settingscache.get_config', return_value=SimpleNamespace(setting=section)):
+            self.cache.get('ignore_regex', str.upper)
+            self.cache.get('genres_filter', str.upper)
+            section['ignore_regex'] = 'baz'
+            self.assertEqual(len(self.cache), 1)
+            self.assertEqual(self.cache.get('ignore_regex', str.upper), 'BAZ')
+
+    def test_concurrent_access(self):
+        section = _Section({'ignore_regex': 'foo'})
+        factories = [lambda value, i=i: (i, value) for i in range(50)]
+        errors = []
+
+        def fill():
+            try:
+                for _ in range(20):
+                    for factory in factories:
+                        self.cache.get('ignore_regex', factory)
+            except Exception as e:
+                errors.append(e)
+
+        with patch('picard.util.settingscache.get_config', return_value=SimpleNamespace(setting=section)):
+            threads = [threading.Thread(target=fill) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for _ in range(200):
+                self.cache._setting_changed('ignore_regex', None, 'foo')
+            for thread in threads:
+                thread.join()
+        self.assertEqual([], errors)
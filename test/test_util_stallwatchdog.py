@@ -0,0 +1,100 @@
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from collections import Counter
+import os
+import sys
+import time
+
+from PyQt6 import QtCore
+
+from test.picardtestcase import PicardTestCase
+
+import picard
+from picard.util.stallwatchdog import (
+    StallReport,
+    StallWatchdog,
+    stack_key,
+    stall_site,
+)
+
+
+PICARD_FILE = os.path.join(os.path.dirname(picard.__file__), 'file.py')
+
+
+def process_events_for(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        QtCore.QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+class StallReportTest(PicardTestCase):
+    def test_stall_site(self):
+        stack = (('/usr/lib/python3/foo.py', 1, 'inner'), (PICARD_FILE, 42, 'load'), (PICARD_FILE, 10, 'outer'))
+        self.assertEqual(stall_site(stack), os.path.join('picard', 'file.py') + ':42 in load')
+        self.assertEqual(stall_site(stack[:1]), '/usr/lib/python3/foo.py:1 in inner')
+
+    def test_stack_key(self):
+        stack = stack_key(sys._getframe())
+        self.assertEqual(stack[0][2], 'test_stack_key')
+
+    def test_add(self):
+        report = StallReport(max_recent=1)
+        site_a = ((PICARD_FILE, 1, 'a'),)
+        site_b = ((PICARD_FILE, 2, 'b'),)
+        report.add(0, 0.5, Counter({site_a: 3, site_b: 1}))
+        stall = report.add(0, 1.5, Counter({site_b: 5}))
+        self.assertEqual(report.count, 2)
+        self.assertEqual(report.total_time, 2.0)
+        self.assertEqual(report.longest, 1.5)
+        self.assertEqual(stall.samples, 5)
+        self.assertTrue(stall.site.endswith(':2 in b'))
+        self.assertEqual([site.stack for site in report.top_sites()], [site_b, site_a])
+        self.assertEqual(report.sites[site_b].stalls, 2)
+        self.assertEqual(list(report.recent), [stall])
+        text = report.format(0.02)
+        self.assertIn('Stalls: 2, total 2.00 s, longest 1.50 s', text)
+        self.assertIn('0.12 s  6 samples in 2 stalls', text)
+
+    def test_format_empty(self):
+        self.assertEqual(StallReport().format(0.02), "No stalls recorded.")
+
+
+class StallWatchdogTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values({'gui_stall_threshold_ms': 100})
+        self.watchdog = StallWatchdog()
+        self.addCleanup(self.watchdog.stop)
+
+    def test_detects_stall(self):
+        self.watchdog.start()
+        self.assertTrue(self.watchdog.running)
+        process_events_for(0.15)
+        self.assertEqual(self.watchdog.report.count, 0)
+        time.sleep(0.5)
+        process_events_for(0.15)
+        self.watchdog.stop()
+        self.assertFalse(self.watchdog.running)
+        report = self.watchdog.report
+        self.assertEqual(report.count, 1)
+        self.assertGreaterEqual(report.longest, 0.3)
+        (stall,) = report.recent
+        self.assertIn('test_detects_stall', stall.site)
+        self.assertGreater(stall.samples, 0)
@@ -59,6 +59,10 @@ def patched_get_config(monkeypatch: pytest.MonkeyPatch) -> None:
             'remove_images_from_tags': False,
             'rating_user_email': '',
             'rating_steps': 6,
+            'tag_padding_policy': 'default',
+            'tag_padding_size_kb': 64,
+            'tag_padding_percent': 1,
+            'tag_padding_reserve_images': False,
         }
     )
     return None
@@ -129,3 +129,13 @@ class AcoustdIdAPITest(PicardTestCase):
             'duration.3': '500000',
         }
         self.assertEqual(result, expected)
+
+    def test_query_acoustid_batch(self):
+        handler = MagicMock()
+        self.api.query_acoustid = MagicMock()
+        self.api.query_acoustid_batch(handler, [('f1', 100), ('f2', 200)], meta='recordings')
+        self.api.query_acoustid.assert_called_once_with(
+            handler,
+            meta='recordings',
+            **{'fingerprint.0': 'f1', 'duration.0': '100', 'fingerprint.1': 'f2', 'duration.1': '200'},
+        )